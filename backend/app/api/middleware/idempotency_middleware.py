@@ -0,0 +1,161 @@
+"""
+Idempotency Middleware
+
+Replays the stored response of write requests retried with the same
+Idempotency-Key header, so flaky-network retries do not write twice.
+"""
+
+import base64
+import hashlib
+import logging
+from typing import Callable, List, Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ...application.ports.idempotency_store_port import (
+    IdempotencyStorePort, IDEMPOTENCY_PENDING, build_idempotency_key, fingerprint_payload
+)
+from ...core.config import settings
+from ...infrastructure.stores.idempotency_store_adapter import get_idempotency_store
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+IDEMPOTENT_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware for idempotent write requests.
+
+    A write request under one of the configured paths that carries an
+    Idempotency-Key header is recorded by key, scoped to the caller's
+    credentials and the path. While it runs, retries get 409; once it has
+    finished, retries with the same payload get the stored response without
+    reaching the route, and a reused key with a different payload gets 422.
+    Server errors are not stored, so the client can retry them.
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: List[str],
+        store: Optional[IdempotencyStorePort] = None,
+        ttl_seconds: int = settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+        pending_ttl_seconds: int = settings.IDEMPOTENCY_PENDING_TTL_SECONDS
+    ):
+        """
+        Initialize idempotency middleware.
+
+        Args:
+            app: FastAPI application
+            paths: Path prefixes of the endpoints to make idempotent
+            store: Idempotency store. If None, uses the configured store.
+            ttl_seconds: How long stored responses are replayed
+            pending_ttl_seconds: How long a key stays claimed by a request that never finishes
+        """
+        super().__init__(app)
+        self.paths = paths
+        self.store = store or get_idempotency_store()
+        self.ttl_seconds = ttl_seconds
+        self.pending_ttl_seconds = pending_ttl_seconds
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Replay or record the response of an idempotent request."""
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not idempotency_key or not self.store or not self._applies_to(request):
+            return await call_next(request)
+
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters"}
+            )
+
+        store_key = build_idempotency_key(self._scope(request), idempotency_key)
+        fingerprint = fingerprint_payload(await request.body())
+
+        record = await self.store.reserve(store_key, fingerprint, self.pending_ttl_seconds)
+        if record is not None:
+            return self._replay(record, fingerprint)
+
+        try:
+            response = await call_next(request)
+            body = b"".join([chunk async for chunk in response.body_iterator])
+        except Exception:
+            await self.store.release(store_key)
+            raise
+
+        # Raw header pairs keep repeated headers such as Set-Cookie
+        headers = [
+            [name.decode("latin-1"), value.decode("latin-1")]
+            for name, value in response.raw_headers
+            if name.lower() != b"content-length"
+        ]
+
+        if response.status_code >= 500:
+            await self.store.release(store_key)
+        else:
+            await self.store.complete(store_key, fingerprint, {
+                "status_code": response.status_code,
+                "headers": headers,
+                "body": base64.b64encode(body).decode("ascii")
+            }, self.ttl_seconds)
+
+        return self._build_response(body, response.status_code, headers, background=response.background)
+
+    def _applies_to(self, request: Request) -> bool:
+        """Check if the request is a write to one of the configured paths."""
+        if request.method not in IDEMPOTENT_METHODS:
+            return False
+
+        path = request.url.path
+        return any(path.startswith(prefix) for prefix in self.paths)
+
+    def _scope(self, request: Request) -> str:
+        """Keys are unique per caller and endpoint, so one caller cannot replay another's response."""
+        credentials = request.headers.get("Authorization", "")
+        caller = hashlib.sha256(credentials.encode("utf-8")).hexdigest() if credentials else "anonymous"
+        return f"{caller}:{request.method}:{request.url.path}?{request.url.query}"
+
+    def _replay(self, record: dict, fingerprint: str) -> Response:
+        """Response for a request whose key is already recorded."""
+        if record.get("fingerprint") != fingerprint:
+            return JSONResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                content={"detail": f"{IDEMPOTENCY_HEADER} was already used for a different request"}
+            )
+
+        if record.get("state") == IDEMPOTENCY_PENDING:
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content={"detail": f"A request with this {IDEMPOTENCY_HEADER} is still being processed"},
+                headers={"Retry-After": "1"}
+            )
+
+        stored = record["response"]
+        logger.info(f"Replaying stored response for {IDEMPOTENCY_HEADER}")
+        return self._build_response(
+            base64.b64decode(stored["body"]),
+            stored["status_code"],
+            stored["headers"] + [[REPLAYED_HEADER, "true"]]
+        )
+
+    def _build_response(
+        self,
+        body: bytes,
+        status_code: int,
+        headers: List[List[str]],
+        background=None
+    ) -> Response:
+        """Response with the given header pairs in order, repeated names included."""
+        response = Response(content=body, status_code=status_code, background=background)
+        response.raw_headers.extend(
+            (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers
+        )
+        return response
@@ -13,6 +13,7 @@ from starlette.middleware.cors import CORSMiddleware
 from .error_handler import ErrorHandlerMiddleware
 from .auth_handler import AuthMiddleware
 from .business_context_middleware import BusinessContextMiddleware
+from .idempotency_middleware import IdempotencyMiddleware
 from ...core.config import settings
 
 # Configure logging
@@ -69,6 +70,14 @@ class MiddlewareConfig:
             f"{self.api_v1_str}/public/availability/",
         ]
     
+    @property
+    def idempotent_paths(self) -> List[str]:
+        """Paths whose write requests honor the Idempotency-Key header."""
+        return [
+            f"{self.api_v1_str}/public/contractors/",
+            f"{self.api_v1_str}/bookings/",
+        ]
+    
     @property
     def cors_origins(self) -> List[str]:
         """CORS allowed origins from settings."""
@@ -102,6 +111,7 @@ class MiddlewareManager:
         # 2. CORS - Handles cross-origin requests  
         # 3. Business Context - Validates business access
         # 4. Authentication - Sets user context
+        # 5. Idempotency - Replays responses of retried write requests
         
         self.middlewares = [
             {
@@ -126,6 +136,14 @@ class MiddlewareManager:
                     "skip_paths": self.config.auth_skip_paths
                 },
                 "description": "JWT token validation and user authentication"
+            },
+            {
+                "name": "Idempotency",
+                "middleware": IdempotencyMiddleware,
+                "kwargs": {
+                    "paths": self.config.idempotent_paths
+                },
+                "description": "Replays stored responses for retried Idempotency-Key requests"
             }
         ]
     
@@ -18,6 +18,7 @@ from ..schemas.activity_schemas import (
     ActivityTemplateCreateRequest, ActivityTemplateResponse, TimelineRequest, TimelineResponse,
     ActivityStatisticsResponse, ContactActivitySummaryResponse, ActivityReminderResponse,
     DashboardActivitiesResponse, MessageResponse, BulkOperationResponse, PaginationParams,
+    CursorPaginationParams,
     ActivityBulkUpdateRequest, ActivitySearchRequest
 )
 from ...application.use_cases.activity.manage_activities import ManageActivitiesUseCase
@@ -164,7 +165,7 @@ async def delete_activity(
 @require_view_contacts
 async def search_activities(
     search_request: ActivitySearchRequest = Body(...),
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     current_user: dict = Depends(get_current_user),
     business_context: dict = Depends(get_business_context),
     use_case: ManageActivitiesUseCase = Depends(get_manage_activities_use_case)
@@ -179,13 +180,15 @@ async def search_activities(
     # Get business activities with filtering
     activities = await use_case.get_business_activities(
         business_id=business_context["business_id"],
+        user_id=current_user["sub"],
         activity_types=[ActivityType(t.value) for t in search_request.activity_types] if search_request.activity_types else None,
         statuses=[ActivityStatus(s.value) for s in search_request.statuses] if search_request.statuses else None,
         assigned_to=search_request.assigned_to,
         start_date=search_request.start_date,
         end_date=search_request.end_date,
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        include_total=pagination.include_total
     )
     
     return activities
@@ -194,7 +197,7 @@ async def search_activities(
 @router.get("/user/assigned", response_model=ActivityListResponse)
 @require_view_contacts
 async def get_user_activities(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     statuses: Optional[List[str]] = Query(None, description="Filter by activity statuses"),
     start_date: Optional[datetime] = Query(None, description="Filter activities after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter activities before this date"),
@@ -219,8 +222,9 @@ async def get_user_activities(
         statuses=status_enums,
         start_date=start_date,
         end_date=end_date,
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        include_total=pagination.include_total
     )
     
     return activities
@@ -555,7 +559,6 @@ async def get_dashboard_activities(
         business_id=business_context["business_id"],
         user_id=current_user["sub"],
         statuses=[ActivityStatus.COMPLETED],
-        skip=0,
         limit=5
     )
     
@@ -26,9 +26,10 @@ from ...domain.entities.booking import (
     AvailabilityRequest, AvailabilityResponse, TimeSlot,
     BookingRequest, BookingResponse, Booking, BookingStatus,
     BookingConfirmationRequest, BookingRescheduleRequest, 
-    BookingCancellationRequest, BookingListResponse
+    BookingCancellationRequest, BookingListResponse, SlotHold, SlotHoldRequest
 )
 from ..deps import get_supabase_client, get_current_user
+from ...infrastructure.stores.idempotency_store_adapter import get_idempotency_store
 from supabase import Client
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
@@ -51,7 +52,7 @@ def get_booking_service(
     availability_service: AvailabilityService = Depends(get_availability_service)
 ) -> BookingService:
     """Get booking service instance"""
-    return BookingService(supabase, availability_service)
+    return BookingService(supabase, availability_service, get_idempotency_store())
 
 
 # =====================================================
@@ -126,6 +127,64 @@ async def get_next_available_slot(
         )
 
 
+@router.post("/holds", response_model=SlotHold, status_code=status.HTTP_201_CREATED)
+async def hold_slot(
+    request: SlotHoldRequest,
+    booking_service: BookingService = Depends(get_booking_service)
+):
+    """
+    Hold a time slot while the customer completes the booking
+    
+    Pass the returned hold_token when creating the booking. The hold
+    lapses after a few minutes if no booking is created.
+    """
+    try:
+        return await booking_service.hold_slot(request)
+        
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ServiceNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to hold slot"
+        )
+
+
+@router.delete("/holds/{hold_token}", status_code=status.HTTP_204_NO_CONTENT)
+async def release_slot_hold(
+    hold_token: str,
+    booking_service: BookingService = Depends(get_booking_service)
+):
+    """Release a slot hold the customer no longer needs"""
+    try:
+        released = await booking_service.release_hold(hold_token)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to release slot hold"
+        )
+    
+    if not released:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Slot hold not found"
+        )
+
+
 @router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
 async def create_booking(
     request: BookingRequest,
@@ -432,11 +491,30 @@ async def update_booking_status(
     Allows admins to manually update booking status for operational needs.
     """
     try:
-        # TODO: Implement status update logic
-        # This would be similar to confirm/cancel but more flexible
+        response = await booking_service.update_booking_status(
+            booking_id,
+            new_status,
+            reason=reason,
+            triggered_by="admin"
+        )
         
-        return {"message": f"Booking status updated to {new_status.value}"}
+        return {"message": response.message}
         
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -253,8 +253,9 @@ async def delete_contact(
 @router.get("", response_model=ContactListResponse, operation_id="list_contacts_no_slash")
 async def list_contacts(
     business_context: dict = Depends(get_business_context),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
     include_user_details: UserDetailLevel = Query(UserDetailLevel.BASIC, description="Level of user detail to include"),
     current_user: dict = Depends(get_current_user),
     use_case: ListContactsUseCase = Depends(get_list_contacts_use_case),
@@ -263,14 +264,15 @@ async def list_contacts(
     """
     List contacts for the current business.
     
-    Retrieves a paginated list of contacts with optional user detail information.
+    Retrieves a cursor-paginated list of contacts with optional user detail information.
+    Pass the returned next_cursor to fetch the following page.
     Requires 'view_contacts' permission.
     """
     business_id = uuid.UUID(business_context["business_id"])
     
     try:
         contact_list_dto = await use_case.execute(
-            business_id, current_user["sub"], skip, limit, include_user_details
+            business_id, current_user["sub"], limit, cursor, include_user_details, include_total
         )
         
         logger.info(f"🔧 ContactAPI: Retrieved {len(contact_list_dto.contacts)} contacts from use case")
@@ -292,7 +294,8 @@ async def list_contacts(
             page=contact_list_dto.page,
             per_page=contact_list_dto.per_page,
             has_next=contact_list_dto.has_next,
-            has_previous=contact_list_dto.has_previous
+            has_previous=contact_list_dto.has_previous,
+            next_cursor=contact_list_dto.next_cursor
         )
     except Exception as e:
         logger.error(f"❌ ContactAPI: Error in list_contacts: {str(e)}")
@@ -336,7 +339,8 @@ async def search_contacts(
             max_estimated_value=request.max_estimated_value,
             never_contacted=request.never_contacted,
             skip=request.skip,
-            limit=request.limit
+            limit=request.limit,
+            cursor=request.cursor
         )
         
         contact_list_dto = await use_case.execute(search_dto, current_user["sub"])
@@ -347,7 +351,8 @@ async def search_contacts(
             page=contact_list_dto.page,
             per_page=contact_list_dto.per_page,
             has_next=contact_list_dto.has_next,
-            has_previous=contact_list_dto.has_previous
+            has_previous=contact_list_dto.has_previous,
+            next_cursor=contact_list_dto.next_cursor
         )
     except Exception as e:
         raise HTTPException(
@@ -378,8 +383,10 @@ async def bulk_update_contacts(
             business_id=business_id,
             contact_ids=request.contact_ids,
             status=ContactStatus(request.status.value) if request.status else None,
+            priority=ContactPriority(request.priority.value) if request.priority else None,
             assigned_to=request.assigned_to,
-            tags_to_add=request.tags_to_add
+            tags_to_add=request.tags_to_add,
+            tags_to_remove=request.tags_to_remove
         )
         
         updated_count = await use_case.bulk_update(bulk_dto, current_user["sub"])
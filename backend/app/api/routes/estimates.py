@@ -17,7 +17,8 @@ from ..middleware.permissions import (
 from ..schemas.estimate_schemas import (
     CreateEstimateSchema, UpdateEstimateSchema, EstimateSearchSchema,
     EstimateStatusUpdateSchema, EstimateResponseSchema, 
-    EstimateListResponseSchema, EstimateActionResponse, NextEstimateNumberSchema
+    EstimateListResponseSchema, EstimateActionResponse, NextEstimateNumberSchema,
+    EstimateSummaryResponseSchema, EstimateSummaryListResponseSchema
 )
 from ..schemas.activity_schemas import MessageResponse
 from ...application.use_cases.estimate.create_estimate_use_case import CreateEstimateUseCase
@@ -205,6 +206,68 @@ async def get_next_estimate_number(
         )
 
 
+@router.get("/summary", response_model=EstimateSummaryListResponseSchema)
+async def list_estimate_summaries(
+    business_context: dict = Depends(get_business_context),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
+    estimate_status: Optional[EstimateStatus] = Query(None, description="Filter by estimate status"),
+    contact_id: Optional[uuid.UUID] = Query(None, description="Filter by contact ID"),
+    project_id: Optional[uuid.UUID] = Query(None, description="Filter by project ID"),
+    job_id: Optional[uuid.UUID] = Query(None, description="Filter by job ID"),
+    current_user: dict = Depends(get_current_user),
+    use_case: ListEstimatesUseCase = Depends(get_list_estimates_use_case),
+    _: bool = Depends(require_view_projects_dep)
+):
+    """
+    List estimate summaries.
+    
+    Lightweight list for list screens: header fields and stored totals only,
+    without line items. Cursor-paginated like the full list.
+    Requires 'view_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    
+    try:
+        filters = EstimateFilters(
+            status=estimate_status if estimate_status else None,
+            contact_id=contact_id,
+            project_id=project_id,
+            job_id=job_id
+        )
+        
+        result = await use_case.execute_summary(
+            business_id=business_id,
+            user_id=current_user["sub"],
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
+        )
+        
+        return EstimateSummaryListResponseSchema(
+            estimates=[
+                EstimateSummaryResponseSchema.model_validate(summary.model_dump(mode="json"))
+                for summary in result["estimates"]
+            ],
+            total_count=result["total_count"],
+            per_page=limit,
+            has_next=result["has_next"],
+            has_prev=result["has_previous"],
+            next_cursor=result["next_cursor"]
+        )
+    except ValidationError as e:
+        logger.error(f"❌ EstimateAPI: Validation error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ EstimateAPI: Error listing estimate summaries: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
 @router.get("/{estimate_id}", response_model=EstimateResponseSchema)
 async def get_estimate(
     estimate_id: uuid.UUID = Path(..., description="Estimate ID"),
@@ -349,8 +412,9 @@ async def delete_estimate(
 @router.get("", response_model=EstimateListResponseSchema, operation_id="list_estimates_no_slash")
 async def list_estimates(
     business_context: dict = Depends(get_business_context),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
     estimate_status: Optional[EstimateStatus] = Query(None, description="Filter by estimate status"),
     contact_id: Optional[uuid.UUID] = Query(None, description="Filter by contact ID"),
     project_id: Optional[uuid.UUID] = Query(None, description="Filter by project ID"),
@@ -362,7 +426,8 @@ async def list_estimates(
     """
     List estimates.
     
-    Retrieves a paginated list of estimates for the current business.
+    Retrieves a cursor-paginated list of estimates for the current business.
+    Pass the returned next_cursor to fetch the following page.
     Requires 'view_projects' permission.
     """
     business_id = uuid.UUID(business_context["business_id"])
@@ -380,17 +445,18 @@ async def list_estimates(
             business_id=business_id,
             user_id=current_user["sub"],
             filters=filters,
-            skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
         )
         
         return EstimateListResponseSchema(
             estimates=[_estimate_dto_to_response_from_dto(estimate_dto) for estimate_dto in result["estimates"]],
             total_count=result["total_count"],
-            page=skip // limit + 1,
             per_page=limit,
             has_next=result["has_next"],
-            has_prev=result["has_previous"]
+            has_prev=result["has_previous"],
+            next_cursor=result["next_cursor"]
         )
     except ValidationError as e:
         logger.error(f"❌ EstimateAPI: Validation error: {str(e)}")
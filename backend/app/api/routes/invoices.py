@@ -6,9 +6,10 @@ REST API endpoints for invoice management operations.
 
 import uuid
 import logging
-from datetime import datetime
+from datetime import datetime, date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
+from fastapi.responses import StreamingResponse
 
 from ..deps import get_current_user, get_business_context
 from ..middleware.permissions import (
@@ -17,7 +18,8 @@ from ..middleware.permissions import (
 from ..schemas.invoice_schemas import (
     CreateInvoiceSchema, InvoiceSearchSchema, CreateInvoiceFromEstimateSchema,
     UpdateInvoiceSchema, ProcessPaymentSchema, InvoiceResponseSchema, InvoiceListResponseSchema,
-    InvoiceStatusUpdateSchema, PaymentResponse, InvoiceLineItemSchema, PaymentSchema, NextInvoiceNumberSchema
+    InvoiceStatusUpdateSchema, PaymentResponse, InvoiceLineItemSchema, PaymentSchema, NextInvoiceNumberSchema,
+    InvoiceSummaryResponseSchema, InvoiceSummaryListResponseSchema
 )
 from ...application.use_cases.invoice.create_invoice_use_case import CreateInvoiceUseCase
 from ...application.use_cases.invoice.get_invoice_use_case import GetInvoiceUseCase
@@ -32,13 +34,17 @@ from ...application.dto.invoice_dto import (
     InvoiceLineItemDTO, InvoiceDTO, InvoiceListFilters, InvoiceSearchCriteria
 )
 from ...application.exceptions.application_exceptions import (
-    ValidationError, NotFoundError, PermissionDeniedError, BusinessRuleViolationError
+    ValidationError, NotFoundError, PermissionDeniedError, BusinessRuleViolationError, ApplicationError
 )
 from ...infrastructure.config.dependency_injection import (
     get_invoice_repository,
     get_create_invoice_use_case, get_get_invoice_use_case, get_update_invoice_use_case, 
     get_delete_invoice_use_case, get_list_invoices_use_case, get_search_invoices_use_case,
-    get_process_payment_use_case, get_get_next_invoice_number_use_case
+    get_process_payment_use_case, get_get_next_invoice_number_use_case,
+    get_receivables_report_service
+)
+from ...application.services.receivables_report_service import (
+    ReceivablesReportService, AgingReport, RevenueReport, revenue_report_csv
 )
 from ...domain.entities.invoice_enums.enums import InvoiceStatus
 from ...domain.shared.enums import PaymentMethod, CurrencyCode
@@ -401,6 +407,184 @@ async def get_next_invoice_number(
         )
 
 
+@router.get("/summary", response_model=InvoiceSummaryListResponseSchema)
+async def list_invoice_summaries(
+    business_context: dict = Depends(get_business_context),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
+    invoice_status: Optional[InvoiceStatus] = Query(None, description="Filter by invoice status"),
+    contact_id: Optional[uuid.UUID] = Query(None, description="Filter by contact ID"),
+    project_id: Optional[uuid.UUID] = Query(None, description="Filter by project ID"),
+    job_id: Optional[uuid.UUID] = Query(None, description="Filter by job ID"),
+    overdue_only: bool = Query(False, description="Show only overdue invoices"),
+    current_user: dict = Depends(get_current_user),
+    use_case: ListInvoicesUseCase = Depends(get_list_invoices_use_case),
+    _: bool = Depends(require_view_projects_dep)
+):
+    """
+    List invoice summaries.
+    
+    Lightweight list for list screens: header fields and stored totals only,
+    without line items or payments. Cursor-paginated like the full list.
+    Requires 'view_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    
+    try:
+        filters = InvoiceListFilters(
+            status=invoice_status.value if invoice_status else None,
+            contact_id=contact_id,
+            project_id=project_id,
+            job_id=job_id,
+            overdue_only=overdue_only
+        )
+        
+        result = await use_case.execute_summary(
+            business_id=business_id,
+            user_id=current_user["sub"],
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
+        )
+        
+        return InvoiceSummaryListResponseSchema(
+            invoices=[
+                InvoiceSummaryResponseSchema.model_validate(summary.model_dump(mode="json"))
+                for summary in result["invoices"]
+            ],
+            total_count=result["total_count"],
+            per_page=limit,
+            has_next=result["has_next"],
+            has_prev=result["has_previous"],
+            next_cursor=result["next_cursor"]
+        )
+    except ValidationError as e:
+        logger.error(f"❌ InvoiceAPI: Validation error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ InvoiceAPI: Error listing invoice summaries: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.get("/reports/aging", response_model=AgingReport)
+async def get_receivables_aging(
+    as_of: Optional[date] = Query(None, description="Age balances as of this date (defaults to today)"),
+    contact_id: Optional[uuid.UUID] = Query(None, description="Only this contact's invoices"),
+    by_contact: bool = Query(False, description="Also break the buckets down per contact"),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    report_service: ReceivablesReportService = Depends(get_receivables_report_service),
+    _: bool = Depends(require_view_projects_dep)
+):
+    """
+    Receivables aging.
+    
+    Outstanding balances of open invoices in 0-30, 31-60, 61-90 and 90+
+    days-past-due buckets, aggregated in the database.
+    Requires 'view_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    
+    try:
+        return await report_service.get_aging(
+            business_id, as_of=as_of, contact_id=contact_id, by_contact=by_contact
+        )
+    except ApplicationError as e:
+        logger.error(f"❌ InvoiceAPI: Error building aging report: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/reports/aging/export")
+async def export_receivables_aging(
+    as_of: Optional[date] = Query(None, description="Age balances as of this date (defaults to today)"),
+    contact_id: Optional[uuid.UUID] = Query(None, description="Only this contact's invoices"),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    report_service: ReceivablesReportService = Depends(get_receivables_report_service),
+    _: bool = Depends(require_view_projects_dep)
+):
+    """
+    Export outstanding invoices with their aging bucket as CSV.
+    
+    Rows are streamed as they are read, one page of invoices at a time.
+    Requires 'view_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    as_of = as_of or date.today()
+    
+    return StreamingResponse(
+        report_service.stream_aging_csv(business_id, as_of=as_of, contact_id=contact_id),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename=ar_aging_{as_of.isoformat()}.csv"}
+    )
+
+
+@router.get("/reports/revenue", response_model=RevenueReport)
+async def get_revenue_report(
+    start_date: date = Query(..., description="First day of the report range"),
+    end_date: date = Query(..., description="Last day of the report range"),
+    period: str = Query("month", description="Grouping: day, week, month, quarter or year"),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    report_service: ReceivablesReportService = Depends(get_receivables_report_service),
+    _: bool = Depends(require_view_projects_dep)
+):
+    """
+    Revenue by period.
+    
+    Invoiced revenue by issue date and collections by payment date for each
+    period, with days sales outstanding over the range.
+    Requires 'view_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    
+    try:
+        return await report_service.get_revenue(business_id, start_date, end_date, period=period)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ApplicationError as e:
+        logger.error(f"❌ InvoiceAPI: Error building revenue report: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/reports/revenue/export")
+async def export_revenue_report(
+    start_date: date = Query(..., description="First day of the report range"),
+    end_date: date = Query(..., description="Last day of the report range"),
+    period: str = Query("month", description="Grouping: day, week, month, quarter or year"),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    report_service: ReceivablesReportService = Depends(get_receivables_report_service),
+    _: bool = Depends(require_view_projects_dep)
+):
+    """
+    Export the revenue report as CSV, one row per period.
+    Requires 'view_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    
+    try:
+        report = await report_service.get_revenue(business_id, start_date, end_date, period=period)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ApplicationError as e:
+        logger.error(f"❌ InvoiceAPI: Error exporting revenue report: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    
+    return StreamingResponse(
+        revenue_report_csv(report),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=revenue_{start_date.isoformat()}_{end_date.isoformat()}.csv"
+        }
+    )
+
+
 @router.get("/{invoice_id}", response_model=InvoiceResponseSchema)
 async def get_invoice(
     invoice_id: uuid.UUID = Path(..., description="Invoice ID"),
@@ -542,8 +726,9 @@ async def delete_invoice(
 @router.get("", response_model=InvoiceListResponseSchema, operation_id="list_invoices_no_slash")
 async def list_invoices(
     business_context: dict = Depends(get_business_context),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
     invoice_status: Optional[InvoiceStatus] = Query(None, description="Filter by invoice status"),
     contact_id: Optional[uuid.UUID] = Query(None, description="Filter by contact ID"),
     project_id: Optional[uuid.UUID] = Query(None, description="Filter by project ID"),
@@ -556,7 +741,8 @@ async def list_invoices(
     """
     List invoices.
     
-    Retrieves a paginated list of invoices for the current business.
+    Retrieves a cursor-paginated list of invoices for the current business.
+    Pass the returned next_cursor to fetch the following page.
     Requires 'view_projects' permission.
     """
     business_id = uuid.UUID(business_context["business_id"])
@@ -576,17 +762,18 @@ async def list_invoices(
             business_id=business_id,
             user_id=current_user["sub"],
             filters=filters,
-            skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
         )
         
         return InvoiceListResponseSchema(
             invoices=[_invoice_dto_to_response_from_dto(invoice_dto) for invoice_dto in result["invoices"]],
             total_count=result["total_count"],
-            page=skip // limit + 1,
             per_page=limit,
             has_next=result["has_next"],
-            has_prev=result["has_previous"]
+            has_prev=result["has_previous"],
+            next_cursor=result["next_cursor"]
         )
         
     except Exception as e:
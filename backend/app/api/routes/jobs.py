@@ -366,8 +366,9 @@ async def delete_job(
     operation_id="list_jobs_no_slash"
 )
 async def list_jobs(
-    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of jobs to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
     business_context: dict = Depends(get_business_context),
     current_user: dict = Depends(get_current_user),
     use_case: JobSearchUseCase = Depends(get_job_search_use_case)
@@ -376,21 +377,21 @@ async def list_jobs(
     user_id = current_user["sub"]
     business_id = business_context["business_id"]
     
-    # Use list_jobs method to get all jobs
-    results = await use_case.list_jobs(
+    job_page = await use_case.list_jobs(
         business_id=business_id,
         user_id=user_id,
-        skip=skip,
-        limit=limit
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total
     )
     
     # Convert jobs to response DTOs
     return JobListPaginatedResponse(
-        jobs=[_convert_job_list_dto_to_response(job) for job in results],
-        total=len(results),
-        skip=skip,
+        jobs=[_convert_job_list_dto_to_response(job) for job in job_page.items],
+        total=job_page.estimated_total,
         limit=limit,
-        has_more=len(results) == limit
+        has_more=job_page.has_next,
+        next_cursor=job_page.next_cursor
     )
 
 
@@ -8,7 +8,7 @@ import uuid
 import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, UploadFile, File
 
 from ..deps import get_current_user, get_business_context
 from ..middleware.permissions import (
@@ -18,21 +18,23 @@ from ..schemas.product_schemas import (
     CreateProductSchema, UpdateProductSchema, ProductSearchSchema,
     ProductResponseSchema, ProductListResponseSchema, ProductSummarySchema,
     StockAdjustmentSchema, StockMovementResponseSchema,
-    ReorderSuggestionsResponseSchema, ProductActionResponse, StockActionResponse
+    ReorderSuggestionsResponseSchema, ProductActionResponse, StockActionResponse,
+    BulkStockAdjustmentSchema, BulkStockAdjustmentResponse
 )
 from ..schemas.activity_schemas import MessageResponse
 from ...application.use_cases.product.create_product_use_case import CreateProductUseCase
 from ...application.use_cases.product.manage_inventory_use_case import ManageInventoryUseCase
 from ...application.use_cases.product.inventory_reorder_management_use_case import InventoryReorderManagementUseCase
+from ...application.services.catalog_import_service import CatalogImportService, ImportReport
 from ...application.dto.product_dto import (
     CreateProductDTO, ProductDTO, ProductSearchCriteria, StockAdjustmentDTO
 )
 from ...application.exceptions.application_exceptions import (
-    ValidationError, NotFoundError, PermissionDeniedError, BusinessRuleViolationError
+    ValidationError, NotFoundError, PermissionDeniedError, BusinessRuleViolationError, ApplicationError
 )
 from ...infrastructure.config.dependency_injection import (
     get_product_repository, get_create_product_use_case, get_manage_inventory_use_case,
-    get_inventory_reorder_management_use_case
+    get_inventory_reorder_management_use_case, get_catalog_import_service
 )
 from ...domain.entities.product_enums.enums import ProductStatus, ProductType
 
@@ -258,9 +260,10 @@ async def delete_product(
 @router.get("", response_model=ProductListResponseSchema, operation_id="list_products_no_slash")
 async def list_products(
     business_context: dict = Depends(get_business_context),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    status: Optional[str] = Query(None, description="Filter by product status"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include an estimated total count"),
+    product_status: Optional[ProductStatus] = Query(None, alias="status", description="Filter by product status"),
     category_id: Optional[uuid.UUID] = Query(None, description="Filter by category ID"),
     supplier_id: Optional[uuid.UUID] = Query(None, description="Filter by supplier ID"),
     low_stock_only: bool = Query(False, description="Show only low stock items"),
@@ -271,44 +274,37 @@ async def list_products(
     """
     List products.
     
-    Retrieves a paginated list of products with optional filtering.
+    Retrieves a cursor-paginated list of products, ordered by name, with optional filtering.
+    Pass the returned next_cursor to fetch the following page.
     Requires 'view_projects' permission.
     """
     business_id = uuid.UUID(business_context["business_id"])
     logger.info(f"🔧 ProductAPI: Listing products for business {business_id}")
     
     try:
-        # Build search criteria
-        criteria = ProductSearchCriteria(
+        # Get a keyset page of products
+        product_page = await product_repository.list_page_by_business(
             business_id=business_id,
-            status=status,
+            limit=limit,
+            cursor=cursor,
+            status=product_status,
             category_id=category_id,
             supplier_id=supplier_id,
             low_stock_only=low_stock_only,
-            skip=skip,
-            limit=limit
+            include_total=include_total
         )
         
-        # Get products
-        products, total_count = await product_repository.search(criteria)
-        
         # Convert to DTOs
-        product_dtos = [ProductDTO.from_entity(p) for p in products]
+        product_dtos = [ProductDTO.from_entity(p) for p in product_page.items]
         product_responses = [_product_dto_to_response(dto) for dto in product_dtos]
         
-        # Calculate pagination
-        page = (skip // limit) + 1
-        per_page = limit
-        has_next = (skip + limit) < total_count
-        has_prev = skip > 0
-        
         return ProductListResponseSchema(
             products=product_responses,
-            total_count=total_count,
-            page=page,
-            per_page=per_page,
-            has_next=has_next,
-            has_prev=has_prev
+            total_count=product_page.estimated_total,
+            per_page=limit,
+            has_next=product_page.has_next,
+            has_prev=cursor is not None,
+            next_cursor=product_page.next_cursor
         )
         
     except Exception as e:
@@ -453,6 +449,92 @@ async def adjust_stock(
         )
 
 
+@router.post("/bulk-adjust-stock", response_model=BulkStockAdjustmentResponse)
+async def bulk_adjust_stock(
+    request: BulkStockAdjustmentSchema = Body(...),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    use_case: ManageInventoryUseCase = Depends(get_manage_inventory_use_case),
+    _: bool = Depends(require_edit_projects_dep)
+):
+    """
+    Adjust stock for many products at once.
+    
+    All adjustments are applied together or not at all. Resending the same
+    batch_id does not apply the adjustments twice.
+    Requires 'edit_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    logger.info(f"🔧 ProductAPI: Bulk adjusting stock for {len(request.adjustments)} lines")
+    
+    try:
+        result = await use_case.bulk_adjust_stock(
+            adjustments=[adjustment.dict() for adjustment in request.adjustments],
+            user_id=current_user["sub"],
+            business_id=business_id,
+            batch_id=request.batch_id
+        )
+        
+        return BulkStockAdjustmentResponse(
+            success=result["success"],
+            message="Batch already applied" if result["duplicate"] else "Stock adjusted successfully",
+            batch_id=result["batch_id"],
+            movement_count=result["movement_count"],
+            duplicate=result["duplicate"]
+        )
+        
+    except ValidationError as e:
+        logger.error(f"❌ ProductAPI: Validation error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BusinessRuleViolationError as e:
+        logger.error(f"❌ ProductAPI: Business rule violation: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ ProductAPI: Error bulk adjusting stock: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_products(
+    file: UploadFile = File(..., description="CSV, XLSX or JSONL file with a sku, name and unit_price per row"),
+    chunk_size: int = Query(500, ge=1, le=5000, description="Rows upserted per database call"),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    import_service: CatalogImportService = Depends(get_catalog_import_service),
+    _: bool = Depends(require_edit_projects_dep)
+):
+    """
+    Import a product catalog.
+    
+    Rows are matched on SKU: new SKUs are created and existing ones updated
+    with the columns present in the file. Stock levels are not touched.
+    Requires 'edit_projects' permission.
+    """
+    business_id = uuid.UUID(business_context["business_id"])
+    logger.info(f"🔧 ProductAPI: Importing products from {file.filename} for business {business_id}")
+    
+    try:
+        return await import_service.import_products(
+            business_id, file.file, file.filename or "", chunk_size=chunk_size
+        )
+        
+    except ValidationError as e:
+        logger.error(f"❌ ProductAPI: Validation error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ApplicationError as e:
+        logger.error(f"❌ ProductAPI: Import error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ ProductAPI: Error importing products: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
 @router.post("/{product_id}/reserve", response_model=StockActionResponse)
 async def reserve_stock(
     product_id: uuid.UUID = Path(..., description="Product ID"),
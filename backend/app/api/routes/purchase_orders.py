@@ -67,6 +67,7 @@ class ReceivePurchaseOrderSchema(BaseModel):
     received_items: List[ReceiveItemSchema] = Field(..., min_items=1)
     notes: Optional[str] = Field(None, max_length=2000)
     partial_receipt: bool = Field(default=False)
+    batch_id: Optional[uuid.UUID] = Field(None, description="Client-generated id; retries with the same id are applied once")
 
 class PurchaseOrderResponseSchema(BaseModel):
     """Schema for purchase order response."""
@@ -523,7 +524,8 @@ async def receive_purchase_order(
             user_id=user_id,
             business_id=business_id,
             partial_receipt=receive_data.partial_receipt,
-            notes=receive_data.notes
+            notes=receive_data.notes,
+            batch_id=receive_data.batch_id
         )
         
         logger.info(f"Successfully received items for purchase order {purchase_order_id}")
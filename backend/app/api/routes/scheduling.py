@@ -877,6 +877,7 @@ async def create_calendar_event(
             recurrence_count=request.recurrence_count,
             recurrence_interval=request.recurrence_interval,
             recurrence_days_of_week=request.recurrence_days_of_week,
+            recurrence_exception_dates=request.recurrence_exception_dates,
             blocks_scheduling=request.blocks_scheduling,
             allows_emergency_override=request.allows_emergency_override
         )
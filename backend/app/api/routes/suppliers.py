@@ -8,12 +8,12 @@ search functionality, and supplier relationship management.
 import uuid
 import logging
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
 from pydantic import BaseModel, Field
 
 from app.api.deps import get_current_user, get_business_context
 from app.infrastructure.config.dependency_injection import (
-    get_supplier_repository
+    get_supplier_repository, get_catalog_import_service
 )
 from app.domain.repositories.supplier_repository import SupplierRepository
 from app.domain.entities.supplier import Supplier, SupplierContact, PaymentTerms
@@ -21,7 +21,8 @@ from app.domain.entities.product_enums.enums import SupplierStatus
 from app.domain.exceptions.domain_exceptions import (
     EntityNotFoundError, DuplicateEntityError, BusinessRuleViolationError
 )
-from app.application.exceptions.application_exceptions import ValidationError
+from app.application.exceptions.application_exceptions import ValidationError, ApplicationError
+from app.application.services.catalog_import_service import CatalogImportService, ImportReport
 from app.domain.value_objects.address import Address
 
 logger = logging.getLogger(__name__)
@@ -683,6 +684,39 @@ async def search_suppliers(
             detail="Failed to search suppliers"
         )
 
+@router.post(
+    "/import",
+    response_model=ImportReport,
+    summary="Import Suppliers",
+    description="Bulk import suppliers from a CSV, XLSX or JSONL file, matched on supplier code"
+)
+async def import_suppliers(
+    file: UploadFile = File(..., description="CSV, XLSX or JSONL file with a supplier_code and name per row"),
+    chunk_size: int = Query(500, ge=1, le=5000, description="Rows upserted per database call"),
+    business_context: dict = Depends(get_business_context),
+    current_user: dict = Depends(get_current_user),
+    import_service: CatalogImportService = Depends(get_catalog_import_service)
+):
+    """Import suppliers, creating new ones and updating existing ones by supplier code."""
+    try:
+        business_id = uuid.UUID(business_context["business_id"])
+        logger.info(f"Importing suppliers from {file.filename} for business {business_id}")
+        
+        return await import_service.import_suppliers(
+            business_id, file.file, file.filename or "", chunk_size=chunk_size
+        )
+        
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ApplicationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error importing suppliers: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import suppliers"
+        )
+
 @router.get(
     "/{supplier_id}/performance",
     summary="Get Supplier Performance",
@@ -25,8 +25,8 @@ from app.application.services.content_orchestrator import (
 from app.infrastructure.database.repositories.supabase_business_repository import SupabaseBusinessRepository
 from app.infrastructure.database.repositories.supabase_contact_repository import SupabaseContactRepository
 from app.application.services.llm_content_generation_service import LLMContentGenerationService
+from app.infrastructure.adapters.content_generation_factory import create_failover_content_adapter
 from app.application.services.rag_retrieval_service import RAGRetrievalService
-from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +91,7 @@ async def get_content_orchestrator() -> ContentOrchestrator:
     
     business_repo = SupabaseBusinessRepository(supabase_client)
     contact_repo = SupabaseContactRepository(supabase_client)
-    llm_service = LLMContentGenerationService(openai_api_key=str(settings.OPENAI_API_KEY))
+    llm_service = LLMContentGenerationService(text_generator=create_failover_content_adapter())
     rag_service = RAGRetrievalService(supabase_client)
     
     return ContentOrchestrator(
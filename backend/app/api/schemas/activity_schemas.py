@@ -222,19 +222,12 @@ class ActivityResponse(BaseModel):
 
 
 class ActivityListResponse(BaseModel):
-    """Schema for paginated activity lists."""
+    """Schema for cursor-paginated activity lists."""
     activities: List[ActivityResponse] = Field(..., description="List of activities")
-    total_count: int = Field(..., description="Total number of activities")
-    skip: int = Field(..., description="Number of items skipped")
+    total_count: Optional[int] = Field(None, description="Estimated total number of activities, if requested")
     limit: int = Field(..., description="Maximum number of items returned")
     has_more: bool = Field(..., description="Whether there are more items")
-
-    @validator('has_more', always=True)
-    def calculate_has_more(cls, v, values):
-        """Calculate if there are more items."""
-        if 'total_count' in values and 'skip' in values and 'limit' in values:
-            return values['skip'] + values['limit'] < values['total_count']
-        return False
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 # Template schemas
@@ -379,4 +372,11 @@ class BulkOperationResponse(BaseModel):
 class PaginationParams(BaseModel):
     """Schema for pagination parameters."""
     skip: int = Field(default=0, ge=0, description="Number of items to skip")
-    limit: int = Field(default=50, ge=1, le=1000, description="Maximum number of items to return") 
\ No newline at end of file
+    limit: int = Field(default=50, ge=1, le=1000, description="Maximum number of items to return")
+
+
+class CursorPaginationParams(BaseModel):
+    """Schema for keyset (cursor) pagination parameters."""
+    limit: int = Field(default=50, ge=1, le=1000, description="Maximum number of items to return")
+    cursor: Optional[str] = Field(None, description="Cursor from the previous page's next_cursor")
+    include_total: bool = Field(default=False, description="Include an estimated total count") 
\ No newline at end of file
@@ -265,6 +265,7 @@ class ContactSearchRequest(BaseModel):
     never_contacted: Optional[bool] = Field(None, description="Filter never contacted contacts")
     skip: int = Field(0, ge=0, description="Number of records to skip")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of records to return")
+    cursor: Optional[str] = Field(None, description="Cursor from the previous page's next_cursor (search term results)")
     sort_by: str = Field("created_date", description="Field to sort by")
     sort_order: str = Field("desc", pattern="^(asc|desc)$", description="Sort order")
     include_user_details: UserDetailLevel = Field(UserDetailLevel.BASIC, description="Level of user detail to include")
@@ -272,7 +273,7 @@ class ContactSearchRequest(BaseModel):
 
 class ContactBulkUpdateRequest(BaseModel):
     """Request schema for bulk contact updates."""
-    contact_ids: List[uuid.UUID] = Field(..., min_items=1, max_items=1000, description="Contact IDs to update")
+    contact_ids: List[uuid.UUID] = Field(..., min_items=1, max_items=20000, description="Contact IDs to update")
     status: Optional[ContactStatusSchema] = Field(None, description="New status")
     priority: Optional[ContactPrioritySchema] = Field(None, description="New priority")
     assigned_to: Optional[str] = Field(None, description="User ID to assign contacts to")
@@ -465,11 +466,12 @@ class ContactResponse(BaseModel):
 class ContactListResponse(BaseModel):
     """Response schema for contact list with pagination."""
     contacts: List[ContactResponse] = Field(..., description="List of contacts")
-    total_count: int = Field(..., description="Total number of contacts")
-    page: int = Field(..., description="Current page number")
+    total_count: Optional[int] = Field(None, description="Total number of contacts (estimated for cursor pages)")
+    page: Optional[int] = Field(None, description="Current page number (offset pagination only)")
     per_page: int = Field(..., description="Number of contacts per page")
     has_next: bool = Field(..., description="Whether there are more pages")
     has_previous: bool = Field(..., description="Whether there are previous pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class ContactStatisticsResponse(BaseModel):
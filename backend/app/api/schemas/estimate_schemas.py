@@ -226,16 +226,60 @@ class EstimateResponseSchema(BaseModel):
 class EstimateListResponseSchema(BaseModel):
     """Schema for estimate list responses."""
     estimates: List[EstimateResponseSchema]
-    total_count: int
-    page: int
+    total_count: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 
+class EstimateSummaryResponseSchema(BaseModel):
+    """Schema for estimate rows on list screens (no line items)."""
+    id: uuid.UUID
+    business_id: uuid.UUID
+    estimate_number: Optional[str] = None
+    status: str
+    title: str
+    contact_id: Optional[uuid.UUID] = None
+    client_name: Optional[str] = None
+    client_email: Optional[str] = None
+    project_id: Optional[uuid.UUID] = None
+    job_id: Optional[uuid.UUID] = None
+    currency: str
+    subtotal: Decimal
+    tax_amount: Decimal
+    discount_amount: Decimal
+    total_amount: Decimal
+    issue_date: Optional[date] = None
+    valid_until: Optional[date] = None
+    created_by: Optional[str] = None
+    created_date: datetime
+    last_modified: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+        json_encoders = {
+            Decimal: lambda v: float(v),
+            uuid.UUID: lambda v: str(v),
+            datetime: lambda v: v.isoformat(),
+            date: lambda v: v.isoformat()
+        }
+
+
+class EstimateSummaryListResponseSchema(BaseModel):
+    """Schema for estimate summary list responses."""
+    estimates: List[EstimateSummaryResponseSchema]
+    total_count: Optional[int] = None
+    per_page: int
+    has_next: bool
+    has_prev: bool
+    next_cursor: Optional[str] = None
+
+
 class EstimateSearchSchema(BaseModel):
     """Schema for estimate search parameters."""
     search_term: Optional[str] = Field(None, max_length=200)
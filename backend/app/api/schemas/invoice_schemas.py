@@ -299,16 +299,60 @@ class InvoiceResponseSchema(BaseModel):
 class InvoiceListResponseSchema(BaseModel):
     """Schema for invoice list responses."""
     invoices: List[InvoiceResponseSchema]
-    total_count: int
-    page: int
+    total_count: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 
+class InvoiceSummaryResponseSchema(BaseModel):
+    """Schema for invoice rows on list screens (no line items or payments)."""
+    id: uuid.UUID
+    business_id: uuid.UUID
+    invoice_number: Optional[str] = None
+    status: str
+    title: str
+    contact_id: Optional[uuid.UUID] = None
+    client_name: Optional[str] = None
+    client_email: Optional[str] = None
+    project_id: Optional[uuid.UUID] = None
+    job_id: Optional[uuid.UUID] = None
+    estimate_id: Optional[uuid.UUID] = None
+    currency: str
+    total_amount: Decimal
+    amount_paid: Decimal
+    amount_due: Decimal
+    issue_date: Optional[date] = None
+    due_date: Optional[date] = None
+    created_by: Optional[str] = None
+    created_date: datetime
+    last_modified: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+        json_encoders = {
+            Decimal: lambda v: float(v),
+            uuid.UUID: lambda v: str(v),
+            datetime: lambda v: v.isoformat(),
+            date: lambda v: v.isoformat()
+        }
+
+
+class InvoiceSummaryListResponseSchema(BaseModel):
+    """Schema for invoice summary list responses."""
+    invoices: List[InvoiceSummaryResponseSchema]
+    total_count: Optional[int] = None
+    per_page: int
+    has_next: bool
+    has_prev: bool
+    next_cursor: Optional[str] = None
+
+
 class InvoiceSearchSchema(BaseModel):
     """Schema for invoice search parameters."""
     search_term: Optional[str] = Field(None, max_length=100)
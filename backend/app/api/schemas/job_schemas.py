@@ -573,19 +573,20 @@ class JobScheduleResponse(BaseModel):
 class JobListPaginatedResponse(BaseModel):
     """Schema for paginated job list response."""
     jobs: List[JobListResponse]
-    total: int
-    skip: int
+    total: Optional[int] = None
+    skip: Optional[int] = None
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
     model_config = {
         "json_schema_extra": {
             "example": {
                 "jobs": [],
                 "total": 150,
-                "skip": 0,
                 "limit": 20,
-                "has_more": True
+                "has_more": True,
+                "next_cursor": "WyIyMDI1LTAxLTE1VDEwOjMwOjAwKzAwOjAwIiwiYjJmMiJd"
             }
         }
     }
@@ -391,11 +391,12 @@ class ProductSearchSchema(BaseModel):
 class ProductListResponseSchema(BaseModel):
     """Schema for product list responses."""
     products: List[ProductResponseSchema]
-    total_count: int
-    page: int
+    total_count: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -463,6 +464,36 @@ class ProductActionResponse(BaseModel):
         }
 
 
+class BulkStockAdjustmentItemSchema(BaseModel):
+    """Schema for one line of a bulk stock adjustment."""
+    product_id: uuid.UUID
+    quantity_change: Decimal = Field(..., description="Quantity change (positive for increase, negative for decrease)")
+    adjustment_reason: str = Field(..., min_length=1, max_length=500, description="Reason for adjustment")
+    reference_number: Optional[str] = Field(None, max_length=100, description="Reference number")
+    notes: Optional[str] = Field(None, max_length=1000, description="Additional notes")
+
+    @validator('quantity_change')
+    def validate_quantity_change(cls, v):
+        if v == 0:
+            raise ValueError('Quantity change cannot be zero')
+        return v
+
+
+class BulkStockAdjustmentSchema(BaseModel):
+    """Schema for adjusting stock of many products at once."""
+    adjustments: List[BulkStockAdjustmentItemSchema] = Field(..., min_items=1, max_items=1000)
+    batch_id: Optional[uuid.UUID] = Field(None, description="Client-generated id; retries with the same id are applied once")
+
+
+class BulkStockAdjustmentResponse(BaseModel):
+    """Schema for bulk stock adjustment responses."""
+    success: bool = True
+    message: str
+    batch_id: uuid.UUID
+    movement_count: int
+    duplicate: bool = False
+
+
 class StockActionResponse(BaseModel):
     """Schema for stock action responses."""
     success: bool = True
@@ -676,6 +676,7 @@ class CalendarEvent(BaseModel):
     recurrence_count: Optional[int] = Field(None, ge=1, le=365, description="Number of occurrences")
     recurrence_interval: int = Field(1, ge=1, le=30, description="Recurrence interval")
     recurrence_days_of_week: List[int] = Field(default_factory=list, description="Days of week (0=Monday)")
+    recurrence_exception_dates: List[date] = Field(default_factory=list, description="Dates whose occurrence is skipped")
     
     # Scheduling impact
     blocks_scheduling: bool = Field(True, description="Blocks job scheduling")
@@ -729,6 +730,7 @@ class CreateCalendarEventRequest(BaseModel):
     recurrence_count: Optional[int] = Field(None, ge=1, le=365, description="Number of occurrences")
     recurrence_interval: int = Field(1, ge=1, le=30, description="Recurrence interval")
     recurrence_days_of_week: List[int] = Field(default_factory=list, description="Days of week (0=Monday)")
+    recurrence_exception_dates: List[date] = Field(default_factory=list, description="Dates whose occurrence is skipped")
     
     # Scheduling impact
     blocks_scheduling: bool = Field(True, description="Blocks job scheduling")
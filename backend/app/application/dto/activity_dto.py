@@ -83,11 +83,12 @@ class ActivityResponseDTO(BaseModel):
 
 
 class ActivityListDTO(BaseModel):
-    """DTO for paginated activity lists."""
+    """DTO for cursor-paginated activity lists."""
     activities: List[ActivityResponseDTO]
-    total_count: int
-    skip: int
+    total_count: Optional[int] = None
     limit: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class ActivityTemplateCreateDTO(BaseModel):
@@ -151,9 +152,11 @@ class TimelineResponseDTO(BaseModel):
     """DTO for timeline response data."""
     contact_id: uuid.UUID
     timeline_entries: List[TimelineEntryDTO]
-    total_count: int
-    skip: int
+    total_count: Optional[int] = None
+    skip: int = 0
     limit: int
+    next_cursor: Optional[str] = None
+    has_next: bool = False
     start_date: Optional[datetime]
     end_date: Optional[datetime]
 
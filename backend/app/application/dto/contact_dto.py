@@ -172,11 +172,12 @@ class ContactResponseDTO(BaseModel):
 class ContactListDTO(BaseModel):
     """DTO for contact list with pagination."""
     contacts: List[ContactResponseDTO]
-    total_count: int
-    page: int
+    total_count: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 
 class ContactSearchDTO(BaseModel):
@@ -200,6 +201,7 @@ class ContactSearchDTO(BaseModel):
     never_contacted: Optional[bool] = None
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
     sort_by: str = "created_date"
     sort_order: str = "desc"  # "asc" or "desc"
     include_user_details: UserDetailLevel = UserDetailLevel.BASIC
@@ -10,6 +10,7 @@ from datetime import datetime, date
 from decimal import Decimal
 from pydantic import BaseModel, Field
 
+from app.domain.shared.document_totals import LineTotals, compute_line_totals
 from app.domain.value_objects.address import Address
 
 
@@ -33,8 +34,9 @@ class InvoiceLineItemDTO(BaseModel):
     final_total: Optional[Decimal] = None
 
     @classmethod
-    def from_entity(cls, line_item) -> 'InvoiceLineItemDTO':
-        """Create DTO from domain entity."""
+    def from_entity(cls, line_item, amounts: Optional[LineTotals] = None) -> 'InvoiceLineItemDTO':
+        """Create DTO from domain entity, reusing precomputed line amounts when given."""
+        amounts = amounts or compute_line_totals(line_item)
         return cls(
             id=line_item.id,
             description=line_item.description,
@@ -46,10 +48,10 @@ class InvoiceLineItemDTO(BaseModel):
             discount_value=line_item.discount_value,
             tax_rate=line_item.tax_rate,
             notes=line_item.notes,
-            line_total=line_item.get_subtotal(),
-            discount_amount=line_item.get_discount_amount(),
-            tax_amount=line_item.get_tax_amount(),
-            final_total=line_item.get_total()
+            line_total=amounts.subtotal,
+            discount_amount=amounts.discount_amount,
+            tax_amount=amounts.tax_amount,
+            final_total=amounts.total
         )
 
 
@@ -150,7 +152,10 @@ class InvoiceDTO(BaseModel):
             client_address=invoice.client_address,
             title=invoice.title,
             description=invoice.description,
-            line_items=[InvoiceLineItemDTO.from_entity(item) for item in invoice.line_items],
+            line_items=[
+                InvoiceLineItemDTO.from_entity(item, amounts)
+                for item, amounts in zip(invoice.line_items, invoice.get_totals().lines)
+            ],
             currency=invoice.currency.value if hasattr(invoice.currency, 'value') else invoice.currency,
             tax_rate=invoice.tax_rate,
             tax_type=invoice.tax_type.value if hasattr(invoice.tax_type, 'value') else invoice.tax_type,
@@ -334,6 +334,7 @@ class CalendarEventDTO(BaseModel):
     recurrence_count: Optional[int] = None
     recurrence_interval: int = 1
     recurrence_days_of_week: List[int] = Field(default_factory=list)
+    recurrence_exception_dates: List[date] = Field(default_factory=list)
     blocks_scheduling: bool = True
     allows_emergency_override: bool = False
     created_date: Optional[datetime] = None
@@ -476,6 +477,7 @@ class CreateCalendarEventRequestDTO(BaseModel):
     recurrence_count: Optional[int] = None
     recurrence_interval: int = 1
     recurrence_days_of_week: List[int] = Field(default_factory=list)
+    recurrence_exception_dates: List[date] = Field(default_factory=list)
     blocks_scheduling: bool = True
     allows_emergency_override: bool = False
 
@@ -5,13 +5,19 @@ Interface/contract for content generation services.
 Defines what the application layer expects from content generators.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Dict, Any, List
 from dataclasses import dataclass
 
 from ...domain.entities.business import Business
 from ...domain.entities.business_branding import BusinessBranding
-from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
+from .text_generation_port import TextGenerationPort
+
+if TYPE_CHECKING:
+    # Website entities are not in the domain model yet; they are only used in annotations
+    from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 
 
 @dataclass
@@ -26,13 +32,14 @@ class ContentGenerationResult:
     warnings: List[str] = None
 
 
-class ContentGenerationPort(ABC):
+class ContentGenerationPort(TextGenerationPort):
     """
     Port (interface) for content generation services.
     
     This defines the contract that any content generation implementation
     must follow. The application layer depends on this interface, not
-    on specific implementations.
+    on specific implementations. Content generators also serve plain text
+    generation (TextGenerationPort).
     """
     
     @abstractmethod
@@ -0,0 +1,103 @@
+"""
+Generation Cache Port
+
+Port interface for a content-addressed cache of LLM generations.
+Generations are keyed by a hash of their canonicalized inputs, so identical
+inputs reuse a prior generation even when they come from different businesses
+or differ only in trivial formatting.
+"""
+
+import hashlib
+import json
+import re
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonicalize_generation_inputs(value: Any) -> Any:
+    """
+    Normalize generation inputs into a canonical, JSON-serializable form.
+
+    - Strings are stripped and internal whitespace is collapsed
+    - Dict keys are sorted and None/empty values are dropped
+    - Sets are sorted; lists and tuples keep their order
+    - Enums, decimals and dates are reduced to their string values
+    """
+
+    if isinstance(value, Enum):
+        return canonicalize_generation_inputs(value.value)
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value.normalize())
+    if isinstance(value, dict):
+        canonical = {}
+        for key in sorted(value, key=str):
+            item = canonicalize_generation_inputs(value[key])
+            if item is None or item == "" or item == [] or item == {}:
+                continue
+            canonical[str(key).strip()] = item
+        return canonical
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonicalize_generation_inputs(item) for item in value), key=str)
+    if isinstance(value, (list, tuple)):
+        return [canonicalize_generation_inputs(item) for item in value]
+    return value
+
+
+def build_generation_cache_key(namespace: str, inputs: Dict[str, Any]) -> str:
+    """
+    Build a content-addressed cache key for a generation.
+
+    Args:
+        namespace: Logical generation kind (e.g. "claude:page", "hero_content")
+        inputs: Everything that influences the generated output
+
+    Returns:
+        Cache key of the form ``llm_gen:<namespace>:<sha256 of canonical inputs>``
+    """
+
+    canonical = json.dumps(
+        canonicalize_generation_inputs(inputs),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"llm_gen:{namespace}:{digest}"
+
+
+class GenerationCachePort(ABC):
+    """Port interface for storing and retrieving cached LLM generations."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached generation.
+
+        Args:
+            key: Cache key from build_generation_cache_key
+
+        Returns:
+            The cached payload, or None on a miss or cache failure
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        """
+        Store a generation.
+
+        Args:
+            key: Cache key from build_generation_cache_key
+            value: JSON-serializable payload
+            ttl_seconds: Time to live in seconds
+        """
+        pass
@@ -0,0 +1,89 @@
+"""
+Idempotency Store Port
+
+Port interface for a TTL key store that remembers the outcome of write
+requests by client-supplied idempotency key. A retried request with the same
+key and the same payload gets the stored outcome back instead of being
+executed again.
+
+Records are JSON dicts:
+- {"state": "pending", "fingerprint": ...} while the first request runs
+- {"state": "completed", "fingerprint": ..., "response": ...} once it finished
+"""
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+IDEMPOTENCY_PENDING = "pending"
+IDEMPOTENCY_COMPLETED = "completed"
+
+
+def build_idempotency_key(scope: str, key: str) -> str:
+    """
+    Build a store key for a client idempotency key.
+
+    Args:
+        scope: What the key is unique within (e.g. "booking", or a caller and path)
+        key: Client-supplied idempotency key
+
+    Returns:
+        Store key of the form ``idempotency:<sha256 of scope and key>``
+    """
+
+    digest = hashlib.sha256(f"{scope}\n{key}".encode("utf-8")).hexdigest()
+    return f"idempotency:{digest}"
+
+
+def fingerprint_payload(payload: Any) -> str:
+    """Stable hash of a request payload, to detect a key reused for a different request."""
+
+    if isinstance(payload, bytes):
+        data = payload
+    else:
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class IdempotencyStorePort(ABC):
+    """Port interface for recording and replaying idempotent request outcomes."""
+
+    @abstractmethod
+    async def reserve(self, key: str, fingerprint: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
+        """
+        Atomically claim a key for a new request.
+
+        Args:
+            key: Store key from build_idempotency_key
+            fingerprint: Fingerprint of the request payload
+            ttl_seconds: How long the claim holds if the request never completes
+
+        Returns:
+            None if the key was free and is now pending for the caller, otherwise
+            the existing record
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, key: str, fingerprint: str, response: Dict[str, Any], ttl_seconds: int) -> None:
+        """
+        Store the outcome of a reserved request.
+
+        Args:
+            key: Store key from build_idempotency_key
+            fingerprint: Fingerprint of the request payload
+            response: JSON-serializable outcome to replay
+            ttl_seconds: Time to live in seconds
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """
+        Drop a reservation whose request failed, so the client can retry it.
+
+        Args:
+            key: Store key from build_idempotency_key
+        """
+        pass
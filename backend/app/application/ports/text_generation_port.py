@@ -0,0 +1,39 @@
+"""
+Text Generation Port
+
+Interface for single-prompt text generation by an LLM provider.
+Application services depend on this interface; provider SDKs, rate limiting
+and failover live behind it in the infrastructure layer.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class TextGenerationPort(ABC):
+    """Port (interface) for generating text from a prompt."""
+
+    @abstractmethod
+    async def generate_text(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> str:
+        """
+        Generate text for a prompt.
+
+        Args:
+            prompt: User prompt
+            system: System instructions for the model
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            Generated text
+
+        Raises:
+            Exception: If the provider call fails. Implementations must not
+                swallow errors, so callers and failover can react to them.
+        """
+        pass
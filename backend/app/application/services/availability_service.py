@@ -65,8 +65,9 @@ class AvailabilityService:
             # Get business hours for the date range
             business_hours = await self._get_business_hours(business_id)
             
-            # Get existing calendar events (bookings, blocks, etc.)
+            # Get existing calendar events (bookings, blocks, etc.) and slots held by customers
             calendar_events = await self._get_calendar_events(business_id, search_criteria)
+            calendar_events.extend(await self._get_slot_holds(business_id, search_criteria))
             
             # Generate availability slots based on business hours and existing events
             availability_slots = self._generate_availability_slots(
@@ -257,6 +258,41 @@ class AvailabilityService:
             # Return empty list if table doesn't exist or other error
             return []
     
+    async def _get_slot_holds(
+        self, 
+        business_id: str, 
+        search_criteria: AvailabilitySearchCriteria
+    ) -> List[CalendarEventDTO]:
+        """Get live slot holds as pending calendar events."""
+        try:
+            result = self.supabase.table("booking_slot_holds").select(
+                "id, service_id, starts_at, ends_at"
+            ).eq("business_id", business_id).lt(
+                "starts_at", (search_criteria.end_date + timedelta(days=1)).isoformat()
+            ).gt(
+                "ends_at", search_criteria.start_date.isoformat()
+            ).gt(
+                "expires_at", datetime.utcnow().isoformat()
+            ).execute()
+            
+            return [
+                CalendarEventDTO(
+                    id=str(hold_data["id"]),
+                    business_id=business_id,
+                    title="Held",
+                    start_datetime=datetime.fromisoformat(hold_data["starts_at"]),
+                    end_datetime=datetime.fromisoformat(hold_data["ends_at"]),
+                    event_type="hold",
+                    status="pending",
+                    service_id=hold_data.get("service_id")
+                )
+                for hold_data in result.data
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error getting slot holds: {str(e)}")
+            return []
+    
     def _generate_availability_slots(
         self,
         business_id: str,
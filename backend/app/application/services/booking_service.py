@@ -2,6 +2,7 @@
 Booking Service
 
 Manages the complete booking lifecycle including:
+- Holding slots while customers complete a booking
 - Creating new bookings with conflict detection
 - Confirming and scheduling appointments
 - Rescheduling with availability validation
@@ -10,6 +11,7 @@ Manages the complete booking lifecycle including:
 """
 
 import asyncio
+import secrets
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from uuid import UUID, uuid4
@@ -20,9 +22,12 @@ from ...domain.entities.booking import (
     BookingRequest, Booking, BookingResponse, BookingStatus,
     BookingConfirmationRequest, BookingRescheduleRequest, 
     BookingCancellationRequest, BookingEvent, BookingEventType,
-    CustomerContact, ContactMethod
+    CustomerContact, ContactMethod, SlotHold, SlotHoldRequest
 )
 from .availability_service import AvailabilityService
+from ..ports.idempotency_store_port import (
+    IdempotencyStorePort, IDEMPOTENCY_PENDING, build_idempotency_key, fingerprint_payload
+)
 from ..exceptions.application_exceptions import (
     BusinessNotFoundError, ServiceNotFoundError, ValidationError,
     ConflictError, NotFoundError
@@ -34,14 +39,82 @@ logger = logging.getLogger(__name__)
 class BookingService:
     """Service for managing booking operations and lifecycle"""
     
-    def __init__(self, supabase_client: Client, availability_service: AvailabilityService):
+    def __init__(
+        self,
+        supabase_client: Client,
+        availability_service: AvailabilityService,
+        idempotency_store: Optional[IdempotencyStorePort] = None
+    ):
         self.supabase = supabase_client
         self.availability_service = availability_service
+        self.idempotency_store = idempotency_store
         
         # Booking policies
         self.max_reschedule_hours = 24  # Must reschedule 24h in advance
         self.cancellation_fee_hours = 24  # Fee applies if cancelled < 24h
         self.booking_hold_minutes = 15  # Hold slot for 15 minutes during booking
+        
+        # Idempotency keys are remembered for 24 hours, and claimed for a minute while a create runs
+        self.idempotency_ttl_seconds = 24 * 60 * 60
+        self.idempotency_pending_seconds = 60
+    
+    async def hold_slot(self, request: SlotHoldRequest) -> SlotHold:
+        """
+        Hold a slot for the customer while they complete the booking
+        
+        The hold is taken atomically against other holds and confirmed
+        bookings, is honored by availability checks and lapses after
+        booking_hold_minutes unless converted by create_booking.
+        
+        Args:
+            request: Slot to hold
+            
+        Returns:
+            SlotHold whose hold_token must be passed to create_booking
+        """
+        try:
+            service_result = self.supabase.table('bookable_services').select(
+                'id, estimated_duration_minutes'
+            ).eq('id', str(request.service_id)).eq(
+                'business_id', str(request.business_id)
+            ).eq('is_bookable', True).single().execute()
+            
+            if not service_result.data:
+                raise ServiceNotFoundError(str(request.service_id))
+            
+            if request.starts_at <= datetime.utcnow():
+                raise ValidationError("Requested time must be in the future")
+            
+            ends_at = request.starts_at + timedelta(
+                minutes=service_result.data['estimated_duration_minutes']
+            )
+            
+            result = self.supabase.rpc('acquire_booking_slot_hold', {
+                'p_business_id': str(request.business_id),
+                'p_service_id': str(request.service_id),
+                'p_starts_at': request.starts_at.isoformat(),
+                'p_ends_at': ends_at.isoformat(),
+                'p_hold_token': secrets.token_urlsafe(32),
+                'p_ttl_seconds': self.booking_hold_minutes * 60,
+                'p_technician_id': str(request.technician_id) if request.technician_id else None
+            }).execute()
+            
+            if not result.data:
+                raise ConflictError("Requested time slot is not available")
+            
+            return SlotHold(**result.data[0])
+            
+        except Exception as e:
+            logger.error(f"Error holding slot for business {request.business_id}: {str(e)}")
+            raise
+    
+    async def release_hold(self, hold_token: str) -> bool:
+        """Release a hold that has not been converted into a booking"""
+        result = self.supabase.table('booking_slot_holds').delete().eq(
+            'hold_token', hold_token
+        ).is_('booking_id', 'null').execute()
+        
+        return bool(result.data)
     
     async def create_booking(
         self, 
@@ -58,28 +131,48 @@ class BookingService:
         Returns:
             BookingResponse with booking details and next steps
         """
+        store_key = None
+        
         try:
             # Validate the request
             await self._validate_booking_request(request)
             
             # Check for duplicate booking (idempotency)
             if request.idempotency_key:
-                existing_booking = await self._get_booking_by_idempotency_key(
-                    request.idempotency_key
-                )
+                if self.idempotency_store:
+                    key = build_idempotency_key("booking", request.idempotency_key)
+                    existing_booking = await self._reserve_idempotency_key(key, request)
+                    if not existing_booking:
+                        store_key = key  # Claimed for this request until it completes or fails
+                else:
+                    existing_booking = await self._get_booking_by_idempotency_key(
+                        request.idempotency_key
+                    )
+                
                 if existing_booking:
                     logger.info(f"Returning existing booking for idempotency key {request.idempotency_key}")
-                    return BookingResponse(
-                        booking=existing_booking,
-                        message="Booking already exists",
-                        next_steps=self._get_next_steps(existing_booking)
-                    )
+                    return self._existing_booking_response(existing_booking)
             
             # Get or create customer contact
             customer = await self._get_or_create_customer(request)
             
-            # Create the booking
-            booking = await self._create_booking_record(request, customer)
+            # Create the booking, converting the slot hold if there is one
+            try:
+                if request.hold_token:
+                    booking = await self._create_booking_from_hold(request, customer)
+                else:
+                    booking = await self._create_booking_record(request, customer)
+            except Exception:
+                # The key may have outlived its store record; the unique key constraint caught the duplicate
+                existing_booking = (
+                    await self._get_booking_by_idempotency_key(request.idempotency_key)
+                    if store_key else None
+                )
+                if not existing_booking:
+                    raise
+                await self._remember_idempotent_booking(store_key, request, existing_booking)
+                store_key = None
+                return self._existing_booking_response(existing_booking)
             
             # Log the creation event
             await self._log_booking_event(
@@ -99,6 +192,10 @@ class BookingService:
                     logger.warning(f"Auto-confirmation failed for booking {booking.id}: {str(e)}")
                     # Continue with pending status
             
+            if store_key:
+                await self._remember_idempotent_booking(store_key, request, booking)
+                store_key = None
+            
             response = BookingResponse(
                 booking=booking,
                 message="Booking request created successfully",
@@ -112,6 +209,8 @@ class BookingService:
             
         except Exception as e:
             logger.error(f"Error creating booking: {str(e)}")
+            if store_key:
+                await self.idempotency_store.release(store_key)
             raise
     
     async def confirm_booking(
@@ -170,6 +269,10 @@ class BookingService:
             # Refresh booking object
             booking = Booking(**result.data[0])
             
+            # A hold on the requested slot no longer covers the booking once it moves
+            if scheduled_at != booking.requested_at:
+                await self._release_booking_holds(booking.id)
+            
             # Log the confirmation event
             await self._log_booking_event(
                 booking.id,
@@ -263,6 +366,9 @@ class BookingService:
             # Refresh booking object
             booking = Booking(**result.data[0])
             
+            # The slot held for the old time is no longer needed
+            await self._release_booking_holds(booking.id)
+            
             # Log the reschedule event
             await self._log_booking_event(
                 booking.id,
@@ -354,6 +460,9 @@ class BookingService:
             # Refresh booking object
             booking = Booking(**result.data[0])
             
+            # Free the slot held for this booking
+            await self._release_booking_holds(booking.id)
+            
             # Log the cancellation event
             await self._log_booking_event(
                 booking.id,
@@ -392,6 +501,74 @@ class BookingService:
             logger.error(f"Error cancelling booking {request.booking_id}: {str(e)}")
             raise
     
+    async def update_booking_status(
+        self,
+        booking_id: UUID,
+        new_status: BookingStatus,
+        reason: Optional[str] = None,
+        triggered_by: str = "admin"
+    ) -> BookingResponse:
+        """
+        Manually move a booking to a new status
+        
+        Args:
+            booking_id: Booking to update
+            new_status: Status to set
+            reason: Optional reason for the change
+            triggered_by: Who made the change
+            
+        Returns:
+            BookingResponse with updated booking
+        """
+        try:
+            booking = await self._get_booking(booking_id)
+            if not booking:
+                raise NotFoundError("Booking", str(booking_id))
+            
+            old_status = booking.status
+            if old_status == new_status:
+                raise ValidationError(f"Booking is already {new_status.value}")
+            
+            result = self.supabase.table('bookings').update({
+                'status': new_status.value,
+                'updated_at': datetime.utcnow().isoformat()
+            }).eq('id', str(booking.id)).eq('status', old_status.value).execute()
+            
+            if not result.data:
+                raise ConflictError("Failed to update booking status - may have been modified")
+            
+            booking = Booking(**result.data[0])
+            
+            # The appointment is over, so its slot is free again
+            if new_status in (BookingStatus.COMPLETED, BookingStatus.NO_SHOW, BookingStatus.CANCELLED):
+                await self._release_booking_holds(booking.id)
+            
+            await self._log_booking_event(
+                booking.id,
+                BookingEventType.COMPLETED if new_status == BookingStatus.COMPLETED else BookingEventType.STATUS_CHANGED,
+                old_status,
+                new_status,
+                triggered_by=triggered_by,
+                reason=reason
+            )
+            
+            if booking.scheduled_at:
+                await self.availability_service.invalidate_availability_cache(
+                    booking.business_id,
+                    booking.service_id,
+                    (booking.scheduled_at.date(), booking.scheduled_at.date())
+                )
+            
+            return BookingResponse(
+                booking=booking,
+                message=f"Booking status updated to {new_status.value}",
+                next_steps=self._get_next_steps(booking)
+            )
+            
+        except Exception as e:
+            logger.error(f"Error updating status of booking {booking_id}: {str(e)}")
+            raise
+    
     async def get_booking(self, booking_id: UUID) -> Optional[Booking]:
         """Get booking by ID"""
         return await self._get_booking(booking_id)
@@ -478,6 +655,54 @@ class BookingService:
         except Exception:
             return None
     
+    def _idempotency_fingerprint(self, request: BookingRequest) -> str:
+        """Fingerprint of what the customer asked for, ignoring client metadata"""
+        return fingerprint_payload(
+            request.model_dump(mode='json', exclude={'user_agent', 'ip_address', 'hold_token'})
+        )
+    
+    async def _reserve_idempotency_key(self, store_key: str, request: BookingRequest) -> Optional[Booking]:
+        """
+        Claim the request's idempotency key in the store, or get the booking it
+        already produced, without querying the bookings table
+        """
+        fingerprint = self._idempotency_fingerprint(request)
+        record = await self.idempotency_store.reserve(
+            store_key, fingerprint, self.idempotency_pending_seconds
+        )
+        if record is None:
+            return None
+        
+        if record.get('fingerprint') != fingerprint:
+            raise ConflictError("Idempotency key was already used for a different booking")
+        
+        if record.get('state') == IDEMPOTENCY_PENDING:
+            raise ConflictError("A booking with this idempotency key is already being created")
+        
+        return Booking(**record['response'])
+    
+    async def _remember_idempotent_booking(
+        self, 
+        store_key: str, 
+        request: BookingRequest, 
+        booking: Booking
+    ) -> None:
+        """Record the booking created for the request's idempotency key"""
+        await self.idempotency_store.complete(
+            store_key,
+            self._idempotency_fingerprint(request),
+            booking.model_dump(mode='json'),
+            self.idempotency_ttl_seconds
+        )
+    
+    def _existing_booking_response(self, booking: Booking) -> BookingResponse:
+        """Response for a retried create that already produced a booking"""
+        return BookingResponse(
+            booking=booking,
+            message="Booking already exists",
+            next_steps=self._get_next_steps(booking)
+        )
+    
     async def _get_or_create_customer(self, request: BookingRequest) -> CustomerContact:
         """Get existing customer or create new one"""
         try:
@@ -556,6 +781,38 @@ class BookingService:
     ) -> Booking:
         """Create the booking record in database"""
         
+        booking_data = await self._build_booking_data(request, customer)
+        
+        result = self.supabase.table('bookings').insert(booking_data).execute()
+        return Booking(**result.data[0])
+    
+    async def _create_booking_from_hold(
+        self, 
+        request: BookingRequest, 
+        customer: CustomerContact
+    ) -> Booking:
+        """Create the booking record and convert its slot hold in one transaction"""
+        
+        booking_data = await self._build_booking_data(request, customer)
+        
+        result = self.supabase.rpc('create_booking_from_hold', {
+            'p_hold_token': request.hold_token,
+            'p_starts_at': request.requested_at.isoformat(),
+            'p_booking': booking_data
+        }).execute()
+        
+        if not result.data:
+            raise ConflictError("Slot hold has expired or does not match the requested slot")
+        
+        return Booking(**result.data[0])
+    
+    async def _build_booking_data(
+        self, 
+        request: BookingRequest, 
+        customer: CustomerContact
+    ) -> Dict[str, Any]:
+        """Booking row for a request, with a snapshot of the service"""
+        
         # Get service details for snapshot
         service_result = self.supabase.table('bookable_services').select('*').eq(
             'id', str(request.service_id)
@@ -592,22 +849,13 @@ class BookingService:
             'created_at': datetime.utcnow().isoformat()
         }
         
-        result = self.supabase.table('bookings').insert(booking_data).execute()
-        return Booking(**result.data[0])
+        return booking_data
     
     async def _auto_confirm_booking(self, booking: Booking) -> Booking:
         """Attempt to automatically confirm a booking"""
         
-        # Check if the requested time is still available
+        # confirm_booking checks the requested time is still available
         try:
-            await self._validate_booking_time_available(
-                booking.business_id,
-                booking.service_id,
-                booking.requested_at,
-                booking.estimated_duration_minutes
-            )
-            
-            # Auto-confirm the booking
             confirmation_request = BookingConfirmationRequest(
                 booking_id=booking.id,
                 scheduled_at=booking.requested_at,
@@ -661,6 +909,35 @@ class BookingService:
                 
                 # For now, assume conflict (would need more sophisticated capacity management)
                 raise ConflictError("Requested time slot is not available")
+        
+        # Check for slots held by other customers
+        holds = self.supabase.table('booking_slot_holds').select(
+            'technician_id, booking_id'
+        ).eq('business_id', str(business_id)).lt(
+            'starts_at', end_time.isoformat()
+        ).gt('ends_at', scheduled_at.isoformat()).gt(
+            'expires_at', datetime.utcnow().isoformat()
+        ).execute()
+        
+        for hold in holds.data:
+            if exclude_booking_id and hold['booking_id'] == str(exclude_booking_id):
+                continue
+            
+            if (preferred_technician_id and hold['technician_id'] and
+                    hold['technician_id'] != str(preferred_technician_id)):
+                continue
+            
+            raise ConflictError("Requested time slot is being held by another customer")
+    
+    async def _release_booking_holds(self, booking_id: UUID) -> None:
+        """Release slot holds converted into a booking"""
+        try:
+            self.supabase.table('booking_slot_holds').delete().eq(
+                'booking_id', str(booking_id)
+            ).execute()
+            
+        except Exception as e:
+            logger.error(f"Error releasing slot holds for booking {booking_id}: {str(e)}")
     
     async def _get_booking(self, booking_id: UUID) -> Optional[Booking]:
         """Get booking by ID"""
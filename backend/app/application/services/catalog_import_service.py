@@ -0,0 +1,316 @@
+"""
+Catalog Import Application Service
+
+Streams supplier and product catalog files (CSV, XLSX, JSONL) into the
+repositories in fixed-size chunks. Rows are read and validated one at a time,
+so memory stays flat regardless of file size; only the set of supplier codes
+or SKUs already seen is kept, to reject duplicates within the file.
+"""
+
+import csv
+import io
+import json
+import uuid
+import logging
+from decimal import Decimal
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field, ValidationError as PydanticValidationError, field_validator
+
+from ..exceptions.application_exceptions import ApplicationError, ValidationError
+from ...domain.entities.product_enums.enums import ProductStatus, ProductType, SupplierStatus
+from ...domain.exceptions.domain_exceptions import DatabaseError
+from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.supplier_repository import SupplierRepository
+from ...domain.shared.enums import UnitOfMeasure
+
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+# (row number, raw values, read error)
+RawRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+ChunkUpsert = Callable[[List[Dict[str, Any]]], Awaitable[int]]
+
+
+class SupplierImportRow(BaseModel):
+    """One supplier row of an import file."""
+    supplier_code: str = Field(..., min_length=1, max_length=50)
+    name: str = Field(..., min_length=1, max_length=200)
+    email: Optional[str] = Field(None, max_length=255)
+    phone: Optional[str] = Field(None, max_length=50)
+    website: Optional[str] = Field(None, max_length=255)
+    tax_id: Optional[str] = Field(None, max_length=50)
+    category: Optional[str] = Field(None, max_length=100)
+    currency: Optional[str] = Field(None, min_length=3, max_length=3)
+    payment_terms_days: Optional[int] = Field(None, ge=0, le=365)
+    primary_contact_name: Optional[str] = Field(None, max_length=100)
+    status: Optional[SupplierStatus] = None
+
+
+class ProductImportRow(BaseModel):
+    """One product row of an import file."""
+    sku: str = Field(..., min_length=1, max_length=100)
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    unit_price: Decimal = Field(..., ge=0)
+    cost_price: Optional[Decimal] = Field(None, ge=0)
+    product_type: Optional[ProductType] = None
+    status: Optional[ProductStatus] = None
+    unit_of_measure: Optional[UnitOfMeasure] = None
+    barcode: Optional[str] = Field(None, max_length=100)
+    supplier_sku: Optional[str] = Field(None, max_length=100)
+    reorder_point: Optional[Decimal] = Field(None, ge=0)
+    reorder_quantity: Optional[Decimal] = Field(None, ge=0)
+    track_inventory: Optional[bool] = None
+    tags: Optional[List[str]] = None
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [tag.strip() for tag in value.split(",") if tag.strip()]
+        return value
+
+
+class ImportRowError(BaseModel):
+    """A row that was not imported."""
+    row: int
+    key: Optional[str] = None
+    message: str
+
+
+class ImportReport(BaseModel):
+    """Outcome of a catalog import."""
+    total_rows: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = Field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, row: int, message: str, key: Optional[str] = None) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(row=row, key=key, message=message))
+        else:
+            self.errors_truncated = True
+
+
+def _normalize_header(header: Any) -> str:
+    return str(header or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _clean_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop blank cells so they leave existing values unchanged."""
+    cleaned = {}
+    for key, value in values.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if key and value is not None and value != "":
+            cleaned[key] = value
+    return cleaned
+
+
+def _iter_csv(stream: BinaryIO) -> Iterator[RawRow]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    headers = [_normalize_header(header) for header in next(reader, [])]
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        yield reader.line_num, _clean_values(dict(zip(headers, row))), None
+    text.detach()
+
+
+def _iter_jsonl(stream: BinaryIO) -> Iterator[RawRow]:
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, _clean_values({_normalize_header(k): v for k, v in record.items()}), None
+
+
+def _iter_xlsx(stream: BinaryIO) -> Iterator[RawRow]:
+    if load_workbook is None:
+        raise ImportError("openpyxl is required for XLSX imports. Install with: pip install openpyxl")
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [_normalize_header(header) for header in next(rows, ())]
+        for row_number, row in enumerate(rows, start=2):
+            if all(cell is None or cell == "" for cell in row):
+                continue
+            yield row_number, _clean_values(dict(zip(headers, row))), None
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(stream: BinaryIO, filename: str) -> Iterator[RawRow]:
+    """
+    Yield (row number, values, read error) for each data row of an import file.
+
+    The format is taken from the file extension. Headers are normalized to
+    snake_case and blank cells are omitted.
+    """
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if extension == "csv":
+        return _iter_csv(stream)
+    if extension in ("jsonl", "ndjson"):
+        return _iter_jsonl(stream)
+    if extension == "xlsx":
+        return _iter_xlsx(stream)
+    raise ValidationError(f"Unsupported import file type: {filename}. Use CSV, XLSX or JSONL")
+
+
+class CatalogImportService:
+    """
+    Application service for bulk supplier and product imports.
+
+    Validated rows are buffered until chunk_size of them are pending, then
+    upserted in one repository call keyed by supplier code or SKU.
+    """
+
+    def __init__(
+        self,
+        supplier_repository: SupplierRepository,
+        product_repository: ProductRepository,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.supplier_repository = supplier_repository
+        self.product_repository = product_repository
+        self.chunk_size = chunk_size
+
+    async def import_suppliers(
+        self,
+        business_id: uuid.UUID,
+        stream: BinaryIO,
+        filename: str,
+        chunk_size: Optional[int] = None
+    ) -> ImportReport:
+        """Import suppliers, matched on supplier code."""
+
+        async def upsert(rows: List[Dict[str, Any]]) -> int:
+            result = await self.supplier_repository.import_suppliers(business_id, rows)
+            return result["imported"]
+
+        return await self._run_import(
+            business_id, iter_import_rows(stream, filename), SupplierImportRow, "supplier_code", upsert,
+            chunk_size or self.chunk_size
+        )
+
+    async def import_products(
+        self,
+        business_id: uuid.UUID,
+        stream: BinaryIO,
+        filename: str,
+        chunk_size: Optional[int] = None
+    ) -> ImportReport:
+        """Import products, matched on SKU."""
+
+        async def upsert(rows: List[Dict[str, Any]]) -> int:
+            return await self.product_repository.upsert_by_sku(business_id, rows)
+
+        return await self._run_import(
+            business_id, iter_import_rows(stream, filename), ProductImportRow, "sku", upsert,
+            chunk_size or self.chunk_size
+        )
+
+    async def _run_import(
+        self,
+        business_id: uuid.UUID,
+        rows: Iterator[RawRow],
+        row_model: Type[BaseModel],
+        key_field: str,
+        upsert: ChunkUpsert,
+        chunk_size: int
+    ) -> ImportReport:
+        report = ImportReport()
+        seen: Dict[str, int] = {}
+        chunk: List[Tuple[int, str, Dict[str, Any]]] = []
+
+        try:
+            for row_number, values, read_error in rows:
+                report.total_rows += 1
+
+                if read_error:
+                    report.failed += 1
+                    report.add_error(row_number, read_error)
+                    continue
+
+                try:
+                    record = row_model.model_validate(values)
+                except PydanticValidationError as e:
+                    report.failed += 1
+                    report.add_error(row_number, _format_validation_error(e), values.get(key_field))
+                    continue
+
+                key = getattr(record, key_field)
+                first_row = seen.get(key)
+                if first_row is not None:
+                    report.duplicates += 1
+                    report.add_error(row_number, f"Duplicate {key_field} (first seen on row {first_row})", key)
+                    continue
+                seen[key] = row_number
+
+                chunk.append((row_number, key, record.model_dump(mode="json", exclude_unset=True)))
+
+                if len(chunk) >= chunk_size:
+                    await self._flush(chunk, upsert, report)
+                    chunk = []
+
+            if chunk:
+                await self._flush(chunk, upsert, report)
+
+        except UnicodeDecodeError:
+            raise ValidationError("Import file must be UTF-8 encoded")
+        except csv.Error as e:
+            raise ValidationError(f"Malformed CSV file: {str(e)}")
+        except ImportError as e:
+            raise ApplicationError(str(e))
+
+        logger.info(
+            f"Imported {report.imported}/{report.total_rows} rows for business {business_id} "
+            f"({report.duplicates} duplicates, {report.failed} failed)"
+        )
+        return report
+
+    async def _flush(self, chunk: List[Tuple[int, str, Dict[str, Any]]], upsert: ChunkUpsert, report: ImportReport) -> None:
+        """
+        Upsert one chunk. Rows are grouped by the columns they carry, since a
+        bulk upsert writes the same columns for every row.
+        """
+        groups: Dict[Tuple[str, ...], List[Tuple[int, str, Dict[str, Any]]]] = {}
+        for entry in chunk:
+            groups.setdefault(tuple(sorted(entry[2])), []).append(entry)
+
+        for entries in groups.values():
+            try:
+                report.imported += await upsert([data for _, _, data in entries])
+            except DatabaseError as e:
+                report.failed += len(entries)
+                for row_number, key, _ in entries:
+                    report.add_error(row_number, str(e), key)
+
+
+def _format_validation_error(error: PydanticValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
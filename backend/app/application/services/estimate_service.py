@@ -111,16 +111,17 @@ class EstimateService:
         business_id: uuid.UUID,
         user_id: str,
         filters: Optional[Union[EstimateFilters, Dict[str, Any]]] = None,
-        skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
-        """List estimates with filtering and pagination."""
+        """List estimates with filtering and keyset pagination."""
         try:
             if isinstance(filters, dict):
                 filters = EstimateFilters(**filters) if filters else None
                 
             return await self.list_use_case.execute(
-                business_id, user_id, filters, skip, limit
+                business_id, user_id, filters, limit, cursor, include_total
             )
             
         except Exception as e:
@@ -205,7 +206,7 @@ class EstimateService:
         try:
             filters = EstimateFilters(search_term=search_term)
             return await self.list_estimates(
-                business_id, user_id, filters, 0, limit
+                business_id, user_id, filters, limit
             )
             
         except Exception as e:
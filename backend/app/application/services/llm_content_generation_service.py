@@ -15,13 +15,16 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 
-import openai
 from redis.asyncio import Redis as AsyncRedis
 import httpx
 
+from ..ports.generation_cache_port import GenerationCachePort, build_generation_cache_key
+from ..ports.text_generation_port import TextGenerationPort
+from ...infrastructure.stores.generation_cache_adapter import RedisGenerationCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,15 +61,43 @@ class GeneratedContent:
     generation_timestamp: datetime = None
 
 
+# Request fields each content type's prompt actually reads, as
+# {request attribute: keys used, or None when the whole value is interpolated}.
+# Only these feed the cache key, so requests that would produce the same prompt
+# share the same generation. Content types without an entry key on every field.
+PROMPT_INPUT_FIELDS: Dict[ContentType, Dict[str, Optional[tuple]]] = {
+    ContentType.HERO_CONTENT: {
+        'business_context': (
+            'name', 'city', 'state', 'years_in_business', 'team_size', 'specialties', 'service_areas'
+        ),
+        'trade_config': ('display_name', 'emergency_services', 'service_model', 'key_benefits'),
+        'seasonal_context': ('season',),
+        'weather_context': ('condition', 'temperature'),
+        'local_market_data': None,
+    },
+    ContentType.SERVICE_DESCRIPTION: {
+        'business_context': ('name', 'years_in_business', 'certifications', 'service_philosophy'),
+        'trade_config': ('display_name', 'service_categories', 'typical_projects', 'quality_standards'),
+    },
+    ContentType.SEASONAL_MESSAGE: {
+        'trade_config': ('display_name', 'seasonal_patterns', 'weather_considerations'),
+        'seasonal_context': ('season', 'challenges'),
+        'weather_context': ('condition', 'temperature'),
+    },
+}
+
+
 class LLMContentGenerationService:
     def __init__(
         self,
-        openai_api_key: str,
+        text_generator: TextGenerationPort,
         redis_client: Optional[AsyncRedis] = None,
-        weather_api_key: Optional[str] = None
+        weather_api_key: Optional[str] = None,
+        generation_cache: Optional[GenerationCachePort] = None
     ):
-        self.openai_client = openai.AsyncOpenAI(api_key=openai_api_key)
+        self.text_generator = text_generator
         self.redis_client = redis_client or AsyncRedis(host='localhost', port=6379, db=0)
+        self.generation_cache = generation_cache or RedisGenerationCache(self.redis_client)
         self.weather_api_key = weather_api_key
         
         # Content generation templates
@@ -266,24 +297,15 @@ class LLMContentGenerationService:
         prompt = self._build_hero_prompt(request)
         
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert copywriter specializing in home services marketing. Create compelling, trustworthy, and locally-relevant hero content that converts visitors into customers."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=500
+            response_text = await self.text_generator.generate_text(
+                prompt,
+                system="You are an expert copywriter specializing in home services marketing. Create compelling, trustworthy, and locally-relevant hero content that converts visitors into customers.",
+                max_tokens=500,
+                temperature=0.7
             )
             
             # Parse the response
-            content_data = self._parse_hero_response(response.choices[0].message.content)
+            content_data = self._parse_hero_response(response_text)
             
             return GeneratedContent(
                 content_type=ContentType.HERO_CONTENT,
@@ -308,23 +330,14 @@ class LLMContentGenerationService:
         prompt = self._build_service_description_prompt(request)
         
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a technical writer specializing in home services. Create clear, informative, and persuasive service descriptions that educate customers and build trust."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.6,
-                max_tokens=400
+            response_text = await self.text_generator.generate_text(
+                prompt,
+                system="You are a technical writer specializing in home services. Create clear, informative, and persuasive service descriptions that educate customers and build trust.",
+                max_tokens=400,
+                temperature=0.6
             )
             
-            content = response.choices[0].message.content.strip()
+            content = response_text
             
             return GeneratedContent(
                 content_type=ContentType.SERVICE_DESCRIPTION,
@@ -346,23 +359,14 @@ class LLMContentGenerationService:
         prompt = self._build_seasonal_prompt(request)
         
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a marketing specialist creating seasonal messaging for home services. Focus on timely, relevant, and actionable content that addresses seasonal needs."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.8,
-                max_tokens=300
+            response_text = await self.text_generator.generate_text(
+                prompt,
+                system="You are a marketing specialist creating seasonal messaging for home services. Focus on timely, relevant, and actionable content that addresses seasonal needs.",
+                max_tokens=300,
+                temperature=0.8
             )
             
-            content = response.choices[0].message.content.strip()
+            content = response_text
             
             return GeneratedContent(
                 content_type=ContentType.SEASONAL_MESSAGE,
@@ -628,29 +632,38 @@ Focus on being helpful and timely rather than pushy.
         )
 
     def _get_cache_key(self, request: ContentGenerationRequest) -> str:
-        """Generate cache key for the request."""
+        """Generate a content-addressed cache key from the request's normalized prompt inputs."""
         
-        key_parts = [
-            request.content_type.value,
-            request.business_context.get('id', 'default'),
-            request.trade_config.get('slug', 'general'),
-            request.target_audience
-        ]
+        prompt_fields = PROMPT_INPUT_FIELDS.get(request.content_type)
+        if prompt_fields is None:
+            prompt_fields = {field.name: None for field in fields(request) if field.name != 'content_type'}
         
-        # Add seasonal context to key for time-sensitive content
-        if request.seasonal_context:
-            key_parts.append(request.seasonal_context.get('season', 'none'))
+        inputs = {}
+        for attribute, keys in prompt_fields.items():
+            value = getattr(request, attribute)
+            if keys is not None:
+                value = value or {}
+                value = {key: value.get(key) for key in keys}
+            inputs[attribute] = value
         
-        return f"llm_content:{':'.join(key_parts)}"
+        return build_generation_cache_key(request.content_type.value, inputs)
 
     async def _get_cached_content(self, cache_key: str) -> Optional[GeneratedContent]:
         """Retrieve cached content if available."""
         
         try:
-            cached_data = await self.redis_client.get(cache_key)
-            if cached_data:
-                data = json.loads(cached_data)
-                return GeneratedContent(**data)
+            data = await self.generation_cache.get(cache_key)
+            if data:
+                timestamp = data.get('generation_timestamp')
+                return GeneratedContent(
+                    content_type=ContentType(data['content_type']),
+                    primary_text=data['primary_text'],
+                    secondary_text=data.get('secondary_text'),
+                    cta_text=data.get('cta_text'),
+                    metadata=data.get('metadata'),
+                    confidence_score=data.get('confidence_score', 0.0),
+                    generation_timestamp=datetime.fromisoformat(timestamp) if timestamp else None
+                )
         except Exception as e:
             logger.warning(f"Failed to retrieve cached content: {e}")
         
@@ -664,25 +677,18 @@ Focus on being helpful and timely rather than pushy.
     ) -> None:
         """Cache generated content."""
         
-        try:
-            ttl = self.cache_ttl.get(content_type, 3600)
-            content_data = {
-                'content_type': content.content_type.value,
-                'primary_text': content.primary_text,
-                'secondary_text': content.secondary_text,
-                'cta_text': content.cta_text,
-                'metadata': content.metadata,
-                'confidence_score': content.confidence_score,
-                'generation_timestamp': content.generation_timestamp.isoformat() if content.generation_timestamp else None
-            }
-            
-            await self.redis_client.setex(
-                cache_key, 
-                ttl, 
-                json.dumps(content_data, default=str)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to cache content: {e}")
+        ttl = self.cache_ttl.get(content_type, 3600)
+        content_data = {
+            'content_type': content.content_type.value,
+            'primary_text': content.primary_text,
+            'secondary_text': content.secondary_text,
+            'cta_text': content.cta_text,
+            'metadata': content.metadata,
+            'confidence_score': content.confidence_score,
+            'generation_timestamp': content.generation_timestamp.isoformat() if content.generation_timestamp else None
+        }
+        
+        await self.generation_cache.set(cache_key, content_data, ttl)
 
     def _load_content_templates(self) -> Dict[str, Any]:
         """Load content generation templates."""
@@ -719,7 +725,7 @@ Focus on being helpful and timely rather than pushy.
 
 # Usage example and factory function
 async def create_llm_content_service(
-    openai_api_key: str,
+    text_generator: TextGenerationPort,
     redis_host: str = 'localhost',
     redis_port: int = 6379,
     weather_api_key: Optional[str] = None
@@ -729,7 +735,7 @@ async def create_llm_content_service(
     redis_client = AsyncRedis(host=redis_host, port=redis_port, db=0)
     
     return LLMContentGenerationService(
-        openai_api_key=openai_api_key,
+        text_generator=text_generator,
         redis_client=redis_client,
         weather_api_key=weather_api_key
     )
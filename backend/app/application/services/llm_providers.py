@@ -1,121 +0,0 @@
-"""
-LLM Provider implementations for content generation.
-"""
-
-import logging
-from abc import ABC, abstractmethod
-from typing import Optional
-
-import openai
-import anthropic
-
-logger = logging.getLogger(__name__)
-
-
-class LLMProvider(ABC):
-    """Abstract base class for LLM providers."""
-    
-    @abstractmethod
-    async def generate_text(
-        self, 
-        prompt: str, 
-        max_tokens: int = 1000,
-        temperature: float = 0.7,
-        **kwargs
-    ) -> str:
-        """Generate text from prompt."""
-        pass
-    
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Provider name for logging."""
-        pass
-
-
-class OpenAIProvider(LLMProvider):
-    """OpenAI GPT provider."""
-    
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        self.client = openai.AsyncOpenAI(api_key=api_key)
-        self.model = model
-    
-    async def generate_text(
-        self, 
-        prompt: str, 
-        max_tokens: int = 1000,
-        temperature: float = 0.7,
-        **kwargs
-    ) -> str:
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=temperature,
-                **kwargs
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"OpenAI generation failed: {e}")
-            raise
-    
-    @property
-    def name(self) -> str:
-        return f"openai-{self.model}"
-
-
-class AnthropicProvider(LLMProvider):
-    """Anthropic Claude provider."""
-    
-    def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229"):
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
-        self.model = model
-    
-    async def generate_text(
-        self, 
-        prompt: str, 
-        max_tokens: int = 1000,
-        temperature: float = 0.7,
-        **kwargs
-    ) -> str:
-        try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=[{"role": "user", "content": prompt}],
-                **kwargs
-            )
-            return response.content[0].text.strip()
-        except Exception as e:
-            logger.error(f"Anthropic generation failed: {e}")
-            raise
-    
-    @property
-    def name(self) -> str:
-        return f"anthropic-{self.model}"
-
-
-class GeminiProvider(LLMProvider):
-    """Google Gemini provider (placeholder implementation)."""
-    
-    def __init__(self, project_id: str, location: str = "us-central1", model: str = "gemini-pro"):
-        self.project_id = project_id
-        self.location = location
-        self.model = model
-    
-    async def generate_text(
-        self, 
-        prompt: str, 
-        max_tokens: int = 1000,
-        temperature: float = 0.7,
-        **kwargs
-    ) -> str:
-        # Placeholder - would implement actual Gemini API calls
-        logger.warning("Gemini provider not fully implemented")
-        raise NotImplementedError("Gemini provider requires additional setup")
-    
-    @property
-    def name(self) -> str:
-        return f"gemini-{self.model}"
@@ -0,0 +1,236 @@
+"""
+Receivables Report Application Service
+
+AR aging, revenue by period and DSO for month-end close. Aggregates come from
+the database in one call; CSV exports stream invoice rows page by page, so a
+large ledger is never held in memory.
+"""
+
+import csv
+import io
+import uuid
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import AsyncIterator, Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ..exceptions.application_exceptions import ApplicationError, ValidationError
+from ...domain.exceptions.domain_exceptions import DatabaseError
+from ...domain.repositories.invoice_repository import InvoiceRepository
+
+logger = logging.getLogger(__name__)
+
+REPORT_PERIODS = ("day", "week", "month", "quarter", "year")
+EXPORT_PAGE_SIZE = 500
+MAX_REPORT_DAYS = 366 * 5
+
+AGING_CSV_COLUMNS = [
+    "invoice_number", "client_name", "status", "issue_date", "due_date", "currency",
+    "total_amount", "amount_paid", "balance", "days_past_due", "aging_bucket"
+]
+REVENUE_CSV_COLUMNS = ["period_start", "invoice_count", "invoiced", "payment_count", "collected"]
+
+
+class AgingBuckets(BaseModel):
+    """Outstanding balance per days-past-due bucket."""
+    invoice_count: int = 0
+    total_outstanding: Decimal = Decimal("0")
+    days_0_30: Decimal = Field(Decimal("0"), alias="0_30")
+    days_31_60: Decimal = Field(Decimal("0"), alias="31_60")
+    days_61_90: Decimal = Field(Decimal("0"), alias="61_90")
+    days_90_plus: Decimal = Field(Decimal("0"), alias="90_plus")
+
+    model_config = {"populate_by_name": True}
+
+
+class ContactAging(AgingBuckets):
+    """Aging buckets for one contact."""
+    contact_id: Optional[uuid.UUID] = None
+    contact_name: Optional[str] = None
+
+
+class AgingReport(BaseModel):
+    """Receivables aging as of a date."""
+    as_of: date
+    totals: AgingBuckets = Field(default_factory=AgingBuckets)
+    contacts: List[ContactAging] = Field(default_factory=list)
+
+
+class RevenuePeriod(BaseModel):
+    """Invoiced and collected revenue for one period."""
+    period_start: date
+    invoice_count: int = 0
+    invoiced: Decimal = Decimal("0")
+    payment_count: int = 0
+    collected: Decimal = Decimal("0")
+
+
+class RevenueTotals(BaseModel):
+    """Revenue totals for the whole range."""
+    invoiced: Decimal = Decimal("0")
+    collected: Decimal = Decimal("0")
+    receivables: Decimal = Decimal("0")
+
+
+class RevenueReport(BaseModel):
+    """Revenue by period with days sales outstanding."""
+    start_date: date
+    end_date: date
+    period: str
+    periods: List[RevenuePeriod] = Field(default_factory=list)
+    totals: RevenueTotals = Field(default_factory=RevenueTotals)
+    dso: Optional[Decimal] = None
+
+
+def aging_bucket(days_past_due: int) -> str:
+    """Bucket label for a number of days past due (not yet due counts as 0-30)."""
+    if days_past_due <= 30:
+        return "0_30"
+    if days_past_due <= 60:
+        return "31_60"
+    if days_past_due <= 90:
+        return "61_90"
+    return "90_plus"
+
+
+class _CsvRowWriter:
+    """Formats one CSV row at a time for streaming."""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def row(self, values: list) -> str:
+        self._writer.writerow(values)
+        line = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        return line
+
+
+def revenue_report_csv(report: RevenueReport) -> Iterator[str]:
+    """CSV lines for a revenue report, one per period."""
+    writer = _CsvRowWriter()
+    yield writer.row(REVENUE_CSV_COLUMNS)
+    for row in report.periods:
+        yield writer.row([
+            row.period_start.isoformat(), row.invoice_count, row.invoiced,
+            row.payment_count, row.collected
+        ])
+
+
+class ReceivablesReportService:
+    """Application service for receivables and revenue reporting."""
+
+    def __init__(self, invoice_repository: InvoiceRepository, export_page_size: int = EXPORT_PAGE_SIZE):
+        self.invoice_repository = invoice_repository
+        self.export_page_size = export_page_size
+
+    async def get_aging(
+        self,
+        business_id: uuid.UUID,
+        as_of: Optional[date] = None,
+        contact_id: Optional[uuid.UUID] = None,
+        by_contact: bool = False
+    ) -> AgingReport:
+        """Outstanding balances bucketed 0-30/31-60/61-90/90+ days past due."""
+        as_of = as_of or date.today()
+        try:
+            data = await self.invoice_repository.get_receivables_aging(
+                business_id, as_of, contact_id=contact_id, by_contact=by_contact
+            )
+        except DatabaseError as e:
+            raise ApplicationError(f"Failed to build aging report: {str(e)}")
+
+        return AgingReport(
+            as_of=as_of,
+            totals=AgingBuckets.model_validate(data.get("totals") or {}),
+            contacts=[ContactAging.model_validate(row) for row in data.get("contacts") or []]
+        )
+
+    async def get_revenue(
+        self,
+        business_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+        period: str = "month"
+    ) -> RevenueReport:
+        """Invoiced and collected revenue per period, with DSO over the range."""
+        self._validate_range(start_date, end_date, period)
+        try:
+            data = await self.invoice_repository.get_revenue_report(
+                business_id, start_date, end_date, period=period
+            )
+        except DatabaseError as e:
+            raise ApplicationError(f"Failed to build revenue report: {str(e)}")
+
+        return RevenueReport(
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            periods=[RevenuePeriod.model_validate(row) for row in data.get("periods") or []],
+            totals=RevenueTotals.model_validate(data.get("totals") or {}),
+            dso=data.get("dso")
+        )
+
+    async def stream_aging_csv(
+        self,
+        business_id: uuid.UUID,
+        as_of: Optional[date] = None,
+        contact_id: Optional[uuid.UUID] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream one CSV line per outstanding invoice with its aging bucket.
+
+        Rows come from the same per-invoice balances the aging report sums
+        (payments up to as_of), read in keyset pages so only one page is in
+        memory at a time.
+        """
+        as_of = as_of or date.today()
+
+        writer = _CsvRowWriter()
+        yield writer.row(AGING_CSV_COLUMNS)
+
+        cursor = None
+        exported = 0
+        while True:
+            try:
+                page = await self.invoice_repository.list_receivable_balances_page(
+                    business_id, as_of, contact_id=contact_id,
+                    limit=self.export_page_size, cursor=cursor
+                )
+            except DatabaseError as e:
+                logger.error(f"Aging export for business {business_id} stopped after {exported} rows: {e}")
+                raise ApplicationError(f"Failed to export aging report: {str(e)}")
+
+            for invoice in page.items:
+                yield writer.row([
+                    invoice.invoice_number,
+                    invoice.client_name or "",
+                    invoice.status.value,
+                    invoice.issue_date.isoformat() if invoice.issue_date else "",
+                    invoice.due_date.isoformat() if invoice.due_date else "",
+                    invoice.currency.value,
+                    invoice.total_amount,
+                    invoice.amount_paid,
+                    invoice.balance,
+                    max(invoice.days_past_due, 0),
+                    aging_bucket(invoice.days_past_due)
+                ])
+                exported += 1
+
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        logger.info(f"Exported {exported} aging rows for business {business_id}")
+
+    def _validate_range(self, start_date: date, end_date: date, period: str) -> None:
+        if period not in REPORT_PERIODS:
+            raise ValidationError(f"Unsupported period: {period}. Use one of {', '.join(REPORT_PERIODS)}")
+        if start_date > end_date:
+            raise ValidationError("start_date must be on or before end_date")
+        if (end_date - start_date).days > MAX_REPORT_DAYS:
+            raise ValidationError("Report range cannot exceed five years")
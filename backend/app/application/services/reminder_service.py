@@ -13,15 +13,19 @@ from pydantic import BaseModel, Field
 from enum import Enum
 import logging
 
-from ..dto.activity_dto import ActivityReminderDTO, NotificationDTO
+from ..dto.activity_dto import ActivityReminderDTO, ActivityNotificationDTO
 from ...domain.repositories.activity_repository import ActivityRepository
 from ...domain.repositories.contact_repository import ContactRepository
-from ...domain.entities.activity import Activity, ActivityStatus, ActivityPriority
-from ...application.ports.email_service import EmailService
-from ...application.ports.sms_service import SMSService
+from ...domain.entities.activity import Activity, ActivityReminder, ActivityStatus, ActivityPriority
+from ...application.ports.email_service import EmailServicePort, EmailMessage
+from ...application.ports.sms_service import SMSServicePort, SMSMessage
 
 logger = logging.getLogger(__name__)
 
+REMINDER_BATCH_SIZE = 100
+REMINDER_LEASE_SECONDS = 300
+REMINDER_MAX_ATTEMPTS = 4
+
 
 class ReminderType(Enum):
     """Types of reminders that can be sent."""
@@ -32,6 +36,16 @@ class ReminderType(Enum):
     WEBHOOK = "webhook"
 
 
+# Stored activity reminder types and the channel they are delivered on
+REMINDER_TYPES = {
+    "notification": ReminderType.IN_APP,
+    "email": ReminderType.EMAIL,
+    "sms": ReminderType.SMS,
+    "push_notification": ReminderType.PUSH_NOTIFICATION,
+    "in_app": ReminderType.IN_APP,
+}
+
+
 class NotificationPriority(Enum):
     """Priority levels for notifications."""
     LOW = "low"
@@ -92,13 +106,16 @@ class ReminderNotificationService:
         self,
         activity_repository: ActivityRepository,
         contact_repository: ContactRepository,
-        email_service: EmailService,
-        sms_service: SMSService
+        email_service: EmailServicePort,
+        sms_service: SMSServicePort,
+        worker_id: Optional[str] = None
     ):
         self.activity_repository = activity_repository
         self.contact_repository = contact_repository
         self.email_service = email_service
         self.sms_service = sms_service
+        # Identifies this instance's claims on the reminder queue
+        self.worker_id = worker_id or f"reminders-{uuid.uuid4()}"
         
         # In-memory storage for preferences and templates
         # In production, these would be stored in database
@@ -145,14 +162,25 @@ class ReminderNotificationService:
         
         return reminder_ids
     
-    async def process_pending_reminders(self) -> Dict[str, int]:
+    async def process_pending_reminders(
+        self,
+        batch_size: int = REMINDER_BATCH_SIZE,
+        lease_seconds: int = REMINDER_LEASE_SECONDS
+    ) -> Dict[str, int]:
         """
         Process all pending reminders that are due to be sent.
         
+        Due reminders are claimed from the repository in leased batches, so
+        several workers can run this concurrently without sending a reminder
+        twice. Outcomes are written back once per batch.
+        
+        Args:
+            batch_size: Number of reminders claimed per batch
+            lease_seconds: How long a claimed batch is reserved for this worker
+            
         Returns:
             Dictionary with counts of processed reminders by status
         """
-        current_time = datetime.utcnow()
         stats = {
             'processed': 0,
             'sent': 0,
@@ -160,55 +188,87 @@ class ReminderNotificationService:
             'skipped': 0
         }
         
-        # Get pending reminders from repository
-        pending_reminders = await self.activity_repository.get_pending_reminders(
-            due_before=current_time + timedelta(minutes=5)  # 5-minute buffer
-        )
+        while True:
+            current_time = datetime.utcnow()
+            activities = await self.activity_repository.claim_due_reminders(
+                worker_id=self.worker_id,
+                due_before=current_time + timedelta(minutes=5),  # 5-minute buffer
+                limit=batch_size,
+                lease_seconds=lease_seconds,
+                max_attempts=REMINDER_MAX_ATTEMPTS
+            )
+            if not activities:
+                break
+            
+            claimed = await self._process_claimed_batch(activities, current_time, stats)
+            if claimed < batch_size:
+                break
         
-        for reminder in pending_reminders:
-            stats['processed'] += 1
-            
-            try:
-                # Check if user is in quiet hours
-                if await self._is_in_quiet_hours(reminder.recipient_id, current_time):
-                    # Reschedule for after quiet hours
-                    new_time = await self._calculate_next_available_time(
-                        reminder.recipient_id, current_time
-                    )
-                    await self._reschedule_reminder(reminder.reminder_id, new_time)
-                    stats['skipped'] += 1
-                    continue
-                
-                # Check frequency limits
-                if await self._exceeds_frequency_limit(reminder.recipient_id, current_time):
-                    # Reschedule for next day
-                    new_time = current_time + timedelta(days=1)
-                    await self._reschedule_reminder(reminder.reminder_id, new_time)
-                    stats['skipped'] += 1
-                    continue
+        return stats
+    
+    async def _process_claimed_batch(
+        self,
+        activities: List[Activity],
+        current_time: datetime,
+        stats: Dict[str, int]
+    ) -> int:
+        """Send one claimed batch and record the outcomes. Returns the number of reminders claimed."""
+        sent_ids: List[uuid.UUID] = []
+        retries: Dict[datetime, List[uuid.UUID]] = {}
+        deferrals: Dict[datetime, List[uuid.UUID]] = {}
+        contacts: Dict[uuid.UUID, Any] = {}
+        claimed = 0
+        
+        for activity in activities:
+            if activity.contact_id not in contacts:
+                contacts[activity.contact_id] = await self.contact_repository.get_by_id(activity.contact_id)
+            
+            for activity_reminder in activity.reminders:
+                claimed += 1
+                stats['processed'] += 1
+                reminder = self._to_schedule(activity, activity_reminder)
                 
-                # Send the reminder
-                success = await self._send_reminder(reminder)
+                try:
+                    # Check if user is in quiet hours
+                    if await self._is_in_quiet_hours(reminder.recipient_id, current_time):
+                        new_time = await self._calculate_next_available_time(
+                            reminder.recipient_id, current_time
+                        )
+                        deferrals.setdefault(new_time, []).append(reminder.reminder_id)
+                        stats['skipped'] += 1
+                        continue
+                    
+                    # Check frequency limits
+                    if await self._exceeds_frequency_limit(reminder.recipient_id, current_time):
+                        deferrals.setdefault(current_time + timedelta(days=1), []).append(reminder.reminder_id)
+                        stats['skipped'] += 1
+                        continue
+                    
+                    success = await self._send_reminder(reminder, activity, contacts[activity.contact_id])
+                except Exception as e:
+                    logger.error(f"Error processing reminder {reminder.reminder_id}: {str(e)}")
+                    success = False
                 
                 if success:
                     stats['sent'] += 1
-                    # Mark as sent in repository
-                    await self.activity_repository.mark_reminder_sent(
-                        reminder.activity_id,
-                        reminder.reminder_id,
-                        datetime.utcnow()
-                    )
+                    sent_ids.append(reminder.reminder_id)
                 else:
                     stats['failed'] += 1
-                    # Handle retry logic
-                    await self._handle_reminder_failure(reminder)
-                
-            except Exception as e:
-                logger.error(f"Error processing reminder {reminder.reminder_id}: {str(e)}")
-                stats['failed'] += 1
-                await self._handle_reminder_failure(reminder)
+                    retry_time = self._retry_time(reminder, current_time)
+                    if retry_time:
+                        retries.setdefault(retry_time, []).append(reminder.reminder_id)
+                    else:
+                        logger.error(f"Reminder {reminder.reminder_id} failed after {reminder.retry_count} attempts")
         
-        return stats
+        await self.activity_repository.complete_reminders(self.worker_id, sent_ids, datetime.utcnow())
+        for retry_time, reminder_ids in retries.items():
+            await self.activity_repository.release_reminders(self.worker_id, reminder_ids, retry_time)
+        for retry_time, reminder_ids in deferrals.items():
+            await self.activity_repository.release_reminders(
+                self.worker_id, reminder_ids, retry_time, count_attempt=False
+            )
+        
+        return claimed
     
     async def update_notification_preferences(
         self,
@@ -358,7 +418,7 @@ class ReminderNotificationService:
     
     async def send_immediate_notification(
         self,
-        notification: NotificationDTO,
+        notification: ActivityNotificationDTO,
         user_id: str
     ) -> bool:
         """
@@ -382,7 +442,7 @@ class ReminderNotificationService:
                 )
             
             # Check if notification type is enabled
-            notification_type = ReminderType(notification.notification_type)
+            notification_type = ReminderType(notification.delivery_method)
             if notification_type not in preferences.reminder_types:
                 logger.info(f"Notification type {notification_type} disabled for user {user_id}")
                 return False
@@ -544,18 +604,9 @@ class ReminderNotificationService:
             logger.error(f"Error scheduling reminder for activity {activity.id}: {str(e)}")
             return None
     
-    async def _send_reminder(self, reminder: ReminderSchedule) -> bool:
-        """Send a single reminder."""
+    async def _send_reminder(self, reminder: ReminderSchedule, activity: Activity, contact: Any) -> bool:
+        """Send a single reminder for an activity already loaded with its contact."""
         try:
-            # Get activity details
-            activity = await self.activity_repository.get_by_id(reminder.activity_id)
-            if not activity:
-                logger.error(f"Activity {reminder.activity_id} not found for reminder")
-                return False
-            
-            # Get contact details
-            contact = await self.contact_repository.get_by_id(activity.contact_id)
-            
             # Get template
             template = self.reminder_templates.get(reminder.template_id)
             if not template:
@@ -574,14 +625,15 @@ class ReminderNotificationService:
             }
             
             # Create notification
-            notification = NotificationDTO(
-                notification_id=str(reminder.reminder_id),
-                notification_type=reminder.reminder_type.value,
-                recipient_id=reminder.recipient_id,
+            notification = ActivityNotificationDTO(
+                notification_id=reminder.reminder_id,
+                activity_id=activity.id,
+                recipient_user_id=reminder.recipient_id,
+                notification_type="reminder",
                 title=self._render_template(template.subject_template, notification_data),
                 message=self._render_template(template.body_template, notification_data),
                 scheduled_time=reminder.reminder_time,
-                metadata=reminder.metadata or {}
+                delivery_method=reminder.reminder_type.value
             )
             
             # Send based on type
@@ -601,43 +653,42 @@ class ReminderNotificationService:
             logger.error(f"Error sending reminder {reminder.reminder_id}: {str(e)}")
             return False
     
-    async def _send_email_notification(self, notification: NotificationDTO, user_id: str) -> bool:
+    async def _send_email_notification(self, notification: ActivityNotificationDTO, user_id: str) -> bool:
         """Send email notification."""
         try:
             # Would need user repository to get email address
             user_email = f"{user_id}@example.com"  # Placeholder
             
-            success = await self.email_service.send_email(
-                to_email=user_email,
+            result = await self.email_service.send_email(EmailMessage(
+                to=[user_email],
                 subject=notification.title,
-                body=notification.message,
-                is_html=False
-            )
+                text_body=notification.message
+            ))
             
-            return success
+            return result.success
             
         except Exception as e:
             logger.error(f"Error sending email notification: {str(e)}")
             return False
     
-    async def _send_sms_notification(self, notification: NotificationDTO, user_id: str) -> bool:
+    async def _send_sms_notification(self, notification: ActivityNotificationDTO, user_id: str) -> bool:
         """Send SMS notification."""
         try:
             # Would need user repository to get phone number
             user_phone = "+1234567890"  # Placeholder
             
-            success = await self.sms_service.send_sms(
-                to_phone=user_phone,
+            result = await self.sms_service.send_sms(SMSMessage(
+                to=user_phone,
                 message=notification.message
-            )
+            ))
             
-            return success
+            return result.success
             
         except Exception as e:
             logger.error(f"Error sending SMS notification: {str(e)}")
             return False
     
-    async def _send_push_notification(self, notification: NotificationDTO, user_id: str) -> bool:
+    async def _send_push_notification(self, notification: ActivityNotificationDTO, user_id: str) -> bool:
         """Send push notification."""
         try:
             # Placeholder for push notification service
@@ -648,7 +699,7 @@ class ReminderNotificationService:
             logger.error(f"Error sending push notification: {str(e)}")
             return False
     
-    async def _send_in_app_notification(self, notification: NotificationDTO, user_id: str) -> bool:
+    async def _send_in_app_notification(self, notification: ActivityNotificationDTO, user_id: str) -> bool:
         """Send in-app notification."""
         try:
             # Placeholder for in-app notification storage
@@ -702,42 +753,26 @@ class ReminderNotificationService:
         
         return next_time
     
-    async def _reschedule_reminder(self, reminder_id: uuid.UUID, new_time: datetime) -> bool:
-        """Reschedule a reminder to a new time."""
-        try:
-            success = await self.activity_repository.reschedule_reminder(
-                reminder_id=reminder_id,
-                new_time=new_time
-            )
-            return success
-            
-        except Exception as e:
-            logger.error(f"Error rescheduling reminder {reminder_id}: {str(e)}")
-            return False
+    def _to_schedule(self, activity: Activity, activity_reminder: ActivityReminder) -> ReminderSchedule:
+        """Build the delivery schedule for a claimed activity reminder."""
+        reminder_type = REMINDER_TYPES.get(activity_reminder.reminder_type, ReminderType.IN_APP)
+        return ReminderSchedule(
+            activity_id=activity.id,
+            reminder_id=activity_reminder.reminder_id,
+            reminder_time=activity_reminder.reminder_time,
+            reminder_type=reminder_type,
+            recipient_id=activity.assigned_to or activity.created_by,
+            template_id='appointment_sms' if reminder_type == ReminderType.SMS else 'default_email_reminder',
+            retry_count=activity_reminder.attempts,
+            max_retries=REMINDER_MAX_ATTEMPTS - 1,
+            metadata={'message': activity_reminder.message} if activity_reminder.message else {}
+        )
     
-    async def _handle_reminder_failure(self, reminder: ReminderSchedule) -> bool:
-        """Handle failed reminder delivery with retry logic."""
-        try:
-            if reminder.retry_count < reminder.max_retries:
-                # Schedule retry
-                retry_time = datetime.utcnow() + timedelta(minutes=30 * (reminder.retry_count + 1))
-                success = await self.activity_repository.schedule_reminder_retry(
-                    reminder_id=reminder.reminder_id,
-                    retry_time=retry_time,
-                    retry_count=reminder.retry_count + 1
-                )
-                return success
-            else:
-                # Mark as failed after max retries
-                await self.activity_repository.mark_reminder_failed(
-                    reminder.reminder_id,
-                    "Max retries exceeded"
-                )
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error handling reminder failure {reminder.reminder_id}: {str(e)}")
-            return False
+    def _retry_time(self, reminder: ReminderSchedule, current_time: datetime) -> Optional[datetime]:
+        """Next attempt time after a failed delivery, or None once retries are exhausted."""
+        if reminder.retry_count >= REMINDER_MAX_ATTEMPTS:
+            return None
+        return current_time + timedelta(minutes=30 * reminder.retry_count)
     
     def _render_template(self, template: str, variables: Dict[str, Any]) -> str:
         """Render a template with variables."""
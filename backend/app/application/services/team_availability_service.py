@@ -0,0 +1,276 @@
+"""
+Team Availability Application Service
+
+Loads a team's members, approved time off and calendar events for a window in
+three bulk queries and lays their availability out as a member x time-bucket
+bitmap. Coverage gaps, peak hours and per-member hours are then array
+reductions over the bitmap instead of per-member, per-day loops.
+"""
+
+import asyncio
+import math
+import uuid
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..exceptions.application_exceptions import ValidationError
+from ...domain.entities.user_capabilities import UserCapabilities, CalendarEvent, TimeOffRequest
+from ...domain.repositories.user_capabilities_repository import UserCapabilitiesRepository
+from ...domain.services.calendar_occurrences import BusyIntervalIndex
+
+logger = logging.getLogger(__name__)
+
+BUCKET_MINUTES = 15
+MINUTES_PER_DAY = 24 * 60
+PEAK_HOURS_LIMIT = 5
+MAX_WINDOW_DAYS = 62
+
+
+def working_windows(
+    user_capabilities: UserCapabilities,
+    start_datetime: datetime,
+    end_datetime: datetime
+) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    Working hours of each day overlapping the period, from the member's
+    template or else their availability windows.
+    """
+    current_date = start_datetime.date()
+    while current_date <= end_datetime.date():
+        day_of_week = current_date.weekday()
+        working_hours = None
+        if user_capabilities.working_hours_template:
+            working_hours = user_capabilities.working_hours_template.get_working_hours_for_day(day_of_week)
+        if not working_hours:
+            working_hours = next(
+                ((window.start_time, window.end_time) for window in user_capabilities.availability_windows
+                 if window.day_of_week == day_of_week),
+                None
+            )
+
+        if working_hours:
+            working_start = datetime.combine(current_date, working_hours[0], tzinfo=start_datetime.tzinfo)
+            working_end = datetime.combine(current_date, working_hours[1], tzinfo=start_datetime.tzinfo)
+            if working_start < end_datetime and working_end > start_datetime:
+                yield working_start, working_end
+
+        current_date += timedelta(days=1)
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """[start, end) index pairs of consecutive set values."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+
+@dataclass
+class TeamSchedules:
+    """Members and their busy time for one window."""
+    members: Dict[str, UserCapabilities]
+    index: BusyIntervalIndex
+    time_off: Dict[str, List[TimeOffRequest]]
+    events: Dict[str, List[CalendarEvent]]
+
+
+class TeamAvailabilityMatrix:
+    """
+    Member availability over fixed-size time buckets.
+
+    working[m, b] is set when bucket b lies entirely within member m's working
+    hours, busy[m, b] when any part of it is taken by approved time off or a
+    blocking event; available is working and not busy.
+    """
+
+    def __init__(
+        self,
+        user_ids: List[str],
+        window_start: datetime,
+        bucket_minutes: int,
+        working: np.ndarray,
+        busy: np.ndarray
+    ):
+        self.user_ids = user_ids
+        self.window_start = window_start
+        self.bucket_minutes = bucket_minutes
+        self.working = working
+        self.busy = busy
+        self.available = working & ~busy
+        self._rows = {user_id: row for row, user_id in enumerate(user_ids)}
+
+    @property
+    def bucket_count(self) -> int:
+        return self.working.shape[1]
+
+    def bucket_start(self, bucket: int) -> datetime:
+        return self.window_start + timedelta(minutes=bucket * self.bucket_minutes)
+
+    def member_hours(self) -> Dict[str, Tuple[float, float]]:
+        """(working hours, available hours) per member."""
+        hours_per_bucket = self.bucket_minutes / 60
+        working = self.working.sum(axis=1) * hours_per_bucket
+        available = self.available.sum(axis=1) * hours_per_bucket
+        return {
+            user_id: (float(working[row]), float(available[row]))
+            for row, user_id in enumerate(self.user_ids)
+        }
+
+    def available_intervals(self, user_id: str) -> List[Tuple[datetime, datetime]]:
+        """The member's free working time as merged intervals."""
+        row = self.available[self._rows[user_id]]
+        return [(self.bucket_start(start), self.bucket_start(end)) for start, end in _runs(row)]
+
+    def daily_availability(self) -> List[Dict[str, Any]]:
+        """Members with any free time, and total free hours, per day of the window."""
+        per_day = MINUTES_PER_DAY // self.bucket_minutes
+        days = self.bucket_count // per_day
+        by_day = self.available[:, :days * per_day].reshape(len(self.user_ids), days, per_day)
+        members = by_day.any(axis=2).sum(axis=0)
+        hours = by_day.sum(axis=(0, 2)) * (self.bucket_minutes / 60)
+
+        start_date = self.window_start.date()
+        return [
+            {
+                "date": (start_date + timedelta(days=day)).isoformat(),
+                "available_members": int(members[day]),
+                "available_hours": float(hours[day])
+            }
+            for day in range(days)
+        ]
+
+    def peak_hours(self, limit: int = PEAK_HOURS_LIMIT) -> List[Dict[str, Any]]:
+        """Hours of the day with the most members available on average across the window."""
+        counts = self.available.sum(axis=0)
+        first_minute = self.window_start.hour * 60 + self.window_start.minute
+        hour_of_day = ((first_minute + np.arange(self.bucket_count) * self.bucket_minutes) // 60) % 24
+
+        totals = np.bincount(hour_of_day, weights=counts, minlength=24)
+        buckets = np.bincount(hour_of_day, minlength=24)
+        average = np.divide(totals, buckets, out=np.zeros(24), where=buckets > 0)
+
+        return [
+            {"hour": int(hour), "average_available_members": round(float(average[hour]), 2)}
+            for hour in np.argsort(-average, kind="stable")[:limit]
+            if average[hour] > 0
+        ]
+
+    def coverage_gaps(self) -> List[Dict[str, Any]]:
+        """Stretches inside someone's working hours where no member is available."""
+        gaps = self.working.any(axis=0) & ~self.available.any(axis=0)
+        return [
+            {
+                "start": self.bucket_start(start),
+                "end": self.bucket_start(end),
+                "duration_minutes": (end - start) * self.bucket_minutes
+            }
+            for start, end in _runs(gaps)
+        ]
+
+
+class TeamAvailabilityService:
+    """Application service for team-wide availability."""
+
+    def __init__(self, user_capabilities_repository: UserCapabilitiesRepository, bucket_minutes: int = BUCKET_MINUTES):
+        if MINUTES_PER_DAY % bucket_minutes:
+            raise ValueError("bucket_minutes must divide a day")
+        self.user_capabilities_repository = user_capabilities_repository
+        self.bucket_minutes = bucket_minutes
+
+    async def load_schedules(
+        self,
+        business_id: uuid.UUID,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        user_ids: Optional[List[str]] = None,
+        include_time_off: bool = True,
+        include_calendar_events: bool = True
+    ) -> TeamSchedules:
+        """
+        Load members (all active ones, or user_ids), their approved time off
+        and their calendar events for a period, one query each, and index
+        their busy time.
+        """
+        start_date = start_datetime.date()
+        end_date = end_datetime.date()
+
+        async def nothing() -> list:
+            return []
+
+        members, time_off, events = await asyncio.gather(
+            self.user_capabilities_repository.get_by_business_id(business_id),
+            self.user_capabilities_repository.get_business_time_off_requests(
+                business_id, start_date, end_date, status="approved", user_ids=user_ids
+            ) if include_time_off else nothing(),
+            self.user_capabilities_repository.get_business_calendar_events(
+                business_id, start_date, end_date, user_ids=user_ids
+            ) if include_calendar_events else nothing()
+        )
+
+        wanted = set(user_ids) if user_ids is not None else None
+        schedules = TeamSchedules(
+            members={member.user_id: member for member in members if wanted is None or member.user_id in wanted},
+            index=BusyIntervalIndex(start_datetime, end_datetime),
+            time_off={},
+            events={}
+        )
+        for request in time_off:
+            schedules.time_off.setdefault(request.user_id, []).append(request)
+        for event in events:
+            # Series fetched for the period may have no occurrence inside it
+            if event.get_occurrences(start_datetime, end_datetime):
+                schedules.events.setdefault(event.user_id, []).append(event)
+
+        for user_id, requests in schedules.time_off.items():
+            schedules.index.add_time_off(user_id, requests)
+        for user_id, user_events in schedules.events.items():
+            schedules.index.add_events(user_id, user_events)
+
+        return schedules
+
+    def build_matrix(self, schedules: TeamSchedules, start_datetime: datetime, end_datetime: datetime) -> TeamAvailabilityMatrix:
+        """Lay the members' working hours and busy time out over the period's buckets."""
+        bucket_seconds = self.bucket_minutes * 60
+        bucket_count = math.ceil((end_datetime - start_datetime).total_seconds() / bucket_seconds)
+        user_ids = list(schedules.members)
+        working = np.zeros((len(user_ids), bucket_count), dtype=bool)
+        busy = np.zeros((len(user_ids), bucket_count), dtype=bool)
+
+        def offset(moment: datetime) -> float:
+            return (moment - start_datetime).total_seconds() / bucket_seconds
+
+        for row, user_id in enumerate(user_ids):
+            for working_start, working_end in working_windows(schedules.members[user_id], start_datetime, end_datetime):
+                first = max(math.ceil(offset(working_start)), 0)
+                last = min(math.floor(offset(working_end)), bucket_count)
+                if last > first:
+                    working[row, first:last] = True
+            for busy_start, busy_end in schedules.index.busy(user_id, start_datetime, end_datetime):
+                busy[row, math.floor(offset(busy_start)):math.ceil(offset(busy_end))] = True
+
+        return TeamAvailabilityMatrix(user_ids, start_datetime, self.bucket_minutes, working, busy)
+
+    async def get_team_matrix(
+        self,
+        business_id: uuid.UUID,
+        start_date: date,
+        end_date: date
+    ) -> Tuple[TeamSchedules, TeamAvailabilityMatrix]:
+        """Schedules and availability matrix of all active members over whole days."""
+        if end_date < start_date:
+            raise ValidationError("end_date must be on or after start_date")
+        if (end_date - start_date).days >= MAX_WINDOW_DAYS:
+            raise ValidationError(f"Team availability covers at most {MAX_WINDOW_DAYS} days")
+
+        start_datetime = datetime.combine(start_date, time.min)
+        end_datetime = datetime.combine(end_date + timedelta(days=1), time.min)
+        schedules = await self.load_schedules(business_id, start_datetime, end_datetime)
+        matrix = self.build_matrix(schedules, start_datetime, end_datetime)
+
+        logger.info(
+            f"Built team availability for business {business_id}: "
+            f"{len(matrix.user_ids)} members x {matrix.bucket_count} buckets"
+        )
+        return schedules, matrix
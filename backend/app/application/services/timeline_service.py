@@ -5,16 +5,25 @@ Provides unified timeline feeds by aggregating activities, interactions, and sys
 """
 
 import uuid
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+import heapq
+import asyncio
+from functools import partial
+from itertools import islice
+from typing import List, Dict, Any, Optional, Callable, Iterator, NamedTuple, Set, Tuple
+from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel, Field
 from enum import Enum
 
 from ..dto.activity_dto import TimelineEntryDTO, TimelineResponseDTO
+from ..exceptions.application_exceptions import ValidationError
 from ...domain.repositories.activity_repository import ActivityRepository
 from ...domain.repositories.contact_repository import ContactRepository
-from ...domain.entities.activity import ActivityType
-from ...domain.entities.contact import InteractionType
+from ...domain.entities.activity import Activity, ActivityType
+from ...domain.entities.contact import (
+    Contact, InteractionHistoryEntry, InteractionType, RelationshipStatus, StatusHistoryEntry
+)
+from ...domain.exceptions.domain_exceptions import DomainValidationError
+from ...domain.shared.pagination import decode_cursor, encode_cursor
 
 
 class TimelineEventType(Enum):
@@ -41,6 +50,61 @@ class TimelineEvent(BaseModel):
     related_entities: Dict[str, str] = Field(default_factory=dict)  # {entity_type: entity_id}
 
 
+# (timestamp, -source rank, key); the timeline is ordered by this key, descending
+SortKey = Tuple[datetime, int, str]
+
+# Order of sources among events with the same timestamp, first shown first
+SOURCE_RANKS = {
+    TimelineEventType.ACTIVITY: 0,
+    TimelineEventType.INTERACTION: 1,
+    TimelineEventType.STATUS_CHANGE: 2,
+    TimelineEventType.SYSTEM_EVENT: 3,
+    TimelineEventType.MILESTONE: 4,
+}
+
+MILESTONE_TITLES = {
+    RelationshipStatus.QUALIFIED_LEAD.value: '📈 Qualified as Lead',
+    RelationshipStatus.OPPORTUNITY.value: '💼 Identified as Opportunity',
+    RelationshipStatus.ACTIVE_CLIENT.value: '🎉 Became Active Client',
+}
+
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+class _TimelineItem(NamedTuple):
+    """A timeline position whose event is only built if it lands on the page."""
+    sort_key: SortKey
+    build: Callable[[], TimelineEvent]
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so sources compare consistently."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+def _cursor_values(sort_key: SortKey) -> Tuple[str, int, str]:
+    timestamp, negative_rank, key = sort_key
+    return timestamp.isoformat(), -negative_rank, key
+
+
+def _decode_timeline_cursor(cursor: str) -> SortKey:
+    try:
+        timestamp, rank, key = decode_cursor(cursor, expected_length=3)
+        return _as_utc(datetime.fromisoformat(timestamp)), -int(rank), str(key)
+    except (DomainValidationError, ValueError, TypeError):
+        raise ValidationError("Invalid timeline cursor")
+
+
+async def _none() -> None:
+    return None
+
+
 class TimelineAggregationService:
     """
     Service for aggregating and organizing timeline events from multiple sources.
@@ -66,11 +130,17 @@ class TimelineAggregationService:
         event_types: Optional[List[TimelineEventType]] = None,
         include_system_events: bool = True,
         group_by_day: bool = False,
-        skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> TimelineResponseDTO:
         """
-        Get a unified timeline for a contact combining all event types.
+        Get a page of a contact's unified timeline, newest first.
+        
+        Each source yields its events already sorted; the sources are merged
+        lazily and merging stops once limit events are taken, so only one page
+        of events is built. Activities and the contact record are fetched
+        concurrently.
         
         Args:
             contact_id: Contact to get timeline for
@@ -80,72 +150,65 @@ class TimelineAggregationService:
             event_types: Optional filter by event types
             include_system_events: Whether to include system-generated events
             group_by_day: Whether to group events by day
-            skip: Number of events to skip
             limit: Maximum number of events to return
+            cursor: next_cursor from the previous page
+            include_total: Whether to count all matching events
             
         Returns:
-            TimelineResponseDTO with unified timeline entries
+            TimelineResponseDTO with unified timeline entries and the next cursor
         """
-        # Collect events from all sources
-        all_events = []
-        
-        # Get activity events
-        if not event_types or TimelineEventType.ACTIVITY in event_types:
-            activity_events = await self._get_activity_events(
-                contact_id, business_id, start_date, end_date
-            )
-            all_events.extend(activity_events)
-        
-        # Get interaction events from contact history
-        if not event_types or TimelineEventType.INTERACTION in event_types:
-            interaction_events = await self._get_interaction_events(
-                contact_id, business_id, start_date, end_date
-            )
-            all_events.extend(interaction_events)
-        
-        # Get status change events
-        if not event_types or TimelineEventType.STATUS_CHANGE in event_types:
-            status_events = await self._get_status_change_events(
-                contact_id, business_id, start_date, end_date
-            )
-            all_events.extend(status_events)
-        
-        # Get system events if requested
-        if include_system_events and (not event_types or TimelineEventType.SYSTEM_EVENT in event_types):
-            system_events = await self._get_system_events(
-                contact_id, business_id, start_date, end_date
-            )
-            all_events.extend(system_events)
+        types = set(event_types or TimelineEventType)
+        if not include_system_events:
+            types.discard(TimelineEventType.SYSTEM_EVENT)
+        start_date = _as_utc(start_date) if start_date else None
+        end_date = _as_utc(end_date) if end_date else None
+        after = _decode_timeline_cursor(cursor) if cursor else None
+        
+        contact_types = types - {TimelineEventType.ACTIVITY}
+        activity_page, contact, activity_total = await asyncio.gather(
+            self._fetch_activity_page(contact_id, business_id, start_date, end_date, limit, after)
+            if TimelineEventType.ACTIVITY in types else _none(),
+            self.contact_repository.get_by_id(contact_id) if contact_types else _none(),
+            self.activity_repository.get_contact_activity_count(
+                contact_id=contact_id, business_id=business_id, start_date=start_date, end_date=end_date
+            ) if include_total and TimelineEventType.ACTIVITY in types else _none()
+        )
         
-        # Get milestone events
-        if not event_types or TimelineEventType.MILESTONE in event_types:
-            milestone_events = await self._get_milestone_events(
-                contact_id, business_id, start_date, end_date
+        sources = []
+        if activity_page is not None:
+            sources.append(self._activity_items(contact_id, activity_page.items))
+        contact_items = {}
+        if contact is not None:
+            contact_items = self._contact_items(contact, contact_types, start_date, end_date)
+            sources.extend(
+                (item for item in items if after is None or item.sort_key < after)
+                for items in contact_items.values()
             )
-            all_events.extend(milestone_events)
         
-        # Sort events by timestamp (most recent first)
-        all_events.sort(key=lambda x: x.timestamp, reverse=True)
+        merged = heapq.merge(*sources, key=lambda item: item.sort_key, reverse=True)
+        page_items = list(islice(merged, limit + 1))
+        next_cursor = None
+        if len(page_items) > limit:
+            page_items = page_items[:limit]
+            next_cursor = encode_cursor(*_cursor_values(page_items[-1].sort_key))
         
-        # Apply pagination
-        total_count = len(all_events)
-        paginated_events = all_events[skip:skip + limit]
+        paginated_events = [item.build() for item in page_items]
         
         # Group by day if requested
         if group_by_day:
             paginated_events = self._group_events_by_day(paginated_events)
         
-        # Convert to timeline entries
-        timeline_entries = [
-            self._event_to_timeline_entry(event) for event in paginated_events
-        ]
+        total_count = None
+        if include_total:
+            total_count = (activity_total or 0) + sum(len(items) for items in contact_items.values())
         
         return TimelineResponseDTO(
             contact_id=contact_id,
-            timeline_entries=timeline_entries,
+            timeline_entries=[self._event_to_timeline_entry(event) for event in paginated_events],
             total_count=total_count,
-            skip=skip,
             limit=limit,
+            next_cursor=next_cursor,
+            has_next=next_cursor is not None,
             start_date=start_date,
             end_date=end_date
         )
@@ -240,310 +303,268 @@ class TimelineAggregationService:
         else:
             start_date = now - timedelta(days=7)
         
-        # Get user's activities
-        user_activities = await self.activity_repository.get_user_activities(
+        # Counters and achievements are aggregated in one repository call
+        stats = await self.activity_repository.get_activity_statistics(
             business_id=business_id,
-            user_id=user_id,
             start_date=start_date,
-            end_date=now
+            end_date=now,
+            user_id=user_id,
+            by_scheduled_date=True,
+            achievements_limit=5
         )
         
-        # Calculate metrics
-        total_activities = len(user_activities)
-        completed_activities = len([a for a in user_activities if a.status.value == 'completed'])
-        overdue_activities = len([a for a in user_activities if a.is_overdue()])
-        
-        # Group by type
-        activities_by_type = {}
-        for activity in user_activities:
-            activity_type = activity.activity_type.value
-            activities_by_type[activity_type] = activities_by_type.get(activity_type, 0) + 1
-        
-        # Recent achievements (completed high-priority activities)
-        achievements = [
-            a for a in user_activities 
-            if a.status.value == 'completed' and a.priority.value in ['high', 'urgent']
-        ][-5:]  # Last 5 achievements
-        
         return {
             'period': period,
             'start_date': start_date,
             'end_date': now,
-            'total_activities': total_activities,
-            'completed_activities': completed_activities,
-            'overdue_activities': overdue_activities,
-            'completion_rate': (completed_activities / total_activities * 100) if total_activities > 0 else 0,
-            'activities_by_type': activities_by_type,
-            'recent_achievements': [
-                {
-                    'id': str(a.id),
-                    'title': a.title,
-                    'completed_date': a.completed_date,
-                    'priority': a.priority.value
-                } for a in achievements
-            ]
+            'total_activities': stats['total_activities'],
+            'completed_activities': stats['completed_activities'],
+            'overdue_activities': stats['overdue_activities'],
+            'completion_rate': stats['completion_rate'],
+            'activities_by_type': stats['activities_by_type'],
+            'recent_achievements': stats['recent_achievements']
         }
     
     # Private helper methods
     
-    async def _get_activity_events(
+    async def _fetch_activity_page(
         self,
         contact_id: uuid.UUID,
         business_id: uuid.UUID,
         start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> List[TimelineEvent]:
-        """Get timeline events from activities."""
-        activities = await self.activity_repository.get_contact_timeline(
+        end_date: Optional[datetime],
+        limit: int,
+        after: Optional[SortKey]
+    ):
+        """Fetch the activities that can appear on this page, newest created first."""
+        activity_cursor = None
+        if after is not None:
+            timestamp, negative_rank, key = after
+            # Activities sort first among events with the same timestamp, so after
+            # any other event type every activity at that timestamp was already shown
+            last_id = key if -negative_rank == SOURCE_RANKS[TimelineEventType.ACTIVITY] else NIL_UUID
+            activity_cursor = encode_cursor(timestamp.isoformat(), last_id)
+        
+        # One extra row tells whether the merged timeline has another page
+        return await self.activity_repository.get_contact_timeline_page(
             contact_id=contact_id,
             business_id=business_id,
             start_date=start_date,
             end_date=end_date,
-            limit=1000  # Get all for aggregation
+            limit=limit + 1,
+            cursor=activity_cursor
         )
-        
-        events = []
-        for activity in activities:
-            event = TimelineEvent(
-                id=f"activity_{activity.id}",
-                event_type=TimelineEventType.ACTIVITY,
-                timestamp=activity.scheduled_date or activity.created_date,
-                title=activity.title,
-                description=activity.description,
-                actor_id=activity.created_by,
-                actor_name=activity.created_by,  # Would need user lookup
-                metadata={
-                    'activity_type': activity.activity_type.value,
-                    'status': activity.status.value,
-                    'priority': activity.priority.value,
-                    'duration_minutes': activity.duration_minutes,
-                    'location': activity.location
-                },
-                priority=activity.priority.value,
-                tags=activity.tags,
-                related_entities={
-                    'activity': str(activity.id),
-                    'contact': str(contact_id)
-                }
-            )
-            events.append(event)
-        
-        return events
     
-    async def _get_interaction_events(
-        self,
-        contact_id: uuid.UUID,
-        business_id: uuid.UUID,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> List[TimelineEvent]:
-        """Get timeline events from contact interactions."""
-        contact = await self.contact_repository.get_by_id(contact_id)
-        if not contact or not contact.interaction_history:
-            return []
-        
-        events = []
-        for i, interaction in enumerate(contact.interaction_history):
-            interaction_date = datetime.fromisoformat(interaction.get('timestamp', datetime.utcnow().isoformat()))
-            
-            # Apply date filters
-            if start_date and interaction_date < start_date:
-                continue
-            if end_date and interaction_date > end_date:
-                continue
-            
-            event = TimelineEvent(
-                id=f"interaction_{contact_id}_{i}",
-                event_type=TimelineEventType.INTERACTION,
-                timestamp=interaction_date,
-                title=f"{interaction.get('type', 'Contact')} Interaction",
-                description=interaction.get('description', ''),
-                actor_id=interaction.get('created_by', 'system'),
-                actor_name=interaction.get('created_by', 'System'),
-                metadata={
-                    'interaction_type': interaction.get('type'),
-                    'outcome': interaction.get('outcome'),
-                    'next_action': interaction.get('next_action'),
-                    'duration_minutes': interaction.get('duration_minutes')
-                },
-                priority="medium",
-                tags=interaction.get('tags', []),
-                related_entities={
-                    'contact': str(contact_id),
-                    'interaction': f"{contact_id}_{i}"
-                }
+    def _activity_items(self, contact_id: uuid.UUID, activities: List[Activity]) -> Iterator[_TimelineItem]:
+        """Timeline items for activities, in the order the repository returned them."""
+        rank = SOURCE_RANKS[TimelineEventType.ACTIVITY]
+        for activity in activities:
+            yield _TimelineItem(
+                (_as_utc(activity.created_date), -rank, str(activity.id)),
+                partial(self._activity_event, contact_id, activity)
             )
-            events.append(event)
-        
-        return events
     
-    async def _get_status_change_events(
+    def _contact_items(
         self,
-        contact_id: uuid.UUID,
-        business_id: uuid.UUID,
+        contact: Contact,
+        event_types: Set[TimelineEventType],
         start_date: Optional[datetime],
         end_date: Optional[datetime]
-    ) -> List[TimelineEvent]:
-        """Get timeline events from contact status changes."""
-        contact = await self.contact_repository.get_by_id(contact_id)
-        if not contact or not contact.status_history:
-            return []
+    ) -> Dict[TimelineEventType, List[_TimelineItem]]:
+        """
+        Timeline items from the contact record, one list per event type, newest first.
         
-        events = []
-        for i, status_change in enumerate(contact.status_history):
-            change_date = datetime.fromisoformat(status_change.get('changed_at', datetime.utcnow().isoformat()))
-            
-            # Apply date filters
-            if start_date and change_date < start_date:
-                continue
-            if end_date and change_date > end_date:
-                continue
-            
-            event = TimelineEvent(
-                id=f"status_change_{contact_id}_{i}",
-                event_type=TimelineEventType.STATUS_CHANGE,
-                timestamp=change_date,
-                title=f"Status Changed: {status_change.get('from_status')} → {status_change.get('to_status')}",
-                description=status_change.get('notes', ''),
-                actor_id=status_change.get('changed_by', 'system'),
-                actor_name=status_change.get('changed_by', 'System'),
-                metadata={
-                    'from_status': status_change.get('from_status'),
-                    'to_status': status_change.get('to_status'),
-                    'reason': status_change.get('reason')
-                },
-                priority="medium",
-                tags=['status-change'],
-                related_entities={
-                    'contact': str(contact_id),
-                    'status_change': f"{contact_id}_{i}"
-                }
-            )
-            events.append(event)
+        Events are only built for items that make it onto the page.
+        """
+        candidates: Dict[TimelineEventType, List[Tuple[datetime, str, Callable[[], TimelineEvent]]]] = {}
         
-        return events
-    
-    async def _get_system_events(
-        self,
-        contact_id: uuid.UUID,
-        business_id: uuid.UUID,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> List[TimelineEvent]:
-        """Get system-generated timeline events."""
-        contact = await self.contact_repository.get_by_id(contact_id)
-        if not contact:
-            return []
+        if TimelineEventType.INTERACTION in event_types:
+            candidates[TimelineEventType.INTERACTION] = [
+                (entry.timestamp, str(entry.id), partial(self._interaction_event, contact, entry))
+                for entry in contact.interaction_history
+            ]
         
-        events = []
+        if TimelineEventType.STATUS_CHANGE in event_types:
+            candidates[TimelineEventType.STATUS_CHANGE] = [
+                (entry.timestamp, str(entry.id), partial(self._status_change_event, contact, entry))
+                for entry in contact.status_history
+            ]
         
-        # Contact creation event
-        if not start_date or contact.created_date >= start_date:
-            if not end_date or contact.created_date <= end_date:
-                event = TimelineEvent(
-                    id=f"system_contact_created_{contact_id}",
-                    event_type=TimelineEventType.SYSTEM_EVENT,
-                    timestamp=contact.created_date,
-                    title="Contact Created",
-                    description=f"Contact {contact.display_name} was added to the system",
-                    actor_id=contact.created_by,
-                    actor_name=contact.created_by,
-                    metadata={
-                        'event_type': 'contact_created',
-                        'contact_type': contact.contact_type.value,
-                        'source': contact.source.value if contact.source else None
-                    },
-                    priority="low",
-                    tags=['system', 'creation'],
-                    related_entities={
-                        'contact': str(contact_id)
-                    }
+        if TimelineEventType.SYSTEM_EVENT in event_types:
+            system_events = []
+            if contact.created_date:
+                system_events.append(
+                    (contact.created_date, "contact_created", partial(self._contact_created_event, contact))
                 )
-                events.append(event)
-        
-        # Last contacted event
-        if contact.last_contacted:
-            if not start_date or contact.last_contacted >= start_date:
-                if not end_date or contact.last_contacted <= end_date:
-                    event = TimelineEvent(
-                        id=f"system_last_contacted_{contact_id}",
-                        event_type=TimelineEventType.SYSTEM_EVENT,
-                        timestamp=contact.last_contacted,
-                        title="Last Contact Updated",
-                        description="Contact timestamp was updated",
-                        actor_id="system",
-                        actor_name="System",
-                        metadata={
-                            'event_type': 'last_contacted_updated'
-                        },
-                        priority="low",
-                        tags=['system', 'contact-update'],
-                        related_entities={
-                            'contact': str(contact_id)
-                        }
-                    )
-                    events.append(event)
-        
-        return events
-    
-    async def _get_milestone_events(
-        self,
-        contact_id: uuid.UUID,
-        business_id: uuid.UUID,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> List[TimelineEvent]:
-        """Get milestone events (significant achievements or changes)."""
-        contact = await self.contact_repository.get_by_id(contact_id)
-        if not contact:
-            return []
+            if contact.last_contacted:
+                system_events.append(
+                    (contact.last_contacted, "last_contacted", partial(self._last_contacted_event, contact))
+                )
+            candidates[TimelineEventType.SYSTEM_EVENT] = system_events
         
-        events = []
+        if TimelineEventType.MILESTONE in event_types:
+            candidates[TimelineEventType.MILESTONE] = [
+                (entry.timestamp, str(entry.id), partial(self._milestone_event, contact, entry))
+                for entry in contact.status_history
+                if _enum_value(entry.to_status) in MILESTONE_TITLES
+            ]
         
-        # Check for relationship status milestones
-        if contact.status_history:
-            for i, status_change in enumerate(contact.status_history):
-                change_date = datetime.fromisoformat(status_change.get('changed_at', datetime.utcnow().isoformat()))
-                to_status = status_change.get('to_status')
-                
-                # Apply date filters
-                if start_date and change_date < start_date:
+        items = {}
+        for event_type, entries in candidates.items():
+            rank = SOURCE_RANKS[event_type]
+            source_items = []
+            for timestamp, key, build in entries:
+                timestamp = _as_utc(timestamp)
+                if start_date and timestamp < start_date:
                     continue
-                if end_date and change_date > end_date:
+                if end_date and timestamp > end_date:
                     continue
-                
-                # Check if this is a milestone status
-                milestone_statuses = ['active_client', 'qualified_lead', 'opportunity']
-                if to_status in milestone_statuses:
-                    milestone_titles = {
-                        'active_client': '🎉 Became Active Client',
-                        'qualified_lead': '📈 Qualified as Lead',
-                        'opportunity': '💼 Identified as Opportunity'
-                    }
-                    
-                    event = TimelineEvent(
-                        id=f"milestone_{contact_id}_{to_status}_{i}",
-                        event_type=TimelineEventType.MILESTONE,
-                        timestamp=change_date,
-                        title=milestone_titles.get(to_status, f"Milestone: {to_status}"),
-                        description=f"Contact reached {to_status} status",
-                        actor_id=status_change.get('changed_by', 'system'),
-                        actor_name=status_change.get('changed_by', 'System'),
-                        metadata={
-                            'milestone_type': 'status_milestone',
-                            'status': to_status,
-                            'previous_status': status_change.get('from_status')
-                        },
-                        priority="high",
-                        tags=['milestone', 'achievement', to_status],
-                        related_entities={
-                            'contact': str(contact_id),
-                            'milestone': f"{to_status}_{i}"
-                        }
-                    )
-                    events.append(event)
+                source_items.append(_TimelineItem((timestamp, -rank, key), build))
+            source_items.sort(key=lambda item: item.sort_key, reverse=True)
+            items[event_type] = source_items
         
-        return events
+        return items
+    
+    def _activity_event(self, contact_id: uuid.UUID, activity: Activity) -> TimelineEvent:
+        """Timeline event for an activity, placed at the time it was logged."""
+        return TimelineEvent(
+            id=f"activity_{activity.id}",
+            event_type=TimelineEventType.ACTIVITY,
+            timestamp=_as_utc(activity.created_date),
+            title=activity.title,
+            description=activity.description,
+            actor_id=activity.created_by,
+            actor_name=activity.created_by,  # Would need user lookup
+            metadata={
+                'activity_type': activity.activity_type.value,
+                'status': activity.status.value,
+                'priority': activity.priority.value,
+                'scheduled_date': activity.scheduled_date.isoformat() if activity.scheduled_date else None,
+                'duration_minutes': activity.duration_minutes,
+                'location': activity.location
+            },
+            priority=activity.priority.value,
+            tags=activity.tags,
+            related_entities={
+                'activity': str(activity.id),
+                'contact': str(contact_id)
+            }
+        )
+    
+    def _interaction_event(self, contact: Contact, interaction: InteractionHistoryEntry) -> TimelineEvent:
+        """Timeline event for a contact interaction."""
+        interaction_type = _enum_value(interaction.type)
+        return TimelineEvent(
+            id=f"interaction_{interaction.id}",
+            event_type=TimelineEventType.INTERACTION,
+            timestamp=_as_utc(interaction.timestamp),
+            title=f"{str(interaction_type).replace('_', ' ').title()} Interaction",
+            description=interaction.description,
+            actor_id=interaction.performed_by_id or interaction.performed_by,
+            actor_name=interaction.performed_by,
+            metadata={
+                'interaction_type': interaction_type,
+                'outcome': interaction.outcome,
+                'next_action': interaction.next_action,
+                'scheduled_follow_up': interaction.scheduled_follow_up.isoformat() if interaction.scheduled_follow_up else None
+            },
+            priority="medium",
+            related_entities={
+                'contact': str(contact.id),
+                'interaction': str(interaction.id)
+            }
+        )
+    
+    def _status_change_event(self, contact: Contact, status_change: StatusHistoryEntry) -> TimelineEvent:
+        """Timeline event for a relationship status change."""
+        from_status = _enum_value(status_change.from_status)
+        to_status = _enum_value(status_change.to_status)
+        return TimelineEvent(
+            id=f"status_change_{status_change.id}",
+            event_type=TimelineEventType.STATUS_CHANGE,
+            timestamp=_as_utc(status_change.timestamp),
+            title=f"Status Changed: {from_status} → {to_status}",
+            description=status_change.notes or '',
+            actor_id=status_change.changed_by_id or status_change.changed_by,
+            actor_name=status_change.changed_by,
+            metadata={
+                'from_status': from_status,
+                'to_status': to_status,
+                'reason': status_change.reason
+            },
+            priority="medium",
+            tags=['status-change'],
+            related_entities={
+                'contact': str(contact.id),
+                'status_change': str(status_change.id)
+            }
+        )
+    
+    def _contact_created_event(self, contact: Contact) -> TimelineEvent:
+        """System event for the contact being added."""
+        return TimelineEvent(
+            id=f"system_contact_created_{contact.id}",
+            event_type=TimelineEventType.SYSTEM_EVENT,
+            timestamp=_as_utc(contact.created_date),
+            title="Contact Created",
+            description=f"Contact {contact.get_display_name()} was added to the system",
+            actor_id=contact.created_by or "system",
+            actor_name=contact.created_by or "System",
+            metadata={
+                'event_type': 'contact_created',
+                'contact_type': _enum_value(contact.contact_type),
+                'source': _enum_value(contact.source)
+            },
+            priority="low",
+            tags=['system', 'creation'],
+            related_entities={
+                'contact': str(contact.id)
+            }
+        )
+    
+    def _last_contacted_event(self, contact: Contact) -> TimelineEvent:
+        """System event for the last contact timestamp."""
+        return TimelineEvent(
+            id=f"system_last_contacted_{contact.id}",
+            event_type=TimelineEventType.SYSTEM_EVENT,
+            timestamp=_as_utc(contact.last_contacted),
+            title="Last Contact Updated",
+            description="Contact timestamp was updated",
+            actor_id="system",
+            actor_name="System",
+            metadata={
+                'event_type': 'last_contacted_updated'
+            },
+            priority="low",
+            tags=['system', 'contact-update'],
+            related_entities={
+                'contact': str(contact.id)
+            }
+        )
+    
+    def _milestone_event(self, contact: Contact, status_change: StatusHistoryEntry) -> TimelineEvent:
+        """Milestone event for reaching a significant relationship status."""
+        to_status = _enum_value(status_change.to_status)
+        return TimelineEvent(
+            id=f"milestone_{status_change.id}",
+            event_type=TimelineEventType.MILESTONE,
+            timestamp=_as_utc(status_change.timestamp),
+            title=MILESTONE_TITLES.get(to_status, f"Milestone: {to_status}"),
+            description=f"Contact reached {to_status} status",
+            actor_id=status_change.changed_by_id or status_change.changed_by,
+            actor_name=status_change.changed_by,
+            metadata={
+                'milestone_type': 'status_milestone',
+                'status': to_status,
+                'previous_status': _enum_value(status_change.from_status)
+            },
+            priority="high",
+            tags=['milestone', 'achievement', to_status],
+            related_entities={
+                'contact': str(contact.id),
+                'milestone': str(status_change.id)
+            }
+        )
     
     def _group_events_by_day(self, events: List[TimelineEvent]) -> List[TimelineEvent]:
         """Group events by day for better visualization."""
@@ -292,6 +292,60 @@ class ManageActivitiesUseCase:
             end_date=dto.end_date
         )
     
+    async def get_business_activities(
+        self,
+        business_id: uuid.UUID,
+        user_id: str,
+        activity_types: Optional[List[ActivityType]] = None,
+        statuses: Optional[List[ActivityStatus]] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> ActivityListDTO:
+        """
+        Get a page of activities for a business with filtering.
+        
+        Args:
+            business_id: Business ID
+            user_id: ID of the user requesting activities
+            activity_types: Optional activity type filter
+            statuses: Optional status filter
+            assigned_to: Optional assignee filter
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of items to return
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to include an estimated total count
+            
+        Returns:
+            ActivityListDTO with the business's activities
+        """
+        # Validate user has permission to view activities in this business
+        await self._validate_user_permission(business_id, user_id, "view_contacts")
+        
+        activity_page = await self.activity_repository.get_business_activities_page(
+            business_id=business_id,
+            activity_types=activity_types,
+            statuses=statuses,
+            assigned_to=assigned_to,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
+        )
+        
+        return ActivityListDTO(
+            activities=[self._activity_to_response_dto(activity) for activity in activity_page.items],
+            total_count=activity_page.estimated_total,
+            limit=limit,
+            has_more=activity_page.has_next,
+            next_cursor=activity_page.next_cursor
+        )
+    
     async def get_user_activities(
         self,
         business_id: uuid.UUID,
@@ -299,11 +353,12 @@ class ManageActivitiesUseCase:
         statuses: Optional[List[ActivityStatus]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> ActivityListDTO:
         """
-        Get activities assigned to a user.
+        Get a page of activities assigned to a user.
         
         Args:
             business_id: Business ID
@@ -311,8 +366,9 @@ class ManageActivitiesUseCase:
             statuses: Optional status filter
             start_date: Optional start date filter
             end_date: Optional end date filter
-            skip: Number of items to skip
             limit: Maximum number of items to return
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to include an estimated total count
             
         Returns:
             ActivityListDTO with user's activities
@@ -321,24 +377,23 @@ class ManageActivitiesUseCase:
         await self._validate_user_permission(business_id, user_id, "view_contacts")
         
         # Get activities from repository
-        activities = await self.activity_repository.get_user_activities(
+        activity_page = await self.activity_repository.get_user_activities_page(
             business_id=business_id,
             user_id=user_id,
             statuses=statuses,
             start_date=start_date,
             end_date=end_date,
-            skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
         )
         
-        # Convert to response DTOs
-        activity_responses = [self._activity_to_response_dto(activity) for activity in activities]
-        
         return ActivityListDTO(
-            activities=activity_responses,
-            total_count=len(activity_responses),  # This would need a separate count query in production
-            skip=skip,
-            limit=limit
+            activities=[self._activity_to_response_dto(activity) for activity in activity_page.items],
+            total_count=activity_page.estimated_total,
+            limit=limit,
+            has_more=activity_page.has_next,
+            next_cursor=activity_page.next_cursor
         )
     
     async def get_overdue_activities(self, business_id: uuid.UUID, user_id: str, assigned_to: Optional[str] = None) -> List[ActivityResponseDTO]:
@@ -43,28 +43,26 @@ class BulkContactOperationsUseCase:
         # Validate user has permission to edit contacts in this business
         await self._validate_user_permission(dto.business_id, user_id, "edit_contacts")
         
-        updated_count = 0
+        has_changes = any([
+            dto.status is not None,
+            dto.priority is not None,
+            dto.assigned_to is not None,
+            dto.tags_to_add,
+            dto.tags_to_remove,
+        ])
+        if not has_changes:
+            return 0
         
-        # Update status if provided
-        if dto.status is not None:
-            updated_count += await self.contact_repository.bulk_update_status(
-                dto.business_id, dto.contact_ids, dto.status
-            )
-        
-        # Assign contacts if provided
-        if dto.assigned_to is not None:
-            updated_count += await self.contact_repository.bulk_assign_contacts(
-                dto.business_id, dto.contact_ids, dto.assigned_to
-            )
-        
-        # Add tags if provided
-        if dto.tags_to_add:
-            for tag in dto.tags_to_add:
-                await self.contact_repository.bulk_add_tag(
-                    dto.business_id, dto.contact_ids, tag
-                )
-        
-        return updated_count
+        # Apply all changes in a single set-based update
+        return await self.contact_repository.bulk_update_contacts(
+            dto.business_id,
+            dto.contact_ids,
+            status=dto.status,
+            priority=dto.priority,
+            assigned_to=dto.assigned_to,
+            tags_to_add=dto.tags_to_add,
+            tags_to_remove=dto.tags_to_remove
+        )
     
     async def _validate_user_permission(self, business_id: uuid.UUID, user_id: str, permission: str) -> None:
         """Validate that user has required permission for the business."""
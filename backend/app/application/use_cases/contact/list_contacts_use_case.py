@@ -6,7 +6,7 @@ Handles the business logic for retrieving lists of contacts for a business.
 
 import uuid
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 # Configure logging
@@ -32,17 +32,19 @@ class ListContactsUseCase:
         self.membership_repository = membership_repository
     
     async def execute(self, business_id: uuid.UUID, user_id: str,
-                     skip: int = 0, limit: int = 100,
-                     include_user_details: UserDetailLevel = UserDetailLevel.BASIC) -> ContactListDTO:
+                     limit: int = 100, cursor: Optional[str] = None,
+                     include_user_details: UserDetailLevel = UserDetailLevel.BASIC,
+                     include_total: bool = False) -> ContactListDTO:
         """
-        Get contacts for a business with pagination and optional user data.
+        Get a page of contacts for a business with optional user data.
         
         Args:
             business_id: ID of the business
             user_id: ID of the user requesting contacts
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page's next_cursor
             include_user_details: Level of user detail to include
+            include_total: Whether to include an estimated total count
             
         Returns:
             ContactListDTO with contacts and pagination info
@@ -55,16 +57,18 @@ class ListContactsUseCase:
         
         if include_user_details == UserDetailLevel.NONE:
             # Use regular repository method
-            contacts = await self.contact_repository.get_by_business_id(business_id, skip, limit)
-            contact_dtos = [self._contact_to_response_dto(contact) for contact in contacts]
+            contact_page = await self.contact_repository.get_page_by_business_id(
+                business_id, limit, cursor, include_total
+            )
+            contact_dtos = [self._contact_to_response_dto(contact) for contact in contact_page.items]
         else:
             # Use repository method with user data - simplified approach
-            contacts_data = await self.contact_repository.get_by_business_id_with_users(
-                business_id, include_user_details, skip, limit
+            contact_page = await self.contact_repository.get_page_by_business_id_with_users(
+                business_id, include_user_details, limit, cursor, include_total
             )
             # Use simplified conversion with better error handling
             contact_dtos = []
-            for contact_data in contacts_data:
+            for contact_data in contact_page.items:
                 try:
                     dto = self._contact_dict_to_response_dto_simple(contact_data, include_user_details)
                     contact_dtos.append(dto)
@@ -72,19 +76,13 @@ class ListContactsUseCase:
                     logger.warning(f"Skipping invalid contact {contact_data.get('id', 'unknown')}: {e}")
                     continue
         
-        total_count = await self.contact_repository.count_by_business(business_id)
-        
-        page = (skip // limit) + 1
-        has_next = (skip + limit) < total_count
-        has_previous = skip > 0
-        
         return ContactListDTO(
             contacts=contact_dtos,
-            total_count=total_count,
-            page=page,
+            total_count=contact_page.estimated_total,
             per_page=limit,
-            has_next=has_next,
-            has_previous=has_previous
+            has_next=contact_page.has_next,
+            has_previous=cursor is not None,
+            next_cursor=contact_page.next_cursor
         )
     
     async def _validate_user_permission(self, business_id: uuid.UUID, user_id: str, permission: str) -> None:
@@ -44,11 +44,14 @@ class SearchContactsUseCase:
         # Validate user has permission to view contacts in this business
         await self._validate_user_permission(search_dto.business_id, user_id, "view_contacts")
         
-        # For now, implement basic search - in production, this would use advanced filtering
+        # Term searches use the ranked search index with keyset pagination
+        next_cursor = None
         if search_dto.search_term:
-            contacts = await self.contact_repository.search_contacts(
-                search_dto.business_id, search_dto.search_term, search_dto.skip, search_dto.limit
+            search_page = await self.contact_repository.search_contacts_page(
+                search_dto.business_id, search_dto.search_term, search_dto.limit, search_dto.cursor
             )
+            contacts = search_page.items
+            next_cursor = search_page.next_cursor
         else:
             contacts = await self.contact_repository.get_by_business_id(
                 search_dto.business_id, search_dto.skip, search_dto.limit
@@ -64,8 +67,12 @@ class SearchContactsUseCase:
         contact_dtos = [self._contact_to_response_dto(contact) for contact in filtered_contacts]
         
         page = (search_dto.skip // search_dto.limit) + 1
-        has_next = (search_dto.skip + search_dto.limit) < total_count
-        has_previous = search_dto.skip > 0
+        if search_dto.search_term:
+            has_next = next_cursor is not None
+            has_previous = search_dto.cursor is not None
+        else:
+            has_next = (search_dto.skip + search_dto.limit) < total_count
+            has_previous = search_dto.skip > 0
         
         return ContactListDTO(
             contacts=contact_dtos,
@@ -73,7 +80,8 @@ class SearchContactsUseCase:
             page=page,
             per_page=search_dto.limit,
             has_next=has_next,
-            has_previous=has_previous
+            has_previous=has_previous,
+            next_cursor=next_cursor
         )
     
     async def _validate_user_permission(self, business_id: uuid.UUID, user_id: str, permission: str) -> None:
@@ -32,8 +32,9 @@ class ListEstimatesUseCase:
         business_id: uuid.UUID,
         user_id: str,
         filters: EstimateFilters,
-        skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """Execute the list estimates use case."""
         try:
@@ -43,40 +44,37 @@ class ListEstimatesUseCase:
             await self._validate_permissions(business_id, user_id)
             
             # Validate pagination parameters
-            self._validate_pagination_params(skip, limit)
+            self._validate_pagination_params(0, limit)
             
             # Convert Pydantic filters to dictionary
             filter_dict = filters.to_query_dict() if filters else {}
             
-            # Get estimates with filters using simplified repository interface
-            estimates, total_count = await self.estimate_repository.list_with_filters(
+            # Get a keyset page of estimates with filters
+            estimate_page = await self.estimate_repository.list_page_with_filters(
                 business_id=business_id,
                 filters=filter_dict,
                 sort_by=filters.sort_by if filters else "created_date",
                 sort_desc=filters.sort_desc if filters else True,
-                skip=skip,
-                limit=limit
+                limit=limit,
+                cursor=cursor,
+                include_total=include_total
             )
             
             # Convert to DTOs
-            estimate_dtos = [EstimateDTO.from_entity(estimate) for estimate in estimates]
-            
-            # Calculate pagination info
-            has_next = skip + len(estimates) < total_count
-            has_previous = skip > 0
+            estimate_dtos = [EstimateDTO.from_entity(estimate) for estimate in estimate_page.items]
             
             result = {
                 "estimates": estimate_dtos,
-                "total_count": total_count,
+                "total_count": estimate_page.estimated_total,
                 "page_count": len(estimate_dtos),
-                "skip": skip,
                 "limit": limit,
-                "has_next": has_next,
-                "has_previous": has_previous,
+                "has_next": estimate_page.has_next,
+                "has_previous": cursor is not None,
+                "next_cursor": estimate_page.next_cursor,
                 "filters_applied": filters.has_filters() if filters else False
             }
             
-            logger.info(f"Successfully listed {len(estimate_dtos)} estimates (total: {total_count})")
+            logger.info(f"Successfully listed {len(estimate_dtos)} estimates")
             
             return result
             
@@ -87,6 +85,53 @@ class ListEstimatesUseCase:
             logger.error(f"Unexpected error listing estimates: {e}")
             raise ApplicationError(f"Failed to list estimates: {str(e)}")
     
+    async def execute_summary(
+        self,
+        business_id: uuid.UUID,
+        user_id: str,
+        filters: EstimateFilters,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Dict[str, Any]:
+        """List estimate summaries (header and stored totals, no line items) for list screens."""
+        try:
+            logger.info(f"Listing estimate summaries for business {business_id} by user {user_id}")
+            
+            await self._validate_permissions(business_id, user_id)
+            self._validate_pagination_params(0, limit)
+            
+            filter_dict = filters.to_query_dict() if filters else {}
+            
+            summary_page = await self.estimate_repository.list_summary_page_with_filters(
+                business_id=business_id,
+                filters=filter_dict,
+                sort_by=filters.sort_by if filters else "created_date",
+                sort_desc=filters.sort_desc if filters else True,
+                limit=limit,
+                cursor=cursor,
+                include_total=include_total
+            )
+            
+            return {
+                "estimates": summary_page.items,
+                "total_count": summary_page.estimated_total,
+                "page_count": len(summary_page.items),
+                "limit": limit,
+                "has_next": summary_page.has_next,
+                "has_previous": cursor is not None,
+                "next_cursor": summary_page.next_cursor
+            }
+            
+        except AppValidationError:
+            raise
+        except BusinessRuleViolationError as e:
+            logger.warning(f"Business rule violation listing estimate summaries: {e}")
+            raise AppValidationError(str(e))
+        except Exception as e:
+            logger.error(f"Unexpected error listing estimate summaries: {e}")
+            raise ApplicationError(f"Failed to list estimate summaries: {str(e)}")
+    
     async def execute_with_common_filters(
         self,
         business_id: uuid.UUID,
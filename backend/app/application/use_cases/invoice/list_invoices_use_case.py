@@ -31,48 +31,38 @@ class ListInvoicesUseCase:
         business_id: uuid.UUID,
         user_id: str,
         filters: InvoiceListFilters,
-        skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """Execute the list invoices use case."""
         try:
             logger.info(f"🔧 ListInvoicesUseCase: Starting execution for business {business_id} by user {user_id}")
             logger.info(f"🔧 ListInvoicesUseCase: Filters: {filters}")
-            logger.info(f"🔧 ListInvoicesUseCase: Pagination - skip: {skip}, limit: {limit}")
+            logger.info(f"🔧 ListInvoicesUseCase: Pagination - cursor: {cursor}, limit: {limit}")
             
             # Validate business context and permissions
             await self._validate_permissions(business_id, user_id)
             
             # Validate pagination parameters
-            self._validate_pagination_params(skip, limit)
+            self._validate_pagination_params(0, limit)
             
             # Build filters dictionary for repository
-            filter_dict = {}
-            if filters.status:
-                filter_dict["status"] = filters.status
-            if filters.contact_id:
-                filter_dict["contact_id"] = filters.contact_id
-            if filters.project_id:
-                filter_dict["project_id"] = filters.project_id
-            if filters.job_id:
-                filter_dict["job_id"] = filters.job_id
-            if filters.date_from:
-                filter_dict["date_from"] = filters.date_from
-            if filters.date_to:
-                filter_dict["date_to"] = filters.date_to
-            if filters.overdue_only:
-                filter_dict["overdue_only"] = filters.overdue_only
+            filter_dict = self._build_filter_dict(filters)
             
             logger.info(f"🔧 ListInvoicesUseCase: Built filter dict: {filter_dict}")
             
-            # Get invoices with filters (returns both invoices and total count)
-            logger.info(f"🔧 ListInvoicesUseCase: Calling repository.list_with_pagination...")
-            invoices, total_count = await self.invoice_repository.list_with_pagination(
+            # Get a keyset page of invoices with filters
+            logger.info(f"🔧 ListInvoicesUseCase: Calling repository.list_page_with_filters...")
+            invoice_page = await self.invoice_repository.list_page_with_filters(
                 business_id=business_id,
-                skip=skip,
                 limit=limit,
-                filters=filter_dict if filter_dict else None
+                cursor=cursor,
+                filters=filter_dict if filter_dict else None,
+                include_total=include_total
             )
+            invoices = invoice_page.items
+            total_count = invoice_page.estimated_total
             
             logger.info(f"🔧 ListInvoicesUseCase: Repository returned {len(invoices)} invoices, total_count: {total_count}")
             
@@ -105,17 +95,17 @@ class ListInvoicesUseCase:
                     raise
             
             # Calculate pagination info
-            has_next = skip + len(invoices) < total_count
-            has_previous = skip > 0
+            has_next = invoice_page.has_next
+            has_previous = cursor is not None
             
             result = {
                 "invoices": invoice_dtos,
                 "total_count": total_count,
                 "page_count": len(invoice_dtos),
-                "skip": skip,
                 "limit": limit,
                 "has_next": has_next,
-                "has_previous": has_previous
+                "has_previous": has_previous,
+                "next_cursor": invoice_page.next_cursor
             }
             
             logger.info(f"🔧 ListInvoicesUseCase: Successfully prepared result with {len(invoice_dtos)} DTOs")
@@ -133,6 +123,70 @@ class ListInvoicesUseCase:
             logger.error(f"❌ ListInvoicesUseCase: Traceback: {traceback.format_exc()}")
             raise ApplicationError(f"Failed to list invoices: {str(e)}")
     
+    async def execute_summary(
+        self,
+        business_id: uuid.UUID,
+        user_id: str,
+        filters: InvoiceListFilters,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Dict[str, Any]:
+        """List invoice summaries (header and stored totals, no line items or payments) for list screens."""
+        try:
+            logger.info(f"Listing invoice summaries for business {business_id} by user {user_id}")
+            
+            await self._validate_permissions(business_id, user_id)
+            self._validate_pagination_params(0, limit)
+            
+            filter_dict = self._build_filter_dict(filters)
+            
+            summary_page = await self.invoice_repository.list_summary_page_with_filters(
+                business_id=business_id,
+                limit=limit,
+                cursor=cursor,
+                filters=filter_dict if filter_dict else None,
+                include_total=include_total
+            )
+            
+            return {
+                "invoices": summary_page.items,
+                "total_count": summary_page.estimated_total,
+                "page_count": len(summary_page.items),
+                "limit": limit,
+                "has_next": summary_page.has_next,
+                "has_previous": cursor is not None,
+                "next_cursor": summary_page.next_cursor
+            }
+            
+        except AppValidationError:
+            raise
+        except BusinessRuleViolationError as e:
+            logger.warning(f"Business rule violation listing invoice summaries: {e}")
+            raise AppValidationError(str(e))
+        except Exception as e:
+            logger.error(f"Unexpected error listing invoice summaries: {e}")
+            raise ApplicationError(f"Failed to list invoice summaries: {str(e)}")
+    
+    def _build_filter_dict(self, filters: InvoiceListFilters) -> Dict[str, Any]:
+        """Translate list filters into the repository filter dictionary."""
+        filter_dict = {}
+        if filters.status:
+            filter_dict["status"] = filters.status
+        if filters.contact_id:
+            filter_dict["contact_id"] = filters.contact_id
+        if filters.project_id:
+            filter_dict["project_id"] = filters.project_id
+        if filters.job_id:
+            filter_dict["job_id"] = filters.job_id
+        if filters.date_from:
+            filter_dict["date_from"] = filters.date_from
+        if filters.date_to:
+            filter_dict["date_to"] = filters.date_to
+        if filters.overdue_only:
+            filter_dict["overdue_only"] = filters.overdue_only
+        return filter_dict
+    
     async def _validate_permissions(self, business_id: uuid.UUID, user_id: str) -> None:
         """Validate user has permission to list invoices in this business."""
         # TODO: Implement permission checking logic
@@ -6,10 +6,11 @@ Handles job listing, searching, and filtering with various criteria.
 """
 
 import uuid
-from typing import List
+from typing import List, Optional
 
 from ...dto.job_dto import JobListDTO, JobSearchDTO
 from app.domain.repositories.job_repository import JobRepository
+from app.domain.shared.pagination import CursorPage
 from .job_helper_service import JobHelperService
 
 
@@ -30,15 +31,22 @@ class JobSearchUseCase:
         self.job_helper_service = job_helper_service
     
     async def list_jobs(self, business_id: uuid.UUID, user_id: str,
-                       skip: int = 0, limit: int = 100) -> List[JobListDTO]:
-        """List jobs for a business."""
+                       limit: int = 100, cursor: Optional[str] = None,
+                       include_total: bool = False) -> CursorPage[JobListDTO]:
+        """List a page of jobs for a business, newest first."""
         
         # Check permission
         await self.job_helper_service.check_permission(business_id, user_id, "view_jobs")
         
-        jobs = await self.job_repository.get_by_business_id(business_id, skip, limit)
+        job_page = await self.job_repository.get_page_by_business_id(
+            business_id, limit, cursor, include_total
+        )
         
-        return [await self.job_helper_service.convert_to_list_dto(job) for job in jobs]
+        return CursorPage(
+            items=[await self.job_helper_service.convert_to_list_dto(job) for job in job_page.items],
+            next_cursor=job_page.next_cursor,
+            estimated_total=job_page.estimated_total
+        )
     
     async def search_jobs(self, business_id: uuid.UUID, search_params: JobSearchDTO,
                          user_id: str) -> List[JobListDTO]:
@@ -91,10 +91,14 @@ class ManageInventoryUseCase:
             # Calculate total cost
             movement.total_cost = movement.calculate_total_cost()
             
-            # Update product quantities
-            await self.product_repository.update_quantity(
+            # Update product quantities atomically; a concurrent change may have consumed the stock
+            applied = await self.product_repository.update_quantity(
                 business_id, adjustment.product_id, adjustment.quantity_change
             )
+            if not applied:
+                raise BusinessRuleViolationError(
+                    "Adjustment would result in negative stock after a concurrent change"
+                )
             
             # Save stock movement
             await self.stock_movement_repository.create(movement)
@@ -119,6 +123,75 @@ class ManageInventoryUseCase:
                 raise AppValidationError(str(e))
             raise ApplicationError(f"Failed to process stock adjustment: {str(e)}")
     
+    async def bulk_adjust_stock(
+        self,
+        adjustments: List[Dict[str, Any]],
+        user_id: str,
+        business_id: uuid.UUID,
+        batch_id: Optional[uuid.UUID] = None
+    ) -> Dict[str, Any]:
+        """
+        Adjust stock for many products in one atomic call.
+
+        Each adjustment has product_id, quantity_change and optionally
+        adjustment_reason, reference_number and notes. Either every movement
+        and stock change is applied or none is; repeating a batch_id (e.g. a
+        client retry) does not apply it twice.
+        """
+        try:
+            logger.info(f"Processing bulk stock adjustment of {len(adjustments)} lines by user {user_id}")
+            
+            # Validate permissions
+            await self._validate_permissions(business_id, user_id, "adjust_inventory")
+            
+            if not adjustments:
+                raise BusinessRuleViolationError("At least one adjustment is required")
+            
+            batch_id = batch_id or uuid.uuid4()
+            movement_date = datetime.utcnow()
+            movements = [
+                StockMovement(
+                    id=uuid.uuid4(),
+                    business_id=business_id,
+                    product_id=uuid.UUID(str(adjustment["product_id"])),
+                    movement_type=StockMovementType.ADJUSTMENT,
+                    quantity=Decimal(str(adjustment["quantity_change"])),
+                    context=StockMovementContext(
+                        reference_number=adjustment.get("reference_number")
+                    ),
+                    reason=adjustment.get("adjustment_reason"),
+                    notes=adjustment.get("notes"),
+                    movement_date=movement_date,
+                    created_by=user_id,
+                    is_approved=True
+                )
+                for adjustment in adjustments
+            ]
+            
+            result = await self.stock_movement_repository.record_movement_batch(
+                business_id, batch_id, movements
+            )
+            
+            if result["status"] == "insufficient_stock":
+                raise BusinessRuleViolationError(
+                    "Adjustment would result in negative stock or references an unknown product"
+                )
+            
+            logger.info(f"Bulk stock adjustment {batch_id} {result['status']}")
+            
+            return {
+                "success": True,
+                "batch_id": batch_id,
+                "movement_count": result["movement_count"],
+                "duplicate": result["status"] == "duplicate"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing bulk stock adjustment: {e}")
+            if isinstance(e, (DomainValidationError, BusinessRuleViolationError, EntityNotFoundError)):
+                raise AppValidationError(str(e))
+            raise ApplicationError(f"Failed to process bulk stock adjustment: {str(e)}")
+    
     async def transfer_stock(
         self,
         product_id: uuid.UUID,
@@ -276,7 +349,7 @@ class ManageInventoryUseCase:
             
             # Update product quantities and cost
             await self.product_repository.update_quantity(business_id, product_id, quantity)
-            await self.product_repository.update_cost(business_id, product_id, unit_cost, quantity)
+            await self.product_repository.update_cost(business_id, product_id, unit_cost)
             
             # Save stock movement
             await self.stock_movement_repository.create(movement)
@@ -331,11 +404,13 @@ class ManageInventoryUseCase:
                     f"Insufficient available stock. Available: {product.quantity_available}, Requested: {quantity}"
                 )
             
-            # Reserve the quantity
+            # Reserve the quantity; the repository re-checks availability atomically
             success = await self.product_repository.reserve_quantity(business_id, product_id, quantity)
             
             if not success:
-                raise ApplicationError("Failed to reserve stock")
+                raise BusinessRuleViolationError(
+                    f"Insufficient available stock. Requested: {quantity}"
+                )
             
             logger.info(f"Successfully reserved {quantity} units of product {product_id}")
             
@@ -210,90 +210,59 @@ class ProcessPurchaseOrderUseCase:
         user_id: str,
         business_id: uuid.UUID,
         partial_receipt: bool = False,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        batch_id: Optional[uuid.UUID] = None
     ) -> Dict[str, Any]:
-        """Receive items from purchase order."""
+        """
+        Receive items from purchase order.
+
+        All lines are applied in a single repository call. Passing the same
+        batch_id again (e.g. a client retry) does not receive the items twice.
+        """
         try:
             logger.info(f"Receiving items for purchase order {purchase_order_id} by user {user_id}")
             
             # Validate permissions
             await self._validate_permissions(business_id, user_id, "receive_purchase_order")
             
-            # Get purchase order
-            po = await self.purchase_order_repository.get_by_id(business_id, purchase_order_id)
-            if not po:
-                raise EntityNotFoundError(f"Purchase order {purchase_order_id} not found")
-            
-            # Validate can receive
-            if po.status not in [PurchaseOrderStatus.SENT, PurchaseOrderStatus.CONFIRMED, PurchaseOrderStatus.PARTIAL]:
-                raise BusinessRuleViolationError(f"Cannot receive purchase order in {po.status.value} status")
-            
-            # Process received items
-            total_received_value = Decimal('0')
-            items_updated = 0
-            
-            for received_item in received_items:
-                line_item_id = uuid.UUID(received_item['line_item_id'])
-                quantity_received = Decimal(str(received_item['quantity_received']))
-                
-                # Find the line item
-                line_item = next((item for item in po.line_items if item.id == line_item_id), None)
-                if not line_item:
-                    continue
-                
-                # Validate received quantity
-                if quantity_received <= 0:
-                    continue
-                
-                if line_item.quantity_received + quantity_received > line_item.quantity_ordered:
-                    raise BusinessRuleViolationError(
-                        f"Cannot receive more than ordered for item {line_item.product_name}"
-                    )
-                
-                # Update line item
-                line_item.quantity_received += quantity_received
-                line_item.quantity_pending = line_item.quantity_ordered - line_item.quantity_received
-                
-                # Update product inventory
-                await self.product_repository.update_quantity(
-                    business_id, line_item.product_id, quantity_received
-                )
-                
-                # Update product cost if needed
-                await self.product_repository.update_cost(
-                    business_id, line_item.product_id, line_item.unit_cost, quantity_received
-                )
-                
-                total_received_value += quantity_received * line_item.unit_cost
-                items_updated += 1
-            
-            # Update purchase order status
-            all_received = all(item.quantity_received >= item.quantity_ordered for item in po.line_items)
-            any_received = any(item.quantity_received > 0 for item in po.line_items)
+            receipts = [
+                {
+                    "line_item_id": item["line_item_id"],
+                    "quantity_received": Decimal(str(item["quantity_received"]))
+                }
+                for item in received_items
+                if Decimal(str(item["quantity_received"])) > 0
+            ]
             
-            if all_received:
-                po.status = PurchaseOrderStatus.RECEIVED
-                po.received_date = datetime.utcnow()
-            elif any_received:
-                po.status = PurchaseOrderStatus.PARTIAL
-            
-            po.last_received_date = datetime.utcnow()
-            po.received_by = user_id
-            if notes:
-                po.notes = f"{po.notes}\n\nReceiving Notes: {notes}" if po.notes else f"Receiving Notes: {notes}"
+            result = await self.purchase_order_repository.record_receipt(
+                business_id=business_id,
+                order_id=purchase_order_id,
+                line_item_receipts=receipts,
+                received_by=user_id,
+                batch_id=batch_id or uuid.uuid4(),
+                notes=notes
+            )
             
-            # Save updated purchase order
-            updated_po = await self.purchase_order_repository.update(po)
+            receipt_status = result.get("status")
+            if receipt_status == "not_found":
+                raise EntityNotFoundError(f"Purchase order {purchase_order_id} not found")
+            if receipt_status == "invalid_status":
+                raise BusinessRuleViolationError(
+                    f"Cannot receive purchase order in {result.get('order_status')} status"
+                )
+            if receipt_status == "over_receipt":
+                raise BusinessRuleViolationError("Cannot receive more than ordered for a line item")
             
             logger.info(f"Successfully received items for purchase order {purchase_order_id}")
             
             return {
                 "success": True,
-                "purchase_order_id": updated_po.id,
-                "status": updated_po.status.value,
-                "items_updated": items_updated,
-                "total_received_value": float(total_received_value),
-                "is_complete": all_received
+                "purchase_order_id": purchase_order_id,
+                "status": result.get("order_status"),
+                "items_updated": result.get("items_updated", 0),
+                "total_received_value": float(result.get("total_received_value", 0)),
+                "is_complete": result.get("is_complete", result.get("order_status") == PurchaseOrderStatus.RECEIVED.value),
+                "duplicate": receipt_status == "duplicate"
             }
             
         except Exception as e:
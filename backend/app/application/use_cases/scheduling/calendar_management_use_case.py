@@ -22,15 +22,23 @@ from ...exceptions.application_exceptions import (
 from ...ports.auth_service import AuthServicePort
 from ...ports.sms_service import SMSServicePort
 from ...ports.email_service import EmailServicePort
+from ...services.team_availability_service import TeamAvailabilityService, working_windows
 from app.domain.entities.user_capabilities import (
     UserCapabilities, CalendarEvent, TimeOffRequest, WorkingHoursTemplate,
     CalendarPreferences, CalendarEventType, TimeOffType, RecurrenceType
 )
 from app.domain.repositories.user_capabilities_repository import UserCapabilitiesRepository
 from app.domain.repositories.business_membership_repository import BusinessMembershipRepository
+from app.domain.services.calendar_occurrences import BusyIntervalIndex
 
 logger = logging.getLogger(__name__)
 
+# Bookable slot grid, matching UserCapabilities.get_available_time_slots_for_date
+SLOT_DURATION_MINUTES = 60
+SLOT_INTERVAL_MINUTES = 30
+# Members with less free time than this share of their working hours are "limited"
+LIMITED_AVAILABILITY_RATIO = 0.5
+
 
 class CalendarManagementUseCase:
     """Use case for comprehensive calendar management."""
@@ -41,13 +49,17 @@ class CalendarManagementUseCase:
         business_membership_repository: BusinessMembershipRepository,
         auth_service: AuthServicePort,
         sms_service: Optional[SMSServicePort] = None,
-        email_service: Optional[EmailServicePort] = None
+        email_service: Optional[EmailServicePort] = None,
+        team_availability_service: Optional[TeamAvailabilityService] = None
     ):
         self.user_capabilities_repository = user_capabilities_repository
         self.business_membership_repository = business_membership_repository
         self.auth_service = auth_service
         self.sms_service = sms_service
         self.email_service = email_service
+        self.team_availability_service = team_availability_service or TeamAvailabilityService(
+            user_capabilities_repository
+        )
     
     # Working Hours Management
     async def create_working_hours_template(
@@ -213,6 +225,7 @@ class CalendarManagementUseCase:
                 recurrence_count=request.recurrence_count,
                 recurrence_interval=request.recurrence_interval,
                 recurrence_days_of_week=request.recurrence_days_of_week,
+                recurrence_exception_dates=request.recurrence_exception_dates,
                 blocks_scheduling=request.blocks_scheduling,
                 allows_emergency_override=request.allows_emergency_override
             )
@@ -397,14 +410,20 @@ class CalendarManagementUseCase:
             # Check permissions
             await self._check_member_permission(business_id, current_user_id)
             
-            user_availability = []
+            schedules = await self.team_availability_service.load_schedules(
+                business_id, request.start_datetime, request.end_datetime,
+                user_ids=request.user_ids,
+                include_time_off=request.include_time_off,
+                include_calendar_events=request.include_calendar_events
+            )
             
-            for user_id in request.user_ids:
-                availability = await self._get_user_availability_for_period(
-                    business_id, user_id, request.start_datetime, request.end_datetime,
-                    request.include_time_off, request.include_calendar_events, request.include_working_hours
+            user_availability = [
+                self._build_user_availability(
+                    user_id, schedules.members.get(user_id), request.start_datetime, request.end_datetime,
+                    schedules.index, schedules.time_off.get(user_id, []), schedules.events.get(user_id, [])
                 )
-                user_availability.append(availability)
+                for user_id in request.user_ids
+            ]
             
             # Generate summary
             summary = self._generate_availability_summary(user_availability)
@@ -432,22 +451,47 @@ class CalendarManagementUseCase:
             # Check permissions
             await self._check_member_permission(business_id, current_user_id)
             
-            summary = await self.user_capabilities_repository.get_team_availability_summary(
+            schedules, matrix = await self.team_availability_service.get_team_matrix(
                 business_id, start_date, end_date
             )
+            member_hours = matrix.member_hours()
+            
+            member_summaries = []
+            members_with_limited_availability = 0
+            for user_id, member in schedules.members.items():
+                working_hours, available_hours = member_hours[user_id]
+                time_off = schedules.time_off.get(user_id, [])
+                available_slots = [
+                    {"start": start, "end": end} for start, end in matrix.available_intervals(user_id)
+                ]
+                is_available = bool(available_slots)
+                if is_available and available_hours < working_hours * LIMITED_AVAILABILITY_RATIO:
+                    members_with_limited_availability += 1
+                
+                member_summaries.append(UserAvailabilityDTO(
+                    user_id=user_id,
+                    date=start_date,
+                    available_slots=available_slots,
+                    total_available_hours=available_hours,
+                    working_hours=self._get_working_hours_for_date(member, start_date),
+                    time_off=[self._convert_time_off_to_dto(req) for req in time_off],
+                    calendar_events=[self._convert_event_to_dto(event) for event in schedules.events.get(user_id, [])],
+                    is_available=is_available,
+                    unavailable_reason=self._unavailable_reason(is_available, time_off, working_hours > 0)
+                ))
             
             return TeamAvailabilitySummaryDTO(
                 business_id=str(business_id),
                 start_date=start_date,
                 end_date=end_date,
-                total_team_members=summary.get("total_team_members", 0),
-                available_members=summary.get("available_members", 0),
-                members_on_time_off=summary.get("members_on_time_off", 0),
-                members_with_limited_availability=summary.get("members_with_limited_availability", 0),
-                daily_availability=summary.get("daily_availability", []),
-                member_summaries=summary.get("member_summaries", []),
-                peak_availability_hours=summary.get("peak_availability_hours", []),
-                coverage_gaps=summary.get("coverage_gaps", [])
+                total_team_members=len(schedules.members),
+                available_members=sum(1 for summary in member_summaries if summary.is_available),
+                members_on_time_off=sum(1 for user_id in schedules.members if schedules.time_off.get(user_id)),
+                members_with_limited_availability=members_with_limited_availability,
+                daily_availability=matrix.daily_availability(),
+                member_summaries=member_summaries,
+                peak_availability_hours=matrix.peak_hours(),
+                coverage_gaps=matrix.coverage_gaps()
             )
             
         except Exception as e:
@@ -550,19 +594,17 @@ class CalendarManagementUseCase:
         if not membership or membership.role not in ["admin", "owner"]:
             raise ValidationError("Insufficient permissions")
     
-    async def _get_user_availability_for_period(
+    def _build_user_availability(
         self,
-        business_id: uuid.UUID,
         user_id: str,
+        user_capabilities: Optional[UserCapabilities],
         start_datetime: datetime,
         end_datetime: datetime,
-        include_time_off: bool,
-        include_calendar_events: bool,
-        include_working_hours: bool
+        index: BusyIntervalIndex,
+        time_off: List[TimeOffRequest],
+        events: List[CalendarEvent]
     ) -> UserAvailabilityDTO:
-        """Get detailed availability for a user in a time period."""
-        # Get user capabilities
-        user_capabilities = await self.user_capabilities_repository.get_by_user_id(business_id, user_id)
+        """Get detailed availability for a user in a time period from the busy index."""
         if not user_capabilities:
             return UserAvailabilityDTO(
                 user_id=user_id,
@@ -571,55 +613,29 @@ class CalendarManagementUseCase:
                 unavailable_reason="User capabilities not found"
             )
         
-        # Check availability for each day in the period
-        current_date = start_datetime.date()
-        end_date = end_datetime.date()
+        slot_duration = timedelta(minutes=SLOT_DURATION_MINUTES)
+        slot_interval = timedelta(minutes=SLOT_INTERVAL_MINUTES)
         available_slots = []
-        time_off_list = []
-        calendar_events_list = []
         total_available_hours = 0.0
+        has_working_hours = False
         
-        while current_date <= end_date:
-            # Get available slots for this date
-            if user_capabilities.working_hours_template:
-                day_slots = user_capabilities.get_available_time_slots_for_date(current_date)
-                available_slots.extend([
-                    {"start": slot[0], "end": slot[1]} for slot in day_slots
-                ])
-                
-                # Calculate available hours
-                for slot in day_slots:
-                    duration = (slot[1] - slot[0]).total_seconds() / 3600
-                    total_available_hours += duration
-            
-            current_date += timedelta(days=1)
+        for working_start, working_end in working_windows(user_capabilities, start_datetime, end_datetime):
+            has_working_hours = True
+            free = index.free(user_id, max(working_start, start_datetime), min(working_end, end_datetime))
+            total_available_hours += sum((end - start).total_seconds() / 3600 for start, end in free)
+            
+            # Slots stay on the working-hours grid and must fit in one free interval
+            position = 0
+            slot_start = working_start
+            while slot_start + slot_duration <= working_end:
+                slot_end = slot_start + slot_duration
+                while position < len(free) and free[position][1] < slot_end:
+                    position += 1
+                if position < len(free) and free[position][0] <= slot_start:
+                    available_slots.append({"start": slot_start, "end": slot_end})
+                slot_start += slot_interval
         
-        # Get time off if requested
-        if include_time_off:
-            time_off_requests = await self.user_capabilities_repository.get_time_off_requests(
-                user_id, business_id, "approved"
-            )
-            time_off_list = [self._convert_time_off_to_dto(req) for req in time_off_requests
-                           if req.start_date <= end_datetime.date() and req.end_date >= start_datetime.date()]
-        
-        # Get calendar events if requested
-        if include_calendar_events:
-            events = await self.user_capabilities_repository.get_calendar_events(
-                user_id, business_id, start_datetime.date(), end_datetime.date()
-            )
-            calendar_events_list = [self._convert_event_to_dto(event) for event in events]
-        
-        # Determine overall availability
-        is_available = len(available_slots) > 0 and not any(
-            req.affects_scheduling for req in time_off_list
-        )
-        
-        unavailable_reason = None
-        if not is_available:
-            if not available_slots:
-                unavailable_reason = "No working hours configured"
-            elif any(req.affects_scheduling for req in time_off_list):
-                unavailable_reason = "On approved time off"
+        is_available = bool(available_slots)
         
         return UserAvailabilityDTO(
             user_id=user_id,
@@ -627,12 +643,27 @@ class CalendarManagementUseCase:
             available_slots=available_slots,
             total_available_hours=total_available_hours,
             working_hours=self._get_working_hours_for_date(user_capabilities, start_datetime.date()),
-            time_off=time_off_list,
-            calendar_events=calendar_events_list,
+            time_off=[self._convert_time_off_to_dto(req) for req in time_off],
+            calendar_events=[self._convert_event_to_dto(event) for event in events],
             is_available=is_available,
-            unavailable_reason=unavailable_reason
+            unavailable_reason=self._unavailable_reason(is_available, time_off, has_working_hours)
         )
     
+    def _unavailable_reason(
+        self,
+        is_available: bool,
+        time_off: List[TimeOffRequest],
+        has_working_hours: bool
+    ) -> Optional[str]:
+        """Why a user has no free time in a period, if they have none."""
+        if is_available:
+            return None
+        if any(req.affects_scheduling for req in time_off):
+            return "On approved time off"
+        if not has_working_hours:
+            return "No working hours configured"
+        return "No free time in working hours"
+    
     def _get_working_hours_for_date(self, user_capabilities: UserCapabilities, check_date: date) -> Optional[Dict[str, Any]]:
         """Get working hours for a specific date."""
         if not user_capabilities.working_hours_template:
@@ -729,16 +760,17 @@ class CalendarManagementUseCase:
             business_id=str(event.business_id),
             title=event.title,
             description=event.description,
-            event_type=event.event_type.value,
+            event_type=CalendarEventType(event.event_type).value,
             start_datetime=event.start_datetime,
             end_datetime=event.end_datetime,
             is_all_day=event.is_all_day,
             timezone=event.timezone,
-            recurrence_type=event.recurrence_type.value,
+            recurrence_type=RecurrenceType(event.recurrence_type).value,
             recurrence_end_date=event.recurrence_end_date,
             recurrence_count=event.recurrence_count,
             recurrence_interval=event.recurrence_interval,
             recurrence_days_of_week=event.recurrence_days_of_week,
+            recurrence_exception_dates=event.recurrence_exception_dates,
             blocks_scheduling=event.blocks_scheduling,
             allows_emergency_override=event.allows_emergency_override,
             created_date=event.created_date,
@@ -6,8 +6,8 @@ using external services for travel time and weather data integration.
 """
 
 import uuid
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from datetime import datetime, time, timedelta
 from decimal import Decimal
 import asyncio
 import logging
@@ -37,6 +37,17 @@ from ...ports.external_services import (
 
 logger = logging.getLogger(__name__)
 
+SLOT_INTERVAL = timedelta(minutes=30)
+DEFAULT_TRAVEL_MINUTES = 30
+ENRICHMENT_CONCURRENCY = 8
+PRIORITY_PRICE_MULTIPLIERS = {
+    "low": 0.95,
+    "medium": 1.0,
+    "high": 1.15,
+    "urgent": 1.3,
+    "emergency": 1.5,
+}
+
 
 class IntelligentSchedulingUseCase:
     """
@@ -685,137 +696,162 @@ class IntelligentSchedulingUseCase:
                                            business_id: uuid.UUID,
                                            request: AvailableTimeSlotRequestDTO,
                                            available_users: List[UserCapabilities]) -> List[TimeSlotDTO]:
-        """Generate available time slots based on user availability and job requirements."""
-        time_slots = []
-        slot_duration = timedelta(hours=request.estimated_duration_hours)
-        
-        # Define time slot intervals (e.g., every 30 minutes)
-        slot_interval = timedelta(minutes=30)
+        """
+        Generate available time slots based on user availability and job requirements.
         
-        # Get date range
+        Everything that does not depend on the slot is computed once: skill
+        matching and travel time per technician. Availability is evaluated as
+        free intervals per technician and day, and slot starts are read off
+        those intervals on the 30-minute grid.
+        """
+        slot_duration = timedelta(hours=request.estimated_duration_hours)
         start_date = request.preferred_date_range.start_time
         end_date = request.preferred_date_range.end_time
         
-        current_time = start_date
+        if slot_duration <= timedelta(0) or start_date + slot_duration > end_date:
+            return []
         
-        while current_time < end_date:
-            slot_end = current_time + slot_duration
-            
-            # Don't generate slots that extend beyond the requested range
-            if slot_end > end_date:
-                break
-            
-            # Check each available user for this time slot
-            for user in available_users:
-                if await self._is_user_available_for_slot(user, current_time, slot_end, request.required_skills):
-                    # Calculate travel time if job address is provided
-                    travel_time_minutes = 0
-                    if request.job_address and user.home_base_latitude and user.home_base_longitude:
-                        try:
-                            travel_time_minutes = await self.route_optimization_service.calculate_travel_time(
-                                (user.home_base_latitude, user.home_base_longitude),
-                                (request.job_address.get("latitude", 0), request.job_address.get("longitude", 0))
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to calculate travel time: {str(e)}")
-                            travel_time_minutes = 30  # Default fallback
-                    
-                    # Calculate base quality score
-                    quality_score = self._calculate_slot_quality_score(
-                        user, current_time, slot_end, request
-                    )
-                    
-                    # Get weather impact if available
-                    weather_impact = None
-                    if self.weather_service:
-                        try:
-                            weather_data = await self.weather_service.get_weather_impact(
-                                request.job_address.get("latitude", 0) if request.job_address else 0,
-                                request.job_address.get("longitude", 0) if request.job_address else 0,
-                                current_time,
-                                request.job_type
-                            )
-                            weather_impact = weather_data
-                        except Exception as e:
-                            logger.warning(f"Failed to get weather impact: {str(e)}")
-                    
-                    # Calculate dynamic pricing
-                    base_price = 100.0  # Base price
-                    pricing_factors = self._calculate_pricing_factors(current_time, request.priority, quality_score)
-                    estimated_price = base_price * pricing_factors["total_multiplier"]
-                    
-                    # Create time slot
-                    slot = TimeSlotDTO(
-                        slot_id=str(uuid.uuid4()),
-                        start_time=current_time,
-                        end_time=slot_end,
-                        available_technicians=[{
-                            "technician_id": user.user_id,
-                            "name": f"Technician {user.user_id}",  # Would get from user service
-                            "skills": [skill.skill_id for skill in user.skills],
-                            "rating": float(user.average_job_rating) if user.average_job_rating else 4.5,
-                            "travel_time_minutes": travel_time_minutes
-                        }],
-                        estimated_duration_hours=request.estimated_duration_hours,
-                        slot_quality_score=quality_score,
-                        pricing_info={
-                            "base_price": base_price,
-                            "estimated_price": estimated_price,
-                            "pricing_factors": pricing_factors
-                        },
-                        weather_impact=weather_impact,
-                        travel_time_minutes=travel_time_minutes,
-                        confidence_score=0.85,  # Base confidence
-                        alternative_times=[],  # Would be populated with nearby slots
-                        booking_deadline=current_time - timedelta(hours=2),  # 2 hours before
-                        cancellation_policy="24_hours"
-                    )
-                    
-                    # Enhance slot with calendar-aware data
-                    slot = await self._enhance_time_slot_with_calendar_data(slot, user)
-                    
-                    time_slots.append(slot)
+        candidates = [
+            user for user in available_users
+            if user.matches_job_requirements(request.required_skills)
+        ]
+        if not candidates:
+            return []
+        
+        travel_minutes = await self._get_technician_travel_minutes(candidates, request.job_address)
+        
+        time_slots = []
+        for user in candidates:
+            travel_time_minutes = travel_minutes.get(user.user_id, 0)
+            technician = {
+                "technician_id": user.user_id,
+                "name": f"Technician {user.user_id}",  # Would get from user service
+                "skills": [skill.skill_id for skill in user.skills],
+                "rating": float(user.average_job_rating) if user.average_job_rating else 4.5,
+                "travel_time_minutes": travel_time_minutes
+            }
             
-            current_time += slot_interval
+            free_intervals = self._get_free_intervals(user, start_date, end_date)
+            for slot_start in self._iter_slot_starts(free_intervals, start_date, slot_duration):
+                if not user.is_available_on_datetime(slot_start):
+                    continue
+                
+                slot_end = slot_start + slot_duration
+                quality_score = self._calculate_slot_quality_score(user, slot_start, slot_end, request)
+                
+                # Calculate dynamic pricing
+                base_price = 100.0  # Base price
+                pricing_factors = self._calculate_pricing_factors(slot_start, request.priority)
+                estimated_price = base_price * pricing_factors["total_multiplier"]
+                
+                slot = TimeSlotDTO(
+                    slot_id=str(uuid.uuid4()),
+                    start_time=slot_start,
+                    end_time=slot_end,
+                    available_technicians=[dict(technician)],
+                    confidence_score=0.85,  # Base confidence
+                    estimated_travel_time_minutes=travel_time_minutes,
+                    slot_quality_score=quality_score,
+                    pricing_info={
+                        "base_price": base_price,
+                        "estimated_price": estimated_price,
+                        "pricing_factors": pricing_factors
+                    }
+                )
+                time_slots.append(self._apply_calendar_preferences(slot, user))
         
+        time_slots.sort(key=lambda slot: slot.start_time)
         return time_slots
 
+    async def _get_technician_travel_minutes(self,
+                                           users: List[UserCapabilities],
+                                           job_address: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        """Travel time from each technician's home base to the job, from one matrix request."""
+        if not job_address or "latitude" not in job_address:
+            return {}
+        
+        located = [
+            user for user in users
+            if user.home_base_latitude is not None and user.home_base_longitude is not None
+        ]
+        if not located:
+            return {}
+        
+        origins = [
+            {"latitude": user.home_base_latitude, "longitude": user.home_base_longitude}
+            for user in located
+        ]
+        destination = {"latitude": job_address["latitude"], "longitude": job_address.get("longitude", 0)}
+        
+        try:
+            matrix = await self.route_optimization_service.get_travel_time_matrix(origins, [destination])
+        except Exception as e:
+            logger.warning(f"Failed to calculate travel times: {str(e)}")
+            matrix = {}
+        
+        travel_minutes = {}
+        for index, user in enumerate(located):
+            entry = matrix.get((index, 0))
+            if isinstance(entry, dict):
+                duration = entry.get("duration_minutes")
+            else:
+                duration = getattr(entry, "duration_minutes", None)
+            travel_minutes[user.user_id] = (
+                int(round(float(duration))) if duration is not None else DEFAULT_TRAVEL_MINUTES
+            )
+        return travel_minutes
+
+    def _iter_slot_starts(self,
+                          free_intervals: List[Tuple[datetime, datetime]],
+                          grid_start: datetime,
+                          slot_duration: timedelta) -> Iterator[datetime]:
+        """Slot starts on the SLOT_INTERVAL grid whose whole slot fits in a free interval."""
+        for interval_start, interval_end in free_intervals:
+            steps = -((grid_start - interval_start) // SLOT_INTERVAL)  # ceiling division
+            slot_start = grid_start + max(steps, 0) * SLOT_INTERVAL
+            while slot_start + slot_duration <= interval_end:
+                yield slot_start
+                slot_start += SLOT_INTERVAL
+
     async def _enhance_slots_with_realtime_data(self,
                                               time_slots: List[TimeSlotDTO],
                                               request: AvailableTimeSlotRequestDTO) -> List[TimeSlotDTO]:
-        """Enhance time slots with real-time data like weather and pricing."""
-        enhanced_slots = []
+        """
+        Enhance time slots with weather impact.
         
-        for slot in time_slots:
-            enhanced_slot = slot
-            
-            # Add weather impact if job address is provided
-            if request.job_address and "latitude" in request.job_address:
+        Weather is fetched once per distinct hour, at most
+        ENRICHMENT_CONCURRENCY requests at a time, and shared by every slot
+        starting in that hour.
+        """
+        if not self.weather_service or not request.job_address or "latitude" not in request.job_address:
+            return time_slots
+        
+        latitude = request.job_address["latitude"]
+        longitude = request.job_address.get("longitude", 0)
+        hours = {slot.start_time.replace(minute=0, second=0, microsecond=0) for slot in time_slots}
+        semaphore = asyncio.Semaphore(ENRICHMENT_CONCURRENCY)
+        
+        async def fetch_weather(hour: datetime) -> Tuple[datetime, Optional[Dict[str, Any]]]:
+            async with semaphore:
                 try:
                     weather_data = await self.weather_service.get_weather_impact(
-                        request.job_address["latitude"],
-                        request.job_address["longitude"],
-                        request.job_type,
-                        slot.start_time
+                        latitude, longitude, request.job_type, hour
                     )
-                    enhanced_slot.weather_impact = {
-                        "conditions": weather_data.get("conditions", "unknown"),
-                        "impact_score": float(weather_data.get("impact_score", 0.8)),
-                        "recommendations": weather_data.get("recommendations", [])
-                    }
                 except Exception as e:
-                    logger.warning(f"Could not get weather data for slot {slot.slot_id}: {str(e)}")
-            
-            # Add pricing information
-            try:
-                pricing = await self._calculate_slot_pricing(slot, request)
-                enhanced_slot.pricing_info = pricing
-            except Exception as e:
-                logger.warning(f"Could not calculate pricing for slot {slot.slot_id}: {str(e)}")
-            
-            enhanced_slots.append(enhanced_slot)
+                    logger.warning(f"Could not get weather data for {hour.isoformat()}: {str(e)}")
+                    return hour, None
+            return hour, {
+                "conditions": weather_data.get("conditions", "unknown"),
+                "impact_score": float(weather_data.get("impact_score", 0.8)),
+                "recommendations": weather_data.get("recommendations", [])
+            }
+        
+        weather_by_hour = dict(await asyncio.gather(*(fetch_weather(hour) for hour in hours)))
         
-        return enhanced_slots
+        for slot in time_slots:
+            slot.weather_impact = weather_by_hour.get(slot.start_time.replace(minute=0, second=0, microsecond=0))
+        
+        return time_slots
 
     def _rank_time_slots(self, time_slots: List[TimeSlotDTO], customer_preferences: Optional[Dict]) -> List[TimeSlotDTO]:
         """Rank time slots based on quality score and customer preferences."""
@@ -923,79 +959,72 @@ class IntelligentSchedulingUseCase:
             "location": request.job_address.get("city", "Not specified") if request.job_address else "Not specified"
         }
 
-    async def _is_user_available_for_slot(self,
-                                        user: UserCapabilities,
-                                        start_time: datetime,
-                                        end_time: datetime,
-                                        required_skills: List[str]) -> bool:
-        """Check if user is available for a specific time slot."""
-        # Check day of week availability using enhanced calendar system
-        if not user.is_available_on_datetime(start_time):
-            return False
-        
-        # Check if user has required skills
-        if not user.matches_job_requirements(required_skills):
-            return False
-        
-        # Check working hours template
-        if user.working_hours_template:
-            day_of_week = start_time.weekday()
-            working_hours = user.working_hours_template.get_working_hours_for_day(day_of_week)
-            if not working_hours:
-                return False
-            
-            start_time_only = start_time.time()
-            end_time_only = end_time.time()
-            work_start, work_end = working_hours
-            
-            # Check if slot fits within working hours
-            if not (work_start <= start_time_only and end_time_only <= work_end):
-                return False
-        
-        # Check for time off conflicts
-        for time_off in user.time_off_requests:
-            if (time_off.is_approved() and time_off.affects_scheduling and
-                time_off.overlaps_with_date(start_time.date())):
-                return False
+    def _get_free_intervals(self,
+                            user: UserCapabilities,
+                            range_start: datetime,
+                            range_end: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        Intervals within the range in which the user can take work.
         
-        # Check for calendar event conflicts
-        for event in user.calendar_events:
-            if (event.blocks_scheduling and event.is_active_on_date(start_time.date())):
-                # Check time overlap
-                event_start = datetime.combine(start_time.date(), event.start_datetime.time())
-                event_end = datetime.combine(start_time.date(), event.end_datetime.time())
-                
-                # Check for overlap
-                if not (end_time <= event_start or start_time >= event_end):
-                    # Allow emergency override if configured
-                    if not event.allows_emergency_override:
-                        return False
+        Per day: no approved time off, within working hours (or the whole day
+        without a template), weekends only when the calendar preferences allow
+        them, minus calendar events that block scheduling and cannot be
+        overridden for emergencies.
+        """
+        tzinfo = range_start.tzinfo
+        prefs = user.calendar_preferences
+        blocking_time_off = [
+            time_off for time_off in user.time_off_requests
+            if time_off.is_approved() and time_off.affects_scheduling
+        ]
+        blocking_events = [
+            event for event in user.calendar_events
+            if event.blocks_scheduling and not event.allows_emergency_override
+        ]
         
-        # Check calendar preferences
-        if user.calendar_preferences:
-            prefs = user.calendar_preferences
+        intervals = []
+        day = range_start.date()
+        while day <= range_end.date():
+            current_day = day
+            day += timedelta(days=1)
             
-            # Check weekend availability
-            if start_time.weekday() >= 5 and not prefs.weekend_availability:
-                return False
-            
-            # Check auto-decline outside hours
-            if prefs.auto_decline_outside_hours:
-                if user.working_hours_template:
-                    day_of_week = start_time.weekday()
-                    working_hours = user.working_hours_template.get_working_hours_for_day(day_of_week)
-                    if working_hours:
-                        start_time_only = start_time.time()
-                        work_start, work_end = working_hours
-                        if not (work_start <= start_time_only <= work_end):
-                            return False
+            if prefs and current_day.weekday() >= 5 and not prefs.weekend_availability:
+                continue
+            if any(time_off.overlaps_with_date(current_day) for time_off in blocking_time_off):
+                continue
+            
+            if user.working_hours_template:
+                working_hours = user.working_hours_template.get_working_hours_for_day(current_day.weekday())
+                if not working_hours:
+                    continue
+                window_start = datetime.combine(current_day, working_hours[0], tzinfo=tzinfo)
+                window_end = datetime.combine(current_day, working_hours[1], tzinfo=tzinfo)
+            else:
+                window_start = datetime.combine(current_day, time.min, tzinfo=tzinfo)
+                window_end = datetime.combine(day, time.min, tzinfo=tzinfo)
+            
+            free_start = max(window_start, range_start)
+            window_end = min(window_end, range_end)
+            
+            busy = sorted(
+                (datetime.combine(current_day, event.start_datetime.time(), tzinfo=tzinfo),
+                 datetime.combine(current_day, event.end_datetime.time(), tzinfo=tzinfo))
+                for event in blocking_events
+                if event.is_active_on_date(current_day)
+            )
+            for busy_start, busy_end in busy:
+                if busy_start > free_start:
+                    intervals.append((free_start, min(busy_start, window_end)))
+                free_start = max(free_start, busy_end)
+            if free_start < window_end:
+                intervals.append((free_start, window_end))
         
-        return True
+        return [(start, end) for start, end in intervals if start < end]
 
-    async def _enhance_time_slot_with_calendar_data(self,
-                                                  slot: TimeSlotDTO,
-                                                  user: UserCapabilities) -> TimeSlotDTO:
-        """Enhance time slot with calendar-aware data."""
+    def _apply_calendar_preferences(self,
+                                    slot: TimeSlotDTO,
+                                    user: UserCapabilities) -> TimeSlotDTO:
+        """Adjust a time slot for the technician's calendar preferences."""
         # Apply calendar preferences for better scoring
         if user.calendar_preferences:
             prefs = user.calendar_preferences
@@ -1016,9 +1045,9 @@ class IntelligentSchedulingUseCase:
                         quality_adjustment += 0.1
             
             # Apply travel buffer preferences
-            if hasattr(slot, 'travel_time_minutes') and slot.travel_time_minutes:
-                buffered_time = slot.travel_time_minutes * float(prefs.travel_buffer_percentage)
-                slot.travel_time_minutes = int(buffered_time)
+            if slot.estimated_travel_time_minutes:
+                buffered_time = slot.estimated_travel_time_minutes * float(prefs.travel_buffer_percentage)
+                slot.estimated_travel_time_minutes = int(buffered_time)
             
             # Apply job buffer time
             if prefs.job_buffer_minutes > 0:
@@ -1031,6 +1060,18 @@ class IntelligentSchedulingUseCase:
         
         return slot
 
+    def _calculate_pricing_factors(self, start_time: datetime, priority: str) -> Dict[str, float]:
+        """Price multipliers for a slot's time and the job priority."""
+        time_of_day = 1.25 if start_time.hour < 8 or start_time.hour >= 18 else 1.0
+        weekend = 1.2 if start_time.weekday() >= 5 else 1.0
+        priority_multiplier = PRIORITY_PRICE_MULTIPLIERS.get(priority, 1.0)
+        return {
+            "time_of_day": time_of_day,
+            "weekend": weekend,
+            "priority": priority_multiplier,
+            "total_multiplier": round(time_of_day * weekend * priority_multiplier, 4)
+        }
+
     def _calculate_slot_quality_score(self,
                                     user: UserCapabilities,
                                     start_time: datetime,
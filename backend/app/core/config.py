@@ -197,7 +197,31 @@ class Settings(BaseSettings):
     # Content Generation Parameters
     CONTENT_MAX_TOKENS: int = 4000
     CONTENT_TEMPERATURE: float = 0.7
-    
+
+    # Content Generation Provider Gateway (per-provider concurrency and rate limits)
+    CONTENT_GENERATION_FAILOVER_PROVIDERS: Annotated[
+        list[str] | str, BeforeValidator(parse_cors)
+    ] = ["claude", "openai", "gemini"]
+    CLAUDE_MAX_CONCURRENT_REQUESTS: int = 4
+    CLAUDE_REQUESTS_PER_MINUTE: int = 50
+    CLAUDE_TOKENS_PER_MINUTE: int = 80000
+    OPENAI_MAX_CONCURRENT_REQUESTS: int = 8
+    OPENAI_REQUESTS_PER_MINUTE: int = 500
+    OPENAI_TOKENS_PER_MINUTE: int = 150000
+    GEMINI_MAX_CONCURRENT_REQUESTS: int = 4
+    GEMINI_REQUESTS_PER_MINUTE: int = 60
+    GEMINI_TOKENS_PER_MINUTE: int = 120000
+    LLM_RATE_LIMIT_MAX_RETRIES: int = 4
+
+    # Content-addressed generation cache
+    CONTENT_GENERATION_CACHE_BACKEND: Literal["redis", "memory", "none"] = "redis"
+    CONTENT_GENERATION_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7  # 7 days
+
+    # Idempotency keys for retried write requests
+    IDEMPOTENCY_STORE_BACKEND: Literal["redis", "memory", "none"] = "redis"
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 60 * 60 * 24  # 24 hours
+    IDEMPOTENCY_PENDING_TTL_SECONDS: int = 60  # Claim on a key while its first request runs
+
     # Voice Agent Context & Memory Configuration
     REDIS_URL: str = "redis://localhost:6379"
     MEM0_API_KEY: str | None = None
@@ -88,6 +88,7 @@ class ActivityReminder(BaseModel):
     message: Optional[str] = None
     is_sent: bool = False
     sent_at: Optional[datetime] = None
+    attempts: int = Field(default=0, ge=0)  # delivery attempts made
 
 
 class ActivityTemplate(BaseModel):
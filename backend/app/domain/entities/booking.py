@@ -487,6 +487,9 @@ class BookingRequest(BaseModel):
     
     # Idempotency
     idempotency_key: Optional[str] = Field(None, max_length=100)
+    
+    # Slot hold taken when the customer picked the time
+    hold_token: Optional[str] = Field(None, max_length=100)
 
     @model_validator(mode='after')
     def validate_contact_info(self):
@@ -577,6 +580,32 @@ class Booking(BaseModel):
         return self.status in [BookingStatus.PENDING, BookingStatus.CONFIRMED]
 
 
+class SlotHold(BaseModel):
+    """Short-lived lease on a booking interval while the customer completes the booking"""
+    id: Optional[UUID] = None
+    business_id: UUID
+    service_id: UUID
+    technician_id: Optional[UUID] = None
+    
+    # Held interval
+    starts_at: datetime
+    ends_at: datetime
+    
+    # Lease
+    hold_token: str
+    expires_at: datetime
+    booking_id: Optional[UUID] = None  # Set once converted into a booking
+    
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+    @property
+    def is_converted(self) -> bool:
+        return self.booking_id is not None
+
+
 class BookingEvent(BaseModel):
     """Booking status change audit trail"""
     id: Optional[UUID] = None
@@ -611,6 +640,14 @@ class BookingEvent(BaseModel):
 # REQUEST/RESPONSE MODELS
 # =====================================================
 
+class SlotHoldRequest(BaseModel):
+    """Request to hold a slot while the customer fills in the booking"""
+    business_id: UUID
+    service_id: UUID
+    starts_at: datetime
+    technician_id: Optional[UUID] = None
+
+
 class BookingConfirmationRequest(BaseModel):
     """Request to confirm a booking"""
     booking_id: UUID
@@ -97,6 +97,7 @@ class CalendarEvent(BaseModel):
     recurrence_count: Optional[int] = Field(default=None, gt=0)
     recurrence_interval: int = Field(default=1, gt=0)  # Every N days/weeks/months
     recurrence_days_of_week: List[int] = Field(default_factory=list)  # 0=Monday, 6=Sunday
+    recurrence_exception_dates: List[date] = Field(default_factory=list)  # Skipped occurrences
     
     # Availability impact
     blocks_scheduling: bool = True
@@ -122,15 +123,15 @@ class CalendarEvent(BaseModel):
         if self.end_datetime <= self.start_datetime:
             raise ValueError("End time must be after start time")
         
-        if self.recurrence_type != RecurrenceType.NONE:
-            if self.recurrence_type == RecurrenceType.WEEKLY and not self.recurrence_days_of_week:
+        if RecurrenceType(self.recurrence_type) != RecurrenceType.NONE:
+            if RecurrenceType(self.recurrence_type) == RecurrenceType.WEEKLY and not self.recurrence_days_of_week:
                 raise ValueError("Weekly recurrence requires days of week")
         
         return self
     
     def is_recurring(self) -> bool:
         """Check if this event has recurrence."""
-        return self.recurrence_type != RecurrenceType.NONE
+        return RecurrenceType(self.recurrence_type) != RecurrenceType.NONE
     
     def conflicts_with(self, other: 'CalendarEvent') -> bool:
         """Check if this event conflicts with another event."""
@@ -141,45 +142,16 @@ class CalendarEvent(BaseModel):
                    other.end_datetime <= self.start_datetime)
     
     def is_active_on_date(self, check_date: date) -> bool:
-        """Check if this event is active on a specific date."""
-        if not self.is_active:
-            return False
-        
-        event_date = self.start_datetime.date()
-        
-        # Non-recurring events
-        if not self.is_recurring():
-            return event_date == check_date
-        
-        # Check if date is within recurrence range
-        if check_date < event_date:
-            return False
-        
-        if self.recurrence_end_date and check_date > self.recurrence_end_date:
-            return False
-        
-        # Check recurrence pattern
-        days_diff = (check_date - event_date).days
-        
-        if self.recurrence_type == RecurrenceType.DAILY:
-            return days_diff % self.recurrence_interval == 0
+        """Check if an occurrence of this event starts on a specific date."""
+        from ..services.calendar_occurrences import occurs_on
         
-        elif self.recurrence_type == RecurrenceType.WEEKLY:
-            if check_date.weekday() in self.recurrence_days_of_week:
-                weeks_diff = days_diff // 7
-                return weeks_diff % self.recurrence_interval == 0
-        
-        elif self.recurrence_type == RecurrenceType.BIWEEKLY:
-            if check_date.weekday() in self.recurrence_days_of_week:
-                weeks_diff = days_diff // 7
-                return weeks_diff % 2 == 0
-        
-        elif self.recurrence_type == RecurrenceType.MONTHLY:
-            return (check_date.day == event_date.day and 
-                   (check_date.year - event_date.year) * 12 + 
-                   (check_date.month - event_date.month) % self.recurrence_interval == 0)
+        return occurs_on(self, check_date)
+    
+    def get_occurrences(self, window_start: datetime, window_end: datetime) -> List[tuple[datetime, datetime]]:
+        """Get (start, end) of every occurrence overlapping a time window."""
+        from ..services.calendar_occurrences import occurrence_cache
         
-        return False
+        return list(occurrence_cache.expand(self, window_start, window_end))
 
 
 class TimeOffRequest(BaseModel):
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field, validator, model_validator, UUID4, Before
 from ..exceptions.domain_exceptions import DomainValidationError, BusinessRuleViolationError
 from .estimate_enums.enums import EstimateStatus, DocumentType, EmailStatus
 from ..shared.enums import CurrencyCode, TaxType, DiscountType, AdvancePaymentType, TemplateType
+from ..shared.document_totals import TotalsCachedModel
 from ..value_objects.address import Address
 
 # Configure logging
@@ -253,12 +254,13 @@ class StatusHistoryEntry(BaseModel):
     }
 
 
-class Estimate(BaseModel):
+class Estimate(TotalsCachedModel):
     """
     Estimate domain entity representing a price quote for potential work.
     
     Contains comprehensive business logic for estimate creation, validation,
-    expiry tracking, and conversion to invoices.
+    expiry tracking, and conversion to invoices. Totals are computed once and
+    cached until the line items or pricing fields change.
     """
     
     # Core identification
@@ -361,43 +363,31 @@ class Estimate(BaseModel):
     # Financial calculation methods
     def get_line_items_subtotal(self) -> Decimal:
         """Calculate total of all line items subtotals."""
-        return sum(item.get_subtotal() for item in self.line_items)
+        return self.get_totals().line_items_subtotal
     
     def get_line_items_discount_total(self) -> Decimal:
         """Calculate total discount from line items."""
-        return sum(item.get_discount_amount() for item in self.line_items)
+        return self.get_totals().line_items_discount_total
     
     def get_subtotal_after_line_discounts(self) -> Decimal:
         """Calculate subtotal after line item discounts."""
-        return self.get_line_items_subtotal() - self.get_line_items_discount_total()
+        return self.get_totals().subtotal_after_line_discounts
     
     def get_overall_discount_amount(self) -> Decimal:
         """Calculate overall discount amount."""
-        if self.overall_discount_type == DiscountType.NONE:
-            return Decimal("0")
-        elif self.overall_discount_type == DiscountType.PERCENTAGE:
-            return self.get_subtotal_after_line_discounts() * (self.overall_discount_value / Decimal("100"))
-        else:  # FIXED_AMOUNT
-            return min(self.overall_discount_value, self.get_subtotal_after_line_discounts())
+        return self.get_totals().overall_discount_amount
     
     def get_total_before_tax(self) -> Decimal:
         """Calculate total before tax."""
-        return self.get_subtotal_after_line_discounts() - self.get_overall_discount_amount()
+        return self.get_totals().total_before_tax
     
     def get_tax_amount(self) -> Decimal:
         """Calculate tax amount."""
-        if self.tax_type == TaxType.NONE:
-            return Decimal("0")
-        elif self.tax_type in [TaxType.PERCENTAGE, TaxType.EXCLUSIVE]:
-            return self.get_total_before_tax() * (self.tax_rate / Decimal("100"))
-        elif self.tax_type == TaxType.FIXED_AMOUNT:
-            return self.tax_rate
-        else:  # INCLUSIVE tax is already included in line item prices
-            return Decimal("0")
+        return self.get_totals().tax_amount
     
     def get_total_amount(self) -> Decimal:
         """Calculate final total amount."""
-        return self.get_total_before_tax() + self.get_tax_amount()
+        return self.get_totals().total_amount
     
     def get_advance_payment_amount(self) -> Decimal:
         """Calculate required advance payment amount."""
@@ -557,6 +547,7 @@ class Estimate(BaseModel):
             notes=notes
         )
         self.line_items.append(line_item)
+        self.invalidate_totals()
         self.last_modified = datetime.now(timezone.utc)
         return line_item
     
@@ -565,6 +556,7 @@ class Estimate(BaseModel):
         for i, item in enumerate(self.line_items):
             if str(item.id) == str(line_item_id):
                 del self.line_items[i]
+                self.invalidate_totals()
                 self.last_modified = datetime.now(timezone.utc)
                 return True
         return False
@@ -581,6 +573,7 @@ class Estimate(BaseModel):
                 # Replace in list
                 item_index = self.line_items.index(item)
                 self.line_items[item_index] = updated_item
+                self.invalidate_totals()
                 
                 self.last_modified = datetime.now(timezone.utc)
                 return True
@@ -749,4 +742,32 @@ class Estimate(BaseModel):
                 "status": "draft"
             }
         }
-    } 
\ No newline at end of file
+    } 
+
+class EstimateSummary(BaseModel):
+    """
+    Read model for estimate list screens.
+    
+    Carries the header columns and the totals stored with the estimate, so
+    listing estimates never loads line items.
+    """
+    id: uuid.UUID
+    business_id: uuid.UUID
+    estimate_number: Optional[str] = None
+    status: EstimateStatusField = EstimateStatus.DRAFT
+    title: str = ""
+    contact_id: Optional[uuid.UUID] = None
+    client_name: Optional[str] = None
+    client_email: Optional[str] = None
+    project_id: Optional[uuid.UUID] = None
+    job_id: Optional[uuid.UUID] = None
+    currency: CurrencyField = CurrencyCode.USD
+    subtotal: Decimal = Decimal('0')
+    tax_amount: Decimal = Decimal('0')
+    discount_amount: Decimal = Decimal('0')
+    total_amount: Decimal = Decimal('0')
+    issue_date: Optional[date] = None
+    valid_until: Optional[date] = None
+    created_by: Optional[str] = None
+    created_date: datetime
+    last_modified: Optional[datetime] = None
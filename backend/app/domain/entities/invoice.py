@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator, UUID4,
 from ..exceptions.domain_exceptions import DomainValidationError, BusinessRuleViolationError
 from .invoice_enums.enums import InvoiceStatus, PaymentStatus
 from ..shared.enums import PaymentMethod, CurrencyCode, TaxType, DiscountType
+from ..shared.document_totals import TotalsCachedModel
 from .estimate_enums.enums import EmailStatus
 from ..value_objects.address import Address
 
@@ -279,12 +280,13 @@ class InvoiceStatusHistoryEntry(BaseModel):
     notes: Optional[str] = None
 
 
-class Invoice(BaseModel):
+class Invoice(TotalsCachedModel):
     """
     Invoice domain entity representing a bill for completed work.
     
     Contains comprehensive business logic for payment tracking, status management,
-    financial calculations, and client communication.
+    financial calculations, and client communication. Totals are computed once
+    and cached until the line items or pricing fields change.
     """
     model_config = {"use_enum_values": True, "validate_assignment": True}
     
@@ -407,45 +409,31 @@ class Invoice(BaseModel):
     # Financial calculation methods
     def get_line_items_subtotal(self) -> Decimal:
         """Calculate total of all line items subtotals."""
-        return sum(item.get_subtotal() for item in self.line_items)
+        return self.get_totals().line_items_subtotal
     
     def get_line_items_discount_total(self) -> Decimal:
         """Calculate total discount from line items."""
-        return sum(item.get_discount_amount() for item in self.line_items)
+        return self.get_totals().line_items_discount_total
     
     def get_subtotal_after_line_discounts(self) -> Decimal:
         """Calculate subtotal after line item discounts."""
-        return self.get_line_items_subtotal() - self.get_line_items_discount_total()
+        return self.get_totals().subtotal_after_line_discounts
     
     def get_overall_discount_amount(self) -> Decimal:
         """Calculate overall discount amount."""
-        discount_type_value = self.overall_discount_type.value if hasattr(self.overall_discount_type, 'value') else self.overall_discount_type
-        if discount_type_value == DiscountType.NONE.value:
-            return Decimal("0")
-        elif discount_type_value == DiscountType.PERCENTAGE.value:
-            return self.get_subtotal_after_line_discounts() * (self.overall_discount_value / Decimal("100"))
-        else:  # FIXED_AMOUNT
-            return min(self.overall_discount_value, self.get_subtotal_after_line_discounts())
+        return self.get_totals().overall_discount_amount
     
     def get_total_before_tax(self) -> Decimal:
         """Calculate total before tax."""
-        return self.get_subtotal_after_line_discounts() - self.get_overall_discount_amount()
+        return self.get_totals().total_before_tax
     
     def get_tax_amount(self) -> Decimal:
         """Calculate tax amount."""
-        tax_type_value = self.tax_type.value if hasattr(self.tax_type, 'value') else self.tax_type
-        if tax_type_value == TaxType.NONE.value:
-            return Decimal("0")
-        elif tax_type_value in [TaxType.PERCENTAGE.value, TaxType.EXCLUSIVE.value]:
-            return self.get_total_before_tax() * (self.tax_rate / Decimal("100"))
-        elif tax_type_value == TaxType.FIXED_AMOUNT.value:
-            return self.tax_rate
-        else:  # INCLUSIVE tax is already included in line item prices
-            return Decimal("0")
+        return self.get_totals().tax_amount
     
     def get_total_amount(self) -> Decimal:
         """Calculate invoice total amount."""
-        return self.get_total_before_tax() + self.get_tax_amount()
+        return self.get_totals().total_amount
     
     def get_late_fee_amount(self) -> Decimal:
         """Calculate current late fee amount."""
@@ -1001,4 +989,53 @@ class Invoice(BaseModel):
     def __repr__(self) -> str:
         return (f"Invoice(id={self.id}, number={self.invoice_number}, "
                 f"client={self.client_name}, status={self.status}, "
-                f"total={self.get_total_amount()}, balance={self.get_balance_due()})") 
\ No newline at end of file
+                f"total={self.get_total_amount()}, balance={self.get_balance_due()})") 
+
+class InvoiceSummary(BaseModel):
+    """
+    Read model for invoice list screens.
+    
+    Carries the header columns and the totals stored with the invoice, so
+    listing invoices never loads line items or payments.
+    """
+    id: uuid.UUID
+    business_id: uuid.UUID
+    invoice_number: Optional[str] = None
+    status: Annotated[InvoiceStatus, BeforeValidator(validate_invoice_status)] = InvoiceStatus.DRAFT
+    title: str = ""
+    contact_id: Optional[uuid.UUID] = None
+    client_name: Optional[str] = None
+    client_email: Optional[str] = None
+    project_id: Optional[uuid.UUID] = None
+    job_id: Optional[uuid.UUID] = None
+    estimate_id: Optional[uuid.UUID] = None
+    currency: Annotated[CurrencyCode, BeforeValidator(validate_currency_code)] = CurrencyCode.USD
+    total_amount: Decimal = Decimal('0')
+    amount_paid: Decimal = Decimal('0')
+    amount_due: Decimal = Decimal('0')
+    issue_date: Optional[date] = None
+    due_date: Optional[date] = None
+    created_by: Optional[str] = None
+    created_date: datetime
+    last_modified: Optional[datetime] = None
+
+
+class ReceivableBalance(BaseModel):
+    """
+    Read model for one invoice's receivable balance as of a date.
+    
+    Amount paid counts only payments made up to that date, so an invoice
+    settled since then still shows the balance that was outstanding.
+    """
+    id: uuid.UUID
+    invoice_number: Optional[str] = None
+    status: Annotated[InvoiceStatus, BeforeValidator(validate_invoice_status)] = InvoiceStatus.SENT
+    contact_id: Optional[uuid.UUID] = None
+    client_name: Optional[str] = None
+    currency: Annotated[CurrencyCode, BeforeValidator(validate_currency_code)] = CurrencyCode.USD
+    issue_date: Optional[date] = None
+    due_date: Optional[date] = None
+    total_amount: Decimal = Decimal('0')
+    amount_paid: Decimal = Decimal('0')
+    balance: Decimal = Decimal('0')
+    days_past_due: int = 0
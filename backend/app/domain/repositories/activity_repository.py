@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from ..entities.activity import Activity, ActivityTemplate, ActivityType, ActivityStatus, ActivityPriority
+from ..shared.pagination import CursorPage
 
 
 class ActivityRepository(ABC):
@@ -50,6 +51,20 @@ class ActivityRepository(ABC):
         """Get timeline activities for a contact."""
         pass
     
+    @abstractmethod
+    async def get_contact_timeline_page(
+        self,
+        contact_id: uuid.UUID,
+        business_id: uuid.UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        activity_types: Optional[List[ActivityType]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> CursorPage[Activity]:
+        """Get a page of a contact's activities, newest created first, using keyset pagination."""
+        pass
+    
     @abstractmethod
     async def get_contact_activity_count(
         self,
@@ -92,6 +107,37 @@ class ActivityRepository(ABC):
         """Get activities assigned to a user."""
         pass
     
+    @abstractmethod
+    async def get_business_activities_page(
+        self,
+        business_id: uuid.UUID,
+        activity_types: Optional[List[ActivityType]] = None,
+        statuses: Optional[List[ActivityStatus]] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> CursorPage[Activity]:
+        """Get a page of business activities, latest scheduled first, using keyset pagination."""
+        pass
+    
+    @abstractmethod
+    async def get_user_activities_page(
+        self,
+        business_id: uuid.UUID,
+        user_id: str,
+        statuses: Optional[List[ActivityStatus]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> CursorPage[Activity]:
+        """Get a page of activities assigned to a user, upcoming first, using keyset pagination."""
+        pass
+    
     # Overdue and upcoming activities
     @abstractmethod
     async def get_overdue_activities(
@@ -122,6 +168,52 @@ class ActivityRepository(ABC):
         """Get activities with pending reminders due before the specified date."""
         pass
     
+    @abstractmethod
+    async def claim_due_reminders(
+        self,
+        worker_id: str,
+        due_before: datetime,
+        limit: int = 100,
+        lease_seconds: int = 300,
+        max_attempts: int = 4,
+        business_id: Optional[uuid.UUID] = None
+    ) -> List[Activity]:
+        """
+        Claim up to limit unsent reminders due before due_before for a worker.
+        
+        Claimed reminders are leased to the worker for lease_seconds, so
+        concurrent workers receive disjoint batches. Reminders that already
+        had max_attempts delivery attempts are not claimed again. Each returned
+        activity carries only its claimed reminders.
+        """
+        pass
+    
+    @abstractmethod
+    async def complete_reminders(
+        self,
+        worker_id: str,
+        reminder_ids: List[uuid.UUID],
+        sent_at: Optional[datetime] = None
+    ) -> int:
+        """Mark reminders claimed by the worker as sent. Returns the number updated."""
+        pass
+    
+    @abstractmethod
+    async def release_reminders(
+        self,
+        worker_id: str,
+        reminder_ids: List[uuid.UUID],
+        retry_at: Optional[datetime] = None,
+        count_attempt: bool = True
+    ) -> int:
+        """
+        Release reminders claimed by the worker, optionally rescheduling them to retry_at.
+        
+        With count_attempt False the attempt taken by the claim is given back,
+        for reminders that were deferred rather than tried.
+        """
+        pass
+    
     # Activity statistics
     @abstractmethod
     async def get_activity_statistics(
@@ -129,9 +221,17 @@ class ActivityRepository(ABC):
         business_id: uuid.UUID,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        by_scheduled_date: bool = False,
+        achievements_limit: int = 0
     ) -> Dict[str, Any]:
-        """Get activity statistics for a business or user."""
+        """
+        Get activity statistics for a business or user.
+        
+        The date range applies to creation dates, or to scheduled dates when
+        by_scheduled_date is set. With achievements_limit, the latest completed
+        high-priority activities are included as recent_achievements.
+        """
         pass
     
     @abstractmethod
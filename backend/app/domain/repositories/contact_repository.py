@@ -10,6 +10,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from ..entities.contact import Contact, ContactType, ContactStatus, ContactPriority, ContactSource
+from ..shared.pagination import CursorPage
 
 
 class ContactRepository(ABC):
@@ -71,6 +72,27 @@ class ContactRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_page_by_business_id(self, business_id: uuid.UUID, limit: int = 100,
+                                      cursor: Optional[str] = None,
+                                      include_total: bool = False) -> CursorPage[Contact]:
+        """
+        Get a page of contacts by business ID using keyset pagination.
+        
+        Args:
+            business_id: ID of the business
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to include an estimated total count
+            
+        Returns:
+            CursorPage of Contact entities, newest first
+            
+        Raises:
+            DatabaseError: If retrieval fails
+        """
+        pass
+    
     @abstractmethod
     async def get_by_email(self, business_id: uuid.UUID, email: str) -> Optional[Contact]:
         """
@@ -225,6 +247,29 @@ class ContactRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def search_contacts_page(self, business_id: uuid.UUID, search_term: str,
+                                   limit: int = 50, cursor: Optional[str] = None) -> CursorPage[Contact]:
+        """
+        Search contacts within a business with ranked results and keyset pagination.
+        
+        Matches name/company/email by word prefix and substring, and phone
+        numbers by digits regardless of formatting.
+        
+        Args:
+            business_id: ID of the business
+            search_term: Term to search for
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page's next_cursor
+            
+        Returns:
+            CursorPage of Contact entities, best matches first
+            
+        Raises:
+            DatabaseError: If search fails
+        """
+        pass
+    
     @abstractmethod
     async def get_recently_contacted(self, business_id: uuid.UUID, days: int = 30,
                                    skip: int = 0, limit: int = 100) -> List[Contact]:
@@ -374,6 +419,33 @@ class ContactRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def bulk_update_contacts(self, business_id: uuid.UUID, contact_ids: List[uuid.UUID],
+                                   status: Optional[ContactStatus] = None,
+                                   priority: Optional[ContactPriority] = None,
+                                   assigned_to: Optional[str] = None,
+                                   tags_to_add: Optional[List[str]] = None,
+                                   tags_to_remove: Optional[List[str]] = None) -> int:
+        """
+        Apply several changes to multiple contacts in one set-based operation.
+        
+        Args:
+            business_id: ID of the business
+            contact_ids: List of contact IDs to update
+            status: New status to set, if any
+            priority: New priority to set, if any
+            assigned_to: User ID to assign contacts to, if any
+            tags_to_add: Tags to add (existing tags are kept, duplicates ignored)
+            tags_to_remove: Tags to remove
+            
+        Returns:
+            Number of contacts updated
+            
+        Raises:
+            DatabaseError: If bulk update fails
+        """
+        pass
+    
     @abstractmethod
     async def count_by_business(self, business_id: uuid.UUID) -> int:
         """
@@ -11,9 +11,10 @@ from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from decimal import Decimal
 
-from ..entities.estimate import Estimate
+from ..entities.estimate import Estimate, EstimateSummary
 from ..entities.estimate_enums.enums import EstimateStatus
 from ..shared.enums import CurrencyCode
+from ..shared.pagination import CursorPage
 
 
 class EstimateQueryBuilder:
@@ -258,6 +259,62 @@ class EstimateRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_page_with_filters(
+        self,
+        business_id: uuid.UUID,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "created_date",
+        sort_desc: bool = True,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> CursorPage[Estimate]:
+        """
+        List a page of estimates with flexible filtering and keyset pagination.
+        
+        Args:
+            business_id: ID of the business
+            filters: Dictionary of filters to apply (same as list_with_filters)
+            sort_by: Field to sort by
+            sort_desc: Sort in descending order
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to include an estimated total count
+            
+        Returns:
+            CursorPage of Estimate entities
+            
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+    
+    @abstractmethod
+    async def list_summary_page_with_filters(
+        self,
+        business_id: uuid.UUID,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "created_date",
+        sort_desc: bool = True,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> CursorPage[EstimateSummary]:
+        """
+        List a page of estimate summaries for list screens.
+        
+        Same filtering and pagination as list_page_with_filters, but reads only
+        header columns and stored totals; line items are not loaded.
+        
+        Returns:
+            CursorPage of EstimateSummary read models
+            
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+    
     @abstractmethod
     async def exists(self, estimate_id: uuid.UUID) -> bool:
         """
@@ -7,13 +7,14 @@ Follows the Repository pattern for clean architecture.
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime
+from typing import Optional, List, Dict, Any
+from datetime import datetime, date
 from decimal import Decimal
 
-from ..entities.invoice import Invoice
+from ..entities.invoice import Invoice, InvoiceSummary, ReceivableBalance
 from ..entities.invoice_enums.enums import InvoiceStatus, PaymentStatus
 from ..shared.enums import PaymentMethod, CurrencyCode
+from ..shared.pagination import CursorPage
 
 
 class InvoiceRepository(ABC):
@@ -212,7 +213,38 @@ class InvoiceRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_with_pagination(self, business_id: uuid.UUID, skip: int = 0, limit: int = 100, 
-                                  filters: Optional[Dict[str, Any]] = None) -> Tuple[List[Invoice], int]:
-        """List invoices with pagination and filters. Returns (invoices, total_count)."""
-        pass 
\ No newline at end of file
+    async def list_page_with_filters(self, business_id: uuid.UUID, limit: int = 100,
+                                     cursor: Optional[str] = None,
+                                     filters: Optional[Dict[str, Any]] = None,
+                                     include_total: bool = False) -> CursorPage[Invoice]:
+        """List a page of invoices with filters using keyset pagination, newest first."""
+        pass
+    
+    @abstractmethod
+    async def list_summary_page_with_filters(self, business_id: uuid.UUID, limit: int = 100,
+                                             cursor: Optional[str] = None,
+                                             filters: Optional[Dict[str, Any]] = None,
+                                             include_total: bool = False) -> CursorPage[InvoiceSummary]:
+        """List a page of invoice summaries (header and stored totals, no line items or payments), newest first."""
+        pass
+    
+    @abstractmethod
+    async def get_receivables_aging(self, business_id: uuid.UUID, as_of: date,
+                                    contact_id: Optional[uuid.UUID] = None,
+                                    by_contact: bool = False) -> Dict[str, Any]:
+        """Aggregate outstanding balances into 0-30/31-60/61-90/90+ days-past-due buckets."""
+        pass
+    
+    @abstractmethod
+    async def list_receivable_balances_page(self, business_id: uuid.UUID, as_of: date,
+                                            contact_id: Optional[uuid.UUID] = None,
+                                            limit: int = 100,
+                                            cursor: Optional[str] = None) -> CursorPage[ReceivableBalance]:
+        """List a page of invoices with a balance outstanding as of a date, by invoice number."""
+        pass
+    
+    @abstractmethod
+    async def get_revenue_report(self, business_id: uuid.UUID, start_date: date, end_date: date,
+                                 period: str = "month") -> Dict[str, Any]:
+        """Aggregate invoiced and collected revenue by period, with DSO for the range."""
+        pass
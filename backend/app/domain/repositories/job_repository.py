@@ -12,6 +12,7 @@ from datetime import datetime
 
 from ..entities.job import Job
 from ..entities.job_enums.enums import JobStatus, JobType, JobPriority
+from ..shared.pagination import CursorPage
 
 
 class JobRepository(ABC):
@@ -42,6 +43,13 @@ class JobRepository(ABC):
         """Get jobs by business ID with pagination."""
         pass
     
+    @abstractmethod
+    async def get_page_by_business_id(self, business_id: uuid.UUID, limit: int = 100,
+                                      cursor: Optional[str] = None,
+                                      include_total: bool = False) -> CursorPage[Job]:
+        """Get a page of jobs by business ID using keyset pagination, newest first."""
+        pass
+    
     @abstractmethod
     async def get_by_contact_id(self, contact_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Job]:
         """Get jobs by contact ID with pagination."""
@@ -14,6 +14,7 @@ from datetime import datetime
 from ..entities.product import Product
 from ..entities.product_enums.enums import ProductType, ProductStatus
 from ..shared.enums import PricingModel
+from ..shared.pagination import CursorPage
 
 
 class ProductRepository(ABC):
@@ -59,6 +60,21 @@ class ProductRepository(ABC):
         """List products for a business with optional filtering."""
         pass
     
+    @abstractmethod
+    async def list_page_by_business(
+        self,
+        business_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[ProductStatus] = None,
+        category_id: Optional[uuid.UUID] = None,
+        supplier_id: Optional[uuid.UUID] = None,
+        low_stock_only: bool = False,
+        include_total: bool = False
+    ) -> CursorPage[Product]:
+        """List a page of products for a business by name using keyset pagination."""
+        pass
+    
     @abstractmethod
     async def search_products(
         self,
@@ -118,7 +134,7 @@ class ProductRepository(ABC):
         quantity_change: Decimal,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Update product quantity."""
+        """Atomically change product stock. Returns False if stock would go negative."""
         pass
     
     @abstractmethod
@@ -129,7 +145,7 @@ class ProductRepository(ABC):
         quantity: Decimal,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Reserve product quantity for an order."""
+        """Atomically reserve product quantity. Returns False if not enough stock is available."""
         pass
     
     @abstractmethod
@@ -140,7 +156,34 @@ class ProductRepository(ABC):
         quantity: Decimal,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Release reserved product quantity."""
+        """Atomically release reserved product quantity."""
+        pass
+    
+    @abstractmethod
+    async def update_quantities(
+        self,
+        business_id: uuid.UUID,
+        quantity_changes: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """Atomically change stock for several products. Applies all changes or none."""
+        pass
+    
+    @abstractmethod
+    async def reserve_quantities(
+        self,
+        business_id: uuid.UUID,
+        quantities: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """Atomically reserve quantities for several products. Reserves all lines or none."""
+        pass
+    
+    @abstractmethod
+    async def release_reservations(
+        self,
+        business_id: uuid.UUID,
+        quantities: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """Atomically release reserved quantities for several products."""
         pass
     
     # Cost and pricing operations
@@ -149,10 +192,9 @@ class ProductRepository(ABC):
         self,
         business_id: uuid.UUID,
         product_id: uuid.UUID,
-        new_cost: Decimal,
-        quantity: Optional[Decimal] = None
+        new_cost: Decimal
     ) -> bool:
-        """Update product cost using appropriate costing method."""
+        """Record the latest purchase cost of a product."""
         pass
     
     @abstractmethod
@@ -283,6 +325,20 @@ class ProductRepository(ABC):
         """Bulk adjust inventory quantities."""
         pass
     
+    @abstractmethod
+    async def upsert_by_sku(
+        self,
+        business_id: uuid.UUID,
+        product_data: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Upsert a chunk of catalog rows, matched on SKU.
+        
+        Each row holds only the columns to write; rows in one call must carry
+        the same columns. Returns the number of rows written.
+        """
+        pass
+    
     # Mobile app optimization
     @abstractmethod
     async def get_products_for_mobile(
@@ -160,10 +160,17 @@ class PurchaseOrderRepository(ABC):
         order_id: uuid.UUID,
         line_item_receipts: List[Dict[str, Any]],
         received_by: str,
+        batch_id: uuid.UUID,
         receipt_date: Optional[datetime] = None,
         notes: Optional[str] = None
-    ) -> bool:
-        """Record receipt of purchase order items."""
+    ) -> Dict[str, Any]:
+        """
+        Record receipt of purchase order items, their stock movements and stock in one call.
+
+        Idempotent by batch_id. Returns a dict with "status" ("applied",
+        "duplicate", "not_found", "invalid_status" or "over_receipt"),
+        "order_status", "items_updated", "total_received_value" and "is_complete".
+        """
         pass
     
     @abstractmethod
@@ -155,6 +155,21 @@ class StockMovementRepository(ABC):
         """Create multiple stock movements in a batch."""
         pass
     
+    @abstractmethod
+    async def record_movement_batch(
+        self,
+        business_id: uuid.UUID,
+        batch_id: uuid.UUID,
+        movements: List[StockMovement]
+    ) -> Dict[str, Any]:
+        """
+        Record movements and apply their aggregated stock deltas in one call.
+
+        Returns a dict with "status" ("applied", "duplicate" or
+        "insufficient_stock") and "movement_count".
+        """
+        pass
+    
     @abstractmethod
     async def get_movements_by_batch(
         self,
@@ -192,17 +207,27 @@ class StockMovementRepository(ABC):
         product_id: uuid.UUID,
         up_to_date: Optional[datetime] = None
     ) -> Decimal:
-        """Calculate weighted average cost from movement history."""
+        """Get the running weighted average cost of a product, optionally as of a date."""
         pass
     
     @abstractmethod
-    async def get_inventory_valuation_movements(
+    async def get_inventory_valuation(
         self,
         business_id: uuid.UUID,
-        valuation_date: datetime,
-        product_ids: Optional[List[uuid.UUID]] = None
-    ) -> List[Dict[str, Any]]:
-        """Get movements for inventory valuation at a specific date."""
+        valuation_date: Optional[datetime] = None,
+        product_ids: Optional[List[uuid.UUID]] = None,
+        category_id: Optional[uuid.UUID] = None
+    ) -> Dict[uuid.UUID, Dict[str, Decimal]]:
+        """Get quantity, average cost and value per product, current or as of a date."""
+        pass
+
+    @abstractmethod
+    async def create_valuation_snapshot(
+        self,
+        business_id: uuid.UUID,
+        as_of: Optional[datetime] = None
+    ) -> int:
+        """Snapshot inventory valuation so as-of valuations start closer to the requested date."""
         pass
     
     # Analytics and reporting
@@ -397,7 +422,27 @@ class StockMovementRepository(ABC):
     ) -> Dict[uuid.UUID, Dict[str, Decimal]]:
         """Get current stock levels calculated from movements."""
         pass
-    
+
+    @abstractmethod
+    async def get_stock_levels_at(
+        self,
+        business_id: uuid.UUID,
+        as_of: datetime,
+        product_ids: Optional[List[uuid.UUID]] = None,
+        location_id: Optional[uuid.UUID] = None
+    ) -> Dict[uuid.UUID, Decimal]:
+        """Get on-hand quantity per product as of a point in time."""
+        pass
+
+    @abstractmethod
+    async def create_stock_snapshot(
+        self,
+        business_id: uuid.UUID,
+        as_of: Optional[datetime] = None
+    ) -> int:
+        """Snapshot stock levels so point-in-time queries replay fewer movements."""
+        pass
+
     @abstractmethod
     async def rebuild_stock_levels(
         self,
@@ -407,7 +452,7 @@ class StockMovementRepository(ABC):
     ) -> bool:
         """Rebuild stock levels from movement history."""
         pass
-    
+
     # Count operations
     @abstractmethod
     async def count_movements(
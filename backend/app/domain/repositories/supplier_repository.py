@@ -338,7 +338,12 @@ class SupplierRepository(ABC):
         business_id: uuid.UUID,
         supplier_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Import suppliers from external data."""
+        """
+        Upsert a chunk of validated supplier rows, matched on supplier code.
+        
+        Each row holds only the columns to write; rows in one call must carry
+        the same columns.
+        """
         pass
     
     # Advanced search and filtering
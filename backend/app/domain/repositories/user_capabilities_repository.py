@@ -82,6 +82,12 @@ class UserCapabilitiesRepository(ABC):
         """Get calendar events for a user within date range."""
         pass
     
+    @abstractmethod
+    async def get_business_calendar_events(self, business_id: uuid.UUID, start_date: date, end_date: date,
+                                         user_ids: Optional[List[str]] = None) -> List[CalendarEvent]:
+        """Get calendar events of all (or the given) users of a business that can occur within date range."""
+        pass
+    
     @abstractmethod
     async def get_recurring_events(self, user_id: str, business_id: uuid.UUID) -> List[CalendarEvent]:
         """Get all recurring events for a user."""
@@ -114,6 +120,13 @@ class UserCapabilitiesRepository(ABC):
         """Get time off requests for a user."""
         pass
     
+    @abstractmethod
+    async def get_business_time_off_requests(self, business_id: uuid.UUID, start_date: date, end_date: date,
+                                           status: Optional[str] = None,
+                                           user_ids: Optional[List[str]] = None) -> List[TimeOffRequest]:
+        """Get time off requests of all (or the given) users of a business overlapping date range."""
+        pass
+    
     @abstractmethod
     async def get_pending_time_off_requests(self, business_id: uuid.UUID) -> List[TimeOffRequest]:
         """Get all pending time off requests for a business."""
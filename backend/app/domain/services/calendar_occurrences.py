@@ -0,0 +1,259 @@
+"""
+Calendar Occurrences
+
+Expands recurring calendar events into concrete occurrences for a time window
+in one pass, and indexes the resulting busy intervals per user so that
+availability checks are range lookups instead of per-day recurrence tests.
+
+Recurrence follows RRULE semantics for the patterns CalendarEvent supports:
+- daily: every recurrence_interval days
+- weekly / custom: on recurrence_days_of_week (the start date's weekday when
+  empty), every recurrence_interval weeks; weeks start on Monday
+- biweekly: weekly with an interval of two
+- monthly: on the start date's day of month every recurrence_interval months;
+  months without that day are skipped
+recurrence_count counts occurrences from the first one, including those later
+removed by recurrence_exception_dates; recurrence_end_date is inclusive.
+"""
+
+import calendar
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from ..entities.calendar import CalendarEvent, RecurrenceType, TimeOffRequest
+
+Interval = Tuple[datetime, datetime]
+
+EXPANSION_CACHE_MAX_ENTRIES = 20000
+
+
+def _recurrence_type(event: CalendarEvent) -> RecurrenceType:
+    # Events store enum values (use_enum_values), so normalize before comparing
+    return RecurrenceType(event.recurrence_type)
+
+
+def _align(value: datetime, reference: datetime) -> datetime:
+    """Make value comparable with reference: naive values are taken as reference's zone, aware ones as UTC."""
+    if reference.tzinfo is not None and value.tzinfo is None:
+        return value.replace(tzinfo=reference.tzinfo)
+    if reference.tzinfo is None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _pattern_dates(event: CalendarEvent, recurrence: RecurrenceType, start: date, until: date) -> Iterator[date]:
+    """Dates matching the recurrence pattern in [start, until], in order, ignoring count and end date."""
+    first = event.start_datetime.date()
+
+    if recurrence == RecurrenceType.DAILY:
+        step = event.recurrence_interval
+        offset = -(-(start - first).days // step) * step
+        current = first + timedelta(days=offset)
+        while current <= until:
+            yield current
+            current += timedelta(days=step)
+
+    elif recurrence in (RecurrenceType.WEEKLY, RecurrenceType.BIWEEKLY, RecurrenceType.CUSTOM):
+        step = 2 if recurrence == RecurrenceType.BIWEEKLY else event.recurrence_interval
+        weekdays = sorted(set(event.recurrence_days_of_week)) or [first.weekday()]
+        anchor = first - timedelta(days=first.weekday())
+        week = -(-((start - anchor).days // 7) // step) * step
+        while True:
+            week_start = anchor + timedelta(weeks=week)
+            if week_start > until:
+                return
+            for weekday in weekdays:
+                current = week_start + timedelta(days=weekday)
+                if current > until:
+                    return
+                if current >= start:
+                    yield current
+            week += step
+
+    elif recurrence == RecurrenceType.MONTHLY:
+        step = event.recurrence_interval
+        months = (start.year - first.year) * 12 + start.month - first.month
+        months = -(-months // step) * step
+        while True:
+            year, month = divmod(first.month - 1 + months, 12)
+            year += first.year
+            if date(year, month + 1, 1) > until:
+                return
+            if first.day <= calendar.monthrange(year, month + 1)[1]:
+                current = date(year, month + 1, first.day)
+                if start <= current <= until:
+                    yield current
+            months += step
+
+
+def occurrence_dates(event: CalendarEvent, from_date: date, to_date: date) -> Iterator[date]:
+    """Dates in [from_date, to_date] on which an occurrence of the event starts."""
+    first = event.start_datetime.date()
+    recurrence = _recurrence_type(event)
+    exceptions = set(event.recurrence_exception_dates)
+
+    if recurrence == RecurrenceType.NONE:
+        if from_date <= first <= to_date:
+            yield first
+        return
+
+    until = to_date if event.recurrence_end_date is None else min(to_date, event.recurrence_end_date)
+    count = event.recurrence_count
+    # With a count, occurrences before the window still use up the count
+    start = first if count is not None else max(first, from_date)
+
+    produced = 0
+    for current in _pattern_dates(event, recurrence, start, until):
+        if count is not None:
+            if produced >= count:
+                return
+            produced += 1
+        if current >= from_date and current not in exceptions:
+            yield current
+
+
+def occurs_on(event: CalendarEvent, check_date: date) -> bool:
+    """Whether an occurrence of an active event starts on check_date."""
+    return event.is_active and next(occurrence_dates(event, check_date, check_date), None) is not None
+
+
+def expand_event(event: CalendarEvent, window_start: datetime, window_end: datetime) -> List[Interval]:
+    """Occurrences of the event overlapping [window_start, window_end), in start order."""
+    if not event.is_active:
+        return []
+
+    window_start = _align(window_start, event.start_datetime)
+    window_end = _align(window_end, event.start_datetime)
+    duration = event.end_datetime - event.start_datetime
+    start_time = event.start_datetime.timetz()
+
+    occurrences = []
+    # Occurrences starting before the window can still run into it
+    for current in occurrence_dates(event, (window_start - duration).date(), window_end.date()):
+        occurrence_start = datetime.combine(current, start_time)
+        occurrence_end = occurrence_start + duration
+        if occurrence_start < window_end and occurrence_end > window_start:
+            occurrences.append((occurrence_start, occurrence_end))
+    return occurrences
+
+
+class OccurrenceCache:
+    """
+    LRU cache of event expansions.
+
+    Keyed by the event's timing and recurrence fields plus the window, so an
+    edited event misses naturally and reloaded copies of the same event hit.
+    """
+
+    def __init__(self, max_entries: int = EXPANSION_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Interval, ...]]" = OrderedDict()
+
+    @staticmethod
+    def _key(event: CalendarEvent, window_start: datetime, window_end: datetime) -> Hashable:
+        return (
+            event.id, event.start_datetime, event.end_datetime, event.is_active,
+            _recurrence_type(event), event.recurrence_interval, event.recurrence_count,
+            event.recurrence_end_date, tuple(event.recurrence_days_of_week),
+            tuple(sorted(event.recurrence_exception_dates)), window_start, window_end
+        )
+
+    def expand(self, event: CalendarEvent, window_start: datetime, window_end: datetime) -> Tuple[Interval, ...]:
+        key = self._key(event, window_start, window_end)
+        occurrences = self._entries.get(key)
+        if occurrences is not None:
+            self._entries.move_to_end(key)
+            return occurrences
+
+        occurrences = tuple(expand_event(event, window_start, window_end))
+        self._entries[key] = occurrences
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return occurrences
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+occurrence_cache = OccurrenceCache()
+
+
+class BusyIntervalIndex:
+    """
+    Busy time per user within one window.
+
+    Blocking event occurrences and approved time off are clipped to the
+    window and merged into sorted, disjoint intervals per user; lookups
+    bisect into them.
+    """
+
+    def __init__(self, window_start: datetime, window_end: datetime, cache: Optional[OccurrenceCache] = None):
+        self.window_start = window_start
+        self.window_end = window_end
+        self.cache = cache or occurrence_cache
+        self._pending: Dict[str, List[Interval]] = {}
+        self._merged: Dict[str, Tuple[List[datetime], List[datetime]]] = {}
+
+    def add_events(self, user_id: str, events: Iterable[CalendarEvent]) -> None:
+        """Add occurrences of the user's events that block scheduling."""
+        busy = self._pending.setdefault(user_id, [])
+        for event in events:
+            if event.blocks_scheduling:
+                busy.extend(self.cache.expand(event, self.window_start, self.window_end))
+        self._merged.pop(user_id, None)
+
+    def add_time_off(self, user_id: str, requests: Iterable[TimeOffRequest]) -> None:
+        """Add approved time off that affects scheduling, as whole days."""
+        busy = self._pending.setdefault(user_id, [])
+        for request in requests:
+            if request.is_approved() and request.affects_scheduling:
+                busy.append((
+                    _align(datetime.combine(request.start_date, time.min), self.window_start),
+                    _align(datetime.combine(request.end_date + timedelta(days=1), time.min), self.window_start)
+                ))
+        self._merged.pop(user_id, None)
+
+    def _intervals(self, user_id: str) -> Tuple[List[datetime], List[datetime]]:
+        merged = self._merged.get(user_id)
+        if merged is None:
+            starts: List[datetime] = []
+            ends: List[datetime] = []
+            for start, end in sorted(self._pending.get(user_id, [])):
+                start = max(_align(start, self.window_start), self.window_start)
+                end = min(_align(end, self.window_start), self.window_end)
+                if end <= start:
+                    continue
+                if ends and start <= ends[-1]:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            merged = self._merged[user_id] = (starts, ends)
+        return merged
+
+    def busy(self, user_id: str, start: datetime, end: datetime) -> List[Interval]:
+        """Busy intervals of the user overlapping [start, end), clipped to it."""
+        start = _align(start, self.window_start)
+        end = _align(end, self.window_start)
+        starts, ends = self._intervals(user_id)
+        first = bisect_right(ends, start)
+        last = bisect_left(starts, end)
+        return [(max(starts[i], start), min(ends[i], end)) for i in range(first, last)]
+
+    def is_free(self, user_id: str, start: datetime, end: datetime) -> bool:
+        return not self.busy(user_id, start, end)
+
+    def free(self, user_id: str, start: datetime, end: datetime) -> List[Interval]:
+        """Gaps between the user's busy intervals within [start, end)."""
+        gaps = []
+        cursor = _align(start, self.window_start)
+        end = _align(end, self.window_start)
+        for busy_start, busy_end in self.busy(user_id, start, end):
+            if busy_start > cursor:
+                gaps.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
@@ -0,0 +1,309 @@
+"""
+Route Optimizer
+
+Local vehicle routing with time windows and shift limits for technicians'
+daily routes. Works offline on a travel time matrix: routes are built by
+regret insertion and then improved with 2-opt, or-opt and relocate moves
+until no move helps or the time budget runs out. With the same inputs and no
+budget cut-off the result is deterministic.
+
+Sized for daily dispatch (tens of stops per technician), not fleet-wide
+planning.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+Matrix = Sequence[Sequence[float]]
+
+EPSILON = 1e-9
+MAX_SEGMENT_LENGTH = 3
+# Regret of a stop that fits only one route: insert it before it loses that option
+SINGLE_OPTION_REGRET = float("inf")
+
+
+@dataclass(frozen=True)
+class RouteStop:
+    """
+    A job to visit.
+
+    node indexes the travel matrix. Times are minutes on the same clock as the
+    shifts; service must start within [earliest_start, latest_start].
+    """
+
+    stop_id: str
+    node: int
+    service_minutes: float = 0.0
+    earliest_start: Optional[float] = None
+    latest_start: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TechnicianShift:
+    """A technician's working day: start and end locations and hours."""
+
+    technician_id: str
+    start_node: int
+    end_node: int
+    shift_start: float = 0.0
+    shift_end: float = float("inf")
+    max_stops: Optional[int] = None
+
+
+@dataclass
+class PlannedRoute:
+    """One technician's stops in visiting order with their service start times."""
+
+    technician_id: str
+    stop_ids: List[str] = field(default_factory=list)
+    service_starts: List[float] = field(default_factory=list)
+    travel_minutes: float = 0.0
+    end_minutes: float = 0.0
+
+
+@dataclass
+class RoutePlan:
+    """Routes for all shifts plus the stops that could not be fitted."""
+
+    routes: List[PlannedRoute]
+    unassigned: List[str]
+    total_travel_minutes: float
+
+
+class RouteOptimizer:
+    """Vehicle routing with time windows over a travel time matrix (minutes)."""
+
+    def __init__(self, travel_minutes: Matrix, time_budget_seconds: float = 1.0, max_rounds: int = 1000):
+        self.travel_minutes = travel_minutes
+        self.time_budget_seconds = time_budget_seconds
+        self.max_rounds = max_rounds
+
+    def optimize(self, stops: Sequence[RouteStop], shifts: Sequence[TechnicianShift]) -> RoutePlan:
+        """Assign stops to shifts and order each route to minimize total travel time."""
+
+        deadline = time.monotonic() + self.time_budget_seconds
+        search = _RouteSearch(self.travel_minutes, list(stops), list(shifts))
+
+        search.insert_pending()
+        rounds = 0
+        while rounds < self.max_rounds and time.monotonic() < deadline:
+            rounds += 1
+            improved = False
+            for route_index in range(len(shifts)):
+                improved |= search.two_opt(route_index, deadline)
+                improved |= search.or_opt(route_index, deadline)
+            improved |= search.relocate(deadline)
+            # Shorter routes may have room for stops that did not fit before
+            if search.pending and search.insert_pending():
+                improved = True
+            if not improved:
+                break
+
+        return search.plan()
+
+
+class _RouteSearch:
+    """Mutable search state: one list of stop indices per shift."""
+
+    def __init__(self, travel: Matrix, stops: List[RouteStop], shifts: List[TechnicianShift]):
+        self.travel = travel
+        self.stops = stops
+        self.shifts = shifts
+        self.routes: List[List[int]] = [[] for _ in shifts]
+        self.costs: List[float] = [self.cost(index, []) for index in range(len(shifts))]
+        self.pending = set(range(len(stops)))
+
+    def schedule(self, route_index: int, route: List[int]) -> Optional[Tuple[float, float, List[float]]]:
+        """(travel, end time, service starts) for a route, or None if it breaks a window or the shift."""
+
+        shift = self.shifts[route_index]
+        if shift.max_stops is not None and len(route) > shift.max_stops:
+            return None
+
+        clock = shift.shift_start
+        node = shift.start_node
+        travel = 0.0
+        starts = []
+        for stop_index in route:
+            stop = self.stops[stop_index]
+            leg = self.travel[node][stop.node]
+            travel += leg
+            clock += leg
+            if stop.earliest_start is not None and clock < stop.earliest_start:
+                clock = stop.earliest_start
+            if stop.latest_start is not None and clock > stop.latest_start + EPSILON:
+                return None
+            starts.append(clock)
+            clock += stop.service_minutes
+            node = stop.node
+
+        leg = self.travel[node][shift.end_node]
+        travel += leg
+        clock += leg
+        if clock > shift.shift_end + EPSILON:
+            return None
+        return travel, clock, starts
+
+    def cost(self, route_index: int, route: List[int]) -> Optional[float]:
+        scheduled = self.schedule(route_index, route)
+        return scheduled[0] if scheduled else None
+
+    def _try(self, route_index: int, candidate: List[int]) -> bool:
+        """Adopt candidate for the route if it is feasible and shorter."""
+
+        cost = self.cost(route_index, candidate)
+        if cost is not None and cost < self.costs[route_index] - EPSILON:
+            self.routes[route_index] = candidate
+            self.costs[route_index] = cost
+            return True
+        return False
+
+    def insert_pending(self) -> bool:
+        """
+        Regret-2 insertion: repeatedly insert the stop that would lose most by
+        not getting its best route, at its cheapest feasible position.
+        Returns whether any stop was inserted.
+        """
+
+        inserted = False
+        while self.pending:
+            best = None  # (regret, -delta, -stop_index), route_index, position, stop_index
+            for stop_index in sorted(self.pending):
+                options = []
+                for route_index, route in enumerate(self.routes):
+                    if self.costs[route_index] is None:
+                        continue
+                    option = self._best_insertion(route_index, route, stop_index)
+                    if option:
+                        options.append(option)
+                if not options:
+                    continue
+
+                options.sort()
+                delta, route_index, position = options[0]
+                regret = options[1][0] - delta if len(options) > 1 else SINGLE_OPTION_REGRET
+                key = (regret, -delta, -stop_index)
+                if best is None or key > best[0]:
+                    best = (key, route_index, position, stop_index)
+
+            if best is None:
+                break
+
+            _, route_index, position, stop_index = best
+            route = self.routes[route_index]
+            route.insert(position, stop_index)
+            self.costs[route_index] = self.cost(route_index, route)
+            self.pending.discard(stop_index)
+            inserted = True
+
+        return inserted
+
+    def _best_insertion(self, route_index: int, route: List[int], stop_index: int) -> Optional[Tuple[float, int, int]]:
+        best = None
+        for position in range(len(route) + 1):
+            cost = self.cost(route_index, route[:position] + [stop_index] + route[position:])
+            if cost is None:
+                continue
+            delta = cost - self.costs[route_index]
+            if best is None or delta < best[0] - EPSILON:
+                best = (delta, route_index, position)
+        return best
+
+    def two_opt(self, route_index: int, deadline: float) -> bool:
+        """Reverse route segments while that shortens the route."""
+
+        improved = False
+        restart = True
+        while restart and time.monotonic() < deadline:
+            restart = False
+            route = self.routes[route_index]
+            for i in range(len(route) - 1):
+                for j in range(i + 1, len(route)):
+                    candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+                    if self._try(route_index, candidate):
+                        improved = restart = True
+                        break
+                if restart:
+                    break
+        return improved
+
+    def or_opt(self, route_index: int, deadline: float) -> bool:
+        """Move segments of up to MAX_SEGMENT_LENGTH stops elsewhere in the route."""
+
+        improved = False
+        restart = True
+        while restart and time.monotonic() < deadline:
+            restart = False
+            route = self.routes[route_index]
+            for length in range(1, min(MAX_SEGMENT_LENGTH, len(route) - 1) + 1):
+                for i in range(len(route) - length + 1):
+                    segment = route[i:i + length]
+                    rest = route[:i] + route[i + length:]
+                    for position in range(len(rest) + 1):
+                        if position == i:
+                            continue
+                        if self._try(route_index, rest[:position] + segment + rest[position:]):
+                            improved = restart = True
+                            break
+                    if restart:
+                        break
+                if restart:
+                    break
+        return improved
+
+    def relocate(self, deadline: float) -> bool:
+        """Move single stops between routes while that lowers the combined travel."""
+
+        improved = False
+        for source in range(len(self.routes)):
+            for target in range(len(self.routes)):
+                if source == target or self.costs[target] is None:
+                    continue
+                i = 0
+                while i < len(self.routes[source]):
+                    if time.monotonic() >= deadline:
+                        return improved
+                    source_route = self.routes[source]
+                    stop_index = source_route[i]
+                    remaining = source_route[:i] + source_route[i + 1:]
+                    remaining_cost = self.cost(source, remaining)
+                    option = self._best_insertion(target, self.routes[target], stop_index)
+                    if remaining_cost is not None and option is not None:
+                        delta, _, position = option
+                        saving = self.costs[source] - remaining_cost
+                        if delta < saving - EPSILON:
+                            self.routes[source] = remaining
+                            self.costs[source] = remaining_cost
+                            self.routes[target].insert(position, stop_index)
+                            self.costs[target] = self.cost(target, self.routes[target])
+                            improved = True
+                            continue
+                    i += 1
+        return improved
+
+    def plan(self) -> RoutePlan:
+        routes = []
+        total_travel = 0.0
+        for route_index, route in enumerate(self.routes):
+            shift = self.shifts[route_index]
+            scheduled = self.schedule(route_index, route)
+            if scheduled is None:
+                # Only an empty route over an impossible shift gets here
+                routes.append(PlannedRoute(technician_id=shift.technician_id))
+                continue
+            travel, end, starts = scheduled
+            total_travel += travel
+            routes.append(PlannedRoute(
+                technician_id=shift.technician_id,
+                stop_ids=[self.stops[index].stop_id for index in route],
+                service_starts=starts,
+                travel_minutes=travel,
+                end_minutes=end
+            ))
+
+        return RoutePlan(
+            routes=routes,
+            unassigned=[self.stops[index].stop_id for index in sorted(self.pending)],
+            total_travel_minutes=total_travel
+        )
@@ -8,6 +8,7 @@ from .enums import (
     CurrencyCode, TaxType, DiscountType, AdvancePaymentType, TemplateType,
     PricingModel, UnitOfMeasure, PaymentMethod
 )
+from .pagination import CursorPage, encode_cursor, decode_cursor
 
 __all__ = [
     "CurrencyCode",
@@ -18,4 +19,7 @@ __all__ = [
     "PricingModel",
     "UnitOfMeasure",
     "PaymentMethod",
+    "CursorPage",
+    "encode_cursor",
+    "decode_cursor",
 ] 
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Shared Document Totals
+
+Totals engine for priced documents (estimates, invoices). All line-level and
+document-level amounts are computed in a single pass over the line items and
+kept on the entity until a pricing field or the line items change, so reading
+several totals from one document does not redo the Decimal arithmetic.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, PrivateAttr
+
+from .enums import DiscountType, TaxType
+
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+
+_DISCOUNT_NONE = DiscountType.NONE.value
+_DISCOUNT_PERCENTAGE = DiscountType.PERCENTAGE.value
+_PERCENTAGE_TAX_TYPES = (TaxType.PERCENTAGE.value, TaxType.EXCLUSIVE.value)
+_TAX_NONE = TaxType.NONE.value
+_TAX_FIXED_AMOUNT = TaxType.FIXED_AMOUNT.value
+
+# Fields whose assignment changes a document's totals
+TOTALS_FIELDS = frozenset({
+    "line_items", "tax_rate", "tax_type", "overall_discount_type", "overall_discount_value"
+})
+
+
+@dataclass(frozen=True)
+class LineTotals:
+    """Amounts for one line item."""
+
+    subtotal: Decimal
+    discount_amount: Decimal
+    total_after_discount: Decimal
+    tax_amount: Decimal
+    total: Decimal
+
+
+@dataclass(frozen=True)
+class DocumentTotals:
+    """Amounts for a whole document, plus the per-line amounts they were built from."""
+
+    lines: Tuple[LineTotals, ...]
+    line_items_subtotal: Decimal
+    line_items_discount_total: Decimal
+    subtotal_after_line_discounts: Decimal
+    overall_discount_amount: Decimal
+    total_before_tax: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+def _discount(base: Decimal, discount_type: Any, discount_value: Decimal) -> Decimal:
+    if discount_type == _DISCOUNT_NONE:
+        return ZERO
+    if discount_type == _DISCOUNT_PERCENTAGE:
+        return base * (discount_value / HUNDRED)
+    # FIXED_AMOUNT
+    return min(discount_value, base)
+
+
+def compute_line_totals(line_item: Any) -> LineTotals:
+    """Compute the amounts for one line item."""
+
+    subtotal = line_item.quantity * line_item.unit_price
+    discount = _discount(subtotal, _enum_value(line_item.discount_type), line_item.discount_value)
+    after_discount = subtotal - discount
+    tax = after_discount * (line_item.tax_rate / HUNDRED)
+    return LineTotals(subtotal, discount, after_discount, tax, after_discount + tax)
+
+
+def compute_document_totals(
+    line_items: Sequence[Any],
+    tax_type: Any,
+    tax_rate: Decimal,
+    overall_discount_type: Any,
+    overall_discount_value: Decimal
+) -> DocumentTotals:
+    """
+    Compute line and document totals in one pass over the line items.
+
+    Document tax applies to the total after line and overall discounts;
+    line-level tax only contributes to each line's own total. INCLUSIVE tax is
+    already part of the line prices and adds nothing.
+    """
+
+    lines = tuple(compute_line_totals(item) for item in line_items)
+    line_subtotal = sum((line.subtotal for line in lines), ZERO)
+    line_discount = sum((line.discount_amount for line in lines), ZERO)
+    after_line_discounts = line_subtotal - line_discount
+
+    overall_discount = _discount(
+        after_line_discounts, _enum_value(overall_discount_type), overall_discount_value
+    )
+    before_tax = after_line_discounts - overall_discount
+
+    tax_type = _enum_value(tax_type)
+    if tax_type in _PERCENTAGE_TAX_TYPES:
+        tax = before_tax * (tax_rate / HUNDRED)
+    elif tax_type == _TAX_FIXED_AMOUNT:
+        tax = tax_rate
+    else:  # NONE or INCLUSIVE
+        tax = ZERO
+
+    return DocumentTotals(
+        lines=lines,
+        line_items_subtotal=line_subtotal,
+        line_items_discount_total=line_discount,
+        subtotal_after_line_discounts=after_line_discounts,
+        overall_discount_amount=overall_discount,
+        total_before_tax=before_tax,
+        tax_amount=tax,
+        total_amount=before_tax + tax
+    )
+
+
+def compute_totals_batch(documents: Iterable["TotalsCachedModel"]) -> List[DocumentTotals]:
+    """
+    Compute totals for many documents, e.g. for reports.
+
+    Documents whose totals are already cached are not recomputed; the rest are
+    computed and cached, so later reads on the same entities are free.
+    """
+
+    return [document.get_totals() for document in documents]
+
+
+class TotalsCachedModel(BaseModel):
+    """
+    Base for priced documents that cache their totals.
+
+    The cache is dropped whenever a field in TOTALS_FIELDS is assigned or
+    replaced through model_copy(update=...). Code that changes line items in
+    place must call invalidate_totals().
+    """
+
+    _totals: Optional[DocumentTotals] = PrivateAttr(default=None)
+
+    def get_totals(self) -> DocumentTotals:
+        """Return the document totals, computing them on first use."""
+        if self._totals is None:
+            self._totals = compute_document_totals(
+                self.line_items,
+                self.tax_type,
+                self.tax_rate,
+                self.overall_discount_type,
+                self.overall_discount_value
+            )
+        return self._totals
+
+    def invalidate_totals(self) -> None:
+        """Drop cached totals after the line items were changed in place."""
+        self._totals = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in TOTALS_FIELDS:
+            self._totals = None
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not TOTALS_FIELDS.isdisjoint(update):
+            copied._totals = None
+        return copied
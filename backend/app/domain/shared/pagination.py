@@ -0,0 +1,56 @@
+"""
+Shared Pagination Definitions
+
+Keyset (cursor) pagination primitives shared by repositories.
+A cursor is an opaque, URL-safe token wrapping the sort key values of the
+last row on a page, so the next page starts strictly after that row.
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, Optional, TypeVar
+
+from ..exceptions.domain_exceptions import DomainValidationError
+
+T = TypeVar("T")
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort key values (e.g. ``rank, id``) into an opaque cursor."""
+
+    payload = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_length: Optional[int] = None) -> List[Any]:
+    """
+    Decode an opaque cursor back into its sort key values.
+
+    Raises:
+        DomainValidationError: If the cursor is malformed
+    """
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise DomainValidationError(f"Invalid pagination cursor: {str(e)}")
+
+    if not isinstance(values, list) or (expected_length is not None and len(values) != expected_length):
+        raise DomainValidationError("Invalid pagination cursor")
+
+    return values
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """A page of keyset-paginated results."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    estimated_total: Optional[int] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
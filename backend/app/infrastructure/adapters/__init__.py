@@ -4,31 +4,34 @@ Infrastructure Adapters
 Clean Architecture adapters that implement application ports.
 These adapters handle external service integration while keeping
 business logic separate in domain services.
-"""
 
-from .openai_content_adapter import OpenAIContentAdapter
-from .claude_content_adapter import ClaudeContentAdapter
-from .gemini_content_adapter import GeminiContentAdapter
-from .content_generation_factory import create_content_adapter, get_provider_info
+Adapters are imported on first access, so importing one adapter module
+does not load every provider SDK and website builder integration.
+"""
 
-from .seo_tools_adapter import SEOToolsAdapter
-from .cloudflare_domain_adapter import CloudflareDomainAdapter
-from .aws_hosting_adapter import AWSHostingAdapter
-from .google_business_profile_adapter import GoogleBusinessProfileAdapter
-from .hero365_subdomain_adapter import Hero365SubdomainAdapter
+from importlib import import_module
 
-__all__ = [
+_EXPORTS = {
     # Content Generation Adapters
-    "OpenAIContentAdapter",
-    "ClaudeContentAdapter", 
-    "GeminiContentAdapter",
-    "create_content_adapter",
-    "get_provider_info",
-    
+    "OpenAIContentAdapter": ".openai_content_adapter",
+    "ClaudeContentAdapter": ".claude_content_adapter",
+    "GeminiContentAdapter": ".gemini_content_adapter",
+    "create_content_adapter": ".content_generation_factory",
+    "create_failover_content_adapter": ".content_generation_factory",
+    "get_provider_info": ".content_generation_factory",
+
     # Website Builder Adapters
-    "SEOToolsAdapter",
-    "CloudflareDomainAdapter",
-    "AWSHostingAdapter",
-    "GoogleBusinessProfileAdapter",
-    "Hero365SubdomainAdapter",
-]
+    "SEOToolsAdapter": ".seo_tools_adapter",
+    "CloudflareDomainAdapter": ".cloudflare_domain_adapter",
+    "AWSHostingAdapter": ".aws_hosting_adapter",
+    "GoogleBusinessProfileAdapter": ".google_business_profile_adapter",
+    "Hero365SubdomainAdapter": ".hero365_subdomain_adapter",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
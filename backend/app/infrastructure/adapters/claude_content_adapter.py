@@ -5,9 +5,11 @@ Implementation of ContentGenerationPort using Anthropic's Claude.
 This adapter specializes in generating high-quality React/Next.js components and content.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime
 import json
 
@@ -17,10 +19,18 @@ from anthropic import AsyncAnthropic
 from ...application.ports.content_generation_port import (
     ContentGenerationPort, ContentGenerationResult
 )
+from ...application.ports.generation_cache_port import (
+    GenerationCachePort, build_generation_cache_key
+)
 from ...domain.entities.business import Business
 from ...domain.entities.business_branding import BusinessBranding
-from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 from ...core.config import settings
+from .llm_gateway import StreamingSectionParser, estimate_tokens, get_provider_gateway
+from ..stores.generation_cache_adapter import get_generation_cache
+
+if TYPE_CHECKING:
+    # Website entities are not in the domain model yet; they are only used in annotations
+    from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +47,7 @@ class ClaudeContentAdapter(ContentGenerationPort):
     It does NOT contain business logic.
     """
     
-    def __init__(self):
+    def __init__(self, generation_cache: Optional[GenerationCachePort] = None):
         if not settings.CLAUDE_API_KEY:
             raise ValueError("CLAUDE_API_KEY is required for Claude content generation")
         
@@ -45,6 +55,8 @@ class ClaudeContentAdapter(ContentGenerationPort):
         self.model = settings.CLAUDE_CONTENT_MODEL
         self.max_tokens = settings.CONTENT_MAX_TOKENS
         self.temperature = settings.CONTENT_TEMPERATURE
+        self.gateway = get_provider_gateway("claude")
+        self.generation_cache = generation_cache or get_generation_cache()
     
     async def generate_website_content(
         self,
@@ -99,21 +111,13 @@ class ClaudeContentAdapter(ContentGenerationPort):
         prompt = self._build_claude_page_prompt(business, branding, page_type, context)
         
         try:
-            response = await self.client.messages.create(
-                model=self.model,
+            content_text = await self._create_message(
+                prompt,
+                system=self._get_claude_system_prompt(),
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                system=self._get_claude_system_prompt(),
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
             )
             
-            content_text = response.content[0].text
-            
             # Parse structured content from response
             return self._parse_claude_content_response(content_text, page_type)
             
@@ -202,20 +206,12 @@ class ClaudeContentAdapter(ContentGenerationPort):
         """
         
         try:
-            response = await self.client.messages.create(
-                model=self.model,
+            content = await self._create_message(
+                prompt,
+                system="You are an expert SEO specialist for home services businesses. Generate precise, effective SEO content that ranks well and converts visitors.",
                 max_tokens=1500,
                 temperature=0.3,  # Lower temperature for SEO precision
-                system="You are an expert SEO specialist for home services businesses. Generate precise, effective SEO content that ranks well and converts visitors.",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
             )
-            
-            content = response.content[0].text
             return self._parse_claude_seo_content(content)
             
         except Exception as e:
@@ -282,43 +278,143 @@ class ClaudeContentAdapter(ContentGenerationPort):
         """
         
         try:
-            response = await self.client.messages.create(
-                model=self.model,
+            analysis = await self._create_message(
+                prompt,
+                system="You are a content quality analyst specializing in home services websites. Provide thorough, actionable analysis.",
                 max_tokens=2000,
                 temperature=0.2,  # Very low temperature for analytical precision
-                system="You are a content quality analyst specializing in home services websites. Provide thorough, actionable analysis.",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
             )
-            
-            analysis = response.content[0].text
             return self._parse_claude_quality_analysis(analysis)
             
         except Exception as e:
             logger.error(f"Claude content validation failed: {str(e)}")
-            return {
-                "overall_score": 50,
-                "category_scores": {
-                    "clarity": 50,
-                    "professionalism": 50,
-                    "cta_effectiveness": 50,
-                    "local_relevance": 50,
-                    "trade_accuracy": 50,
-                    "seo_optimization": 50
-                },
-                "strengths": [],
-                "improvement_areas": [f"Validation error: {str(e)}"],
-                "recommendations": ["Please retry content validation"]
-            }
+            raise
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> str:
+        """Generate text for a prompt using Claude."""
+        
+        content = await self._create_message(prompt, system, max_tokens, temperature)
+        return content.strip()
     
     # =====================================
     # PRIVATE HELPER METHODS
     # =====================================
     
+    async def _create_message(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Send a single-turn request to Claude through the shared provider gateway."""
+        
+        cache_key = self._get_generation_cache_key("message", prompt, system, max_tokens, temperature)
+        cached = await self._get_cached_generation(cache_key)
+        if cached is not None:
+            return cached
+        
+        async def _request() -> str:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
+            return response.content[0].text
+        
+        content_text = await self.gateway.call(_request, estimated_tokens=estimate_tokens(system + prompt, max_tokens))
+        await self._cache_generation(cache_key, content_text)
+        return content_text
+    
+    async def _stream_message(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int,
+        temperature: float
+    ) -> StreamingSectionParser:
+        """Stream a Claude response through the gateway, parsing JSON sections as they complete."""
+        
+        cache_key = self._get_generation_cache_key("stream", prompt, system, max_tokens, temperature)
+        cached = await self._get_cached_generation(cache_key)
+        if cached is not None:
+            parser = StreamingSectionParser()
+            parser.feed(cached)
+            return parser
+        
+        async def _request() -> StreamingSectionParser:
+            # Fresh parser per attempt so a rate-limited retry starts clean
+            parser = StreamingSectionParser()
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            ) as stream:
+                async for text in stream.text_stream:
+                    for section_type, _ in parser.feed(text):
+                        logger.debug(f"Claude streamed section complete: {section_type}")
+            return parser
+        
+        parser = await self.gateway.call(_request, estimated_tokens=estimate_tokens(system + prompt, max_tokens))
+        # Only complete responses are worth reusing
+        if parser.is_complete:
+            await self._cache_generation(cache_key, parser.text)
+        return parser
+    
+    def _get_generation_cache_key(
+        self,
+        kind: str,
+        prompt: str,
+        system: str,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Content-addressed key: identical prompts reuse a generation across businesses."""
+        
+        return build_generation_cache_key(f"claude:{kind}", {
+            "model": self.model,
+            "system": system,
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        })
+    
+    async def _get_cached_generation(self, cache_key: str) -> Optional[str]:
+        if not self.generation_cache:
+            return None
+        
+        cached = await self.generation_cache.get(cache_key)
+        if cached:
+            logger.info(f"Claude generation cache hit: {cache_key}")
+            return cached.get("text")
+        return None
+    
+    async def _cache_generation(self, cache_key: str, text: str) -> None:
+        if self.generation_cache and text:
+            await self.generation_cache.set(
+                cache_key, {"text": text}, settings.CONTENT_GENERATION_CACHE_TTL_SECONDS
+            )
+    
     def _get_claude_system_prompt(self) -> str:
         """Get Claude-optimized system prompt for content generation."""
         
@@ -710,20 +806,12 @@ Always return structured, well-formatted content that can be easily parsed and u
         """
         
         try:
-            response = await self.client.messages.create(
-                model=self.model,
+            updated_content = await self._create_message(
+                prompt,
+                system="You are updating website content. Maintain consistency with existing style while incorporating new information and improving quality.",
                 max_tokens=1500,
                 temperature=0.4,
-                system="You are updating website content. Maintain consistency with existing style while incorporating new information and improving quality.",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
             )
-            
-            updated_content = response.content[0].text
             return self._parse_claude_content_response(updated_content, section)
             
         except Exception as e:
@@ -743,23 +831,19 @@ Always return structured, well-formatted content that can be easily parsed and u
         prompt = self._build_batch_website_prompt(business, branding, template, required_pages)
         
         try:
-            response = await self.client.messages.create(
-                model=self.model,
+            # Stream the response so sections are parsed as soon as each one completes
+            parser = await self._stream_message(
+                prompt,
+                system=self._get_batch_generation_system_prompt(),
                 max_tokens=8000,  # Increased for batch generation
                 temperature=self.temperature,
-                system=self._get_batch_generation_system_prompt(),
-                messages=[
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ]
             )
             
-            content_text = response.content[0].text
+            if parser.is_complete and parser.sections:
+                return self._structure_batch_content(parser.sections, template)
             
-            # Parse the batch response into structured content
-            return self._parse_batch_content_response(content_text, template)
+            # Incomplete or malformed stream: fall back to whole-text parsing
+            return self._parse_batch_content_response(parser.text, template)
             
         except Exception as e:
             logger.error(f"Claude batch generation failed: {str(e)}")
@@ -916,25 +1000,7 @@ Always return valid JSON with all required sections. Focus on benefits over feat
             json_content = content_text[json_start:json_end]
             parsed_content = json.loads(json_content)
             
-            # Structure content for website builder
-            structured_content = {}
-            
-            # Map content to page paths and sections
-            for page in template.structure.get("pages", []):
-                page_path = page.get("path", "/")
-                
-                # Add full page content
-                structured_content[page_path] = parsed_content
-                
-                # Add section-specific content
-                for section in page.get("sections", []):
-                    section_type = section.get("type")
-                    section_key = f"{page_path}_{section_type}"
-                    
-                    if section_type in parsed_content:
-                        structured_content[section_key] = {section_type: parsed_content[section_type]}
-            
-            return structured_content
+            return self._structure_batch_content(parsed_content, template)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse batch content JSON: {str(e)}")
@@ -947,6 +1013,28 @@ Always return valid JSON with all required sections. Focus on benefits over feat
             logger.error(f"Batch content parsing failed: {str(e)}")
             return self._create_fallback_content(template)
     
+    def _structure_batch_content(self, parsed_content: Dict[str, Any], template: WebsiteTemplate) -> Dict[str, Any]:
+        """Map parsed batch sections onto the template's page paths and sections."""
+        
+        structured_content = {}
+        
+        # Map content to page paths and sections
+        for page in template.structure.get("pages", []):
+            page_path = page.get("path", "/")
+            
+            # Add full page content
+            structured_content[page_path] = parsed_content
+            
+            # Add section-specific content
+            for section in page.get("sections", []):
+                section_type = section.get("type")
+                section_key = f"{page_path}_{section_type}"
+                
+                if section_type in parsed_content:
+                    structured_content[section_key] = {section_type: parsed_content[section_type]}
+        
+        return structured_content
+    
     def _create_fallback_content(self, template: WebsiteTemplate) -> Dict[str, Any]:
         """Create fallback content structure when parsing fails."""
         
@@ -2,18 +2,29 @@
 Content Generation Factory
 
 Factory for creating content generation adapters based on configuration.
-Allows switching between different LLM providers (OpenAI, Claude, Gemini).
+Allows switching between different LLM providers (OpenAI, Claude, Gemini),
+with automatic failover across configured providers.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Dict, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 
-from ...application.ports.content_generation_port import ContentGenerationPort
+from ...application.ports.content_generation_port import (
+    ContentGenerationPort, ContentGenerationResult
+)
+from ...domain.entities.business import Business
+from ...domain.entities.business_branding import BusinessBranding
 from ...core.config import settings
 from .openai_content_adapter import OpenAIContentAdapter
 from .claude_content_adapter import ClaudeContentAdapter
 from .gemini_content_adapter import GeminiContentAdapter
 
+if TYPE_CHECKING:
+    # Website entities are not in the domain model yet; they are only used in annotations
+    from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,6 +82,43 @@ class ContentGenerationFactory:
             logger.error(f"Failed to create {provider} adapter: {str(e)}")
             raise ValueError(f"Failed to initialize {provider} content generation: {str(e)}")
     
+    @classmethod
+    def create_failover_adapter(self, providers: List[str] = None) -> ContentGenerationPort:
+        """
+        Create an adapter that fails over across providers in order.
+        
+        Args:
+            providers: Ordered provider names. If None, uses the configured default
+                      provider followed by CONTENT_GENERATION_FAILOVER_PROVIDERS.
+        
+        Returns:
+            ContentGenerationPort that tries each configured provider in turn
+            
+        Raises:
+            ValueError: If none of the providers can be created
+        """
+        
+        if providers is None:
+            providers = [settings.CONTENT_GENERATION_PROVIDER, *settings.CONTENT_GENERATION_FAILOVER_PROVIDERS]
+        
+        adapters: List[tuple] = []
+        for provider in dict.fromkeys(providers):
+            if provider not in self._adapters or not self._is_provider_configured(provider):
+                continue
+            try:
+                adapters.append((provider, self._adapters[provider]()))
+            except Exception as e:
+                logger.warning(f"Skipping {provider} for failover: {str(e)}")
+        
+        if not adapters:
+            raise ValueError(f"No configured content generation provider among: {', '.join(providers)}")
+        
+        if len(adapters) == 1:
+            return adapters[0][1]
+        
+        logger.info(f"Created failover content adapter: {' -> '.join(name for name, _ in adapters)}")
+        return FailoverContentAdapter(adapters)
+    
     @classmethod
     def get_available_providers(self) -> Dict[str, Dict[str, any]]:
         """
@@ -149,6 +197,124 @@ class ContentGenerationFactory:
         return descriptions.get(provider, f"Content generation using {provider}")
 
 
+class FailoverContentAdapter(ContentGenerationPort):
+    """
+    Content generation adapter that fails over across providers.
+    
+    Each call goes to the first provider; if it raises (after its gateway has
+    exhausted rate-limit retries) or returns a failed result, the next
+    provider is tried. The last provider's result is returned as is.
+    """
+    
+    def __init__(self, adapters: List[tuple]):
+        self.adapters = adapters
+    
+    async def _call_with_failover(
+        self,
+        method: str,
+        *args,
+        failure: Optional[Callable[[Any], Optional[str]]] = None,
+        **kwargs
+    ) -> Any:
+        last_error: Exception = None
+        
+        for index, (provider, adapter) in enumerate(self.adapters):
+            is_last = index == len(self.adapters) - 1
+            try:
+                result = await getattr(adapter, method)(*args, **kwargs)
+            except Exception as e:
+                last_error = e
+                if not is_last:
+                    logger.warning(f"{provider} {method} failed, failing over: {str(e)}")
+                continue
+            
+            reason = failure(result) if failure else None
+            if reason and not is_last:
+                logger.warning(f"{provider} {method} unsuccessful, failing over: {reason}")
+                continue
+            
+            return result
+        
+        raise last_error
+    
+    @staticmethod
+    def _result_failure(result: ContentGenerationResult) -> Optional[str]:
+        """
+        Why a generation result counts as failed, or None if it succeeded.
+        
+        Providers key pages differently (page types, template paths), so a
+        result succeeds when it carries any non-empty content.
+        """
+        if not result.success:
+            return result.error_message or "generation failed"
+        
+        if not any(result.content_data.values()):
+            return "no content generated"
+        
+        return None
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> str:
+        return await self._call_with_failover("generate_text", prompt, system, max_tokens, temperature)
+    
+    async def generate_website_content(
+        self,
+        business: Business,
+        branding: BusinessBranding,
+        template: WebsiteTemplate,
+        required_pages: List[str]
+    ) -> ContentGenerationResult:
+        return await self._call_with_failover(
+            "generate_website_content", business, branding, template, required_pages,
+            failure=self._result_failure
+        )
+    
+    async def generate_page_content(
+        self,
+        business: Business,
+        branding: BusinessBranding,
+        page_type: str,
+        context: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        return await self._call_with_failover(
+            "generate_page_content", business, branding, page_type, context
+        )
+    
+    async def update_website_content(
+        self,
+        website: BusinessWebsite,
+        business: Business,
+        branding: BusinessBranding,
+        content_updates: Dict[str, Any]
+    ) -> ContentGenerationResult:
+        return await self._call_with_failover(
+            "update_website_content", website, business, branding, content_updates,
+            failure=self._result_failure
+        )
+    
+    async def generate_seo_content(
+        self,
+        business: Business,
+        target_keywords: List[str],
+        page_type: str
+    ) -> Dict[str, Any]:
+        return await self._call_with_failover(
+            "generate_seo_content", business, target_keywords, page_type
+        )
+    
+    async def validate_content_quality(
+        self,
+        content: Dict[str, Any],
+        business: Business
+    ) -> Dict[str, Any]:
+        return await self._call_with_failover("validate_content_quality", content, business)
+
+
 # Convenience function for creating the default adapter
 def create_content_adapter(provider: str = None) -> ContentGenerationPort:
     """
@@ -163,6 +329,20 @@ def create_content_adapter(provider: str = None) -> ContentGenerationPort:
     return ContentGenerationFactory.create_adapter(provider)
 
 
+# Convenience function for creating a failover adapter
+def create_failover_content_adapter(providers: List[str] = None) -> ContentGenerationPort:
+    """
+    Convenience function to create an adapter with provider failover.
+    
+    Args:
+        providers: Optional ordered provider names. Uses configured order if None.
+        
+    Returns:
+        ContentGenerationPort implementation
+    """
+    return ContentGenerationFactory.create_failover_adapter(providers)
+
+
 # Convenience function for getting provider info
 def get_provider_info() -> Dict[str, Dict[str, any]]:
     """
@@ -5,9 +5,11 @@ Implementation of ContentGenerationPort using Google's Gemini.
 This adapter provides an alternative AI provider for content generation.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 from datetime import datetime
 import json
 
@@ -19,8 +21,12 @@ from ...application.ports.content_generation_port import (
 )
 from ...domain.entities.business import Business
 from ...domain.entities.business_branding import BusinessBranding
-from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 from ...core.config import settings
+from .llm_gateway import estimate_tokens, get_provider_gateway
+
+if TYPE_CHECKING:
+    # Website entities are not in the domain model yet; they are only used in annotations
+    from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +61,7 @@ class GeminiContentAdapter(ContentGenerationPort):
             max_output_tokens=settings.CONTENT_MAX_TOKENS,
             temperature=settings.CONTENT_TEMPERATURE,
         )
+        self.gateway = get_provider_gateway("gemini")
     
     async def generate_website_content(
         self,
@@ -133,20 +140,11 @@ class GeminiContentAdapter(ContentGenerationPort):
         prompt = self._build_gemini_page_prompt(business, branding, page_type, context)
         
         try:
-            # Gemini API is synchronous, so we run it in a thread pool
-            import asyncio
-            loop = asyncio.get_event_loop()
-            
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(
-                    prompt,
-                    generation_config=self.generation_config
-                )
+            content_text = await self._generate_text(
+                prompt,
+                self.generation_config
             )
             
-            content_text = response.text
-            
             # Parse structured content from response
             return self._parse_gemini_content_response(content_text, page_type)
             
@@ -229,21 +227,13 @@ class GeminiContentAdapter(ContentGenerationPort):
         """
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=1500,
-                        temperature=0.3
-                    )
+            content = await self._generate_text(
+                prompt,
+                genai.types.GenerationConfig(
+                    max_output_tokens=1500,
+                    temperature=0.3
                 )
             )
-            
-            content = response.text
             return self._parse_gemini_seo_content(content)
             
         except Exception as e:
@@ -278,43 +268,61 @@ class GeminiContentAdapter(ContentGenerationPort):
         """
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=2000,
-                        temperature=0.2
-                    )
+            analysis = await self._generate_text(
+                prompt,
+                genai.types.GenerationConfig(
+                    max_output_tokens=2000,
+                    temperature=0.2
                 )
             )
-            
-            analysis = response.text
             return self._parse_gemini_quality_analysis(analysis)
             
         except Exception as e:
             logger.error(f"Gemini content validation failed: {str(e)}")
-            return {
-                "overall_score": 50,
-                "category_scores": {
-                    "clarity": 50,
-                    "professionalism": 50,
-                    "cta_effectiveness": 50,
-                    "local_relevance": 50,
-                    "trade_accuracy": 50,
-                    "seo_optimization": 50
-                },
-                "issues": [f"Validation error: {str(e)}"],
-                "suggestions": ["Please retry content validation"]
-            }
+            raise
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> str:
+        """Generate text for a prompt using Gemini."""
+        
+        content = await self._generate_text(
+            f"{system}\n\n{prompt}",
+            genai.types.GenerationConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature
+            )
+        )
+        return content.strip()
     
     # =====================================
     # PRIVATE HELPER METHODS
     # =====================================
     
+    async def _generate_text(self, prompt: str, generation_config) -> str:
+        """Run a Gemini generation through the shared provider gateway."""
+        
+        async def _request() -> str:
+            # Gemini API is synchronous, so we run it in a thread pool
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(
+                None,
+                lambda: self.model.generate_content(
+                    prompt,
+                    generation_config=generation_config
+                )
+            )
+            return response.text
+        
+        return await self.gateway.call(
+            _request,
+            estimated_tokens=estimate_tokens(prompt, generation_config.max_output_tokens or 0)
+        )
+    
     async def _generate_single_page_content(
         self,
         business: Business,
@@ -532,21 +540,13 @@ class GeminiContentAdapter(ContentGenerationPort):
         """
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=1500,
-                        temperature=0.4
-                    )
+            updated_content = await self._generate_text(
+                prompt,
+                genai.types.GenerationConfig(
+                    max_output_tokens=1500,
+                    temperature=0.4
                 )
             )
-            
-            updated_content = response.text
             return self._parse_gemini_content_response(updated_content, section)
             
         except Exception as e:
@@ -0,0 +1,252 @@
+"""
+LLM Provider Gateway
+
+Shared concurrency and rate limiting for LLM provider calls.
+
+Every content generation adapter routes its provider requests through a
+per-provider gateway so that bursts of site builds share one concurrency cap
+and one request/token budget per process, instead of each adapter instance
+hammering the provider independently and tripping 429s.
+
+Also provides an incremental parser that turns a streamed JSON response into
+top-level page sections as soon as each one is complete.
+"""
+
+import asyncio
+import json
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ...core.config import settings
+from ..rate_limiting import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RATE_LIMIT_ERROR_NAMES = {"RateLimitError", "ResourceExhausted", "TooManyRequests"}
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception raised by a provider SDK is a rate limit (429)."""
+
+    if getattr(error, "status_code", None) == 429 or getattr(error, "code", None) == 429:
+        return True
+    return type(error).__name__ in _RATE_LIMIT_ERROR_NAMES
+
+
+def _get_retry_after(error: BaseException) -> Optional[float]:
+    """Extract the provider's Retry-After hint (seconds) from an SDK error, if present."""
+
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderGateway:
+    """
+    Per-provider call gateway.
+
+    Combines a concurrency semaphore, a request-rate bucket and a token-rate
+    bucket, and retries rate-limited calls with exponential backoff (honouring
+    the provider's Retry-After header when present).
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int,
+        requests_per_minute: int,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 4,
+        base_backoff_seconds: float = 1.0,
+    ):
+        self.provider = provider
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._request_bucket = TokenBucket(requests_per_minute)
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+    ) -> T:
+        """
+        Run a provider call under the gateway's limits.
+
+        Args:
+            operation: Zero-argument coroutine factory performing the provider call.
+                It is invoked again on each retry, so it must not hold partial state.
+            estimated_tokens: Expected prompt + completion tokens, charged against
+                the provider's token budget before the call is made.
+
+        Returns:
+            Whatever ``operation`` returns
+
+        Raises:
+            The provider error once it is not a rate limit or retries are exhausted
+        """
+
+        attempt = 0
+        while True:
+            await self._request_bucket.acquire()
+            if self._token_bucket and estimated_tokens:
+                await self._token_bucket.acquire(estimated_tokens)
+
+            async with self._semaphore:
+                try:
+                    return await operation()
+                except Exception as e:
+                    if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                        raise
+                    delay = _get_retry_after(e)
+                    if delay is None:
+                        delay = self.base_backoff_seconds * (2 ** attempt) + random.uniform(0, 0.5)
+
+            attempt += 1
+            logger.warning(
+                f"{self.provider} rate limited, retrying in {delay:.1f}s "
+                f"(attempt {attempt}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+
+_gateways: Dict[str, ProviderGateway] = {}
+
+
+def _build_gateway(provider: str) -> ProviderGateway:
+    """Create a gateway for a provider from its configured limits."""
+
+    limits = {
+        "claude": (
+            settings.CLAUDE_MAX_CONCURRENT_REQUESTS,
+            settings.CLAUDE_REQUESTS_PER_MINUTE,
+            settings.CLAUDE_TOKENS_PER_MINUTE,
+        ),
+        "openai": (
+            settings.OPENAI_MAX_CONCURRENT_REQUESTS,
+            settings.OPENAI_REQUESTS_PER_MINUTE,
+            settings.OPENAI_TOKENS_PER_MINUTE,
+        ),
+        "gemini": (
+            settings.GEMINI_MAX_CONCURRENT_REQUESTS,
+            settings.GEMINI_REQUESTS_PER_MINUTE,
+            settings.GEMINI_TOKENS_PER_MINUTE,
+        ),
+    }
+
+    max_concurrency, requests_per_minute, tokens_per_minute = limits.get(provider, (4, 60, None))
+    return ProviderGateway(
+        provider=provider,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+        max_retries=settings.LLM_RATE_LIMIT_MAX_RETRIES,
+    )
+
+
+def get_provider_gateway(provider: str) -> ProviderGateway:
+    """Get the process-wide gateway for a provider ("claude", "openai", "gemini")."""
+
+    gateway = _gateways.get(provider)
+    if gateway is None:
+        gateway = _build_gateway(provider)
+        _gateways[provider] = gateway
+    return gateway
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough token estimate for budgeting: ~4 characters per prompt token plus the completion cap."""
+
+    return len(prompt) // 4 + max_tokens
+
+
+class StreamingSectionParser:
+    """
+    Incremental parser for a streamed JSON object.
+
+    Feed text chunks as they arrive; each call returns the top-level
+    ``(key, value)`` members that became complete with that chunk. Any prose or
+    code fences before the opening brace are ignored.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: Optional[int] = None
+        self._done = False
+        self.sections: Dict[str, Any] = {}
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._text
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the top-level object has been closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk of streamed text and return newly completed sections."""
+
+        self._text += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        while self._pos < len(self._text) and not self._done:
+            char = self._text[self._pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._member_start = self._pos + 1
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 1:
+                    completed.extend(self._emit_member(self._pos))
+                    self._done = True
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                completed.extend(self._emit_member(self._pos))
+                self._member_start = self._pos + 1
+
+            self._pos += 1
+
+        return completed
+
+    def _emit_member(self, end: int) -> List[Tuple[str, Any]]:
+        member = self._text[self._member_start:end].strip()
+        if not member:
+            return []
+
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping unparseable streamed section: {member[:80]}")
+            return []
+
+        self.sections.update(parsed)
+        return list(parsed.items())
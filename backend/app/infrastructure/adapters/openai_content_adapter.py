@@ -5,9 +5,11 @@ Implementation of ContentGenerationPort using OpenAI GPT-4.
 This is a pure adapter - it only handles external API communication.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 from datetime import datetime
 import json
 
@@ -19,8 +21,12 @@ from ...application.ports.content_generation_port import (
 )
 from ...domain.entities.business import Business
 from ...domain.entities.business_branding import BusinessBranding
-from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 from ...core.config import settings
+from .llm_gateway import estimate_tokens, get_provider_gateway
+
+if TYPE_CHECKING:
+    # Website entities are not in the domain model yet; they are only used in annotations
+    from ...domain.entities.website import BusinessWebsite, WebsiteTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +48,7 @@ class OpenAIContentAdapter(ContentGenerationPort):
         self.model = "gpt-4"
         self.max_tokens = 2000
         self.temperature = 0.7
+        self.gateway = get_provider_gateway("openai")
     
     async def generate_website_content(
         self,
@@ -120,24 +127,13 @@ class OpenAIContentAdapter(ContentGenerationPort):
         prompt = self._build_page_prompt(business, branding, page_type, context)
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert web content writer specializing in home services businesses. Generate professional, SEO-optimized content that converts visitors into customers."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            content_text = await self._create_completion(
+                prompt,
+                system="You are an expert web content writer specializing in home services businesses. Generate professional, SEO-optimized content that converts visitors into customers.",
                 max_tokens=self.max_tokens,
                 temperature=self.temperature
             )
             
-            content_text = response.choices[0].message.content
-            
             # Parse structured content from response
             return self._parse_content_response(content_text, page_type)
             
@@ -213,23 +209,12 @@ class OpenAIContentAdapter(ContentGenerationPort):
         """
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an SEO expert specializing in local home services businesses."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            content = await self._create_completion(
+                prompt,
+                system="You are an SEO expert specializing in local home services businesses.",
                 max_tokens=800,
                 temperature=0.5
             )
-            
-            content = response.choices[0].message.content
             return self._parse_seo_content(content)
             
         except Exception as e:
@@ -259,36 +244,62 @@ class OpenAIContentAdapter(ContentGenerationPort):
         """
         
         try:
+            analysis = await self._create_completion(
+                prompt,
+                system="You are a content quality analyst for home services websites.",
+                max_tokens=1000,
+                temperature=0.3
+            )
+            return self._parse_quality_analysis(analysis)
+            
+        except Exception as e:
+            logger.error(f"Content validation failed: {str(e)}")
+            raise
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> str:
+        """Generate text for a prompt using OpenAI."""
+        
+        content = await self._create_completion(prompt, system, max_tokens, temperature)
+        return content.strip()
+    
+    # =====================================
+    # PRIVATE HELPER METHODS
+    # =====================================
+    
+    async def _create_completion(
+        self,
+        prompt: str,
+        system: str,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Send a chat completion request through the shared provider gateway."""
+        
+        async def _request() -> str:
             response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a content quality analyst for home services websites."
+                        "content": system
                     },
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
-                max_tokens=1000,
-                temperature=0.3
+                max_tokens=max_tokens,
+                temperature=temperature
             )
-            
-            analysis = response.choices[0].message.content
-            return self._parse_quality_analysis(analysis)
-            
-        except Exception as e:
-            logger.error(f"Content validation failed: {str(e)}")
-            return {
-                "quality_score": 50,
-                "issues": [f"Validation error: {str(e)}"],
-                "suggestions": []
-            }
-    
-    # =====================================
-    # PRIVATE HELPER METHODS
-    # =====================================
+            return response.choices[0].message.content
+        
+        return await self.gateway.call(_request, estimated_tokens=estimate_tokens(system + prompt, max_tokens))
     
     async def _generate_single_page_content(
         self,
@@ -448,23 +459,12 @@ class OpenAIContentAdapter(ContentGenerationPort):
         """
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are updating website content. Maintain consistency with existing style while incorporating new information."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            updated_content = await self._create_completion(
+                prompt,
+                system="You are updating website content. Maintain consistency with existing style while incorporating new information.",
                 max_tokens=1000,
                 temperature=0.5
             )
-            
-            updated_content = response.choices[0].message.content
             return self._parse_content_response(updated_content, section)
             
         except Exception as e:
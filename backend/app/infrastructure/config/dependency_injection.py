@@ -145,6 +145,8 @@ from ...application.use_cases.product.create_product_use_case import CreateProdu
 from ...application.use_cases.product.manage_inventory_use_case import ManageInventoryUseCase
 from ...application.use_cases.product.inventory_reorder_management_use_case import InventoryReorderManagementUseCase
 from ...application.use_cases.product.process_purchase_order_use_case import ProcessPurchaseOrderUseCase
+from ...application.services.catalog_import_service import CatalogImportService
+from ...application.services.receivables_report_service import ReceivablesReportService
 
 # Repository interfaces
 from app.domain.repositories import (
@@ -1252,6 +1254,20 @@ def get_purchase_order_repository() -> PurchaseOrderRepository:
     return get_container().get_purchase_order_repository()
 
 
+def get_catalog_import_service() -> CatalogImportService:
+    """Get catalog import service wired to the supplier and product repositories."""
+    container = get_container()
+    return CatalogImportService(
+        supplier_repository=container.get_supplier_repository(),
+        product_repository=container.get_product_repository()
+    )
+
+
+def get_receivables_report_service() -> ReceivablesReportService:
+    """Get receivables report service wired to the invoice repository."""
+    return ReceivablesReportService(invoice_repository=get_container().get_invoice_repository())
+
+
 # Estimate and Invoice use case dependencies
 def get_create_estimate_use_case() -> CreateEstimateUseCase:
     """Get create estimate use case from container."""
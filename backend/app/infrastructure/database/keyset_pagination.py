@@ -0,0 +1,106 @@
+"""
+Keyset Pagination
+
+Cursor pagination helpers for Supabase table queries.
+Rows are ordered by (sort column, id) and each page starts strictly after the
+last row of the previous one, so deep pages cost the same as the first page
+instead of scanning past every skipped row the way ``.range(skip, ...)`` does.
+"""
+
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ...domain.shared.pagination import CursorPage, decode_cursor, encode_cursor
+
+T = TypeVar("T")
+
+
+def _quote(value: Any) -> str:
+    """Quote a filter value so timestamps and punctuation survive PostgREST's or() syntax."""
+
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _after_filter(sort_column: str, sort_value: Any, id_column: str, last_id: Any, descending: bool) -> str:
+    """
+    PostgREST or() filter selecting rows that sort after (sort_value, last_id).
+
+    Follows PostgreSQL's default NULL placement: first when descending, last when ascending.
+    """
+
+    operator = "lt" if descending else "gt"
+    id_after = f"{id_column}.{operator}.{_quote(last_id)}"
+
+    if sort_value is None:
+        ties = f"and({sort_column}.is.null,{id_after})"
+        return f"{sort_column}.not.is.null,{ties}" if descending else ties
+
+    conditions = [
+        f"{sort_column}.{operator}.{_quote(sort_value)}",
+        f"and({sort_column}.eq.{_quote(sort_value)},{id_after})",
+    ]
+    if not descending:
+        conditions.append(f"{sort_column}.is.null")
+    return ",".join(conditions)
+
+
+def page_count_method(include_total: bool) -> Optional[str]:
+    """
+    Count method for a page query.
+
+    Totals are planner estimates: PostgREST counts exactly up to its max-rows
+    threshold and falls back to the query plan above it, avoiding a full scan.
+    """
+
+    return "estimated" if include_total else None
+
+
+def apply_keyset(
+    query,
+    cursor: Optional[str],
+    limit: int,
+    sort_column: str = "created_date",
+    descending: bool = True,
+    id_column: str = "id",
+):
+    """
+    Order a query by (sort_column, id), start after the cursor and fetch one extra row.
+
+    The extra row tells build_cursor_page whether another page exists.
+
+    Raises:
+        DomainValidationError: If the cursor is malformed
+    """
+
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor, expected_length=2)
+        query = query.or_(_after_filter(sort_column, sort_value, id_column, last_id, descending))
+
+    return (
+        query.order(sort_column, desc=descending)
+        .order(id_column, desc=descending)
+        .limit(limit + 1)
+    )
+
+
+def build_cursor_page(
+    response,
+    limit: int,
+    mapper: Callable[[Dict[str, Any]], T],
+    sort_column: str = "created_date",
+    id_column: str = "id",
+) -> CursorPage[T]:
+    """Build a CursorPage from a query prepared with apply_keyset."""
+
+    rows = response.data or []
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1]
+        next_cursor = encode_cursor(last_row.get(sort_column), last_row.get(id_column))
+
+    return CursorPage(
+        items=[mapper(row) for row in rows],
+        next_cursor=next_cursor,
+        estimated_total=getattr(response, "count", None),
+    )
@@ -20,6 +20,8 @@ from app.domain.entities.activity import (
 from app.domain.exceptions.domain_exceptions import (
     DomainValidationError, EntityNotFoundError, RepositoryError
 )
+from app.domain.shared.pagination import CursorPage
+from app.infrastructure.database.keyset_pagination import apply_keyset, build_cursor_page, page_count_method
 
 logger = logging.getLogger(__name__)
 
@@ -241,6 +243,45 @@ class SupabaseActivityRepository(ActivityRepository):
             logger.error(f"Unexpected error getting contact timeline: {str(e)}")
             raise RepositoryError(f"Unexpected error: {str(e)}")
     
+    async def get_contact_timeline_page(
+        self,
+        contact_id: uuid.UUID,
+        business_id: uuid.UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        activity_types: Optional[List[ActivityType]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> CursorPage[Activity]:
+        """Get a page of a contact's activities using keyset pagination on (created_date, id)."""
+        query = self.client.table('activities').select('*').eq(
+            'contact_id', str(contact_id)
+        ).eq('business_id', str(business_id))
+        
+        if start_date:
+            query = query.gte('created_date', start_date.isoformat())
+        
+        if end_date:
+            query = query.lte('created_date', end_date.isoformat())
+        
+        if activity_types:
+            query = query.in_('activity_type', [t.value for t in activity_types])
+        
+        query = apply_keyset(query, cursor, limit, sort_column='created_date', descending=True)
+        
+        try:
+            result = query.execute()
+            return build_cursor_page(
+                result, limit, lambda row: self._map_to_activity(row, [], []), sort_column='created_date'
+            )
+            
+        except APIError as e:
+            logger.error(f"Database error getting contact timeline page: {str(e)}")
+            raise RepositoryError(f"Failed to get contact timeline: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error getting contact timeline page: {str(e)}")
+            raise RepositoryError(f"Unexpected error: {str(e)}")
+    
     async def get_business_activities(
         self,
         business_id: uuid.UUID,
@@ -254,38 +295,15 @@ class SupabaseActivityRepository(ActivityRepository):
     ) -> List[Activity]:
         """Get activities for a business with filtering."""
         try:
-            query = self.client.table('activities').select('*').eq(
-                'business_id', str(business_id)
+            query = self._filtered_activities_query(
+                business_id, activity_types, statuses, assigned_to, start_date, end_date
             )
             
-            # Apply filters
-            if activity_types:
-                type_values = [t.value for t in activity_types]
-                query = query.in_('activity_type', type_values)
-            
-            if statuses:
-                status_values = [s.value for s in statuses]
-                query = query.in_('status', status_values)
-            
-            if assigned_to:
-                query = query.eq('assigned_to', assigned_to)
-            
-            if start_date:
-                query = query.gte('scheduled_date', start_date.isoformat())
-            
-            if end_date:
-                query = query.lte('scheduled_date', end_date.isoformat())
-            
             # Order by scheduled_date descending and apply pagination
             result = query.order('scheduled_date', desc=True).range(skip, skip + limit - 1).execute()
             
-            activities = []
-            for row in result.data or []:
-                # For performance, skip participants and reminders in list view
-                activity = self._map_to_activity(row, [], [])
-                activities.append(activity)
-            
-            return activities
+            # For performance, skip participants and reminders in list view
+            return [self._map_to_activity(row, [], []) for row in result.data or []]
             
         except APIError as e:
             logger.error(f"Database error getting business activities: {str(e)}")
@@ -306,30 +324,79 @@ class SupabaseActivityRepository(ActivityRepository):
     ) -> List[Activity]:
         """Get activities assigned to a specific user."""
         try:
-            query = self.client.table('activities').select('*').eq(
-                'business_id', str(business_id)
-            ).eq('assigned_to', user_id)
-            
-            # Apply filters
-            if statuses:
-                status_values = [s.value for s in statuses]
-                query = query.in_('status', status_values)
-            
-            if start_date:
-                query = query.gte('scheduled_date', start_date.isoformat())
-            
-            if end_date:
-                query = query.lte('scheduled_date', end_date.isoformat())
+            query = self._filtered_activities_query(
+                business_id, statuses=statuses, assigned_to=user_id,
+                start_date=start_date, end_date=end_date
+            )
             
             # Order by scheduled_date ascending (upcoming first)
             result = query.order('scheduled_date', desc=False).range(skip, skip + limit - 1).execute()
             
-            activities = []
-            for row in result.data or []:
-                activity = self._map_to_activity(row, [], [])
-                activities.append(activity)
+            return [self._map_to_activity(row, [], []) for row in result.data or []]
             
-            return activities
+        except APIError as e:
+            logger.error(f"Database error getting user activities: {str(e)}")
+            raise RepositoryError(f"Failed to get user activities: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error getting user activities: {str(e)}")
+            raise RepositoryError(f"Unexpected error: {str(e)}")
+    
+    async def get_business_activities_page(
+        self,
+        business_id: uuid.UUID,
+        activity_types: Optional[List[ActivityType]] = None,
+        statuses: Optional[List[ActivityStatus]] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> CursorPage[Activity]:
+        """Get a page of business activities using keyset pagination on (scheduled_date, id)."""
+        query = self._filtered_activities_query(
+            business_id, activity_types, statuses, assigned_to, start_date, end_date,
+            count=page_count_method(include_total)
+        )
+        query = apply_keyset(query, cursor, limit, sort_column='scheduled_date', descending=True)
+        
+        try:
+            result = query.execute()
+            return build_cursor_page(
+                result, limit, lambda row: self._map_to_activity(row, [], []), sort_column='scheduled_date'
+            )
+            
+        except APIError as e:
+            logger.error(f"Database error getting business activities: {str(e)}")
+            raise RepositoryError(f"Failed to get business activities: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error getting business activities: {str(e)}")
+            raise RepositoryError(f"Unexpected error: {str(e)}")
+    
+    async def get_user_activities_page(
+        self,
+        business_id: uuid.UUID,
+        user_id: str,
+        statuses: Optional[List[ActivityStatus]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> CursorPage[Activity]:
+        """Get a page of a user's activities using keyset pagination on (scheduled_date, id)."""
+        query = self._filtered_activities_query(
+            business_id, statuses=statuses, assigned_to=user_id,
+            start_date=start_date, end_date=end_date,
+            count=page_count_method(include_total)
+        )
+        query = apply_keyset(query, cursor, limit, sort_column='scheduled_date', descending=False)
+        
+        try:
+            result = query.execute()
+            return build_cursor_page(
+                result, limit, lambda row: self._map_to_activity(row, [], []), sort_column='scheduled_date'
+            )
             
         except APIError as e:
             logger.error(f"Database error getting user activities: {str(e)}")
@@ -338,6 +405,40 @@ class SupabaseActivityRepository(ActivityRepository):
             logger.error(f"Unexpected error getting user activities: {str(e)}")
             raise RepositoryError(f"Unexpected error: {str(e)}")
     
+    def _filtered_activities_query(
+        self,
+        business_id: uuid.UUID,
+        activity_types: Optional[List[ActivityType]] = None,
+        statuses: Optional[List[ActivityStatus]] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        count: Optional[str] = None
+    ):
+        """Build an activities query for a business with the common list filters applied."""
+        query = self.client.table('activities').select('*', count=count).eq(
+            'business_id', str(business_id)
+        )
+        
+        if activity_types:
+            type_values = [t.value for t in activity_types]
+            query = query.in_('activity_type', type_values)
+        
+        if statuses:
+            status_values = [s.value for s in statuses]
+            query = query.in_('status', status_values)
+        
+        if assigned_to:
+            query = query.eq('assigned_to', assigned_to)
+        
+        if start_date:
+            query = query.gte('scheduled_date', start_date.isoformat())
+        
+        if end_date:
+            query = query.lte('scheduled_date', end_date.isoformat())
+        
+        return query
+    
     async def get_overdue_activities(
         self,
         business_id: uuid.UUID,
@@ -413,68 +514,37 @@ class SupabaseActivityRepository(ActivityRepository):
         business_id: uuid.UUID,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        by_scheduled_date: bool = False,
+        achievements_limit: int = 0
     ) -> Dict[str, Any]:
-        """Get activity statistics for analytics."""
+        """Get activity statistics for analytics, aggregated in the database."""
         try:
-            # Base query
-            query = self.client.table('activities').select('*').eq(
-                'business_id', str(business_id)
+            stats = self._aggregate_activities(
+                business_id, start_date, end_date, assigned_to=user_id,
+                by_scheduled_date=by_scheduled_date, achievements_limit=achievements_limit
             )
+            by_status = stats['by_status']
+            total_activities = stats['total']
+            completed_activities = by_status.get('completed', 0)
             
-            # Apply filters
-            if start_date:
-                query = query.gte('created_date', start_date.isoformat())
-            
-            if end_date:
-                query = query.lte('created_date', end_date.isoformat())
-            
-            if user_id:
-                query = query.eq('assigned_to', user_id)
-            
-            result = query.execute()
-            activities = result.data or []
-            
-            # Calculate statistics
-            total_activities = len(activities)
-            pending_activities = len([a for a in activities if a['status'] == 'pending'])
-            in_progress_activities = len([a for a in activities if a['status'] == 'in_progress'])
-            completed_activities = len([a for a in activities if a['status'] == 'completed'])
-            overdue_activities = len([
-                a for a in activities 
-                if a['status'] in ['pending', 'in_progress'] and a['due_date'] and 
-                datetime.fromisoformat(a['due_date'].replace('Z', '+00:00')) < datetime.utcnow()
-            ])
-            
-            # Group by type
-            activities_by_type = {}
-            for activity in activities:
-                activity_type = activity['activity_type']
-                activities_by_type[activity_type] = activities_by_type.get(activity_type, 0) + 1
-            
-            # Group by priority
-            activities_by_priority = {}
-            for activity in activities:
-                priority = activity['priority']
-                activities_by_priority[priority] = activities_by_priority.get(priority, 0) + 1
-            
-            # Calculate completion rate
-            completion_rate = (completed_activities / total_activities * 100) if total_activities > 0 else 0
-            
-            return {
+            statistics = {
                 'total_activities': total_activities,
-                'pending_activities': pending_activities,
-                'in_progress_activities': in_progress_activities,
+                'pending_activities': by_status.get('pending', 0),
+                'in_progress_activities': by_status.get('in_progress', 0),
                 'completed_activities': completed_activities,
-                'overdue_activities': overdue_activities,
-                'activities_by_type': activities_by_type,
-                'activities_by_priority': activities_by_priority,
-                'completion_rate': completion_rate,
-                'upcoming_activities_count': 0,  # Would need separate query
-                'activities_this_week': 0,  # Would need separate query
-                'activities_this_month': 0,  # Would need separate query
-                'average_completion_time': 0.0  # Would need more complex calculation
+                'overdue_activities': stats['overdue'],
+                'activities_by_type': stats['by_type'],
+                'activities_by_priority': stats['by_priority'],
+                'completion_rate': (completed_activities / total_activities * 100) if total_activities > 0 else 0,
+                'upcoming_activities_count': stats['upcoming'],
+                'activities_this_week': stats['this_week'],
+                'activities_this_month': stats['this_month'],
+                'average_completion_time': stats['average_completion_hours']
             }
+            if achievements_limit:
+                statistics['recent_achievements'] = stats['recent_achievements']
+            return statistics
             
         except APIError as e:
             logger.error(f"Database error getting activity statistics: {str(e)}")
@@ -523,67 +593,21 @@ class SupabaseActivityRepository(ActivityRepository):
         contact_id: uuid.UUID,
         business_id: uuid.UUID
     ) -> Dict[str, Any]:
-        """Get activity summary for a specific contact."""
+        """Get activity summary for a specific contact, aggregated in the database."""
         try:
-            # Get all activities for the contact
-            result = self.client.table('activities').select('*').eq(
-                'contact_id', str(contact_id)
-            ).eq('business_id', str(business_id)).execute()
-            
-            activities = result.data or []
-            
-            if not activities:
-                return {
-                    'total_activities': 0,
-                    'by_type': {},
-                    'by_status': {},
-                    'last_activity_date': None,
-                    'next_scheduled_date': None,
-                    'engagement_score': 0
-                }
-            
-            # Calculate summary statistics
-            total_activities = len(activities)
-            
-            # Group by type
-            by_type = {}
-            for activity in activities:
-                activity_type = activity['activity_type']
-                by_type[activity_type] = by_type.get(activity_type, 0) + 1
-            
-            # Group by status
-            by_status = {}
-            for activity in activities:
-                status = activity['status']
-                by_status[status] = by_status.get(status, 0) + 1
-            
-            # Find last activity date
-            last_activity_date = None
-            completed_activities = [a for a in activities if a['completed_date']]
-            if completed_activities:
-                last_completed = max(completed_activities, key=lambda x: x['completed_date'])
-                last_activity_date = last_completed['completed_date']
-            
-            # Find next scheduled date
-            next_scheduled_date = None
-            scheduled_activities = [
-                a for a in activities 
-                if a['scheduled_date'] and a['status'] in ['pending', 'in_progress']
-            ]
-            if scheduled_activities:
-                next_activity = min(scheduled_activities, key=lambda x: x['scheduled_date'])
-                next_scheduled_date = next_activity['scheduled_date']
+            stats = self._aggregate_activities(business_id, contact_id=contact_id)
+            total_activities = stats['total']
             
             # Calculate engagement score (simple heuristic)
-            completed_count = by_status.get('completed', 0)
+            completed_count = stats['by_status'].get('completed', 0)
             engagement_score = min(100, (completed_count / total_activities * 100)) if total_activities > 0 else 0
             
             return {
                 'total_activities': total_activities,
-                'by_type': by_type,
-                'by_status': by_status,
-                'last_activity_date': last_activity_date,
-                'next_scheduled_date': next_scheduled_date,
+                'by_type': stats['by_type'],
+                'by_status': stats['by_status'],
+                'last_activity_date': stats['last_completed_date'],
+                'next_scheduled_date': stats['next_scheduled_date'],
                 'engagement_score': round(engagement_score, 2)
             }
             
@@ -599,43 +623,22 @@ class SupabaseActivityRepository(ActivityRepository):
         business_id: uuid.UUID,
         before_date: datetime
     ) -> List[Activity]:
-        """Get activities with pending reminders due before the specified date."""
+        """
+        Get activities with pending reminders due before the specified date.
+        
+        Reads the due-time index on unsent reminders; each returned activity
+        carries only its due reminders.
+        """
         try:
-            # Query activities with reminders due before the specified date
-            # Join with activity_reminders table
-            result = self.client.table('activities').select(
-                '*, activity_reminders(*)'
-            ).eq('business_id', str(business_id)).execute()
-            
-            activities_with_reminders = []
-            
-            for activity_data in result.data or []:
-                # Check if activity has reminders due before the specified date
-                reminders = activity_data.get('activity_reminders', [])
-                has_pending_reminder = False
-                
-                for reminder in reminders:
-                    if (reminder.get('is_sent', False) is False and 
-                        reminder.get('reminder_time') and
-                        datetime.fromisoformat(reminder['reminder_time'].replace('Z', '+00:00')) <= before_date):
-                        has_pending_reminder = True
-                        break
-                
-                if has_pending_reminder:
-                    # Get participants for this activity
-                    participants_result = self.client.table('activity_participants').select(
-                        '*'
-                    ).eq('activity_id', activity_data['id']).execute()
-                    
-                    activity = self._map_to_activity(
-                        activity_data,
-                        participants_result.data or [],
-                        reminders
-                    )
-                    activities_with_reminders.append(activity)
-            
-            logger.info(f"Found {len(activities_with_reminders)} activities with pending reminders")
-            return activities_with_reminders
+            result = self.client.table('activity_reminders').select(
+                '*, activities!inner(business_id)'
+            ).eq('is_sent', False).lte(
+                'reminder_time', before_date.isoformat()
+            ).eq('activities.business_id', str(business_id)).order('reminder_time').execute()
+            
+            activities = await self._hydrate_reminder_activities(result.data or [])
+            logger.info(f"Found {len(activities)} activities with pending reminders")
+            return activities
             
         except APIError as e:
             logger.error(f"Database error getting pending reminders: {str(e)}")
@@ -644,8 +647,126 @@ class SupabaseActivityRepository(ActivityRepository):
             logger.error(f"Unexpected error getting pending reminders: {str(e)}")
             raise RepositoryError(f"Unexpected error: {str(e)}")
     
+    async def claim_due_reminders(
+        self,
+        worker_id: str,
+        due_before: datetime,
+        limit: int = 100,
+        lease_seconds: int = 300,
+        max_attempts: int = 4,
+        business_id: Optional[uuid.UUID] = None
+    ) -> List[Activity]:
+        """Claim a batch of due reminders for a worker, leased for lease_seconds."""
+        try:
+            result = self.client.rpc('claim_due_reminders', {
+                'p_worker_id': worker_id,
+                'p_due_before': due_before.isoformat(),
+                'p_limit': limit,
+                'p_lease_seconds': lease_seconds,
+                'p_max_attempts': max_attempts,
+                'p_business_id': str(business_id) if business_id else None
+            }).execute()
+            
+            activities = await self._hydrate_reminder_activities(result.data or [])
+            logger.info(f"Worker {worker_id} claimed {len(result.data or [])} due reminders")
+            return activities
+            
+        except APIError as e:
+            logger.error(f"Database error claiming due reminders: {str(e)}")
+            raise RepositoryError(f"Failed to claim due reminders: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error claiming due reminders: {str(e)}")
+            raise RepositoryError(f"Unexpected error: {str(e)}")
+    
+    async def complete_reminders(
+        self,
+        worker_id: str,
+        reminder_ids: List[uuid.UUID],
+        sent_at: Optional[datetime] = None
+    ) -> int:
+        """Mark claimed reminders as sent and clear their lease."""
+        if not reminder_ids:
+            return 0
+        try:
+            result = self.client.table('activity_reminders').update({
+                'is_sent': True,
+                'sent_at': (sent_at or datetime.utcnow()).isoformat(),
+                'claimed_by': None,
+                'claimed_until': None
+            }).in_('id', [str(r) for r in reminder_ids]).eq('claimed_by', worker_id).execute()
+            
+            return len(result.data or [])
+            
+        except APIError as e:
+            logger.error(f"Database error completing reminders: {str(e)}")
+            raise RepositoryError(f"Failed to complete reminders: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error completing reminders: {str(e)}")
+            raise RepositoryError(f"Unexpected error: {str(e)}")
+    
+    async def release_reminders(
+        self,
+        worker_id: str,
+        reminder_ids: List[uuid.UUID],
+        retry_at: Optional[datetime] = None,
+        count_attempt: bool = True
+    ) -> int:
+        """Release claimed reminders, optionally moving them to retry_at and giving back the claimed attempt."""
+        if not reminder_ids:
+            return 0
+        try:
+            result = self.client.rpc('release_reminders', {
+                'p_worker_id': worker_id,
+                'p_reminder_ids': [str(r) for r in reminder_ids],
+                'p_retry_at': retry_at.isoformat() if retry_at else None,
+                'p_count_attempt': count_attempt
+            }).execute()
+            
+            return result.data or 0
+            
+        except APIError as e:
+            logger.error(f"Database error releasing reminders: {str(e)}")
+            raise RepositoryError(f"Failed to release reminders: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error releasing reminders: {str(e)}")
+            raise RepositoryError(f"Unexpected error: {str(e)}")
+    
     # Helper methods for participants and reminders
     
+    async def _hydrate_reminder_activities(self, reminder_rows: List[Dict[str, Any]]) -> List[Activity]:
+        """
+        Load the activities and participants for a set of reminder rows in one
+        query each. Activities keep the order of their first reminder and carry
+        only the given reminders.
+        """
+        if not reminder_rows:
+            return []
+        
+        reminders_by_activity: Dict[str, List[Dict[str, Any]]] = {}
+        for row in reminder_rows:
+            reminders_by_activity.setdefault(row['activity_id'], []).append(row)
+        activity_ids = list(reminders_by_activity)
+        
+        activities_result = self.client.table('activities').select('*').in_('id', activity_ids).execute()
+        participants_result = self.client.table('activity_participants').select('*').in_(
+            'activity_id', activity_ids
+        ).execute()
+        
+        participants_by_activity: Dict[str, List[Dict[str, Any]]] = {}
+        for row in participants_result.data or []:
+            participants_by_activity.setdefault(row['activity_id'], []).append(row)
+        
+        rows_by_id = {row['id']: row for row in activities_result.data or []}
+        return [
+            self._map_to_activity(
+                rows_by_id[activity_id],
+                participants_by_activity.get(activity_id, []),
+                reminders_by_activity[activity_id]
+            )
+            for activity_id in activity_ids
+            if activity_id in rows_by_id
+        ]
+    
     async def _create_participants(self, activity_id: uuid.UUID, participants: List[ActivityParticipant]):
         """Create activity participants."""
         if not participants:
@@ -677,7 +798,8 @@ class SupabaseActivityRepository(ActivityRepository):
                 'reminder_type': r.reminder_type,
                 'message': r.message,
                 'is_sent': r.is_sent,
-                'sent_at': r.sent_at.isoformat() if r.sent_at else None
+                'sent_at': r.sent_at.isoformat() if r.sent_at else None,
+                'attempts': r.attempts
             }
             for r in reminders
         ]
@@ -704,6 +826,44 @@ class SupabaseActivityRepository(ActivityRepository):
         # Create new
         await self._create_reminders(activity_id, reminders)
     
+    def _aggregate_activities(
+        self,
+        business_id: uuid.UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        assigned_to: Optional[str] = None,
+        contact_id: Optional[uuid.UUID] = None,
+        by_scheduled_date: bool = False,
+        achievements_limit: int = 0
+    ) -> Dict[str, Any]:
+        """Run the grouped activity statistics RPC and return its counters."""
+        result = self.client.rpc('get_activity_statistics', {
+            'p_business_id': str(business_id),
+            'p_start_date': start_date.isoformat() if start_date else None,
+            'p_end_date': end_date.isoformat() if end_date else None,
+            'p_assigned_to': assigned_to,
+            'p_contact_id': str(contact_id) if contact_id else None,
+            'p_by_scheduled_date': by_scheduled_date,
+            'p_achievements_limit': achievements_limit
+        }).execute()
+        
+        stats = result.data or {}
+        average_hours = stats.get('average_completion_hours')
+        return {
+            'total': stats.get('total') or 0,
+            'overdue': stats.get('overdue') or 0,
+            'upcoming': stats.get('upcoming') or 0,
+            'this_week': stats.get('this_week') or 0,
+            'this_month': stats.get('this_month') or 0,
+            'average_completion_hours': float(average_hours) if average_hours is not None else None,
+            'last_completed_date': stats.get('last_completed_date'),
+            'next_scheduled_date': stats.get('next_scheduled_date'),
+            'by_status': stats.get('by_status') or {},
+            'by_type': stats.get('by_type') or {},
+            'by_priority': stats.get('by_priority') or {},
+            'recent_achievements': stats.get('recent_achievements') or []
+        }
+    
     async def _get_activity_participants(self, activity_id: uuid.UUID) -> List[Dict[str, Any]]:
         """Get participants for an activity."""
         result = self.client.table('activity_participants').select('*').eq(
@@ -746,7 +906,8 @@ class SupabaseActivityRepository(ActivityRepository):
                 reminder_type=r['reminder_type'],
                 message=r['message'],
                 is_sent=r['is_sent'],
-                sent_at=datetime.fromisoformat(r['sent_at'].replace('Z', '+00:00')) if r['sent_at'] else None
+                sent_at=datetime.fromisoformat(r['sent_at'].replace('Z', '+00:00')) if r['sent_at'] else None,
+                attempts=r['attempts']
             )
             for r in reminders_data
         ]
@@ -12,11 +12,16 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Maximum contact ids sent per bulk update RPC call
+BULK_UPDATE_CHUNK_SIZE = 5000
+
 from supabase import Client
 from app.domain.repositories.contact_repository import ContactRepository
 from app.domain.entities.contact import Contact, ContactType, ContactStatus, ContactPriority, ContactSource, RelationshipStatus, LifecycleStage
 from app.domain.value_objects.address import Address
 from app.domain.exceptions.domain_exceptions import EntityNotFoundError, DuplicateEntityError, DatabaseError
+from app.domain.shared.pagination import CursorPage, encode_cursor, decode_cursor
+from app.infrastructure.database.keyset_pagination import apply_keyset, build_cursor_page, page_count_method
 from app.api.schemas.contact_schemas import UserDetailLevel
 
 
@@ -121,26 +126,46 @@ class SupabaseContactRepository(ContactRepository):
         except Exception as e:
             raise DatabaseError(f"Failed to get recent contacts by business ID: {str(e)}")
     
-    async def get_by_business_id_with_users(self, business_id: uuid.UUID, user_detail_level: UserDetailLevel = UserDetailLevel.BASIC, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get contacts by business ID with user data included."""
+    async def get_page_by_business_id(self, business_id: uuid.UUID, limit: int = 100,
+                                      cursor: Optional[str] = None,
+                                      include_total: bool = False) -> CursorPage[Contact]:
+        """Get a page of contacts by business ID using keyset pagination."""
+        query = self.client.table(self.table_name).select(
+            "*", count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        query = apply_keyset(query, cursor, limit)
+        
         try:
-            if user_detail_level == UserDetailLevel.NONE:
-                # Just return the contacts without user joins
-                response = self.client.table(self.table_name).select("*").eq(
-                    "business_id", str(business_id)
-                ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
-                
-                return [self._prepare_contact_with_user_data(contact_data, user_detail_level) for contact_data in response.data]
+            response = query.execute()
+            return build_cursor_page(response, limit, self._dict_to_contact)
             
+        except Exception as e:
+            raise DatabaseError(f"Failed to get contacts by business ID: {str(e)}")
+    
+    async def get_page_by_business_id_with_users(self, business_id: uuid.UUID,
+                                                 user_detail_level: UserDetailLevel = UserDetailLevel.BASIC,
+                                                 limit: int = 100, cursor: Optional[str] = None,
+                                                 include_total: bool = False) -> CursorPage[Dict[str, Any]]:
+        """Get a page of contacts by business ID with user data included."""
+        if user_detail_level == UserDetailLevel.NONE:
+            # Just return the contacts without user joins
+            columns = "*"
+        else:
             # Build query with user joins using the public.users table
             user_fields = self._get_user_fields(user_detail_level)
-            query = f"*,assigned_user:users!assigned_to({user_fields}),created_user:users!created_by({user_fields})"
-            
-            response = self.client.table(self.table_name).select(query).eq(
-                "business_id", str(business_id)
-            ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
-            
-            return [self._prepare_contact_with_user_data(contact_data, user_detail_level) for contact_data in response.data]
+            columns = f"*,assigned_user:users!assigned_to({user_fields}),created_user:users!created_by({user_fields})"
+        
+        query = self.client.table(self.table_name).select(
+            columns, count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        query = apply_keyset(query, cursor, limit)
+        
+        try:
+            response = query.execute()
+            return build_cursor_page(
+                response, limit,
+                lambda contact_data: self._prepare_contact_with_user_data(contact_data, user_detail_level)
+            )
             
         except Exception as e:
             raise DatabaseError(f"Failed to get contacts with user data: {str(e)}")
@@ -262,20 +287,46 @@ class SupabaseContactRepository(ContactRepository):
     
     async def search_contacts(self, business_id: uuid.UUID, search_term: str,
                              skip: int = 0, limit: int = 100) -> List[Contact]:
-        """Search contacts by name, email, phone, or company within a business."""
+        """Search contacts by name, email, phone, or company within a business, best matches first."""
         try:
-            # Using full-text search on multiple fields
-            response = self.client.table(self.table_name).select("*").eq(
-                "business_id", str(business_id)
-            ).or_(
-                f"first_name.ilike.%{search_term}%,"
-                f"last_name.ilike.%{search_term}%,"
-                f"email.ilike.%{search_term}%,"
-                f"phone.ilike.%{search_term}%,"
-                f"company_name.ilike.%{search_term}%"
-            ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
+            response = self.client.rpc("search_contacts_ranked", {
+                "p_business_id": str(business_id),
+                "p_query": search_term,
+                "p_limit": limit,
+                "p_offset": skip
+            }).execute()
             
-            return [self._dict_to_contact(contact_data) for contact_data in response.data]
+            return [self._dict_to_contact(row["contact"]) for row in response.data or []]
+            
+        except Exception as e:
+            raise DatabaseError(f"Failed to search contacts: {str(e)}")
+    
+    async def search_contacts_page(self, business_id: uuid.UUID, search_term: str,
+                                   limit: int = 50, cursor: Optional[str] = None) -> CursorPage[Contact]:
+        """Search contacts with keyset pagination over (rank, id)."""
+        after_rank, after_id = decode_cursor(cursor, expected_length=2) if cursor else (None, None)
+        
+        try:
+            # Fetch one extra row to know whether another page exists
+            response = self.client.rpc("search_contacts_ranked", {
+                "p_business_id": str(business_id),
+                "p_query": search_term,
+                "p_limit": limit + 1,
+                "p_after_rank": after_rank,
+                "p_after_id": after_id
+            }).execute()
+            
+            rows = response.data or []
+            page_rows = rows[:limit]
+            next_cursor = None
+            if len(rows) > limit:
+                last = page_rows[-1]
+                next_cursor = encode_cursor(last["search_rank"], last["contact"]["id"])
+            
+            return CursorPage(
+                items=[self._dict_to_contact(row["contact"]) for row in page_rows],
+                next_cursor=next_cursor
+            )
             
         except Exception as e:
             raise DatabaseError(f"Failed to search contacts: {str(e)}")
@@ -362,78 +413,47 @@ class SupabaseContactRepository(ContactRepository):
     async def bulk_update_status(self, business_id: uuid.UUID, contact_ids: List[uuid.UUID],
                                status: ContactStatus) -> int:
         """Bulk update contact status."""
-        try:
-            contact_ids_str = [str(cid) for cid in contact_ids]
-            
-            response = self.client.table(self.table_name).update({
-                "status": status.value,
-                "last_modified": datetime.now().isoformat()
-            }).eq("business_id", str(business_id)).in_("id", contact_ids_str).execute()
-            
-            return len(response.data)
-            
-        except Exception as e:
-            raise DatabaseError(f"Failed to bulk update status: {str(e)}")
+        return await self.bulk_update_contacts(business_id, contact_ids, status=status)
     
     async def bulk_assign_contacts(self, business_id: uuid.UUID, contact_ids: List[uuid.UUID],
                                  user_id: str) -> int:
         """Bulk assign contacts to a user."""
-        try:
-            contact_ids_str = [str(cid) for cid in contact_ids]
-            
-            response = self.client.table(self.table_name).update({
-                "assigned_to": user_id,
-                "last_modified": datetime.now().isoformat()
-            }).eq("business_id", str(business_id)).in_("id", contact_ids_str).execute()
-            
-            return len(response.data)
-            
-        except Exception as e:
-            raise DatabaseError(f"Failed to bulk assign contacts: {str(e)}")
+        return await self.bulk_update_contacts(business_id, contact_ids, assigned_to=user_id)
     
     async def bulk_add_tag(self, business_id: uuid.UUID, contact_ids: List[uuid.UUID],
                           tag: str) -> int:
         """Bulk add tag to contacts."""
+        return await self.bulk_update_contacts(business_id, contact_ids, tags_to_add=[tag])
+    
+    async def bulk_update_contacts(self, business_id: uuid.UUID, contact_ids: List[uuid.UUID],
+                                   status: Optional[ContactStatus] = None,
+                                   priority: Optional[ContactPriority] = None,
+                                   assigned_to: Optional[str] = None,
+                                   tags_to_add: Optional[List[str]] = None,
+                                   tags_to_remove: Optional[List[str]] = None) -> int:
+        """Apply status, priority, assignment and tag changes to many contacts in set-based RPC calls."""
         try:
-            contact_ids_str = [str(cid) for cid in contact_ids]
-            
-            # Get current contacts to merge tags
-            current_contacts = self.client.table(self.table_name).select(
-                "id,tags"
-            ).eq("business_id", str(business_id)).in_("id", contact_ids_str).execute()
-            
-            updates = []
-            for contact_data in current_contacts.data:
-                current_tags = contact_data.get("tags", [])
-                if isinstance(current_tags, str):
-                    current_tags = json.loads(current_tags)
-                elif current_tags is None:
-                    current_tags = []
-                
-                if tag not in current_tags:
-                    current_tags.append(tag)
-                
-                updates.append({
-                    "id": contact_data["id"],
-                    "tags": current_tags,  # JSONB field, no need to json.dumps()
-                    "last_modified": datetime.now().isoformat()
-                })
-            
-            # Perform batch update
             updated_count = 0
-            for update_data in updates:
-                response = self.client.table(self.table_name).update({
-                    "tags": update_data["tags"],
-                    "last_modified": update_data["last_modified"]
-                }).eq("id", update_data["id"]).execute()
+            
+            # One round-trip per chunk; chunking keeps request bodies bounded for very large selections
+            for start in range(0, len(contact_ids), BULK_UPDATE_CHUNK_SIZE):
+                chunk = contact_ids[start:start + BULK_UPDATE_CHUNK_SIZE]
+                response = self.client.rpc("bulk_update_contacts", {
+                    "p_business_id": str(business_id),
+                    "p_contact_ids": [str(cid) for cid in chunk],
+                    "p_status": status.value if status else None,
+                    "p_priority": priority.value if priority else None,
+                    "p_assigned_to": assigned_to,
+                    "p_add_tags": tags_to_add or None,
+                    "p_remove_tags": tags_to_remove or None
+                }).execute()
                 
-                if response.data:
-                    updated_count += 1
+                updated_count += response.data or 0
             
             return updated_count
             
         except Exception as e:
-            raise DatabaseError(f"Failed to bulk add tag: {str(e)}")
+            raise DatabaseError(f"Failed to bulk update contacts: {str(e)}")
     
     async def count_by_business(self, business_id: uuid.UUID) -> int:
         """Count contacts in a business."""
@@ -16,7 +16,7 @@ from supabase import Client
 from app.domain.repositories.estimate_repository import EstimateRepository
 from app.domain.entities.estimate import (
     Estimate, EstimateLineItem, AdvancePayment, EstimateTerms, 
-    EmailTracking, StatusHistoryEntry
+    EmailTracking, StatusHistoryEntry, EstimateSummary
 )
 from app.domain.entities.estimate_enums.enums import EstimateStatus, DocumentType, EmailStatus
 from app.domain.shared.enums import CurrencyCode, TaxType, DiscountType, AdvancePaymentType, TemplateType
@@ -24,10 +24,22 @@ from app.domain.value_objects.address import Address
 from app.domain.exceptions.domain_exceptions import (
     EntityNotFoundError, DuplicateEntityError, DatabaseError, DomainValidationError
 )
+from app.domain.shared.pagination import CursorPage
+from app.infrastructure.database.keyset_pagination import apply_keyset, build_cursor_page, page_count_method
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Estimate header with its line items embedded, fetched in one round-trip
+ESTIMATE_SELECT = "*, estimate_line_items(*)"
+
+# Header columns and stored totals for list screens; no line items
+ESTIMATE_SUMMARY_SELECT = (
+    "id, business_id, estimate_number, status, title, contact_id, client_name, client_email, "
+    "project_id, job_id, currency, subtotal, tax_amount, discount_amount, total_amount, "
+    "issue_date, valid_until, created_by, created_date, last_modified"
+)
+
 class SupabaseEstimateRepository(EstimateRepository):
     """
     Supabase client implementation of EstimateRepository.
@@ -83,22 +95,12 @@ class SupabaseEstimateRepository(EstimateRepository):
     async def get_by_id(self, estimate_id: uuid.UUID) -> Optional[Estimate]:
         """Get estimate by ID."""
         try:
-            # Fetch estimate
-            response = self.client.table(self.table_name).select("*").eq("id", str(estimate_id)).execute()
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq("id", str(estimate_id)).execute()
             
             if not response.data:
                 return None
             
-            # Fetch line items
-            line_items_response = self.client.table("estimate_line_items").select("*").eq(
-                "estimate_id", str(estimate_id)
-            ).order("sort_order").execute()
-            
-            # Add line items to estimate data
-            estimate_data = response.data[0]
-            estimate_data["_line_items"] = line_items_response.data
-            
-            return self._dict_to_estimate(estimate_data)
+            return self._dict_to_estimate(response.data[0])
             
         except Exception as e:
             raise DatabaseError(f"Failed to get estimate by ID: {str(e)}")
@@ -106,7 +108,7 @@ class SupabaseEstimateRepository(EstimateRepository):
     async def get_by_estimate_number(self, business_id: uuid.UUID, estimate_number: str) -> Optional[Estimate]:
         """Get estimate by estimate number within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("estimate_number", estimate_number).execute()
             
@@ -120,7 +122,7 @@ class SupabaseEstimateRepository(EstimateRepository):
     async def get_by_business_id(self, business_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates by business ID with pagination."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
             
@@ -134,7 +136,7 @@ class SupabaseEstimateRepository(EstimateRepository):
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).gte("created_date", cutoff_date.isoformat()).range(
                 0, limit - 1
@@ -148,7 +150,7 @@ class SupabaseEstimateRepository(EstimateRepository):
     async def get_by_contact_id(self, contact_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates by contact ID with pagination."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "contact_id", str(contact_id)
             ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
             
@@ -161,7 +163,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                                skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates associated with a specific project."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "project_id", str(project_id)
             ).eq("business_id", str(business_id)).range(
                 skip, skip + limit - 1
@@ -176,7 +178,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                            skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates associated with a specific job."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "job_id", str(job_id)
             ).eq("business_id", str(business_id)).range(
                 skip, skip + limit - 1
@@ -191,7 +193,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                            skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates by status within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("status", status.value).range(
                 skip, skip + limit - 1
@@ -206,7 +208,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                                   skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates assigned to a specific user within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("created_by", user_id).range(
                 skip, skip + limit - 1
@@ -221,7 +223,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                                 skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates using a specific template within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("template_id", str(template_id)).range(
                 skip, skip + limit - 1
@@ -236,7 +238,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                                end_date: datetime, skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates within a date range."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).gte("created_date", start_date.isoformat()).lte(
                 "created_date", end_date.isoformat()
@@ -283,7 +285,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                                   skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates pending client approval (sent but not approved/rejected)."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).in_("status", [EstimateStatus.SENT.value, EstimateStatus.VIEWED.value]).range(
                 skip, skip + limit - 1
@@ -298,7 +300,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                                 max_value: Decimal, skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates within a value range."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).gte("total_amount", float(min_value)).lte(
                 "total_amount", float(max_value)
@@ -313,7 +315,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                               skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Search estimates within a business by title, description, or estimate number."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).or_(
                 f"title.ilike.%{search_term}%,description.ilike.%{search_term}%,estimate_number.ilike.%{search_term}%,client_name.ilike.%{search_term}%"
@@ -328,7 +330,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                              skip: int = 0, limit: int = 100) -> List[Estimate]:
         """Get estimates by currency within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("currency", currency.value).range(
                 skip, skip + limit - 1
@@ -508,7 +510,7 @@ class SupabaseEstimateRepository(EstimateRepository):
         """List estimates with pagination and filters."""
         try:
             # Build the base query with count
-            query = self.client.table(self.table_name).select("*", count="exact").eq("business_id", str(business_id))
+            query = self.client.table(self.table_name).select(ESTIMATE_SELECT, count="exact").eq("business_id", str(business_id))
             
             # Apply filters if provided
             if filters:
@@ -524,30 +526,10 @@ class SupabaseEstimateRepository(EstimateRepository):
             # Add pagination and ordering
             query = query.range(skip, skip + limit - 1).order("created_date", desc=True)
             
-            # Execute the query
+            # Execute the query; line items come embedded in each row
             response = query.execute()
             
-            # Fetch line items for all estimates in one query
-            estimate_ids = [estimate["id"] for estimate in response.data]
-            line_items_response = []
-            if estimate_ids:
-                line_items_response = self.client.table("estimate_line_items").select("*").in_(
-                    "estimate_id", estimate_ids
-                ).order("sort_order").execute()
-            
-            # Group line items by estimate_id
-            line_items_by_estimate = {}
-            for item in line_items_response.data:
-                estimate_id = item["estimate_id"]
-                if estimate_id not in line_items_by_estimate:
-                    line_items_by_estimate[estimate_id] = []
-                line_items_by_estimate[estimate_id].append(item)
-            
-            # Convert the data to Estimate entities with line items
-            estimates = []
-            for estimate_data in response.data:
-                estimate_data["_line_items"] = line_items_by_estimate.get(estimate_data["id"], [])
-                estimates.append(self._dict_to_estimate(estimate_data))
+            estimates = [self._dict_to_estimate(estimate_data) for estimate_data in response.data]
             
             total_count = response.count or 0
             
@@ -713,8 +695,11 @@ class SupabaseEstimateRepository(EstimateRepository):
             except (ValueError, TypeError):
                 return None
         
-        # Parse line items from separate table data
-        line_items_data = data.get("_line_items", [])
+        # Parse line items embedded from the estimate_line_items table
+        line_items_data = sorted(
+            data.get("estimate_line_items") or [],
+            key=lambda item: item.get("sort_order") or 0
+        )
         line_items = []
         for item_data in line_items_data:
             try:
@@ -885,66 +870,11 @@ class SupabaseEstimateRepository(EstimateRepository):
         
         try:
             # Start with base query
-            query = self.client.table(self.table_name).select("*").eq("business_id", str(business_id))
-            
-            # Apply filters
-            for field, value in filters.items():
-                if value is None:
-                    continue
-                    
-                if field == "status":
-                    query = query.eq("status", value)
-                elif field == "status_list":
-                    if value:
-                        status_values = [s.value if hasattr(s, 'value') else str(s) for s in value]
-                        query = query.in_("status", status_values)
-                elif field == "contact_id":
-                    query = query.eq("contact_id", str(value))
-                elif field == "project_id":
-                    query = query.eq("project_id", str(value))
-                elif field == "job_id":
-                    query = query.eq("job_id", str(value))
-                elif field == "template_id":
-                    query = query.eq("template_id", str(value))
-                elif field == "date_from":
-                    query = query.gte("created_date", value.isoformat())
-                elif field == "date_to":
-                    query = query.lte("created_date", value.isoformat())
-                elif field == "min_value":
-                    # This would need a calculated field for total_amount
-                    pass
-                elif field == "max_value":
-                    # This would need a calculated field for total_amount
-                    pass
-                elif field == "currency":
-                    query = query.eq("currency", value)
-                elif field == "client_name_contains":
-                    query = query.ilike("client_name", f"%{value}%")
-                elif field == "client_email":
-                    query = query.eq("client_email", value)
-                elif field == "title_contains":
-                    query = query.ilike("title", f"%{value}%")
-                elif field == "description_contains":
-                    query = query.ilike("description", f"%{value}%")
-                elif field == "estimate_number_contains":
-                    query = query.ilike("estimate_number", f"%{value}%")
-                elif field == "search_term":
-                    # Full text search across multiple fields
-                    query = query.or_(f"title.ilike.%{value}%,description.ilike.%{value}%,client_name.ilike.%{value}%,estimate_number.ilike.%{value}%")
-                elif field == "tags":
-                    if value:
-                        # Search for any tag in the list
-                        for tag in value:
-                            query = query.contains("tags", [tag])
+            query = self.client.table(self.table_name).select(ESTIMATE_SELECT).eq("business_id", str(business_id))
+            query = self._apply_filters(query, filters)
             
             # Apply sorting
-            sort_column = sort_by
-            if sort_column == "client_display_name":
-                sort_column = "client_name"
-            elif sort_column == "total_amount":
-                # For now, sort by created_date if total_amount is requested since it's calculated
-                sort_column = "created_date"
-            
+            sort_column = self._resolve_sort_column(sort_by)
             if sort_desc:
                 query = query.order(sort_column, desc=True)
             else:
@@ -952,47 +882,7 @@ class SupabaseEstimateRepository(EstimateRepository):
             
             # Get total count first (without pagination)
             count_query = self.client.table(self.table_name).select("id", count="exact").eq("business_id", str(business_id))
-            
-            # Apply same filters to count query
-            for field, value in filters.items():
-                if value is None:
-                    continue
-                    
-                if field == "status":
-                    count_query = count_query.eq("status", value)
-                elif field == "status_list":
-                    if value:
-                        count_query = count_query.in_("status", value)
-                elif field == "contact_id":
-                    count_query = count_query.eq("contact_id", str(value))
-                elif field == "project_id":
-                    count_query = count_query.eq("project_id", str(value))
-                elif field == "job_id":
-                    count_query = count_query.eq("job_id", str(value))
-                elif field == "template_id":
-                    count_query = count_query.eq("template_id", str(value))
-                elif field == "date_from":
-                    count_query = count_query.gte("created_date", value.isoformat())
-                elif field == "date_to":
-                    count_query = count_query.lte("created_date", value.isoformat())
-                elif field == "currency":
-                    count_query = count_query.eq("currency", value)
-                elif field == "client_name_contains":
-                    count_query = count_query.ilike("client_name", f"%{value}%")
-                elif field == "client_email":
-                    count_query = count_query.eq("client_email", value)
-                elif field == "title_contains":
-                    count_query = count_query.ilike("title", f"%{value}%")
-                elif field == "description_contains":
-                    count_query = count_query.ilike("description", f"%{value}%")
-                elif field == "estimate_number_contains":
-                    count_query = count_query.ilike("estimate_number", f"%{value}%")
-                elif field == "search_term":
-                    count_query = count_query.or_(f"title.ilike.%{value}%,description.ilike.%{value}%,client_name.ilike.%{value}%,estimate_number.ilike.%{value}%")
-                elif field == "tags":
-                    if value:
-                        for tag in value:
-                            count_query = count_query.contains("tags", [tag])
+            count_query = self._apply_filters(count_query, filters)
             
             # Execute count query
             count_response = count_query.execute()
@@ -1008,38 +898,7 @@ class SupabaseEstimateRepository(EstimateRepository):
                 logger.info(f"No estimates found for business: {business_id}")
                 return [], total_count
             
-            # Fetch line items for all estimates in one query
-            estimate_ids = [item["id"] for item in response.data]
-            line_items_by_estimate = {}
-            
-            if estimate_ids:
-                try:
-                    line_items_response = self.client.table("estimate_line_items").select("*").in_(
-                        "estimate_id", estimate_ids
-                    ).order("estimate_id, sort_order").execute()
-                    
-                    # Group line items by estimate_id
-                    for item in line_items_response.data:
-                        estimate_id = item["estimate_id"]
-                        if estimate_id not in line_items_by_estimate:
-                            line_items_by_estimate[estimate_id] = []
-                        line_items_by_estimate[estimate_id].append(item)
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to fetch line items: {e}")
-                    line_items_by_estimate = {}
-            
-            # Convert to domain entities
-            estimates = []
-            for data in response.data:
-                try:
-                    # Add line items to estimate data
-                    data["_line_items"] = line_items_by_estimate.get(data["id"], [])
-                    estimate = self._dict_to_estimate(data)
-                    estimates.append(estimate)
-                except Exception as e:
-                    logger.error(f"Failed to convert estimate data to entity: {e}, data: {data}")
-                    continue
+            estimates = self._rows_to_estimates(response.data)
             
             logger.info(f"Retrieved {len(estimates)} estimates with filters (total: {total_count})")
             return estimates, total_count
@@ -1048,6 +907,129 @@ class SupabaseEstimateRepository(EstimateRepository):
             logger.error(f"Error retrieving estimates with filters: {e}")
             raise DatabaseError(f"Failed to retrieve estimates: {str(e)}")
     
+    async def list_page_with_filters(self, business_id: uuid.UUID, filters: Dict[str, Any],
+                                     sort_by: str = "created_date", sort_desc: bool = True,
+                                     limit: int = 100, cursor: Optional[str] = None,
+                                     include_total: bool = False) -> CursorPage[Estimate]:
+        """List a page of estimates with flexible filtering using keyset pagination."""
+        logger.info(f"list_page_with_filters() called for business: {business_id}, filters: {filters}")
+        
+        sort_column = self._resolve_sort_column(sort_by)
+        query = self.client.table(self.table_name).select(
+            ESTIMATE_SELECT, count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        query = self._apply_filters(query, filters)
+        query = apply_keyset(query, cursor, limit, sort_column=sort_column, descending=sort_desc)
+        
+        try:
+            response = query.execute()
+            page = build_cursor_page(response, limit, lambda data: data, sort_column=sort_column)
+            
+            return CursorPage(
+                items=self._rows_to_estimates(page.items),
+                next_cursor=page.next_cursor,
+                estimated_total=page.estimated_total
+            )
+            
+        except Exception as e:
+            logger.error(f"Error retrieving estimate page with filters: {e}")
+            raise DatabaseError(f"Failed to retrieve estimates: {str(e)}")
+    
+    async def list_summary_page_with_filters(self, business_id: uuid.UUID, filters: Optional[Dict[str, Any]] = None,
+                                             sort_by: str = "created_date", sort_desc: bool = True,
+                                             limit: int = 100, cursor: Optional[str] = None,
+                                             include_total: bool = False) -> CursorPage[EstimateSummary]:
+        """List a page of estimate summaries (header and stored totals only) using keyset pagination."""
+        sort_column = self._resolve_sort_column(sort_by)
+        query = self.client.table(self.table_name).select(
+            ESTIMATE_SUMMARY_SELECT, count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        query = self._apply_filters(query, filters or {})
+        query = apply_keyset(query, cursor, limit, sort_column=sort_column, descending=sort_desc)
+        
+        try:
+            response = query.execute()
+            return build_cursor_page(response, limit, EstimateSummary.model_validate, sort_column=sort_column)
+            
+        except Exception as e:
+            logger.error(f"Error retrieving estimate summaries with filters: {e}")
+            raise DatabaseError(f"Failed to retrieve estimate summaries: {str(e)}")
+    
+    def _resolve_sort_column(self, sort_by: str) -> str:
+        """Map a requested sort field to a stored column."""
+        if sort_by == "client_display_name":
+            return "client_name"
+        if sort_by == "total_amount":
+            # For now, sort by created_date if total_amount is requested since it's calculated
+            return "created_date"
+        return sort_by
+    
+    def _apply_filters(self, query, filters: Dict[str, Any]):
+        """Apply list_with_filters filters to a query."""
+        for field, value in filters.items():
+            if value is None:
+                continue
+                
+            if field == "status":
+                query = query.eq("status", value)
+            elif field == "status_list":
+                if value:
+                    # Convert EstimateStatus enum objects to string values
+                    status_values = [s.value if hasattr(s, 'value') else str(s) for s in value]
+                    query = query.in_("status", status_values)
+            elif field == "contact_id":
+                query = query.eq("contact_id", str(value))
+            elif field == "project_id":
+                query = query.eq("project_id", str(value))
+            elif field == "job_id":
+                query = query.eq("job_id", str(value))
+            elif field == "template_id":
+                query = query.eq("template_id", str(value))
+            elif field == "date_from":
+                query = query.gte("created_date", value.isoformat())
+            elif field == "date_to":
+                query = query.lte("created_date", value.isoformat())
+            elif field == "min_value":
+                # This would need a calculated field for total_amount
+                pass
+            elif field == "max_value":
+                # This would need a calculated field for total_amount
+                pass
+            elif field == "currency":
+                query = query.eq("currency", value)
+            elif field == "client_name_contains":
+                query = query.ilike("client_name", f"%{value}%")
+            elif field == "client_email":
+                query = query.eq("client_email", value)
+            elif field == "title_contains":
+                query = query.ilike("title", f"%{value}%")
+            elif field == "description_contains":
+                query = query.ilike("description", f"%{value}%")
+            elif field == "estimate_number_contains":
+                query = query.ilike("estimate_number", f"%{value}%")
+            elif field == "search_term":
+                # Full text search across multiple fields
+                query = query.or_(f"title.ilike.%{value}%,description.ilike.%{value}%,client_name.ilike.%{value}%,estimate_number.ilike.%{value}%")
+            elif field == "tags":
+                if value:
+                    # Search for any tag in the list
+                    for tag in value:
+                        query = query.contains("tags", [tag])
+        
+        return query
+    
+    def _rows_to_estimates(self, rows: List[Dict[str, Any]]) -> List[Estimate]:
+        """Convert estimate rows with embedded line items to entities, skipping unreadable rows."""
+        estimates = []
+        for data in rows:
+            try:
+                estimates.append(self._dict_to_estimate(data))
+            except Exception as e:
+                logger.error(f"Failed to convert estimate data to entity: {e}, data: {data}")
+                continue
+        
+        return estimates
+    
     async def count_with_filters(self, business_id: uuid.UUID, filters: Dict[str, Any]) -> int:
         """Count estimates with flexible filtering."""
         logger.info(f"count_with_filters() called for business: {business_id}, filters: {filters}")
@@ -1055,50 +1037,7 @@ class SupabaseEstimateRepository(EstimateRepository):
         try:
             # Start with base query
             query = self.client.table(self.table_name).select("id", count="exact").eq("business_id", str(business_id))
-            
-            # Apply the same filters as list_with_filters
-            for field, value in filters.items():
-                if value is None:
-                    continue
-                    
-                if field == "status":
-                    query = query.eq("status", value)
-                elif field == "status_list":
-                    if value:
-                        # Convert EstimateStatus enum objects to string values
-                        status_values = [s.value if hasattr(s, 'value') else str(s) for s in value]
-                        query = query.in_("status", status_values)
-                elif field == "contact_id":
-                    query = query.eq("contact_id", str(value))
-                elif field == "project_id":
-                    query = query.eq("project_id", str(value))
-                elif field == "job_id":
-                    query = query.eq("job_id", str(value))
-                elif field == "template_id":
-                    query = query.eq("template_id", str(value))
-                elif field == "date_from":
-                    query = query.gte("created_date", value.isoformat())
-                elif field == "date_to":
-                    query = query.lte("created_date", value.isoformat())
-                elif field == "currency":
-                    query = query.eq("currency", value)
-                elif field == "client_name_contains":
-                    query = query.ilike("client_name", f"%{value}%")
-                elif field == "client_email":
-                    query = query.eq("client_email", value)
-                elif field == "title_contains":
-                    query = query.ilike("title", f"%{value}%")
-                elif field == "description_contains":
-                    query = query.ilike("description", f"%{value}%")
-                elif field == "estimate_number_contains":
-                    query = query.ilike("estimate_number", f"%{value}%")
-                elif field == "search_term":
-                    # Full text search across multiple fields
-                    query = query.or_(f"title.ilike.%{value}%,description.ilike.%{value}%,client_name.ilike.%{value}%,estimate_number.ilike.%{value}%")
-                elif field == "tags":
-                    if value:
-                        for tag in value:
-                            query = query.contains("tags", [tag])
+            query = self._apply_filters(query, filters)
             
             # Execute count query
             response = query.execute()
@@ -6,7 +6,7 @@ Repository implementation using Supabase client SDK for invoice management opera
 
 import uuid
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from decimal import Decimal
 import json
@@ -16,7 +16,7 @@ from supabase import Client
 from app.domain.repositories.invoice_repository import InvoiceRepository
 from app.domain.entities.invoice import (
     Invoice, InvoiceLineItem, Payment, PaymentTerms, 
-    InvoiceEmailTracking, InvoiceStatusHistoryEntry
+    InvoiceEmailTracking, InvoiceStatusHistoryEntry, InvoiceSummary, ReceivableBalance
 )
 from app.domain.entities.invoice_enums.enums import InvoiceStatus, PaymentStatus
 from app.domain.shared.enums import PaymentMethod, CurrencyCode, TaxType, DiscountType
@@ -25,9 +25,32 @@ from app.domain.value_objects.address import Address
 from app.domain.exceptions.domain_exceptions import (
     EntityNotFoundError, DuplicateEntityError, DatabaseError
 )
+from app.domain.shared.pagination import CursorPage
+from app.infrastructure.database.keyset_pagination import apply_keyset, build_cursor_page, page_count_method
 
 logger = logging.getLogger(__name__)
 
+# Invoice header with line items, payments and the contact name embedded,
+# fetched in one round-trip
+INVOICE_SELECT = (
+    "*, invoice_line_items(*), payments(*), "
+    "contact:contacts(first_name, last_name, company_name)"
+)
+
+# Header columns and stored totals for list screens; no line items or payments
+INVOICE_SUMMARY_SELECT = (
+    "id, business_id, invoice_number, status, title, contact_id, client_name, client_email, "
+    "project_id, job_id, estimate_id, currency, total_amount, amount_paid, amount_due, "
+    "issue_date, due_date, created_by, created_date, last_modified, "
+    "contact:contacts(first_name, last_name, company_name)"
+)
+
+# Statuses with nothing left to collect
+CLOSED_INVOICE_STATUSES = [
+    InvoiceStatus.DRAFT.value, InvoiceStatus.PAID.value,
+    InvoiceStatus.CANCELLED.value, InvoiceStatus.REFUNDED.value
+]
+
 class SupabaseInvoiceRepository(InvoiceRepository):
     """Supabase implementation of InvoiceRepository."""
     
@@ -54,28 +77,12 @@ class SupabaseInvoiceRepository(InvoiceRepository):
     async def get_by_id(self, invoice_id: uuid.UUID) -> Optional[Invoice]:
         """Get invoice by ID with line items and payments."""
         try:
-            # Fetch main invoice record
-            response = self.client.table(self.table_name).select("*").eq("id", str(invoice_id)).execute()
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("id", str(invoice_id)).execute()
             
             if not response.data:
                 return None
             
-            # Fetch line items for this invoice
-            line_items_response = self.client.table("invoice_line_items").select("*").eq(
-                "invoice_id", str(invoice_id)
-            ).order("sort_order").execute()
-            
-            # Fetch payments for this invoice
-            payments_response = self.client.table("payments").select("*").eq(
-                "invoice_id", str(invoice_id)
-            ).order("payment_date").execute()
-            
-            # Enrich invoice data with line items and payments
-            invoice_data = response.data[0]
-            invoice_data["_line_items"] = line_items_response.data
-            invoice_data["_payments"] = payments_response.data
-            
-            return self._dict_to_invoice(invoice_data)
+            return self._dict_to_invoice(response.data[0])
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoice by ID: {str(e)}")
@@ -83,93 +90,26 @@ class SupabaseInvoiceRepository(InvoiceRepository):
     async def get_by_invoice_number(self, business_id: uuid.UUID, invoice_number: str) -> Optional[Invoice]:
         """Get invoice by invoice number within a business."""
         try:
-            # Fetch main invoice record
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("invoice_number", invoice_number).execute()
             
             if not response.data:
                 return None
             
-            invoice_id = response.data[0]["id"]
-            
-            # Fetch line items for this invoice
-            line_items_response = self.client.table("invoice_line_items").select("*").eq(
-                "invoice_id", invoice_id
-            ).order("sort_order").execute()
-            
-            # Fetch payments for this invoice
-            payments_response = self.client.table("payments").select("*").eq(
-                "invoice_id", invoice_id
-            ).order("payment_date").execute()
-            
-            # Enrich invoice data with line items and payments
-            invoice_data = response.data[0]
-            invoice_data["_line_items"] = line_items_response.data
-            invoice_data["_payments"] = payments_response.data
-            
-            return self._dict_to_invoice(invoice_data)
+            return self._dict_to_invoice(response.data[0])
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoice by number: {str(e)}")
-    
-    async def _enrich_invoices_with_details(self, invoice_data_list: List[dict]) -> List[dict]:
-        """
-        Efficiently fetch and attach line items and payments to invoice data.
-        
-        Args:
-            invoice_data_list: List of invoice dictionaries from database
-            
-        Returns:
-            List of enriched invoice dictionaries with line_items and payments
-        """
-        if not invoice_data_list:
-            return invoice_data_list
-        
-        # Extract all invoice IDs for bulk fetching
-        invoice_ids = [invoice_data["id"] for invoice_data in invoice_data_list]
-        
-        # Bulk fetch line items for all invoices in one query
-        line_items_response = self.client.table("invoice_line_items").select("*").in_("invoice_id", invoice_ids).order("invoice_id").order("sort_order").execute()
-        
-        # Bulk fetch payments for all invoices in one query  
-        payments_response = self.client.table("payments").select("*").in_("invoice_id", invoice_ids).order("invoice_id").order("payment_date").execute()
-        
-        # Group line items by invoice_id
-        line_items_by_invoice = {}
-        for line_item in line_items_response.data:
-            invoice_id = line_item["invoice_id"]
-            if invoice_id not in line_items_by_invoice:
-                line_items_by_invoice[invoice_id] = []
-            line_items_by_invoice[invoice_id].append(line_item)
-        
-        # Group payments by invoice_id
-        payments_by_invoice = {}
-        for payment in payments_response.data:
-            invoice_id = payment["invoice_id"]
-            if invoice_id not in payments_by_invoice:
-                payments_by_invoice[invoice_id] = []
-            payments_by_invoice[invoice_id].append(payment)
-        
-        # Attach line items and payments to their respective invoices
-        for invoice_data in invoice_data_list:
-            invoice_id = invoice_data["id"]
-            invoice_data["line_items"] = line_items_by_invoice.get(invoice_id, [])
-            invoice_data["payments"] = payments_by_invoice.get(invoice_id, [])
-        
-        return invoice_data_list
 
     async def get_by_business_id(self, business_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get invoices by business ID with pagination."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "business_id", str(business_id)
             ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by business: {str(e)}")
@@ -177,14 +117,11 @@ class SupabaseInvoiceRepository(InvoiceRepository):
     async def get_by_contact_id(self, contact_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get invoices by contact ID with pagination."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "contact_id", str(contact_id)
             ).range(skip, skip + limit - 1).order("created_date", desc=True).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by contact: {str(e)}")
@@ -193,16 +130,13 @@ class SupabaseInvoiceRepository(InvoiceRepository):
                                skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get invoices associated with a specific project."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "project_id", str(project_id)
             ).eq("business_id", str(business_id)).range(
                 skip, skip + limit - 1
             ).order("created_date", desc=True).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by project: {str(e)}")
@@ -211,16 +145,13 @@ class SupabaseInvoiceRepository(InvoiceRepository):
                            skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get invoices associated with a specific job."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "job_id", str(job_id)
             ).eq("business_id", str(business_id)).range(
                 skip, skip + limit - 1
             ).order("created_date", desc=True).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by job: {str(e)}")
@@ -229,16 +160,13 @@ class SupabaseInvoiceRepository(InvoiceRepository):
                                 skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get invoices converted from a specific estimate."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "estimate_id", str(estimate_id)
             ).eq("business_id", str(business_id)).range(
                 skip, skip + limit - 1
             ).order("created_date", desc=True).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by estimate: {str(e)}")
@@ -247,16 +175,13 @@ class SupabaseInvoiceRepository(InvoiceRepository):
                            skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get invoices by status within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("status", status.value).range(
                 skip, skip + limit - 1
             ).order("created_date", desc=True).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by status: {str(e)}")
@@ -265,16 +190,13 @@ class SupabaseInvoiceRepository(InvoiceRepository):
                                   skip: int = 0, limit: int = 100) -> List[Invoice]:
         """Get overdue invoices within a business."""
         try:
-            response = self.client.table(self.table_name).select("*").eq(
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq(
                 "business_id", str(business_id)
             ).eq("status", InvoiceStatus.OVERDUE.value).range(
                 skip, skip + limit - 1
             ).order("due_date", desc=False).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
+            return [self._dict_to_invoice(invoice_data) for invoice_data in response.data]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get overdue invoices: {str(e)}")
@@ -290,26 +212,8 @@ class SupabaseInvoiceRepository(InvoiceRepository):
             ).execute()
             
             if response.data:
-                # After update, fetch the complete invoice with line items and payments
-                # like we do in get_by_id
-                invoice_id = invoice.id
-                
-                # Fetch line items for this invoice
-                line_items_response = self.client.table("invoice_line_items").select("*").eq(
-                    "invoice_id", str(invoice_id)
-                ).order("sort_order").execute()
-                
-                # Fetch payments for this invoice
-                payments_response = self.client.table("payments").select("*").eq(
-                    "invoice_id", str(invoice_id)
-                ).order("payment_date").execute()
-                
-                # Enrich invoice data with line items and payments
-                updated_invoice_data = response.data[0]
-                updated_invoice_data["_line_items"] = line_items_response.data
-                updated_invoice_data["_payments"] = payments_response.data
-                
-                return self._dict_to_invoice(updated_invoice_data)
+                # Re-read with line items and payments embedded
+                return await self.get_by_id(invoice.id)
             else:
                 raise EntityNotFoundError(f"Invoice with ID {invoice.id} not found")
                 
@@ -454,11 +358,11 @@ class SupabaseInvoiceRepository(InvoiceRepository):
             except (ValueError, TypeError):
                 return None
 
-        # Parse line items (from separate table or JSON field)
-        line_items_data = data.get("_line_items", data.get("line_items", []))
-        # If it's a string, try to parse as JSON (backward compatibility)
-        if isinstance(line_items_data, str):
-            line_items_data = safe_json_parse(line_items_data, [])
+        # Parse line items embedded from the invoice_line_items table
+        line_items_data = sorted(
+            data.get("invoice_line_items") or [],
+            key=lambda item: item.get("sort_order") or 0
+        )
         
         line_items = []
         for item_data in line_items_data:
@@ -481,11 +385,11 @@ class SupabaseInvoiceRepository(InvoiceRepository):
                 print(f"Warning: Skipping invalid line item: {e}")
                 continue
 
-        # Parse payments (from separate table or JSON field)
-        payments_data = data.get("_payments", data.get("payments", []))
-        # If it's a string, try to parse as JSON (backward compatibility)
-        if isinstance(payments_data, str):
-            payments_data = safe_json_parse(payments_data, [])
+        # Parse payments embedded from the payments table
+        payments_data = sorted(
+            data.get("payments") or [],
+            key=lambda payment: payment.get("payment_date") or ""
+        )
         
         payments = []
         for payment_data in payments_data:
@@ -519,31 +423,9 @@ class SupabaseInvoiceRepository(InvoiceRepository):
             payment_instructions=payment_terms_data.get("payment_instructions")
         )
         
-        # Handle client_name - fetch from contact if missing
-        client_name = data.get("client_name")
+        client_name = self._resolve_client_name(data)
         contact_id = safe_uuid_parse(data.get("contact_id"))
         
-        # If client_name is missing but contact_id is present, fetch contact details
-        if not client_name and contact_id:
-            try:
-                contact_response = self.client.table("contacts").select("first_name, last_name, company_name").eq("id", str(contact_id)).execute()
-                if contact_response.data:
-                    contact = contact_response.data[0]
-                    first_name = contact.get("first_name", "")
-                    last_name = contact.get("last_name", "")
-                    company_name = contact.get("company_name", "")
-                    
-                    if company_name:
-                        client_name = company_name
-                    elif first_name or last_name:
-                        client_name = f"{first_name} {last_name}".strip()
-                    else:
-                        client_name = "Unknown Client"
-            except Exception as e:
-                # If contact fetch fails, use a default
-                print(f"Warning: Could not fetch contact details for invoice: {e}")
-                client_name = "Unknown Client"
-        
         # Parse client address
         client_address = None
         if data.get("client_address"):
@@ -605,34 +487,25 @@ class SupabaseInvoiceRepository(InvoiceRepository):
     # Implement remaining required methods with basic implementations
     async def get_by_assigned_user(self, business_id: uuid.UUID, user_id: str, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).eq("created_by", user_id).range(skip, skip + limit - 1).execute()
-            
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).eq("created_by", user_id).range(skip, skip + limit - 1).execute()
             
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by assigned user: {str(e)}")
 
     async def get_by_template_id(self, business_id: uuid.UUID, template_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).eq("template_id", str(template_id)).range(skip, skip + limit - 1).execute()
-            
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).eq("template_id", str(template_id)).range(skip, skip + limit - 1).execute()
             
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by template: {str(e)}")
 
     async def get_by_date_range(self, business_id: uuid.UUID, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).gte("created_date", start_date.isoformat()).lte("created_date", end_date.isoformat()).range(skip, skip + limit - 1).execute()
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).gte("created_date", start_date.isoformat()).lte("created_date", end_date.isoformat()).range(skip, skip + limit - 1).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by date range: {str(e)}")
 
@@ -642,23 +515,17 @@ class SupabaseInvoiceRepository(InvoiceRepository):
 
     async def get_unpaid_invoices(self, business_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).eq("is_paid", False).range(skip, skip + limit - 1).execute()
-            
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).eq("is_paid", False).range(skip, skip + limit - 1).execute()
             
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get unpaid invoices: {str(e)}")
 
     async def get_partially_paid_invoices(self, business_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).eq("status", InvoiceStatus.PARTIALLY_PAID.value).range(skip, skip + limit - 1).execute()
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).eq("status", InvoiceStatus.PARTIALLY_PAID.value).range(skip, skip + limit - 1).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get partially paid invoices: {str(e)}")
 
@@ -668,34 +535,25 @@ class SupabaseInvoiceRepository(InvoiceRepository):
 
     async def get_by_value_range(self, business_id: uuid.UUID, min_value: Decimal, max_value: Decimal, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).gte("total_amount", float(min_value)).lte("total_amount", float(max_value)).range(skip, skip + limit - 1).execute()
-            
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).gte("total_amount", float(min_value)).lte("total_amount", float(max_value)).range(skip, skip + limit - 1).execute()
             
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by value range: {str(e)}")
 
     async def search_invoices(self, business_id: uuid.UUID, search_term: str, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).or_(f"title.ilike.%{search_term}%,description.ilike.%{search_term}%,invoice_number.ilike.%{search_term}%").range(skip, skip + limit - 1).execute()
-            
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).or_(f"title.ilike.%{search_term}%,description.ilike.%{search_term}%,invoice_number.ilike.%{search_term}%").range(skip, skip + limit - 1).execute()
             
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to search invoices: {str(e)}")
 
     async def get_by_currency(self, business_id: uuid.UUID, currency: CurrencyCode, skip: int = 0, limit: int = 100) -> List[Invoice]:
         try:
-            response = self.client.table(self.table_name).select("*").eq("business_id", str(business_id)).eq("currency", currency.value).range(skip, skip + limit - 1).execute()
+            response = self.client.table(self.table_name).select(INVOICE_SELECT).eq("business_id", str(business_id)).eq("currency", currency.value).range(skip, skip + limit - 1).execute()
             
-            # Enrich with line items and payments
-            enriched_data = await self._enrich_invoices_with_details(response.data)
-            
-            return [self._dict_to_invoice(data) for data in enriched_data]
+            return [self._dict_to_invoice(data) for data in response.data]
         except Exception as e:
             raise DatabaseError(f"Failed to get invoices by currency: {str(e)}")
 
@@ -771,43 +629,132 @@ class SupabaseInvoiceRepository(InvoiceRepository):
     async def get_refund_history(self, invoice_id: uuid.UUID) -> List[Dict[str, Any]]:
         return []  # Placeholder
 
-    async def list_with_pagination(self, business_id: uuid.UUID, skip: int = 0, limit: int = 100, filters: Optional[Dict[str, Any]] = None) -> Tuple[List[Invoice], int]:
-        """List invoices with pagination and filters."""
+    async def list_page_with_filters(self, business_id: uuid.UUID, limit: int = 100,
+                                     cursor: Optional[str] = None,
+                                     filters: Optional[Dict[str, Any]] = None,
+                                     include_total: bool = False) -> CursorPage[Invoice]:
+        """List a page of invoices with filters using keyset pagination."""
+        # Build the base query with an optional estimated count
+        query = self.client.table(self.table_name).select(
+            INVOICE_SELECT, count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        query = self._apply_filters(query, filters)
+        
+        # Order by (created_date, id) and start after the cursor
+        query = apply_keyset(query, cursor, limit)
+        
         try:
-            # Build the base query with count
-            query = self.client.table(self.table_name).select("*", count="exact").eq("business_id", str(business_id))
-            
-            # Apply filters if provided
-            if filters:
-                if "status" in filters:
-                    query = query.eq("status", filters["status"].value if hasattr(filters["status"], 'value') else filters["status"])
-                if "contact_id" in filters:
-                    query = query.eq("contact_id", str(filters["contact_id"]))
-                if "project_id" in filters:
-                    query = query.eq("project_id", str(filters["project_id"]))
-                if "job_id" in filters:
-                    query = query.eq("job_id", str(filters["job_id"]))
-                if "overdue_only" in filters and filters["overdue_only"]:
-                    query = query.eq("status", InvoiceStatus.OVERDUE.value)
-            
-            # Add pagination and ordering
-            query = query.range(skip, skip + limit - 1).order("created_date", desc=True)
-            
-            # Execute the query
             response = query.execute()
+            return build_cursor_page(response, limit, self._dict_to_invoice)
             
-            # Early return if no invoices found
-            if not response.data:
-                return [], 0
+        except Exception as e:
+            raise DatabaseError(f"Failed to list invoices with pagination: {str(e)}")
+    
+    async def list_summary_page_with_filters(self, business_id: uuid.UUID, limit: int = 100,
+                                             cursor: Optional[str] = None,
+                                             filters: Optional[Dict[str, Any]] = None,
+                                             include_total: bool = False) -> CursorPage[InvoiceSummary]:
+        """List a page of invoice summaries (header and stored totals only) using keyset pagination."""
+        query = self.client.table(self.table_name).select(
+            INVOICE_SUMMARY_SELECT, count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        query = self._apply_filters(query, filters)
+        query = apply_keyset(query, cursor, limit)
+        
+        try:
+            response = query.execute()
+            return build_cursor_page(response, limit, self._dict_to_invoice_summary)
             
-            # Enrich with line items and payments using helper method
-            enriched_data = await self._enrich_invoices_with_details(response.data)
+        except Exception as e:
+            raise DatabaseError(f"Failed to list invoice summaries: {str(e)}")
+    
+    async def get_receivables_aging(self, business_id: uuid.UUID, as_of: date,
+                                    contact_id: Optional[uuid.UUID] = None,
+                                    by_contact: bool = False) -> Dict[str, Any]:
+        """Aggregate outstanding balances into days-past-due buckets in the database."""
+        try:
+            response = self.client.rpc("get_receivables_aging", {
+                "p_business_id": str(business_id),
+                "p_as_of": as_of.isoformat(),
+                "p_contact_id": str(contact_id) if contact_id else None,
+                "p_by_contact": by_contact
+            }).execute()
+            return response.data or {}
             
-            # Convert the enriched data to Invoice entities
-            invoices = [self._dict_to_invoice(invoice_data) for invoice_data in enriched_data]
-            total_count = response.count or 0
+        except Exception as e:
+            raise DatabaseError(f"Failed to get receivables aging: {str(e)}")
+    
+    async def list_receivable_balances_page(self, business_id: uuid.UUID, as_of: date,
+                                            contact_id: Optional[uuid.UUID] = None,
+                                            limit: int = 100,
+                                            cursor: Optional[str] = None) -> CursorPage[ReceivableBalance]:
+        """Page through the per-invoice balances the aging RPC aggregates."""
+        query = self.client.rpc("get_receivable_balances", {
+            "p_business_id": str(business_id),
+            "p_as_of": as_of.isoformat(),
+            "p_contact_id": str(contact_id) if contact_id else None
+        })
+        query = apply_keyset(query, cursor, limit, sort_column="invoice_number", descending=False)
+        
+        try:
+            response = query.execute()
+            return build_cursor_page(response, limit, ReceivableBalance.model_validate,
+                                     sort_column="invoice_number")
             
-            return invoices, total_count
+        except Exception as e:
+            raise DatabaseError(f"Failed to list receivable balances: {str(e)}")
+    
+    async def get_revenue_report(self, business_id: uuid.UUID, start_date: date, end_date: date,
+                                 period: str = "month") -> Dict[str, Any]:
+        """Aggregate invoiced and collected revenue by period in the database."""
+        try:
+            response = self.client.rpc("get_revenue_report", {
+                "p_business_id": str(business_id),
+                "p_start_date": start_date.isoformat(),
+                "p_end_date": end_date.isoformat(),
+                "p_period": period
+            }).execute()
+            return response.data or {}
             
         except Exception as e:
-            raise DatabaseError(f"Failed to list invoices with pagination: {str(e)}") 
\ No newline at end of file
+            raise DatabaseError(f"Failed to get revenue report: {str(e)}")
+    
+    def _apply_filters(self, query, filters: Optional[Dict[str, Any]]):
+        """Apply list filters to an invoice query."""
+        if not filters:
+            return query
+        
+        if "status" in filters:
+            query = query.eq("status", filters["status"].value if hasattr(filters["status"], 'value') else filters["status"])
+        if "contact_id" in filters:
+            query = query.eq("contact_id", str(filters["contact_id"]))
+        if "project_id" in filters:
+            query = query.eq("project_id", str(filters["project_id"]))
+        if "job_id" in filters:
+            query = query.eq("job_id", str(filters["job_id"]))
+        if "overdue_only" in filters and filters["overdue_only"]:
+            query = query.eq("status", InvoiceStatus.OVERDUE.value)
+        if filters.get("outstanding_only"):
+            query = query.not_.in_("status", CLOSED_INVOICE_STATUSES).gt("amount_due", 0)
+        
+        return query
+    
+    def _dict_to_invoice_summary(self, data: dict) -> InvoiceSummary:
+        """Convert a summary row to an InvoiceSummary read model."""
+        summary_data = {key: value for key, value in data.items() if key != "contact"}
+        summary_data["client_name"] = self._resolve_client_name(data)
+        return InvoiceSummary.model_validate(summary_data)
+    
+    def _resolve_client_name(self, data: dict) -> Optional[str]:
+        """Use the stored client name, falling back to the embedded contact's name."""
+        client_name = data.get("client_name")
+        contact = data.get("contact")
+        
+        if client_name or not data.get("contact_id"):
+            return client_name
+        if not contact:
+            return "Unknown Client"
+        
+        company_name = contact.get("company_name") or ""
+        full_name = f"{contact.get('first_name') or ''} {contact.get('last_name') or ''}".strip()
+        return company_name or full_name or "Unknown Client"
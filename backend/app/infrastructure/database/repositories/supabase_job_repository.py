@@ -23,6 +23,8 @@ from app.domain.value_objects.address import Address
 from app.domain.entities.job_enums.enums import JobType, JobStatus, JobPriority, JobSource
 from app.domain.repositories.job_repository import JobRepository
 from app.domain.exceptions.domain_exceptions import DomainValidationError
+from app.domain.shared.pagination import CursorPage
+from app.infrastructure.database.keyset_pagination import apply_keyset, build_cursor_page, page_count_method
 
 
 class SupabaseJobRepository(JobRepository):
@@ -95,6 +97,22 @@ class SupabaseJobRepository(JobRepository):
         except Exception as e:
             raise DomainValidationError(f"Failed to get jobs by business: {str(e)}")
     
+    async def get_page_by_business_id(self, business_id: uuid.UUID, limit: int = 100,
+                                      cursor: Optional[str] = None,
+                                      include_total: bool = False) -> CursorPage[Job]:
+        """Get a page of jobs by business ID using keyset pagination."""
+        query = (self.client.table("jobs")
+                 .select("*", count=page_count_method(include_total))
+                 .eq("business_id", str(business_id)))
+        query = apply_keyset(query, cursor, limit)
+        
+        try:
+            result = query.execute()
+            return build_cursor_page(result, limit, self._dict_to_job)
+        
+        except Exception as e:
+            raise DomainValidationError(f"Failed to get jobs by business: {str(e)}")
+    
     async def get_recent_by_business(self, business_id: uuid.UUID, days: int = 30, limit: int = 10) -> List[Job]:
         """Get recent jobs by business ID within the specified number of days."""
         try:
@@ -20,6 +20,8 @@ from app.domain.shared.enums import PricingModel, UnitOfMeasure, CurrencyCode
 from app.domain.exceptions.domain_exceptions import (
     EntityNotFoundError, DuplicateEntityError, DatabaseError
 )
+from app.domain.shared.pagination import CursorPage
+from app.infrastructure.database.keyset_pagination import apply_keyset, build_cursor_page, page_count_method
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -153,6 +155,42 @@ class SupabaseProductRepository(ProductRepository):
         except Exception as e:
             raise DatabaseError(f"Failed to list products: {str(e)}")
     
+    async def list_page_by_business(
+        self,
+        business_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[ProductStatus] = None,
+        category_id: Optional[uuid.UUID] = None,
+        supplier_id: Optional[uuid.UUID] = None,
+        low_stock_only: bool = False,
+        include_total: bool = False
+    ) -> CursorPage[Product]:
+        """List a page of products for a business by name using keyset pagination."""
+        query = self.client.table(self.table_name).select(
+            "*", count=page_count_method(include_total)
+        ).eq("business_id", str(business_id))
+        
+        if status:
+            query = query.eq("status", status.value)
+        if category_id:
+            query = query.eq("category_id", str(category_id))
+        if supplier_id:
+            query = query.eq("primary_supplier_id", str(supplier_id))
+        if low_stock_only:
+            query = query.eq("track_inventory", True).filter(
+                "current_stock", "lte", "reorder_point"
+            )
+        
+        query = apply_keyset(query, cursor, limit, sort_column="name", descending=False)
+        
+        try:
+            response = query.execute()
+            return build_cursor_page(response, limit, self._dict_to_product, sort_column="name")
+            
+        except Exception as e:
+            raise DatabaseError(f"Failed to list products: {str(e)}")
+    
     async def search_products(
         self,
         business_id: uuid.UUID,
@@ -296,33 +334,8 @@ class SupabaseProductRepository(ProductRepository):
         quantity_change: Decimal,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Update product quantity."""
-        try:
-            # Get current stock first
-            current_response = self.client.table(self.table_name).select("current_stock").eq(
-                "business_id", str(business_id)
-            ).eq("id", str(product_id)).execute()
-            
-            if not current_response.data:
-                raise EntityNotFoundError(f"Product with ID {product_id} not found")
-            
-            current_stock = Decimal(str(current_response.data[0]["current_stock"]))
-            new_stock = current_stock + quantity_change
-            
-            # Ensure stock doesn't go negative
-            if new_stock < 0:
-                new_stock = Decimal('0')
-            
-            response = self.client.table(self.table_name).update({
-                "current_stock": float(new_stock),
-                "last_inventory_update": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("business_id", str(business_id)).eq("id", str(product_id)).execute()
-            
-            return len(response.data) > 0
-            
-        except Exception as e:
-            raise DatabaseError(f"Failed to update product quantity: {str(e)}")
+        """Atomically change product stock. Returns False if stock would go negative."""
+        return await self.update_quantities(business_id, {product_id: quantity_change})
     
     async def reserve_quantity(
         self,
@@ -331,28 +344,8 @@ class SupabaseProductRepository(ProductRepository):
         quantity: Decimal,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Reserve product quantity for an order."""
-        try:
-            # Get current reserved stock
-            current_response = self.client.table(self.table_name).select("reserved_stock").eq(
-                "business_id", str(business_id)
-            ).eq("id", str(product_id)).execute()
-            
-            if not current_response.data:
-                raise EntityNotFoundError(f"Product with ID {product_id} not found")
-            
-            current_reserved = Decimal(str(current_response.data[0]["reserved_stock"]))
-            new_reserved = current_reserved + quantity
-            
-            response = self.client.table(self.table_name).update({
-                "reserved_stock": float(new_reserved),
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("business_id", str(business_id)).eq("id", str(product_id)).execute()
-            
-            return len(response.data) > 0
-            
-        except Exception as e:
-            raise DatabaseError(f"Failed to reserve product quantity: {str(e)}")
+        """Atomically reserve product quantity. Returns False if not enough stock is available."""
+        return await self.reserve_quantities(business_id, {product_id: quantity})
     
     async def release_reservation(
         self,
@@ -361,69 +354,99 @@ class SupabaseProductRepository(ProductRepository):
         quantity: Decimal,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Release reserved product quantity."""
+        """Atomically release reserved product quantity."""
+        return await self.release_reservations(business_id, {product_id: quantity})
+    
+    async def update_quantities(
+        self,
+        business_id: uuid.UUID,
+        quantity_changes: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """Atomically change stock for several products, all or nothing."""
         try:
-            # Get current reserved stock
-            current_response = self.client.table(self.table_name).select("reserved_stock").eq(
-                "business_id", str(business_id)
-            ).eq("id", str(product_id)).execute()
-            
-            if not current_response.data:
-                raise EntityNotFoundError(f"Product with ID {product_id} not found")
-            
-            current_reserved = Decimal(str(current_response.data[0]["reserved_stock"]))
-            new_reserved = max(Decimal('0'), current_reserved - quantity)
-            
-            response = self.client.table(self.table_name).update({
-                "reserved_stock": float(new_reserved),
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("business_id", str(business_id)).eq("id", str(product_id)).execute()
-            
-            return len(response.data) > 0
-            
+            return await self._apply_inventory_changes(business_id, "adjust", quantity_changes)
+        except Exception as e:
+            raise DatabaseError(f"Failed to update product quantity: {str(e)}")
+    
+    async def reserve_quantities(
+        self,
+        business_id: uuid.UUID,
+        quantities: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """Atomically reserve quantities for several products, all or nothing."""
+        try:
+            return await self._apply_inventory_changes(business_id, "reserve", quantities)
+        except Exception as e:
+            raise DatabaseError(f"Failed to reserve product quantity: {str(e)}")
+    
+    async def release_reservations(
+        self,
+        business_id: uuid.UUID,
+        quantities: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """Atomically release reserved quantities for several products."""
+        try:
+            return await self._apply_inventory_changes(business_id, "release", quantities)
         except Exception as e:
             raise DatabaseError(f"Failed to release reserved quantity: {str(e)}")
     
+    async def _apply_inventory_changes(
+        self,
+        business_id: uuid.UUID,
+        operation: str,
+        quantities: Dict[uuid.UUID, Decimal]
+    ) -> bool:
+        """
+        Apply stock changes in one round-trip through the apply_inventory_changes RPC.
+        
+        The RPC locks the products, checks every guard and updates all of them or none,
+        returning no rows when a product is missing or a guard fails.
+        """
+        if not quantities:
+            return True
+        
+        response = self.client.rpc("apply_inventory_changes", {
+            "p_business_id": str(business_id),
+            "p_operation": operation,
+            "p_lines": [
+                {"product_id": str(product_id), "quantity": str(quantity)}
+                for product_id, quantity in quantities.items()
+            ]
+        }).execute()
+        
+        return len(response.data or []) == len(quantities)
+    
     # Cost and pricing operations
     async def update_cost(
         self,
         business_id: uuid.UUID,
         product_id: uuid.UUID,
-        new_cost: Decimal,
-        quantity: Optional[Decimal] = None
+        new_cost: Decimal
     ) -> bool:
-        """Update product cost using appropriate costing method."""
+        """
+        Record the latest purchase cost of a product.
+
+        Weighted average cost is maintained from stock movements by the
+        database, so only last cost (and cost price for fixed cost methods)
+        is written here.
+        """
         try:
-            # Get current product data
             current_response = self.client.table(self.table_name).select(
-                "cost_price, weighted_average_cost, costing_method, current_stock"
+                "costing_method"
             ).eq("business_id", str(business_id)).eq("id", str(product_id)).execute()
             
             if not current_response.data:
                 raise EntityNotFoundError(f"Product with ID {product_id} not found")
             
-            current_data = current_response.data[0]
-            costing_method = current_data["costing_method"]
-            current_stock = Decimal(str(current_data["current_stock"]))
-            current_weighted_avg = Decimal(str(current_data["weighted_average_cost"]))
+            costing_method = current_response.data[0]["costing_method"]
             
             update_data = {
                 "last_cost": float(new_cost),
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            # Update weighted average cost for appropriate methods
-            if costing_method == CostingMethod.weighted_average.value:
-                if current_stock > 0 and quantity:
-                    total_value = (current_weighted_avg * current_stock) + (new_cost * quantity)
-                    total_quantity = current_stock + quantity
-                    new_weighted_avg = total_value / total_quantity
-                    update_data["weighted_average_cost"] = float(new_weighted_avg)
-                else:
-                    update_data["weighted_average_cost"] = float(new_cost)
-            
             # Update cost price for fixed cost methods
-            if costing_method in [CostingMethod.standard_cost.value, CostingMethod.specific_identification.value]:
+            if costing_method in [CostingMethod.STANDARD_COST.value, CostingMethod.SPECIFIC_IDENTIFICATION.value]:
                 update_data["cost_price"] = float(new_cost)
             
             response = self.client.table(self.table_name).update(update_data).eq(
@@ -460,24 +483,17 @@ class SupabaseProductRepository(ProductRepository):
         category_id: Optional[uuid.UUID] = None,
         location_id: Optional[uuid.UUID] = None
     ) -> Decimal:
-        """Calculate total inventory value."""
+        """Calculate total inventory value from the running cost positions."""
         try:
-            query = self.client.table(self.table_name).select(
-                "current_stock, weighted_average_cost"
-            ).eq("business_id", str(business_id)).eq("track_inventory", True)
-            
-            if category_id:
-                query = query.eq("category_id", str(category_id))
-            
-            response = query.execute()
-            
-            total_value = Decimal('0')
-            for product_data in response.data:
-                stock = Decimal(str(product_data["current_stock"]))
-                cost = Decimal(str(product_data["weighted_average_cost"]))
-                total_value += stock * cost
-            
-            return total_value
+            response = self.client.rpc("get_inventory_valuation", {
+                "p_business_id": str(business_id),
+                "p_category_id": str(category_id) if category_id else None
+            }).execute()
+            
+            return sum(
+                (Decimal(str(row["inventory_value"] or 0)) for row in response.data or []),
+                Decimal('0')
+            )
             
         except Exception as e:
             raise DatabaseError(f"Failed to calculate inventory value: {str(e)}")
@@ -847,37 +863,49 @@ class SupabaseProductRepository(ProductRepository):
         business_id: uuid.UUID,
         adjustments: List[Dict[str, Any]]
     ) -> int:
-        """Bulk adjust inventory quantities."""
+        """
+        Bulk adjust inventory quantities in one atomic call.
+
+        Changes to the same product are summed. Returns the number of products
+        adjusted, or 0 when any product is missing or would go negative.
+        """
+        quantities: Dict[uuid.UUID, Decimal] = {}
+        for adjustment in adjustments:
+            product_id = uuid.UUID(str(adjustment.get("product_id")))
+            quantity_change = Decimal(str(adjustment.get("quantity_change", 0)))
+            quantities[product_id] = quantities.get(product_id, Decimal('0')) + quantity_change
+        
+        if not quantities:
+            return 0
+        
+        applied = await self.update_quantities(business_id, quantities)
+        return len(quantities) if applied else 0
+    
+    async def upsert_by_sku(
+        self,
+        business_id: uuid.UUID,
+        product_data: List[Dict[str, Any]]
+    ) -> int:
+        """Upsert a chunk of catalog rows, matched on SKU."""
         try:
-            updated_count = 0
-            
-            for adjustment in adjustments:
-                product_id = adjustment.get("product_id")
-                quantity_change = Decimal(str(adjustment.get("quantity_change", 0)))
-                
-                # Get current stock
-                current_response = self.client.table(self.table_name).select("current_stock").eq(
-                    "business_id", str(business_id)
-                ).eq("id", str(product_id)).execute()
-                
-                if current_response.data:
-                    current_stock = Decimal(str(current_response.data[0]["current_stock"]))
-                    new_stock = max(Decimal('0'), current_stock + quantity_change)
-                    
-                    update_response = self.client.table(self.table_name).update({
-                        "current_stock": float(new_stock),
-                        "available_stock": float(new_stock),  # Simplified for now
-                        "last_inventory_update": datetime.utcnow().isoformat(),
-                        "updated_at": datetime.utcnow().isoformat()
-                    }).eq("business_id", str(business_id)).eq("id", str(product_id)).execute()
-                    
-                    if update_response.data:
-                        updated_count += 1
+            if not product_data:
+                return 0
+            
+            now = datetime.utcnow().isoformat()
+            rows = [
+                {**row, "business_id": str(business_id), "updated_at": now}
+                for row in product_data
+            ]
+            self.client.table(self.table_name).upsert(
+                rows,
+                on_conflict="business_id,sku",
+                returning="minimal"
+            ).execute()
             
-            return updated_count
+            return len(rows)
             
         except Exception as e:
-            raise DatabaseError(f"Failed to bulk adjust inventory: {str(e)}")
+            raise DatabaseError(f"Failed to upsert products: {str(e)}")
     
     # Advanced search and filtering
     async def advanced_search(
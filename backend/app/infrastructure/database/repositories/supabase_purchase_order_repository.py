@@ -8,7 +8,7 @@ import uuid
 import logging
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from supabase import Client
 
@@ -385,28 +385,35 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
         order_id: uuid.UUID,
         line_item_receipts: List[Dict[str, Any]],
         received_by: str,
+        batch_id: uuid.UUID,
         receipt_date: Optional[datetime] = None,
         notes: Optional[str] = None
-    ) -> bool:
-        """Record receipt of purchase order items."""
+    ) -> Dict[str, Any]:
+        """
+        Record receipt of purchase order items, their stock movements and stock in one call.
+
+        Line quantities, purchase movements, product stock and last cost and
+        the order status are updated together; a repeated batch_id returns
+        status "duplicate" without applying the receipt again.
+        """
         try:
-            # This would require updating line items in a separate table
-            # For now, just update the main order status
-            receipt_datetime = receipt_date or datetime.utcnow()
-            
-            update_data = {
-                "status": PurchaseOrderStatus.RECEIVED.value,
-                "received_by": received_by,
-                "received_at": receipt_datetime.isoformat(),
-                "receipt_notes": notes,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            response = self.client.table(self.table_name).update(update_data).eq(
-                "business_id", str(business_id)
-            ).eq("id", str(order_id)).execute()
-            
-            return len(response.data) > 0
+            response = self.client.rpc("receive_purchase_order_items", {
+                "p_business_id": str(business_id),
+                "p_order_id": str(order_id),
+                "p_batch_id": str(batch_id),
+                "p_receipts": [
+                    {
+                        "line_item_id": str(receipt["line_item_id"]),
+                        "quantity_received": str(receipt["quantity_received"])
+                    }
+                    for receipt in line_item_receipts
+                ],
+                "p_received_by": received_by,
+                "p_received_at": (receipt_date or datetime.utcnow()).isoformat(),
+                "p_notes": notes
+            }).execute()
+            
+            return response.data or {"status": "not_found"}
             
         except Exception as e:
             raise DatabaseError(f"Failed to record receipt: {str(e)}")
@@ -600,29 +607,19 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
     ) -> Dict[str, Any]:
         """Get spending analytics by supplier."""
         try:
-            query = self.client.table(self.table_name).select("*").eq(
-                "business_id", str(business_id)
-            ).eq("supplier_id", str(supplier_id))
-            
-            if start_date:
-                query = query.gte("order_date", start_date.isoformat())
-            if end_date:
-                query = query.lte("order_date", end_date.isoformat())
-            
-            response = query.execute()
-            orders = [self._dict_to_purchase_order(po) for po in response.data]
-            
-            total_spend = sum(po.total_amount for po in orders)
+            analytics = self._get_analytics(
+                business_id, start_date, end_date, supplier_id=supplier_id, sections=["totals"]
+            )
+            totals = analytics.get("totals") or {}
+            total_spend = float(totals.get("total_spend") or 0)
+            order_count = totals.get("order_count") or 0
             
             return {
                 "supplier_id": str(supplier_id),
-                "total_spend": float(total_spend),
-                "order_count": len(orders),
-                "average_order_value": float(total_spend / len(orders)) if orders else 0,
-                "period": {
-                    "start": start_date.isoformat() if start_date else None,
-                    "end": end_date.isoformat() if end_date else None
-                }
+                "total_spend": total_spend,
+                "order_count": order_count,
+                "average_order_value": total_spend / order_count if order_count else 0,
+                "period": self._period_bounds(start_date, end_date)
             }
             
         except Exception as e:
@@ -634,15 +631,19 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
-        """Get spending analytics by category."""
+        """Get spending analytics by product category, from order lines."""
         try:
-            # This would require joining with products and categories
-            # For now, returning basic spending data
-            return [{
-                "category": "General",
-                "total_spend": 0.0,
-                "order_count": 0
-            }]
+            analytics = self._get_analytics(business_id, start_date, end_date, sections=["category"])
+            
+            return [
+                {
+                    "category_id": row.get("category_id"),
+                    "category": row["category"],
+                    "total_spend": float(row["total_spend"] or 0),
+                    "order_count": row["order_count"]
+                }
+                for row in analytics.get("category") or []
+            ]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get spending by category: {str(e)}")
@@ -653,16 +654,33 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
         budget_period: str = "month",
         category_id: Optional[uuid.UUID] = None
     ) -> Dict[str, Any]:
-        """Get budget analysis."""
+        """
+        Get budget analysis for the current period.
+
+        No budgets are stored yet, so only actual spend is reported; the
+        budget and variance fields stay empty until budgets exist.
+        """
         try:
-            # This would require budget tables and complex calculations
-            # For now, returning basic budget data
+            period_start = self._period_start(budget_period, 1)
+            sections = ["category"] if category_id else ["totals"]
+            analytics = self._get_analytics(business_id, period_start, None, sections=sections)
+            
+            if category_id:
+                actual_spend = sum(
+                    float(row["total_spend"] or 0)
+                    for row in analytics.get("category") or []
+                    if row.get("category_id") == str(category_id)
+                )
+            else:
+                actual_spend = float((analytics.get("totals") or {}).get("total_spend") or 0)
+            
             return {
                 "period": budget_period,
-                "budgeted_amount": 10000.0,
-                "actual_spend": 8500.0,
-                "variance": 1500.0,
-                "variance_percentage": 15.0
+                "period_start": period_start.date().isoformat(),
+                "budgeted_amount": None,
+                "actual_spend": actual_spend,
+                "variance": None,
+                "variance_percentage": None
             }
             
         except Exception as e:
@@ -677,45 +695,14 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
     ) -> Dict[str, Any]:
         """Get comprehensive order analytics."""
         try:
-            query = self.client.table(self.table_name).select("*").eq("business_id", str(business_id))
-            
-            if start_date:
-                query = query.gte("order_date", start_date.isoformat())
-            if end_date:
-                query = query.lte("order_date", end_date.isoformat())
-            if supplier_id:
-                query = query.eq("supplier_id", str(supplier_id))
-            
-            response = query.execute()
-            orders = [self._dict_to_purchase_order(po) for po in response.data]
-            
-            if not orders:
-                return {"total_orders": 0, "total_spend": 0.0, "average_order_value": 0.0}
-            
-            total_spend = sum(po.total_amount for po in orders)
-            
-            return {
-                "total_orders": len(orders),
-                "total_spend": float(total_spend),
-                "average_order_value": float(total_spend / len(orders)),
-                "status_breakdown": self._get_status_breakdown(orders),
-                "period": {
-                    "start": start_date.isoformat() if start_date else None,
-                    "end": end_date.isoformat() if end_date else None
-                }
-            }
+            analytics = self._get_analytics(
+                business_id, start_date, end_date, supplier_id=supplier_id, sections=["totals", "status"]
+            )
+            return self._summarize_orders(analytics, start_date, end_date)
             
         except Exception as e:
             raise DatabaseError(f"Failed to get order analytics: {str(e)}")
     
-    def _get_status_breakdown(self, orders: List[PurchaseOrder]) -> Dict[str, int]:
-        """Get status breakdown from orders list."""
-        breakdown = {}
-        for order in orders:
-            status = order.status.value
-            breakdown[status] = breakdown.get(status, 0) + 1
-        return breakdown
-    
     async def get_delivery_performance_metrics(
         self,
         business_id: uuid.UUID,
@@ -723,16 +710,21 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> Dict[str, Any]:
-        """Get delivery performance metrics."""
+        """Get delivery performance metrics from expected vs actual delivery dates."""
         try:
-            # This would require delivery tracking data
-            # For now, returning basic performance metrics
+            analytics = self._get_analytics(
+                business_id, start_date, end_date, supplier_id=supplier_id, sections=["delivery"]
+            )
+            delivery = analytics.get("delivery") or {}
+            total_orders = delivery.get("total_orders") or 0
+            on_time = delivery.get("on_time_deliveries") or 0
+            
             return {
-                "total_orders": 25,
-                "on_time_deliveries": 20,
-                "late_deliveries": 5,
-                "on_time_percentage": 80.0,
-                "average_delay_days": 2.3
+                "total_orders": total_orders,
+                "on_time_deliveries": on_time,
+                "late_deliveries": delivery.get("late_deliveries") or 0,
+                "on_time_percentage": round(on_time / total_orders * 100, 1) if total_orders else 0.0,
+                "average_delay_days": round(float(delivery.get("average_delay_days") or 0), 1)
             }
             
         except Exception as e:
@@ -744,17 +736,21 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
         period: str = "month",  # day, week, month, quarter
         periods_count: int = 12
     ) -> List[Dict[str, Any]]:
-        """Get order trends over time."""  
+        """Get order trends over the last periods_count periods, oldest first."""  
         try:
-            # This would require time-series analysis
-            # For now, returning sample trend data
+            start_date = self._period_start(period, periods_count)
+            analytics = self._get_analytics(
+                business_id, start_date, None, period=period, sections=["period"]
+            )
+            
             trends = []
-            for i in range(periods_count):
+            for row in analytics.get("period") or []:
+                total_spend = float(row["total_spend"] or 0)
                 trends.append({
-                    "period": f"2024-{12-i:02d}",
-                    "order_count": 15 + (i % 5),
-                    "total_spend": 5000.0 + (i * 500),
-                    "average_order_value": 333.33
+                    "period": row["period_start"],
+                    "order_count": row["order_count"],
+                    "total_spend": total_spend,
+                    "average_order_value": total_spend / row["order_count"] if row["order_count"] else 0
                 })
             return trends
             
@@ -770,9 +766,20 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
     ) -> List[Dict[str, Any]]:
         """Get top products by spend."""
         try:
-            # This would require joining with line items and products
-            # For now, returning empty list
-            return []
+            analytics = self._get_analytics(
+                business_id, start_date, end_date, sections=["product"], top_products=limit
+            )
+            
+            return [
+                {
+                    "product_id": row.get("product_id"),
+                    "product_name": row.get("product_name"),
+                    "quantity_ordered": float(row.get("quantity_ordered") or 0),
+                    "total_spend": float(row.get("total_spend") or 0),
+                    "order_count": row.get("order_count", 0)
+                }
+                for row in analytics.get("product") or []
+            ]
             
         except Exception as e:
             raise DatabaseError(f"Failed to get top products by spend: {str(e)}")
@@ -1237,33 +1244,8 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
     ) -> Dict[str, Any]:
         """Get order statistics for a date range."""
         try:
-            query = self.client.table(self.table_name).select("*").eq(
-                "business_id", str(business_id)
-            ).gte("order_date", start_date.isoformat()).lte("order_date", end_date.isoformat())
-            
-            response = query.execute()
-            orders = [self._dict_to_purchase_order(po) for po in response.data]
-            
-            if not orders:
-                return {
-                    "total_orders": 0,
-                    "total_spend": 0.0,
-                    "average_order_value": 0.0,
-                    "status_breakdown": {}
-                }
-            
-            total_spend = sum(po.total_amount for po in orders)
-            
-            return {
-                "total_orders": len(orders),
-                "total_spend": float(total_spend),
-                "average_order_value": float(total_spend / len(orders)),
-                "status_breakdown": self._get_status_breakdown(orders),
-                "period": {
-                    "start": start_date.isoformat(),
-                    "end": end_date.isoformat()
-                }
-            }
+            analytics = self._get_analytics(business_id, start_date, end_date, sections=["totals", "status"])
+            return self._summarize_orders(analytics, start_date, end_date)
             
         except Exception as e:
             raise DatabaseError(f"Failed to get order statistics: {str(e)}")
@@ -1296,6 +1278,76 @@ class SupabasePurchaseOrderRepository(PurchaseOrderRepository):
         except Exception as e:
             raise DatabaseError(f"Failed to get orders requiring review: {str(e)}")
 
+    def _get_analytics(
+        self,
+        business_id: uuid.UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        supplier_id: Optional[uuid.UUID] = None,
+        period: str = "month",
+        sections: Optional[List[str]] = None,
+        top_products: int = 20
+    ) -> Dict[str, Any]:
+        """Run the purchase order analytics aggregation for the requested sections."""
+        response = self.client.rpc("get_purchase_order_analytics", {
+            "p_business_id": str(business_id),
+            "p_start_date": start_date.date().isoformat() if start_date else None,
+            "p_end_date": end_date.date().isoformat() if end_date else None,
+            "p_supplier_id": str(supplier_id) if supplier_id else None,
+            "p_period": period,
+            "p_sections": sections,
+            "p_top_products": top_products
+        }).execute()
+        return response.data or {}
+    
+    def _summarize_orders(
+        self,
+        analytics: Dict[str, Any],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """Build the order totals and status breakdown response."""
+        totals = analytics.get("totals") or {}
+        total_spend = float(totals.get("total_spend") or 0)
+        total_orders = totals.get("order_count") or 0
+        
+        return {
+            "total_orders": total_orders,
+            "total_spend": total_spend,
+            "average_order_value": total_spend / total_orders if total_orders else 0.0,
+            "status_breakdown": {
+                row["status"]: row["order_count"] for row in analytics.get("status") or []
+            },
+            "period": self._period_bounds(start_date, end_date)
+        }
+    
+    @staticmethod
+    def _period_bounds(start_date: Optional[datetime], end_date: Optional[datetime]) -> Dict[str, Optional[str]]:
+        return {
+            "start": start_date.isoformat() if start_date else None,
+            "end": end_date.isoformat() if end_date else None
+        }
+    
+    @staticmethod
+    def _period_start(period: str, periods_count: int) -> datetime:
+        """Start of the period periods_count - 1 periods before the current one."""
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        back = max(periods_count, 1) - 1
+        
+        if period == "day":
+            return today - timedelta(days=back)
+        if period == "week":
+            return today - timedelta(days=today.weekday(), weeks=back)
+        
+        months_per_period = {"month": 1, "quarter": 3, "year": 12}.get(period)
+        if months_per_period is None:
+            raise ValueError(f"Unsupported period: {period}")
+        
+        month_index = today.year * 12 + today.month - 1
+        month_index -= month_index % months_per_period
+        month_index -= back * months_per_period
+        return today.replace(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
     def _purchase_order_to_dict(self, po: PurchaseOrder) -> dict:
         """Convert PurchaseOrder entity to dictionary."""
         return {
@@ -29,6 +29,9 @@ class SupabaseStockMovementRepository(StockMovementRepository):
     Handles comprehensive stock movement tracking with audit trail.
     """
     
+    # Products re-aggregated per rebuild_stock_levels RPC call
+    REBUILD_CHUNK_SIZE = 500
+
     def __init__(self, supabase_client: Client):
         self.client = supabase_client
         self.table_name = "stock_movements"
@@ -334,6 +337,36 @@ class SupabaseStockMovementRepository(StockMovementRepository):
         except Exception as e:
             raise DatabaseError(f"Failed to create batch movements: {str(e)}")
     
+    async def record_movement_batch(
+        self,
+        business_id: uuid.UUID,
+        batch_id: uuid.UUID,
+        movements: List[StockMovement]
+    ) -> Dict[str, Any]:
+        """
+        Record movements and apply their aggregated stock deltas in one call.
+
+        Idempotent by batch_id: a repeated batch returns status "duplicate"
+        and changes nothing. A batch that would take a product negative
+        returns "insufficient_stock" and is not recorded.
+        """
+        try:
+            response = self.client.rpc("record_stock_movement_batch", {
+                "p_business_id": str(business_id),
+                "p_batch_id": str(batch_id),
+                "p_movements": [self._movement_to_dict(movement) for movement in movements]
+            }).execute()
+            
+            if not response.data:
+                raise DatabaseError("Failed to record movement batch - no data returned")
+            
+            return response.data[0]
+            
+        except DatabaseError:
+            raise
+        except Exception as e:
+            raise DatabaseError(f"Failed to record movement batch: {str(e)}")
+    
     async def get_movements_by_batch(
         self,
         business_id: uuid.UUID,
@@ -401,60 +434,61 @@ class SupabaseStockMovementRepository(StockMovementRepository):
         product_id: uuid.UUID,
         up_to_date: Optional[datetime] = None
     ) -> Decimal:
-        """Calculate weighted average cost from movement history."""
+        """Get the running weighted average cost of a product, optionally as of a date."""
+        valuation = await self.get_inventory_valuation(business_id, up_to_date, [product_id])
+        return valuation[product_id]["average_cost"]
+    
+    async def get_inventory_valuation(
+        self,
+        business_id: uuid.UUID,
+        valuation_date: Optional[datetime] = None,
+        product_ids: Optional[List[uuid.UUID]] = None,
+        category_id: Optional[uuid.UUID] = None
+    ) -> Dict[uuid.UUID, Dict[str, Decimal]]:
+        """
+        Get quantity, average cost and value per product, current or as of a date.
+
+        Reads the cost positions maintained as movements are recorded; as-of
+        values start from the latest valuation snapshot, so the cost does not
+        grow with the length of the movement history.
+        """
         try:
-            movements = await self.get_cost_affecting_movements(business_id, product_id, up_to_date)
-            
-            total_cost = Decimal('0')
-            total_quantity = Decimal('0')
-            
-            for movement in movements:
-                if movement.movement_type == StockMovementType.PURCHASE:
-                    total_cost += movement.total_cost or Decimal('0')
-                    total_quantity += movement.quantity
-            
-            if total_quantity > 0:
-                return total_cost / total_quantity
-            return Decimal('0')
+            response = self.client.rpc("get_inventory_valuation", {
+                "p_business_id": str(business_id),
+                "p_as_of": valuation_date.isoformat() if valuation_date else None,
+                "p_product_ids": [str(pid) for pid in product_ids] if product_ids else None,
+                "p_category_id": str(category_id) if category_id else None
+            }).execute()
+
+            zero = {"quantity": Decimal('0'), "average_cost": Decimal('0'), "inventory_value": Decimal('0')}
+            valuation: Dict[uuid.UUID, Dict[str, Decimal]] = {pid: dict(zero) for pid in product_ids or []}
+            for row in response.data or []:
+                valuation[uuid.UUID(row["product_id"])] = {
+                    "quantity": Decimal(str(row["quantity"] or 0)),
+                    "average_cost": Decimal(str(row["average_cost"] or 0)),
+                    "inventory_value": Decimal(str(row["inventory_value"] or 0))
+                }
+            return valuation
             
         except Exception as e:
-            raise DatabaseError(f"Failed to calculate weighted average cost: {str(e)}")
-    
-    async def get_inventory_valuation_movements(
+            raise DatabaseError(f"Failed to get inventory valuation: {str(e)}")
+
+    async def create_valuation_snapshot(
         self,
         business_id: uuid.UUID,
-        valuation_date: datetime,
-        product_ids: Optional[List[uuid.UUID]] = None
-    ) -> List[Dict[str, Any]]:
-        """Get inventory valuation movements for a specific date."""
+        as_of: Optional[datetime] = None
+    ) -> int:
+        """Snapshot inventory valuation so as-of valuations start closer to the requested date."""
         try:
-            query = self.client.table(self.table_name).select("*").eq(
-                "business_id", str(business_id)
-            ).lte("movement_date", valuation_date.isoformat())
-            
-            if product_ids:
-                query = query.in_("product_id", [str(pid) for pid in product_ids])
-            
-            response = query.order("movement_date").execute()
-            
-            movements = [self._dict_to_movement(movement) for movement in response.data]
-            
-            # Process into valuation data
-            valuation_data = []
-            for movement in movements:
-                valuation_data.append({
-                    "product_id": str(movement.product_id),
-                    "quantity": float(movement.quantity),
-                    "unit_cost": float(movement.unit_cost) if movement.unit_cost else 0,
-                    "total_cost": float(movement.total_cost) if movement.total_cost else 0,
-                    "movement_type": movement.movement_type.value,
-                    "movement_date": movement.movement_date.isoformat()
-                })
-            
-            return valuation_data
-            
+            params = {"p_business_id": str(business_id)}
+            if as_of:
+                params["p_as_of"] = as_of.isoformat()
+
+            response = self.client.rpc("snapshot_inventory_valuation", params).execute()
+            return int(response.data or 0)
+
         except Exception as e:
-            raise DatabaseError(f"Failed to get inventory valuation movements: {str(e)}")
+            raise DatabaseError(f"Failed to snapshot inventory valuation: {str(e)}")
     
     async def get_movement_summary(
         self,
@@ -888,24 +922,92 @@ class SupabaseStockMovementRepository(StockMovementRepository):
         product_ids: Optional[List[uuid.UUID]] = None,
         location_id: Optional[uuid.UUID] = None
     ) -> Dict[uuid.UUID, Dict[str, Decimal]]:
-        """Get current stock levels for products."""
+        """
+        Get current stock levels for products from the stock_levels projection.
+
+        Balances are summed across locations unless location_id is given.
+        Reservations are tracked per product, so they only apply to the
+        all-locations view.
+        """
         try:
-            # This would require complex calculation based on all movements
-            # For now, returning basic structure
-            stock_levels = {}
-            
+            query = self.client.table("stock_levels").select("product_id, quantity").eq(
+                "business_id", str(business_id)
+            )
             if product_ids:
-                for product_id in product_ids:
-                    stock_levels[product_id] = {
-                        "quantity": Decimal('0'),
-                        "reserved": Decimal('0'),
-                        "available": Decimal('0')
-                    }
-            
-            return stock_levels
+                query = query.in_("product_id", [str(pid) for pid in product_ids])
+            if location_id:
+                query = query.eq("location_id", str(location_id))
+
+            response = query.execute()
+
+            quantities: Dict[uuid.UUID, Decimal] = {pid: Decimal('0') for pid in product_ids or []}
+            for row in response.data or []:
+                pid = uuid.UUID(row["product_id"])
+                quantities[pid] = quantities.get(pid, Decimal('0')) + Decimal(str(row["quantity"] or 0))
+
+            reserved: Dict[uuid.UUID, Decimal] = {}
+            if quantities and location_id is None:
+                reserved_response = self.client.table("products").select("id, reserved_stock").eq(
+                    "business_id", str(business_id)
+                ).in_("id", [str(pid) for pid in quantities]).execute()
+                reserved = {
+                    uuid.UUID(row["id"]): Decimal(str(row.get("reserved_stock") or 0))
+                    for row in reserved_response.data or []
+                }
+
+            return {
+                pid: {
+                    "quantity": quantity,
+                    "reserved": reserved.get(pid, Decimal('0')),
+                    "available": quantity - reserved.get(pid, Decimal('0'))
+                }
+                for pid, quantity in quantities.items()
+            }
             
         except Exception as e:
             raise DatabaseError(f"Failed to get current stock levels: {str(e)}")
+
+    async def get_stock_levels_at(
+        self,
+        business_id: uuid.UUID,
+        as_of: datetime,
+        product_ids: Optional[List[uuid.UUID]] = None,
+        location_id: Optional[uuid.UUID] = None
+    ) -> Dict[uuid.UUID, Decimal]:
+        """Get on-hand quantity per product as of a point in time (latest snapshot plus replay)."""
+        try:
+            response = self.client.rpc("get_stock_levels_at", {
+                "p_business_id": str(business_id),
+                "p_as_of": as_of.isoformat(),
+                "p_product_ids": [str(pid) for pid in product_ids] if product_ids else None,
+                "p_location_id": str(location_id) if location_id else None
+            }).execute()
+
+            levels: Dict[uuid.UUID, Decimal] = {pid: Decimal('0') for pid in product_ids or []}
+            for row in response.data or []:
+                pid = uuid.UUID(row["product_id"])
+                levels[pid] = levels.get(pid, Decimal('0')) + Decimal(str(row["quantity"] or 0))
+            return levels
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to get stock levels as of {as_of}: {str(e)}")
+
+    async def create_stock_snapshot(
+        self,
+        business_id: uuid.UUID,
+        as_of: Optional[datetime] = None
+    ) -> int:
+        """Snapshot stock levels so point-in-time queries replay fewer movements."""
+        try:
+            params = {"p_business_id": str(business_id)}
+            if as_of:
+                params["p_as_of"] = as_of.isoformat()
+
+            response = self.client.rpc("snapshot_stock_levels", params).execute()
+            return int(response.data or 0)
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to snapshot stock levels: {str(e)}")
     
     async def rebuild_stock_levels(
         self,
@@ -913,14 +1015,48 @@ class SupabaseStockMovementRepository(StockMovementRepository):
         product_id: Optional[uuid.UUID] = None,
         location_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Rebuild stock levels from movement history."""
+        """
+        Rebuild stock levels from movement history.
+
+        A full rebuild walks the business's products in id order and
+        re-aggregates the ledger one chunk of products per call.
+        """
         try:
-            # This would require recalculating all stock levels from movements
-            # For now, returning True indicating success
-            return True
+            if product_id:
+                self._rebuild_stock_level_chunk(business_id, [str(product_id)], location_id)
+                return True
+
+            last_id = None
+            while True:
+                query = self.client.table("products").select("id").eq("business_id", str(business_id))
+                if last_id:
+                    query = query.gt("id", last_id)
+                response = query.order("id").limit(self.REBUILD_CHUNK_SIZE).execute()
+
+                chunk = [row["id"] for row in response.data or []]
+                if not chunk:
+                    return True
+
+                self._rebuild_stock_level_chunk(business_id, chunk, location_id)
+                if len(chunk) < self.REBUILD_CHUNK_SIZE:
+                    return True
+                last_id = chunk[-1]
             
         except Exception as e:
             raise DatabaseError(f"Failed to rebuild stock levels: {str(e)}")
+
+    def _rebuild_stock_level_chunk(
+        self,
+        business_id: uuid.UUID,
+        product_ids: List[str],
+        location_id: Optional[uuid.UUID]
+    ) -> None:
+        """Re-aggregate stock_levels for a chunk of products."""
+        self.client.rpc("rebuild_stock_levels", {
+            "p_business_id": str(business_id),
+            "p_product_ids": product_ids,
+            "p_location_id": str(location_id) if location_id else None
+        }).execute()
     
     async def count_movements(
         self,
@@ -990,6 +1126,7 @@ class SupabaseStockMovementRepository(StockMovementRepository):
             "id": str(movement.id),
             "business_id": str(movement.business_id),
             "product_id": str(movement.product_id),
+            "location_id": str(movement.location_id) if movement.location_id else None,
             "movement_type": movement.movement_type.value,
             "quantity": float(movement.quantity),
             "unit_cost": float(movement.unit_cost) if movement.unit_cost else None,
@@ -1019,6 +1156,7 @@ class SupabaseStockMovementRepository(StockMovementRepository):
             id=uuid.UUID(data["id"]),
             business_id=uuid.UUID(data["business_id"]),
             product_id=uuid.UUID(data["product_id"]),
+            location_id=uuid.UUID(data["location_id"]) if data.get("location_id") else None,
             movement_type=StockMovementType(data["movement_type"]),
             quantity=safe_decimal(data["quantity"], Decimal('0')),
             unit_cost=safe_decimal(data.get("unit_cost")),
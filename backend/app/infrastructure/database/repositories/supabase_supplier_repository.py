@@ -650,15 +650,23 @@ class SupabaseSupplierRepository(SupplierRepository):
         business_id: uuid.UUID,
         supplier_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Import suppliers from data."""
+        """Upsert a chunk of validated supplier rows, matched on supplier code."""
         try:
-            # This would require data validation and batch insertion
-            # For now, returning basic import result
-            return {
-                "imported": 0,
-                "failed": len(supplier_data),
-                "errors": ["Import functionality not yet implemented"]
-            }
+            if not supplier_data:
+                return {"imported": 0, "failed": 0, "errors": []}
+            
+            now = datetime.utcnow().isoformat()
+            rows = [
+                {**row, "business_id": str(business_id), "updated_at": now}
+                for row in supplier_data
+            ]
+            self.client.table(self.table_name).upsert(
+                rows,
+                on_conflict="business_id,supplier_code",
+                returning="minimal"
+            ).execute()
+            
+            return {"imported": len(rows), "failed": 0, "errors": []}
             
         except Exception as e:
             raise DatabaseError(f"Failed to import suppliers: {str(e)}")
@@ -14,7 +14,8 @@ from supabase import AsyncClient
 from app.domain.repositories.user_capabilities_repository import UserCapabilitiesRepository
 from app.domain.entities.user_capabilities import UserCapabilities
 from app.domain.entities.calendar import (
-    CalendarEvent, TimeOffRequest, WorkingHoursTemplate, CalendarPreferences
+    CalendarEvent, TimeOffRequest, WorkingHoursTemplate, CalendarPreferences,
+    CalendarEventType, RecurrenceType
 )
 from app.domain.entities.skills import Skill, Certification
 from app.domain.entities.availability import AvailabilityWindow, WorkloadCapacity
@@ -101,7 +102,10 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
     async def get_by_business_id(self, business_id: uuid.UUID) -> List[UserCapabilities]:
         """Get all user capabilities for a business."""
         try:
-            result = await self.client.table("user_capabilities").select("*").eq("business_id", str(business_id)).eq("is_active", True).execute()
+            # Templates are embedded so a whole team loads in one query
+            result = await self.client.table("user_capabilities").select(
+                "*, working_hours_template:working_hours_templates(*)"
+            ).eq("business_id", str(business_id)).eq("is_active", True).execute()
             
             capabilities_list = []
             for data in result.data:
@@ -208,16 +212,17 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
                 "business_id": str(business_id),
                 "title": event.title,
                 "description": event.description,
-                "event_type": event.event_type.value,
+                "event_type": CalendarEventType(event.event_type).value,
                 "start_datetime": event.start_datetime.isoformat(),
                 "end_datetime": event.end_datetime.isoformat(),
                 "is_all_day": event.is_all_day,
                 "timezone": event.timezone,
-                "recurrence_type": event.recurrence_type.value,
+                "recurrence_type": RecurrenceType(event.recurrence_type).value,
                 "recurrence_end_date": event.recurrence_end_date.isoformat() if event.recurrence_end_date else None,
                 "recurrence_count": event.recurrence_count,
                 "recurrence_interval": event.recurrence_interval,
                 "recurrence_days_of_week": event.recurrence_days_of_week,
+                "recurrence_exception_dates": [d.isoformat() for d in event.recurrence_exception_dates],
                 "blocks_scheduling": event.blocks_scheduling,
                 "allows_emergency_override": event.allows_emergency_override,
                 "is_active": event.is_active
@@ -240,16 +245,17 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
             event_data = {
                 "title": event.title,
                 "description": event.description,
-                "event_type": event.event_type.value,
+                "event_type": CalendarEventType(event.event_type).value,
                 "start_datetime": event.start_datetime.isoformat(),
                 "end_datetime": event.end_datetime.isoformat(),
                 "is_all_day": event.is_all_day,
                 "timezone": event.timezone,
-                "recurrence_type": event.recurrence_type.value,
+                "recurrence_type": RecurrenceType(event.recurrence_type).value,
                 "recurrence_end_date": event.recurrence_end_date.isoformat() if event.recurrence_end_date else None,
                 "recurrence_count": event.recurrence_count,
                 "recurrence_interval": event.recurrence_interval,
                 "recurrence_days_of_week": event.recurrence_days_of_week,
+                "recurrence_exception_dates": [d.isoformat() for d in event.recurrence_exception_dates],
                 "blocks_scheduling": event.blocks_scheduling,
                 "allows_emergency_override": event.allows_emergency_override,
                 "is_active": event.is_active
@@ -277,9 +283,15 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
     
     async def get_calendar_events(self, user_id: str, business_id: uuid.UUID,
                                 start_date: date, end_date: date) -> List[CalendarEvent]:
-        """Get calendar events for a user within date range."""
+        """
+        Get calendar events for a user that can occur within a date range.
+        
+        Includes events overlapping the range and recurring series that started
+        before it and have not ended; expand them to get the occurrences.
+        """
         try:
-            result = await self.client.table("calendar_events").select("*").eq("user_id", user_id).eq("business_id", str(business_id)).gte("start_datetime", start_date.isoformat()).lte("end_datetime", end_date.isoformat()).execute()
+            query = self._calendar_window_query(business_id, start_date, end_date).eq("user_id", user_id)
+            result = await query.execute()
             
             events = []
             for event_data in result.data:
@@ -291,6 +303,29 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
             logger.error(f"Error getting calendar events: {e}")
             return []
     
+    async def get_business_calendar_events(self, business_id: uuid.UUID, start_date: date, end_date: date,
+                                         user_ids: Optional[List[str]] = None) -> List[CalendarEvent]:
+        """Get calendar events of all (or the given) users of a business that can occur within date range."""
+        try:
+            query = self._calendar_window_query(business_id, start_date, end_date)
+            if user_ids is not None:
+                query = query.in_("user_id", user_ids)
+            result = await query.execute()
+            
+            return [self._build_calendar_event_from_data(event_data) for event_data in result.data]
+            
+        except Exception as e:
+            logger.error(f"Error getting business calendar events: {e}")
+            raise DomainValidationError(f"Failed to get calendar events: {e}")
+    
+    def _calendar_window_query(self, business_id: uuid.UUID, start_date: date, end_date: date):
+        """Active events overlapping the range, plus recurring series started before it that have not ended."""
+        range_end = (end_date + timedelta(days=1)).isoformat()
+        return self.client.table("calendar_events").select("*").eq("business_id", str(business_id)).eq("is_active", True).lt("start_datetime", range_end).or_(
+            f"end_datetime.gte.{start_date.isoformat()},"
+            f"and(recurrence_type.neq.none,or(recurrence_end_date.is.null,recurrence_end_date.gte.{start_date.isoformat()}))"
+        )
+    
     async def get_recurring_events(self, user_id: str, business_id: uuid.UUID) -> List[CalendarEvent]:
         """Get all recurring events for a user."""
         try:
@@ -327,7 +362,41 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
     async def get_time_off_requests(self, user_id: str, business_id: uuid.UUID,
                                   status: Optional[str] = None) -> List[TimeOffRequest]:
         """Get time off requests for a user."""
-        pass
+        try:
+            query = self.client.table("time_off_requests").select("*").eq("business_id", str(business_id)).eq("user_id", user_id)
+            if status:
+                query = query.eq("status", status)
+            result = await query.order("start_date").execute()
+            
+            return [self._build_time_off_request_from_data(row) for row in result.data]
+            
+        except Exception as e:
+            logger.error(f"Error getting time off requests: {e}")
+            raise DomainValidationError(f"Failed to get time off requests: {e}")
+    
+    async def get_business_time_off_requests(self, business_id: uuid.UUID, start_date: date, end_date: date,
+                                           status: Optional[str] = None,
+                                           user_ids: Optional[List[str]] = None) -> List[TimeOffRequest]:
+        """Get time off requests of all (or the given) users of a business overlapping date range."""
+        try:
+            query = self.client.table("time_off_requests").select("*").eq("business_id", str(business_id)).lte("start_date", end_date.isoformat()).gte("end_date", start_date.isoformat())
+            if status:
+                query = query.eq("status", status)
+            if user_ids is not None:
+                query = query.in_("user_id", user_ids)
+            result = await query.execute()
+            
+            requests = []
+            for row in result.data:
+                if not row.get("user_id"):
+                    logger.warning(f"Skipping time off request {row.get('id')} with no user id")
+                    continue
+                requests.append(self._build_time_off_request_from_data(row))
+            return requests
+            
+        except Exception as e:
+            logger.error(f"Error getting business time off requests: {e}")
+            raise DomainValidationError(f"Failed to get time off requests: {e}")
     
     async def get_pending_time_off_requests(self, business_id: uuid.UUID) -> List[TimeOffRequest]:
         """Get all pending time off requests for a business."""
@@ -435,7 +504,10 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
         certifications = await self._get_certifications(capabilities_id)
         availability_windows = await self._get_availability_windows(capabilities_id)
         workload_capacity = await self._get_workload_capacity(capabilities_id)
-        working_hours_template = await self._get_working_hours_template(data.get("working_hours_template_id"))
+        if data.get("working_hours_template"):
+            working_hours_template = WorkingHoursTemplate.model_validate(data["working_hours_template"])
+        else:
+            working_hours_template = await self._get_working_hours_template(data.get("working_hours_template_id"))
         
         return UserCapabilities(
             id=capabilities_id,
@@ -517,13 +589,28 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
         """Update workload capacity for user capabilities."""
         pass
     
+    def _build_time_off_request_from_data(self, data: Dict) -> TimeOffRequest:
+        """Build TimeOffRequest from database data."""
+        return TimeOffRequest(
+            id=uuid.UUID(data["id"]),
+            user_id=data["user_id"],
+            business_id=uuid.UUID(data["business_id"]),
+            time_off_type=data["request_type"],
+            start_date=date.fromisoformat(data["start_date"]),
+            end_date=date.fromisoformat(data["end_date"]),
+            reason=data.get("reason"),
+            notes=data.get("notes"),
+            status=data.get("status") or "pending",
+            approved_by=data.get("approved_by"),
+            approval_date=datetime.fromisoformat(data["approved_at"]) if data.get("approved_at") else None
+        )
+    
     def _build_calendar_event_from_data(self, data: Dict) -> CalendarEvent:
         """Build CalendarEvent from database data."""
-        # Basic implementation
-        from app.domain.entities.calendar import CalendarEventType, RecurrenceType
-        
         return CalendarEvent(
             id=uuid.UUID(data["id"]),
+            user_id=data["user_id"],
+            business_id=uuid.UUID(data["business_id"]),
             title=data["title"],
             description=data.get("description"),
             event_type=CalendarEventType(data["event_type"]),
@@ -531,7 +618,12 @@ class SupabaseUserCapabilitiesRepository(UserCapabilitiesRepository):
             end_datetime=datetime.fromisoformat(data["end_datetime"]),
             is_all_day=data.get("is_all_day", False),
             timezone=data.get("timezone", "UTC"),
-            recurrence_type=RecurrenceType(data.get("recurrence_type", "none")),
+            recurrence_type=RecurrenceType(data.get("recurrence_type") or "none"),
+            recurrence_end_date=date.fromisoformat(data["recurrence_end_date"]) if data.get("recurrence_end_date") else None,
+            recurrence_count=data.get("recurrence_count"),
+            recurrence_interval=data.get("recurrence_interval") or 1,
+            recurrence_days_of_week=data.get("recurrence_days_of_week") or [],
+            recurrence_exception_dates=[date.fromisoformat(d) for d in data.get("recurrence_exception_dates") or []],
             blocks_scheduling=data.get("blocks_scheduling", True),
             allows_emergency_override=data.get("allows_emergency_override", False),
             is_active=data.get("is_active", True)
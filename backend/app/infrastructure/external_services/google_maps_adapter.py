@@ -17,9 +17,17 @@ from pydantic import BaseModel, Field
 from ...application.ports.external_services import RouteOptimizationPort, TravelTimePort
 from ...domain.exceptions.domain_exceptions import DomainValidationError
 from ...core.config import settings
+from ..rate_limiting import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Distance Matrix limits: 10 origins/destinations per side per request
+# (100 elements) and an element rate per second across requests
+MATRIX_BATCH_SIZE = 10
+MATRIX_ELEMENTS_PER_SECOND = 1000
+MATRIX_MAX_CONCURRENCY = 8
+REQUEST_TIMEOUT_SECONDS = 10
+
 
 class Location(BaseModel):
     """Location value object for coordinates."""
@@ -60,23 +68,41 @@ class GoogleMapsAdapter:
     scheduling capabilities for Hero365's intelligent scheduling system.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 max_concurrency: int = MATRIX_MAX_CONCURRENCY,
+                 elements_per_second: int = MATRIX_ELEMENTS_PER_SECOND):
         self.api_key = api_key or settings.GOOGLE_MAPS_API_KEY
         self.base_url = "https://maps.googleapis.com/maps/api"
         self.session: Optional[aiohttp.ClientSession] = None
+        # Matrix batches run concurrently but share the provider's element budget
+        self._batch_semaphore = asyncio.Semaphore(max_concurrency)
+        self._element_limiter = TokenBucket(elements_per_second * 60, capacity=elements_per_second)
         
         if not self.api_key:
             logger.warning("Google Maps API key not configured. Real-time optimization will be limited.")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            )
+        return self.session
     
     async def get_travel_time(self, 
                              origin: Location, 
@@ -111,7 +137,7 @@ class GoogleMapsAdapter:
                 "departure_time": self._format_departure_time(departure_time)
             }
             
-            async with self.session.get(url, params=params) as response:
+            async with self._get_session().get(url, params=params) as response:
                 if response.status != 200:
                     logger.error(f"Google Maps API error: {response.status}")
                     return await self._fallback_travel_time(origin, destination)
@@ -159,7 +185,7 @@ class GoogleMapsAdapter:
                 "departure_time": "now"
             }
             
-            async with self.session.get(url, params=params) as response:
+            async with self._get_session().get(url, params=params) as response:
                 if response.status != 200:
                     logger.error(f"Google Directions API error: {response.status}")
                     return await self._fallback_route_optimization(start, end, waypoints)
@@ -174,42 +200,74 @@ class GoogleMapsAdapter:
     async def get_travel_time_matrix(self, 
                                    origins: List[Location],
                                    destinations: List[Location],
-                                   departure_time: Optional[datetime] = None) -> Dict[Tuple[int, int], TravelTimeResult]:
+                                   departure_time: Optional[datetime] = None,
+                                   assume_symmetric: bool = False) -> Dict[Tuple[int, int], TravelTimeResult]:
         """
         Get travel times between multiple origins and destinations.
         
+        Duplicate locations are requested once and a location's distance to
+        itself is zero. The remaining pairs are split into provider-sized
+        batches that run concurrently under the element rate limit; a batch
+        that fails falls back to haversine estimates for its pairs only.
+        
         Args:
             origins: List of starting locations
             destinations: List of destination locations
             departure_time: When trips will start
+            assume_symmetric: Reuse A->B for B->A when origins and destinations
+                are the same set of locations (ignores one-way differences)
             
         Returns:
             Dictionary mapping (origin_index, destination_index) to TravelTimeResult
         """
-        try:
-            if not self.api_key:
-                return await self._fallback_travel_matrix(origins, destinations)
-            
-            # Google Maps API has limits, so batch if necessary
-            results = {}
-            batch_size = 10  # API limit per request
-            
-            for i in range(0, len(origins), batch_size):
-                origin_batch = origins[i:i + batch_size]
+        if not self.api_key:
+            return await self._fallback_travel_matrix(origins, destinations)
+        
+        unique_origins, origin_slots = self._dedupe_locations(origins)
+        unique_destinations, destination_slots = self._dedupe_locations(destinations)
+        origin_keys = [loc.to_string() for loc in unique_origins]
+        destination_keys = [loc.to_string() for loc in unique_destinations]
+        same_set = origin_keys == destination_keys
+        
+        batches = []
+        for i in range(0, len(unique_origins), MATRIX_BATCH_SIZE):
+            for j in range(0, len(unique_destinations), MATRIX_BATCH_SIZE):
+                if assume_symmetric and same_set and j < i:
+                    continue
+                batches.append((i, j))
+        
+        batch_results = await asyncio.gather(*(
+            self._get_matrix_batch_or_fallback(
+                unique_origins[i:i + MATRIX_BATCH_SIZE],
+                unique_destinations[j:j + MATRIX_BATCH_SIZE],
+                departure_time, i, j
+            )
+            for i, j in batches
+        ))
+        unique_results: Dict[Tuple[int, int], TravelTimeResult] = {}
+        for batch in batch_results:
+            unique_results.update(batch)
+        
+        results = {}
+        for origin_index, origin_slot in enumerate(origin_slots):
+            for destination_index, destination_slot in enumerate(destination_slots):
+                if origin_keys[origin_slot] == destination_keys[destination_slot]:
+                    results[(origin_index, destination_index)] = TravelTimeResult(
+                        distance_km=Decimal("0"), duration_minutes=Decimal("0")
+                    )
+                    continue
                 
-                for j in range(0, len(destinations), batch_size):
-                    dest_batch = destinations[j:j + batch_size]
-                    
-                    batch_results = await self._get_matrix_batch(
-                        origin_batch, dest_batch, departure_time, i, j
+                result = unique_results.get((origin_slot, destination_slot))
+                if result is None and assume_symmetric and same_set:
+                    result = unique_results.get((destination_slot, origin_slot))
+                if result is None:
+                    # Element not routable by the provider
+                    result = self._haversine_travel_time(
+                        unique_origins[origin_slot], unique_destinations[destination_slot]
                     )
-                    results.update(batch_results)
-            
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error getting travel time matrix: {str(e)}")
-            return await self._fallback_travel_matrix(origins, destinations)
+                results[(origin_index, destination_index)] = result
+        
+        return results
     
     async def get_traffic_conditions(self, 
                                    location: Location,
@@ -336,8 +394,13 @@ class GoogleMapsAdapter:
             "departure_time": self._format_departure_time(departure_time)
         }
         
-        async with self.session.get(url, params=params) as response:
+        async with self._get_session().get(url, params=params) as response:
+            if response.status != 200:
+                raise DomainValidationError(f"Google Maps API error: {response.status}")
+            
             data = await response.json()
+            if data.get("status") != "OK":
+                raise DomainValidationError(f"Google Maps API error: {data.get('status')}")
             
             results = {}
             for i, row in enumerate(data["rows"]):
@@ -353,8 +416,48 @@ class GoogleMapsAdapter:
             
             return results
     
+    async def _get_matrix_batch_or_fallback(self,
+                                            origins: List[Location],
+                                            destinations: List[Location],
+                                            departure_time: Optional[datetime],
+                                            origin_offset: int,
+                                            dest_offset: int) -> Dict[Tuple[int, int], TravelTimeResult]:
+        """Fetch one matrix batch within the rate limit, or estimate it if the request fails."""
+        try:
+            async with self._batch_semaphore:
+                await self._element_limiter.acquire(len(origins) * len(destinations))
+                return await self._get_matrix_batch(
+                    origins, destinations, departure_time, origin_offset, dest_offset
+                )
+        except Exception as e:
+            logger.error(f"Matrix batch at ({origin_offset}, {dest_offset}) failed, using estimates: {str(e)}")
+            return {
+                (origin_offset + i, dest_offset + j): self._haversine_travel_time(origin, destination)
+                for i, origin in enumerate(origins)
+                for j, destination in enumerate(destinations)
+            }
+    
+    @staticmethod
+    def _dedupe_locations(locations: List[Location]) -> Tuple[List[Location], List[int]]:
+        """Unique locations by coordinates, and each input's index into them."""
+        unique: List[Location] = []
+        positions: Dict[str, int] = {}
+        slots = []
+        for location in locations:
+            key = location.to_string()
+            if key not in positions:
+                positions[key] = len(unique)
+                unique.append(location)
+            slots.append(positions[key])
+        return unique, slots
+    
     async def _fallback_travel_time(self, origin: Location, destination: Location) -> TravelTimeResult:
         """Fallback travel time calculation using Haversine formula."""
+        return self._haversine_travel_time(origin, destination)
+    
+    @staticmethod
+    def _haversine_travel_time(origin: Location, destination: Location) -> TravelTimeResult:
+        """Straight-line travel estimate for when the provider cannot be used."""
         from ...domain.entities.scheduling_engine import TravelTimeCalculation
         
         distance_km = TravelTimeCalculation.calculate_haversine_distance(
@@ -374,83 +477,64 @@ class GoogleMapsAdapter:
                                          start: Location,
                                          end: Location,
                                          waypoints: List[Location]) -> OptimizedRoute:
-        """Fallback route optimization using simple nearest neighbor."""
-        if not waypoints:
-            travel_result = await self._fallback_travel_time(start, end)
-            return OptimizedRoute(
-                total_distance_km=travel_result.distance_km,
-                total_duration_minutes=travel_result.duration_minutes,
-                waypoints_order=[],
-                route_legs=[]
-            )
-        
-        # Simple nearest neighbor optimization
-        current_location = start
-        remaining_waypoints = list(enumerate(waypoints))
-        optimized_order = []
+        """
+        Fallback route optimization on a haversine travel matrix.
+
+        The matrix is built once and the waypoint order is solved locally by
+        the route optimizer, so no external calls are made.
+        """
+        from ...domain.entities.scheduling_engine import TravelTimeCalculation
+        from ...domain.services.route_optimizer import RouteOptimizer, RouteStop, TechnicianShift
+
+        # Nodes: start, waypoints..., end
+        nodes = [start, *waypoints, end]
+        distances = [
+            [
+                TravelTimeCalculation.calculate_haversine_distance(
+                    origin.latitude, origin.longitude, destination.latitude, destination.longitude
+                )
+                for destination in nodes
+            ]
+            for origin in nodes
+        ]
+        durations = [[TravelTimeCalculation.estimate_travel_time(km) for km in row] for row in distances]
+
+        plan = RouteOptimizer([[float(minutes) for minutes in row] for row in durations]).optimize(
+            stops=[RouteStop(stop_id=str(index), node=index + 1) for index in range(len(waypoints))],
+            shifts=[TechnicianShift(technician_id="route", start_node=0, end_node=len(nodes) - 1)]
+        )
+        optimized_order = [int(stop_id) for stop_id in plan.routes[0].stop_ids]
+
+        path = [0, *(index + 1 for index in optimized_order), len(nodes) - 1]
         total_distance = Decimal("0")
         total_duration = Decimal("0")
         route_legs = []
-        
-        while remaining_waypoints:
-            # Find nearest waypoint
-            nearest_idx = 0
-            nearest_distance = float('inf')
-            
-            for i, (orig_idx, waypoint) in enumerate(remaining_waypoints):
-                dist_result = await self._fallback_travel_time(current_location, waypoint)
-                if float(dist_result.distance_km) < nearest_distance:
-                    nearest_distance = float(dist_result.distance_km)
-                    nearest_idx = i
-            
-            # Move to nearest waypoint
-            orig_idx, nearest_waypoint = remaining_waypoints.pop(nearest_idx)
-            optimized_order.append(orig_idx)
-            
-            travel_result = await self._fallback_travel_time(current_location, nearest_waypoint)
-            total_distance += travel_result.distance_km
-            total_duration += travel_result.duration_minutes
-            
+        for origin, destination in zip(path, path[1:]):
+            total_distance += distances[origin][destination]
+            total_duration += durations[origin][destination]
             route_legs.append({
-                "distance_km": float(travel_result.distance_km),
-                "duration_minutes": float(travel_result.duration_minutes),
-                "start_address": f"{current_location.latitude},{current_location.longitude}",
-                "end_address": f"{nearest_waypoint.latitude},{nearest_waypoint.longitude}"
+                "distance_km": float(distances[origin][destination]),
+                "duration_minutes": float(durations[origin][destination]),
+                "start_address": nodes[origin].to_string(),
+                "end_address": nodes[destination].to_string()
             })
-            
-            current_location = nearest_waypoint
-        
-        # Final leg to destination
-        final_travel = await self._fallback_travel_time(current_location, end)
-        total_distance += final_travel.distance_km
-        total_duration += final_travel.duration_minutes
-        
-        route_legs.append({
-            "distance_km": float(final_travel.distance_km),
-            "duration_minutes": float(final_travel.duration_minutes),
-            "start_address": f"{current_location.latitude},{current_location.longitude}",
-            "end_address": f"{end.latitude},{end.longitude}"
-        })
-        
+
         return OptimizedRoute(
             total_distance_km=total_distance,
             total_duration_minutes=total_duration,
             waypoints_order=optimized_order,
-            route_legs=route_legs
+            route_legs=route_legs if waypoints else []
         )
     
     async def _fallback_travel_matrix(self, 
                                     origins: List[Location],
                                     destinations: List[Location]) -> Dict[Tuple[int, int], TravelTimeResult]:
         """Fallback travel matrix using Haversine calculations."""
-        results = {}
-        
-        for i, origin in enumerate(origins):
-            for j, destination in enumerate(destinations):
-                travel_result = await self._fallback_travel_time(origin, destination)
-                results[(i, j)] = travel_result
-        
-        return results
+        return {
+            (i, j): self._haversine_travel_time(origin, destination)
+            for i, origin in enumerate(origins)
+            for j, destination in enumerate(destinations)
+        }
 
 
 # Factory function for dependency injection
@@ -7,8 +7,10 @@ weather impact analysis for intelligent job scheduling.
 
 import asyncio
 import aiohttp
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Hashable, Tuple
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 import json
@@ -21,6 +23,17 @@ from ...core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Coordinates are rounded to this many decimals (~1 km) to share cache entries
+GEOCELL_PRECISION = 2
+# Provider refresh intervals: current conditions every 10 minutes, the
+# 5-day/3-hour forecast every 3 hours
+CURRENT_WEATHER_TTL_SECONDS = 600
+FORECAST_TTL_SECONDS = 3 * 3600
+# Full span of the provider's forecast response
+FORECAST_HORIZON_HOURS = 120
+CACHE_MAX_ENTRIES = 5000
+REQUEST_TIMEOUT_SECONDS = 10
+
 
 class WeatherCondition(Enum):
     """Weather condition categories."""
@@ -83,31 +96,120 @@ class WeatherForecast(BaseModel):
     impact_analysis: WeatherImpact
 
 
+class _TTLCache:
+    """Process-local cache with per-entry TTL expiry and LRU eviction."""
+    
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def geocell(latitude: float, longitude: float) -> Tuple[float, float]:
+    """Round coordinates to the cache grid."""
+    return round(latitude, GEOCELL_PRECISION), round(longitude, GEOCELL_PRECISION)
+
+
+def forecast_hour(value: datetime) -> datetime:
+    """Naive UTC datetime truncated to the hour."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
 class WeatherServiceAdapter:
     """
     Weather service adapter for job scheduling optimization.
     
     Provides weather data and impact analysis to help optimize
     job scheduling based on weather conditions and forecasts.
+    
+    Current conditions and forecasts are cached per geocell for as long as
+    the provider keeps them, and concurrent lookups for the same cell share
+    one request, so repeated scheduling queries rarely reach the API. All
+    requests go through one long-lived HTTP session.
     """
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.WEATHER_API_KEY
         self.base_url = "https://api.openweathermap.org/data/2.5"
         self.session: Optional[aiohttp.ClientSession] = None
+        self._cache = _TTLCache()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
         
         if not self.api_key:
             logger.warning("Weather API key not configured. Weather-based optimization will be limited.")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            )
+        return self.session
+    
+    async def _cached(self, key: Hashable, ttl_seconds: int, load):
+        """
+        Return the cached value for key, or run load() once and cache it.
+        
+        Callers that miss while a load for the same key is running await
+        that load instead of starting another request.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await pending
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value, cacheable = await load()
+            if cacheable:
+                self._cache.set(key, value, ttl_seconds)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
     
     async def get_current_weather(self, latitude: float, longitude: float) -> WeatherData:
         """
@@ -120,10 +222,17 @@ class WeatherServiceAdapter:
         Returns:
             WeatherData with current conditions
         """
+        if not self.api_key:
+            return self._get_default_weather()
+        
+        cell = geocell(latitude, longitude)
+        return await self._cached(
+            ("current", cell), CURRENT_WEATHER_TTL_SECONDS, lambda: self._fetch_current_weather(*cell)
+        )
+    
+    async def _fetch_current_weather(self, latitude: float, longitude: float) -> Tuple[WeatherData, bool]:
+        """Fetch current conditions; the flag tells whether the result may be cached."""
         try:
-            if not self.api_key:
-                return self._get_default_weather()
-            
             url = f"{self.base_url}/weather"
             params = {
                 "lat": latitude,
@@ -132,17 +241,17 @@ class WeatherServiceAdapter:
                 "units": "metric"
             }
             
-            async with self.session.get(url, params=params) as response:
+            async with self._get_session().get(url, params=params) as response:
                 if response.status != 200:
                     logger.error(f"Weather API error: {response.status}")
-                    return self._get_default_weather()
+                    return self._get_default_weather(), False
                 
                 data = await response.json()
-                return self._parse_current_weather(data)
+                return self._parse_current_weather(data), True
                 
         except Exception as e:
             logger.error(f"Error getting current weather: {str(e)}")
-            return self._get_default_weather()
+            return self._get_default_weather(), False
     
     async def get_weather_forecast(self, 
                                  latitude: float, 
@@ -159,10 +268,26 @@ class WeatherServiceAdapter:
         Returns:
             List of WeatherForecast objects
         """
+        if not self.api_key:
+            return self._get_default_forecast(latitude, longitude, hours_ahead)
+        
+        forecasts = await self._get_cell_forecast(latitude, longitude)
+        if not forecasts:
+            return self._get_default_forecast(latitude, longitude, hours_ahead)
+        
+        horizon = datetime.utcnow() + timedelta(hours=hours_ahead)
+        return [forecast for forecast in forecasts if forecast.forecast_time <= horizon]
+    
+    async def _get_cell_forecast(self, latitude: float, longitude: float) -> List[WeatherForecast]:
+        """Full provider forecast for the geocell containing the location."""
+        cell = geocell(latitude, longitude)
+        return await self._cached(
+            ("forecast", cell), FORECAST_TTL_SECONDS, lambda: self._fetch_forecast(*cell)
+        )
+    
+    async def _fetch_forecast(self, latitude: float, longitude: float) -> Tuple[List[WeatherForecast], bool]:
+        """Fetch the full forecast; the flag tells whether the result may be cached."""
         try:
-            if not self.api_key:
-                return self._get_default_forecast(latitude, longitude, hours_ahead)
-            
             url = f"{self.base_url}/forecast"
             params = {
                 "lat": latitude,
@@ -171,17 +296,17 @@ class WeatherServiceAdapter:
                 "units": "metric"
             }
             
-            async with self.session.get(url, params=params) as response:
+            async with self._get_session().get(url, params=params) as response:
                 if response.status != 200:
                     logger.error(f"Weather forecast API error: {response.status}")
-                    return self._get_default_forecast(latitude, longitude, hours_ahead)
+                    return [], False
                 
                 data = await response.json()
-                return self._parse_weather_forecast(data, latitude, longitude, hours_ahead)
+                return self._parse_weather_forecast(data, latitude, longitude, FORECAST_HORIZON_HOURS), True
                 
         except Exception as e:
             logger.error(f"Error getting weather forecast: {str(e)}")
-            return self._get_default_forecast(latitude, longitude, hours_ahead)
+            return [], False
     
     async def get_weather_impact(self, 
                                latitude: float, 
@@ -191,6 +316,8 @@ class WeatherServiceAdapter:
         """
         Analyze weather impact on a specific job.
         
+        Results are memoized per geocell, hour and job type.
+        
         Args:
             latitude: Job location latitude
             longitude: Job location longitude
@@ -201,22 +328,53 @@ class WeatherServiceAdapter:
             WeatherImpact analysis
         """
         try:
+            cell = geocell(latitude, longitude)
+            hour = forecast_hour(scheduled_time)
+            key = ("impact", cell, hour, job_type)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            
             # Get weather data for the scheduled time
-            if scheduled_time <= datetime.utcnow() + timedelta(hours=1):
+            if hour <= datetime.utcnow() + timedelta(hours=1):
                 # Current weather
                 weather_data = await self.get_current_weather(latitude, longitude)
+                source_key, ttl_seconds = ("current", cell), CURRENT_WEATHER_TTL_SECONDS
             else:
                 # Forecast weather
-                forecasts = await self.get_weather_forecast(latitude, longitude, 48)
-                weather_data = self._find_closest_forecast(forecasts, scheduled_time)
+                forecasts = await self._get_cell_forecast(latitude, longitude) if self.api_key else []
+                weather_data = self._find_closest_forecast(forecasts, hour)
+                source_key, ttl_seconds = ("forecast", cell), FORECAST_TTL_SECONDS
             
             # Analyze impact based on job type and weather
-            return self._analyze_weather_impact(weather_data, job_type)
+            impact = self._analyze_weather_impact(weather_data, job_type)
+            # Only memoize impacts derived from real (cached) provider data
+            if self._cache.get(source_key) is not None:
+                self._cache.set(key, impact, ttl_seconds)
+            return impact
             
         except Exception as e:
             logger.error(f"Error analyzing weather impact: {str(e)}")
             return self._get_default_impact()
     
+    async def get_weather_impacts(self,
+                                  requests: List[Tuple[float, float, datetime]],
+                                  job_type: str) -> List[WeatherImpact]:
+        """
+        Analyze weather impact for many (latitude, longitude, time) pairs.
+        
+        Each distinct geocell is fetched at most once, and the cells are
+        fetched concurrently. Results are returned in request order.
+        """
+        if self.api_key:
+            cells = {geocell(latitude, longitude) for latitude, longitude, _ in requests}
+            await asyncio.gather(*(self._get_cell_forecast(*cell) for cell in cells))
+        
+        return list(await asyncio.gather(*(
+            self.get_weather_impact(latitude, longitude, job_type, scheduled_time)
+            for latitude, longitude, scheduled_time in requests
+        )))
+    
     async def get_optimal_weather_window(self,
                                        latitude: float,
                                        longitude: float,
@@ -285,7 +443,7 @@ class WeatherServiceAdapter:
         forecasts = []
         
         for item in data["list"]:
-            forecast_time = datetime.fromtimestamp(item["dt"])
+            forecast_time = datetime.utcfromtimestamp(item["dt"])
             
             # Only include forecasts within our time window
             if forecast_time <= datetime.utcnow() + timedelta(hours=hours_ahead):
@@ -0,0 +1,49 @@
+"""
+Rate Limiting
+
+Shared async rate limiting primitives for calls to external services.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Refills continuously at ``rate_per_minute / 60`` tokens per second up to
+    ``capacity``. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(rate_per_minute)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available and consume them."""
+
+        # A single request larger than the bucket can never be satisfied; cap it
+        # so it waits for a full bucket instead of blocking forever.
+        amount = min(amount, self.capacity)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate_per_second)
@@ -0,0 +1,23 @@
+"""
+Key-Value Stores
+
+Redis-backed stores (with in-memory stand-ins) that implement application
+ports. Kept apart from the provider adapters so importing a store does not
+load any provider SDK.
+"""
+
+from .generation_cache_adapter import (
+    RedisGenerationCache, InMemoryGenerationCache, get_generation_cache
+)
+from .idempotency_store_adapter import (
+    RedisIdempotencyStore, InMemoryIdempotencyStore, get_idempotency_store
+)
+
+__all__ = [
+    "RedisGenerationCache",
+    "InMemoryGenerationCache",
+    "get_generation_cache",
+    "RedisIdempotencyStore",
+    "InMemoryIdempotencyStore",
+    "get_idempotency_store",
+]
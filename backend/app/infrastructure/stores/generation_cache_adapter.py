@@ -0,0 +1,92 @@
+"""
+Generation Cache Adapters
+
+Implementations of GenerationCachePort:
+- RedisGenerationCache persists generations in Redis so they are shared across workers
+- InMemoryGenerationCache is a process-local stand-in for tests and local development
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from redis.asyncio import Redis as AsyncRedis
+
+from ...application.ports.generation_cache_port import GenerationCachePort
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisGenerationCache(GenerationCachePort):
+    """Redis-backed generation cache. Cache failures are logged and treated as misses."""
+
+    def __init__(self, redis_client: Optional[AsyncRedis] = None):
+        self.redis_client = redis_client or AsyncRedis.from_url(settings.REDIS_URL)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            cached = await self.redis_client.get(key)
+            if cached:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"Failed to read generation cache: {e}")
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        try:
+            await self.redis_client.setex(key, ttl_seconds, json.dumps(value, default=str))
+        except Exception as e:
+            logger.warning(f"Failed to write generation cache: {e}")
+
+
+class InMemoryGenerationCache(GenerationCachePort):
+    """Process-local generation cache with TTL expiry and LRU eviction."""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_generation_cache: Optional[GenerationCachePort] = None
+
+
+def get_generation_cache() -> Optional[GenerationCachePort]:
+    """
+    Get the process-wide generation cache for the configured backend.
+
+    Returns:
+        The shared cache, or None when CONTENT_GENERATION_CACHE_BACKEND is "none"
+    """
+
+    global _generation_cache
+
+    if _generation_cache is None:
+        backend = settings.CONTENT_GENERATION_CACHE_BACKEND
+        if backend == "redis":
+            _generation_cache = RedisGenerationCache()
+        elif backend == "memory":
+            _generation_cache = InMemoryGenerationCache()
+
+    return _generation_cache
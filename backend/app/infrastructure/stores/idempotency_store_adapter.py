@@ -0,0 +1,121 @@
+"""
+Idempotency Store Adapters
+
+Implementations of IdempotencyStorePort:
+- RedisIdempotencyStore keeps records in Redis so retries are recognized by any worker
+- InMemoryIdempotencyStore is a process-local stand-in for tests and local development
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from redis.asyncio import Redis as AsyncRedis
+
+from ...application.ports.idempotency_store_port import (
+    IdempotencyStorePort, IDEMPOTENCY_PENDING, IDEMPOTENCY_COMPLETED
+)
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisIdempotencyStore(IdempotencyStorePort):
+    """
+    Redis-backed idempotency store. Store failures are logged and let the
+    request through, as if the key were new.
+    """
+
+    def __init__(self, redis_client: Optional[AsyncRedis] = None):
+        self.redis_client = redis_client or AsyncRedis.from_url(settings.REDIS_URL)
+
+    async def reserve(self, key: str, fingerprint: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
+        pending = json.dumps({"state": IDEMPOTENCY_PENDING, "fingerprint": fingerprint})
+        try:
+            if await self.redis_client.set(key, pending, nx=True, ex=ttl_seconds):
+                return None
+            existing = await self.redis_client.get(key)
+            if existing:
+                return json.loads(existing)
+        except Exception as e:
+            logger.warning(f"Failed to reserve idempotency key: {e}")
+        return None
+
+    async def complete(self, key: str, fingerprint: str, response: Dict[str, Any], ttl_seconds: int) -> None:
+        record = {"state": IDEMPOTENCY_COMPLETED, "fingerprint": fingerprint, "response": response}
+        try:
+            await self.redis_client.setex(key, ttl_seconds, json.dumps(record, default=str))
+        except Exception as e:
+            logger.warning(f"Failed to store idempotent response: {e}")
+
+    async def release(self, key: str) -> None:
+        try:
+            await self.redis_client.delete(key)
+        except Exception as e:
+            logger.warning(f"Failed to release idempotency key: {e}")
+
+
+class InMemoryIdempotencyStore(IdempotencyStorePort):
+    """Process-local idempotency store with TTL expiry and LRU eviction."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, record = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return record
+
+    def _set(self, key: str, record: Dict[str, Any], ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, record)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def reserve(self, key: str, fingerprint: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
+        existing = self._get(key)
+        if existing is not None:
+            return existing
+
+        self._set(key, {"state": IDEMPOTENCY_PENDING, "fingerprint": fingerprint}, ttl_seconds)
+        return None
+
+    async def complete(self, key: str, fingerprint: str, response: Dict[str, Any], ttl_seconds: int) -> None:
+        self._set(key, {"state": IDEMPOTENCY_COMPLETED, "fingerprint": fingerprint, "response": response}, ttl_seconds)
+
+    async def release(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+_idempotency_store: Optional[IdempotencyStorePort] = None
+
+
+def get_idempotency_store() -> Optional[IdempotencyStorePort]:
+    """
+    Get the process-wide idempotency store for the configured backend.
+
+    Returns:
+        The shared store, or None when IDEMPOTENCY_STORE_BACKEND is "none"
+    """
+
+    global _idempotency_store
+
+    if _idempotency_store is None:
+        backend = settings.IDEMPOTENCY_STORE_BACKEND
+        if backend == "redis":
+            _idempotency_store = RedisIdempotencyStore()
+        elif backend == "memory":
+            _idempotency_store = InMemoryIdempotencyStore()
+
+    return _idempotency_store
@@ -0,0 +1,272 @@
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+import pytest
+
+from app.domain.entities.calendar import CalendarEvent, RecurrenceType, TimeOffRequest
+from app.domain.services.calendar_occurrences import (
+    BusyIntervalIndex,
+    OccurrenceCache,
+    expand_event,
+    occurrence_dates,
+)
+
+BUSINESS_ID = uuid.uuid4()
+
+
+def make_event(start: datetime, end: datetime, **fields: Any) -> CalendarEvent:
+    return CalendarEvent(
+        user_id="user-1",
+        business_id=BUSINESS_ID,
+        title="Event",
+        start_datetime=start,
+        end_datetime=end,
+        **fields,
+    )
+
+
+def make_time_off(start: date, end: date, status: str = "approved") -> TimeOffRequest:
+    return TimeOffRequest(
+        user_id="user-1",
+        business_id=BUSINESS_ID,
+        time_off_type="vacation",
+        start_date=start,
+        end_date=end,
+        status=status,
+    )
+
+
+def d(month: int, day: int, year: int = 2025) -> date:
+    return date(year, month, day)
+
+
+def dt(month: int, day: int, hour: int = 0, minute: int = 0, year: int = 2025) -> datetime:
+    return datetime(year, month, day, hour, minute)
+
+
+@pytest.mark.parametrize(
+    ("first", "fields", "window", "expected"),
+    [
+        pytest.param(
+            d(1, 3), {}, (d(1, 1), d(1, 5)), [d(1, 3)],
+            id="none-in-window",
+        ),
+        pytest.param(
+            d(1, 1), {}, (d(1, 2), d(1, 9)), [],
+            id="none-outside-window",
+        ),
+        pytest.param(
+            d(1, 1), {"recurrence_type": RecurrenceType.DAILY},
+            (d(1, 3), d(1, 6)), [d(1, 3), d(1, 4), d(1, 5), d(1, 6)],
+            id="daily",
+        ),
+        pytest.param(
+            d(1, 1), {"recurrence_type": RecurrenceType.DAILY, "recurrence_interval": 3},
+            (d(1, 5), d(1, 15)), [d(1, 7), d(1, 10), d(1, 13)],
+            id="daily-every-3-days",
+        ),
+        pytest.param(
+            d(1, 1), {"recurrence_type": RecurrenceType.DAILY, "recurrence_end_date": d(1, 3)},
+            (d(1, 1), d(1, 31)), [d(1, 1), d(1, 2), d(1, 3)],
+            id="daily-end-date-inclusive",
+        ),
+        pytest.param(
+            d(1, 6), {"recurrence_type": RecurrenceType.WEEKLY, "recurrence_days_of_week": [0, 2]},
+            (d(1, 6), d(1, 19)), [d(1, 6), d(1, 8), d(1, 13), d(1, 15)],
+            id="weekly-monday-wednesday",
+        ),
+        pytest.param(
+            d(1, 3),
+            {"recurrence_type": RecurrenceType.WEEKLY, "recurrence_days_of_week": [4], "recurrence_interval": 2},
+            (d(1, 1), d(2, 1)), [d(1, 3), d(1, 17), d(1, 31)],
+            id="weekly-every-2-weeks",
+        ),
+        pytest.param(
+            d(1, 7), {"recurrence_type": RecurrenceType.BIWEEKLY},
+            (d(1, 1), d(2, 10)), [d(1, 7), d(1, 21), d(2, 4)],
+            id="biweekly-on-start-weekday",
+        ),
+        pytest.param(
+            d(1, 6),
+            {"recurrence_type": RecurrenceType.CUSTOM, "recurrence_days_of_week": [1, 3], "recurrence_interval": 3},
+            (d(1, 1), d(2, 28)), [d(1, 7), d(1, 9), d(1, 28), d(1, 30), d(2, 18), d(2, 20)],
+            id="custom-every-3-weeks",
+        ),
+        pytest.param(
+            d(1, 15), {"recurrence_type": RecurrenceType.MONTHLY},
+            (d(1, 20), d(4, 30)), [d(2, 15), d(3, 15), d(4, 15)],
+            id="monthly",
+        ),
+        pytest.param(
+            d(1, 10), {"recurrence_type": RecurrenceType.MONTHLY, "recurrence_interval": 2},
+            (d(2, 1), d(6, 30)), [d(3, 10), d(5, 10)],
+            id="monthly-every-2-months",
+        ),
+        pytest.param(
+            d(1, 31), {"recurrence_type": RecurrenceType.MONTHLY},
+            (d(1, 1), d(7, 31)), [d(1, 31), d(3, 31), d(5, 31), d(7, 31)],
+            id="monthly-day-31-skips-short-months",
+        ),
+        pytest.param(
+            d(1, 29, 2024), {"recurrence_type": RecurrenceType.MONTHLY, "recurrence_interval": 12},
+            (d(1, 1, 2024), d(12, 31, 2025)), [d(1, 29, 2024), d(1, 29, 2025)],
+            id="monthly-every-12-months",
+        ),
+        pytest.param(
+            d(2, 29, 2024), {"recurrence_type": RecurrenceType.MONTHLY},
+            (d(2, 1, 2024), d(4, 30, 2024)), [d(2, 29, 2024), d(3, 29, 2024), d(4, 29, 2024)],
+            id="monthly-from-leap-day",
+        ),
+        pytest.param(
+            d(1, 31), {"recurrence_type": RecurrenceType.MONTHLY, "recurrence_count": 3},
+            (d(1, 1), d(12, 31)), [d(1, 31), d(3, 31), d(5, 31)],
+            id="monthly-count-ignores-skipped-months",
+        ),
+        pytest.param(
+            d(1, 1), {"recurrence_type": RecurrenceType.DAILY, "recurrence_count": 5},
+            (d(1, 4), d(1, 10)), [d(1, 4), d(1, 5)],
+            id="count-consumed-before-window",
+        ),
+        pytest.param(
+            d(1, 1), {"recurrence_type": RecurrenceType.DAILY, "recurrence_count": 5},
+            (d(1, 6), d(1, 10)), [],
+            id="count-exhausted-before-window",
+        ),
+        pytest.param(
+            d(1, 6),
+            {"recurrence_type": RecurrenceType.WEEKLY, "recurrence_days_of_week": [0, 3], "recurrence_count": 3},
+            (d(1, 9), d(1, 31)), [d(1, 9), d(1, 13)],
+            id="weekly-count-consumed-before-window",
+        ),
+        pytest.param(
+            d(1, 1),
+            {"recurrence_type": RecurrenceType.DAILY, "recurrence_count": 3, "recurrence_exception_dates": [d(1, 2)]},
+            (d(1, 1), d(1, 10)), [d(1, 1), d(1, 3)],
+            id="count-consumed-by-exception-date",
+        ),
+        pytest.param(
+            d(1, 1),
+            {"recurrence_type": RecurrenceType.DAILY, "recurrence_exception_dates": [d(1, 4)]},
+            (d(1, 3), d(1, 5)), [d(1, 3), d(1, 5)],
+            id="exception-date-skipped",
+        ),
+    ],
+)
+def test_occurrence_dates(
+    first: date, fields: dict[str, Any], window: tuple[date, date], expected: list[date]
+) -> None:
+    start = datetime.combine(first, datetime.min.time()).replace(hour=9)
+    event = make_event(start, start.replace(hour=10), **fields)
+
+    assert list(occurrence_dates(event, *window)) == expected
+
+
+@pytest.mark.parametrize(
+    ("fields", "window", "expected"),
+    [
+        pytest.param(
+            {"recurrence_type": RecurrenceType.DAILY},
+            (dt(1, 3), dt(1, 3, 12)),
+            [(dt(1, 2, 22), dt(1, 3, 2))],
+            id="previous-night-spills-into-window",
+        ),
+        pytest.param(
+            {"recurrence_type": RecurrenceType.DAILY},
+            (dt(1, 3, 1), dt(1, 4, 1)),
+            [(dt(1, 2, 22), dt(1, 3, 2)), (dt(1, 3, 22), dt(1, 4, 2))],
+            id="spill-and-start-in-window",
+        ),
+        pytest.param(
+            {"recurrence_type": RecurrenceType.DAILY},
+            (dt(1, 3, 2), dt(1, 3, 22)),
+            [],
+            id="window-between-occurrences",
+        ),
+        pytest.param(
+            {"recurrence_type": RecurrenceType.DAILY, "recurrence_count": 2},
+            (dt(1, 3), dt(1, 4)),
+            [(dt(1, 2, 22), dt(1, 3, 2))],
+            id="count-stops-after-spilling-occurrence",
+        ),
+        pytest.param(
+            {"recurrence_type": RecurrenceType.DAILY, "recurrence_exception_dates": [d(1, 2)]},
+            (dt(1, 3), dt(1, 3, 12)),
+            [],
+            id="exception-removes-spilling-occurrence",
+        ),
+        pytest.param(
+            {"recurrence_type": RecurrenceType.DAILY, "is_active": False},
+            (dt(1, 1), dt(1, 10)),
+            [],
+            id="inactive",
+        ),
+    ],
+)
+def test_expand_overnight_event(
+    fields: dict[str, Any], window: tuple[datetime, datetime], expected: list[tuple[datetime, datetime]]
+) -> None:
+    event = make_event(dt(1, 1, 22), dt(1, 2, 2), **fields)
+
+    assert expand_event(event, *window) == expected
+
+
+def test_busy_intervals_merge_and_clip_to_window() -> None:
+    index = BusyIntervalIndex(dt(1, 6), dt(1, 7), cache=OccurrenceCache())
+    index.add_events("user-1", [
+        make_event(dt(1, 6, 9), dt(1, 6, 10)),
+        make_event(dt(1, 6, 9, 30), dt(1, 6, 11)),
+        make_event(dt(1, 6, 11), dt(1, 6, 12)),
+        make_event(dt(1, 6, 12), dt(1, 6, 13), blocks_scheduling=False),
+        make_event(dt(1, 6, 14), dt(1, 6, 15)),
+        make_event(dt(1, 6, 23), dt(1, 7, 1)),
+        make_event(dt(1, 5, 20), dt(1, 6, 1)),
+    ])
+
+    assert index.busy("user-1", dt(1, 6), dt(1, 7)) == [
+        (dt(1, 6), dt(1, 6, 1)),
+        (dt(1, 6, 9), dt(1, 6, 12)),
+        (dt(1, 6, 14), dt(1, 6, 15)),
+        (dt(1, 6, 23), dt(1, 7)),
+    ]
+    assert index.busy("user-1", dt(1, 6, 10), dt(1, 6, 14, 30)) == [
+        (dt(1, 6, 10), dt(1, 6, 12)),
+        (dt(1, 6, 14), dt(1, 6, 14, 30)),
+    ]
+    assert index.free("user-1", dt(1, 6, 8), dt(1, 6, 16)) == [
+        (dt(1, 6, 8), dt(1, 6, 9)),
+        (dt(1, 6, 12), dt(1, 6, 14)),
+        (dt(1, 6, 15), dt(1, 6, 16)),
+    ]
+    assert index.is_free("user-1", dt(1, 6, 12), dt(1, 6, 14))
+    assert not index.is_free("user-1", dt(1, 6, 11, 59), dt(1, 6, 12, 30))
+    assert index.free("user-2", dt(1, 6, 8), dt(1, 6, 16)) == [(dt(1, 6, 8), dt(1, 6, 16))]
+
+
+def test_busy_intervals_include_recurring_events_and_approved_time_off() -> None:
+    index = BusyIntervalIndex(dt(1, 6), dt(1, 10), cache=OccurrenceCache())
+    index.add_events("user-1", [
+        make_event(dt(1, 1, 12), dt(1, 1, 13), recurrence_type=RecurrenceType.DAILY),
+        make_event(dt(1, 7, 22), dt(1, 8, 1)),
+    ])
+    index.add_time_off("user-1", [
+        make_time_off(d(1, 8), d(1, 8)),
+        make_time_off(d(1, 9), d(1, 9), status="pending"),
+    ])
+
+    assert index.busy("user-1", dt(1, 6), dt(1, 10)) == [
+        (dt(1, 6, 12), dt(1, 6, 13)),
+        (dt(1, 7, 12), dt(1, 7, 13)),
+        (dt(1, 7, 22), dt(1, 9)),
+        (dt(1, 9, 12), dt(1, 9, 13)),
+    ]
+
+
+def test_busy_intervals_refresh_after_more_events_are_added() -> None:
+    index = BusyIntervalIndex(dt(1, 6), dt(1, 7), cache=OccurrenceCache())
+    index.add_events("user-1", [make_event(dt(1, 6, 9), dt(1, 6, 10))])
+    assert index.busy("user-1", dt(1, 6), dt(1, 7)) == [(dt(1, 6, 9), dt(1, 6, 10))]
+
+    index.add_events("user-1", [make_event(dt(1, 6, 10), dt(1, 6, 11))])
+
+    assert index.busy("user-1", dt(1, 6), dt(1, 7)) == [(dt(1, 6, 9), dt(1, 6, 11))]
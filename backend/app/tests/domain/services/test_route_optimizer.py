@@ -0,0 +1,203 @@
+import random
+
+from app.domain.services.route_optimizer import (
+    RouteOptimizer,
+    RouteStop,
+    TechnicianShift,
+    _RouteSearch,
+)
+
+
+def line_matrix(positions: list[float]) -> list[list[float]]:
+    """Travel minutes between points on a line."""
+    return [[abs(a - b) for b in positions] for a in positions]
+
+
+def test_latest_start_forces_visit_order() -> None:
+    # Nodes: depot at 0, A at 5, B at 10; the shift ends at B
+    travel = line_matrix([0, 5, 10])
+    stops = [
+        RouteStop("a", node=1, service_minutes=5),
+        RouteStop("b", node=2, latest_start=10),
+    ]
+    shift = TechnicianShift("tech", start_node=0, end_node=2)
+
+    plan = RouteOptimizer(travel).optimize(stops, [shift])
+
+    route = plan.routes[0]
+    assert route.stop_ids == ["b", "a"]
+    assert route.service_starts == [10, 15]
+    assert plan.unassigned == []
+
+
+def test_earliest_start_waits_for_window() -> None:
+    travel = line_matrix([0, 5])
+    stops = [RouteStop("a", node=1, earliest_start=30, service_minutes=10)]
+    shift = TechnicianShift("tech", start_node=0, end_node=0)
+
+    plan = RouteOptimizer(travel).optimize(stops, [shift])
+
+    assert plan.routes[0].service_starts == [30]
+    assert plan.routes[0].end_minutes == 45
+    assert plan.routes[0].travel_minutes == 10
+
+
+def test_shift_end_limits_route() -> None:
+    travel = line_matrix([0, 10, 20, 30])
+    stops = [
+        RouteStop("near", node=1),
+        RouteStop("middle", node=2),
+        RouteStop("far", node=3),
+    ]
+    shift = TechnicianShift("tech", start_node=0, end_node=0, shift_end=40)
+
+    plan = RouteOptimizer(travel).optimize(stops, [shift])
+
+    assert sorted(plan.routes[0].stop_ids) == ["middle", "near"]
+    assert plan.routes[0].end_minutes == 40
+    assert plan.unassigned == ["far"]
+
+
+def test_max_stops_limits_route() -> None:
+    travel = line_matrix([0, 1, 2, 3])
+    stops = [RouteStop(f"s{i}", node=i) for i in (1, 2, 3)]
+    shift = TechnicianShift("tech", start_node=0, end_node=0, max_stops=2)
+
+    plan = RouteOptimizer(travel).optimize(stops, [shift])
+
+    assert len(plan.routes[0].stop_ids) == 2
+    assert len(plan.unassigned) == 1
+    assert sorted(plan.routes[0].stop_ids + plan.unassigned) == ["s1", "s2", "s3"]
+
+
+def test_unassigned_stops_are_reported_in_input_order() -> None:
+    travel = line_matrix([0, 5, 50, 60])
+    stops = [
+        RouteStop("late_window", node=2, latest_start=20),
+        RouteStop("ok", node=1),
+        RouteStop("after_shift", node=1, earliest_start=500),
+        RouteStop("too_far", node=3, service_minutes=90),
+    ]
+    shift = TechnicianShift("tech", start_node=0, end_node=0, shift_end=120)
+
+    plan = RouteOptimizer(travel).optimize(stops, [shift])
+
+    assert plan.routes[0].stop_ids == ["ok"]
+    assert plan.unassigned == ["late_window", "after_shift", "too_far"]
+
+
+def test_no_shifts_leaves_everything_unassigned() -> None:
+    travel = line_matrix([0, 5])
+    plan = RouteOptimizer(travel).optimize([RouteStop("a", node=1)], [])
+
+    assert plan.routes == []
+    assert plan.unassigned == ["a"]
+    assert plan.total_travel_minutes == 0
+
+
+def test_relocate_moves_stop_to_closer_technician() -> None:
+    # Technician west is based at 0, east at 100; the stop is at 95
+    travel = line_matrix([0, 100, 95])
+    stops = [RouteStop("job", node=2)]
+    shifts = [
+        TechnicianShift("west", start_node=0, end_node=0),
+        TechnicianShift("east", start_node=1, end_node=1),
+    ]
+    search = _RouteSearch(travel, stops, shifts)
+    search.routes[0] = [0]
+    search.costs[0] = search.cost(0, [0])
+    search.pending.clear()
+
+    assert search.relocate(deadline=float("inf"))
+
+    plan = search.plan()
+    assert plan.routes[0].stop_ids == []
+    assert plan.routes[1].stop_ids == ["job"]
+    assert plan.total_travel_minutes == 10
+
+
+def test_relocate_keeps_stop_when_target_shift_cannot_take_it() -> None:
+    travel = line_matrix([0, 100, 95])
+    stops = [RouteStop("job", node=2)]
+    shifts = [
+        TechnicianShift("west", start_node=0, end_node=0),
+        TechnicianShift("east", start_node=1, end_node=1, max_stops=0),
+    ]
+    search = _RouteSearch(travel, stops, shifts)
+    search.routes[0] = [0]
+    search.costs[0] = search.cost(0, [0])
+    search.pending.clear()
+
+    assert not search.relocate(deadline=float("inf"))
+    assert search.routes == [[0], []]
+
+
+def test_stops_go_to_nearest_technician() -> None:
+    travel = line_matrix([0, 100, 2, 4, 96, 98])
+    stops = [RouteStop(f"s{node}", node=node) for node in (2, 3, 4, 5)]
+    shifts = [
+        TechnicianShift("west", start_node=0, end_node=0),
+        TechnicianShift("east", start_node=1, end_node=1),
+    ]
+
+    plan = RouteOptimizer(travel).optimize(stops, shifts)
+
+    assert sorted(plan.routes[0].stop_ids) == ["s2", "s3"]
+    assert sorted(plan.routes[1].stop_ids) == ["s4", "s5"]
+    assert plan.total_travel_minutes == 16
+
+
+def _random_instance(seed: int) -> tuple[list[list[float]], list[RouteStop], list[TechnicianShift]]:
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 60), rng.uniform(0, 60)) for _ in range(33)]
+    travel = [
+        [round(abs(ax - bx) + abs(ay - by), 1) for bx, by in points]
+        for ax, ay in points
+    ]
+    stops = []
+    for node in range(3, len(points)):
+        earliest = rng.choice([None, rng.uniform(0, 200)])
+        latest = earliest + 120 if earliest is not None else rng.choice([None, rng.uniform(60, 400)])
+        stops.append(RouteStop(
+            f"job-{node}",
+            node=node,
+            service_minutes=rng.choice([15, 30, 45]),
+            earliest_start=earliest,
+            latest_start=latest,
+        ))
+    shifts = [
+        TechnicianShift(f"tech-{i}", start_node=i, end_node=i, shift_end=480, max_stops=8)
+        for i in range(3)
+    ]
+    return travel, stops, shifts
+
+
+def test_repeated_runs_return_identical_plans() -> None:
+    travel, stops, shifts = _random_instance(seed=7)
+
+    plans = [
+        RouteOptimizer(travel, time_budget_seconds=60).optimize(stops, shifts)
+        for _ in range(3)
+    ]
+
+    assert plans[0] == plans[1] == plans[2]
+
+
+def test_plan_respects_every_constraint() -> None:
+    travel, stops, shifts = _random_instance(seed=11)
+    by_id = {stop.stop_id: stop for stop in stops}
+
+    plan = RouteOptimizer(travel, time_budget_seconds=60).optimize(stops, shifts)
+
+    planned = [stop_id for route in plan.routes for stop_id in route.stop_ids]
+    assert sorted(planned + plan.unassigned) == sorted(by_id)
+    for route, shift in zip(plan.routes, shifts):
+        assert len(route.stop_ids) <= shift.max_stops
+        assert route.end_minutes <= shift.shift_end
+        for stop_id, start in zip(route.stop_ids, route.service_starts):
+            stop = by_id[stop_id]
+            if stop.earliest_start is not None:
+                assert start >= stop.earliest_start
+            if stop.latest_start is not None:
+                assert start <= stop.latest_start + 1e-9
+    assert plan.total_travel_minutes == sum(route.travel_minutes for route in plan.routes)
@@ -0,0 +1,126 @@
+"""
+Request mapping and error translation for the inventory RPC.
+
+Row locking and the all-or-nothing guards live in the apply_inventory_changes
+SQL function; these tests only cover what the repository sends to it and how
+it reads the reply.
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+from typing import Any, Optional
+
+import pytest
+
+from app.domain.exceptions.domain_exceptions import DatabaseError
+from app.infrastructure.database.repositories.supabase_product_repository import (
+    SupabaseProductRepository,
+)
+
+
+class _Response:
+    def __init__(self, data: list[dict[str, Any]]) -> None:
+        self.data = data
+
+
+class _RpcCall:
+    def __init__(self, client: "RecordingClient") -> None:
+        self.client = client
+
+    def execute(self) -> _Response:
+        if self.client.error:
+            raise self.client.error
+        return _Response(self.client.rows)
+
+
+class RecordingClient:
+    """Fake client recording RPC calls and replying with canned rows."""
+
+    def __init__(self, rows: Optional[list[dict[str, Any]]] = None, error: Optional[Exception] = None) -> None:
+        self.rows = rows or []
+        self.error = error
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def rpc(self, name: str, params: dict[str, Any]) -> _RpcCall:
+        self.calls.append((name, params))
+        return _RpcCall(self)
+
+
+def test_update_quantity_sends_an_adjust_line() -> None:
+    business_id = uuid.uuid4()
+    product_id = uuid.uuid4()
+    client = RecordingClient(rows=[{"product_id": str(product_id)}])
+    repository = SupabaseProductRepository(client)
+
+    assert asyncio.run(repository.update_quantity(business_id, product_id, Decimal("-2.5")))
+    assert client.calls == [(
+        "apply_inventory_changes",
+        {
+            "p_business_id": str(business_id),
+            "p_operation": "adjust",
+            "p_lines": [{"product_id": str(product_id), "quantity": "-2.5"}],
+        },
+    )]
+
+
+def test_reserve_quantities_sends_every_line_in_one_call() -> None:
+    business_id = uuid.uuid4()
+    first_id = uuid.uuid4()
+    second_id = uuid.uuid4()
+    client = RecordingClient(rows=[{"product_id": str(first_id)}, {"product_id": str(second_id)}])
+    repository = SupabaseProductRepository(client)
+
+    assert asyncio.run(repository.reserve_quantities(
+        business_id, {first_id: Decimal("2"), second_id: Decimal("1")}
+    ))
+    assert len(client.calls) == 1
+    name, params = client.calls[0]
+    assert name == "apply_inventory_changes"
+    assert params["p_operation"] == "reserve"
+    assert params["p_lines"] == [
+        {"product_id": str(first_id), "quantity": "2"},
+        {"product_id": str(second_id), "quantity": "1"},
+    ]
+
+
+def test_release_reservation_uses_the_release_operation() -> None:
+    product_id = uuid.uuid4()
+    client = RecordingClient(rows=[{"product_id": str(product_id)}])
+    repository = SupabaseProductRepository(client)
+
+    assert asyncio.run(repository.release_reservation(uuid.uuid4(), product_id, Decimal("3")))
+    assert client.calls[0][1]["p_operation"] == "release"
+
+
+def test_rejected_change_returns_false() -> None:
+    client = RecordingClient(rows=[])
+    repository = SupabaseProductRepository(client)
+
+    assert not asyncio.run(repository.update_quantity(uuid.uuid4(), uuid.uuid4(), Decimal("-1")))
+
+
+def test_partial_reply_returns_false() -> None:
+    first_id = uuid.uuid4()
+    client = RecordingClient(rows=[{"product_id": str(first_id)}])
+    repository = SupabaseProductRepository(client)
+
+    assert not asyncio.run(repository.reserve_quantities(
+        uuid.uuid4(), {first_id: Decimal("1"), uuid.uuid4(): Decimal("1")}
+    ))
+
+
+def test_empty_change_set_skips_the_rpc() -> None:
+    client = RecordingClient()
+    repository = SupabaseProductRepository(client)
+
+    assert asyncio.run(repository.update_quantities(uuid.uuid4(), {}))
+    assert client.calls == []
+
+
+def test_rpc_errors_are_raised_as_database_errors() -> None:
+    client = RecordingClient(error=RuntimeError("connection reset"))
+    repository = SupabaseProductRepository(client)
+
+    with pytest.raises(DatabaseError, match="Failed to reserve product quantity: connection reset"):
+        asyncio.run(repository.reserve_quantity(uuid.uuid4(), uuid.uuid4(), Decimal("1")))
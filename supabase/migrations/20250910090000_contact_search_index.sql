@@ -0,0 +1,98 @@
+-- Contact search index
+-- Replaces OR-ed ILIKE '%term%' scans with a ranked search backed by
+-- a weighted tsvector (prefix matching), pg_trgm (substring/fuzzy matching)
+-- and a digits-only phone column (so "(512) 555" finds "+15125551234").
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Columns the contact repository reads and writes
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS company_name VARCHAR(255);
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS mobile_phone VARCHAR(20);
+
+-- Generated search columns
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(company_name, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(email, '')), 'C')
+    ) STORED;
+
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (
+        lower(
+            coalesce(first_name, '') || ' ' ||
+            coalesce(last_name, '') || ' ' ||
+            coalesce(company_name, '') || ' ' ||
+            coalesce(email, '')
+        )
+    ) STORED;
+
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS phone_digits TEXT
+    GENERATED ALWAYS AS (
+        regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g') || ' ' ||
+        regexp_replace(coalesce(mobile_phone, ''), '[^0-9]', '', 'g')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_contacts_search_vector ON contacts USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_contacts_search_text_trgm ON contacts USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_contacts_phone_digits_trgm ON contacts USING GIN (phone_digits gin_trgm_ops);
+
+-- Ranked contact search with keyset pagination.
+-- Results are ordered by (search_rank DESC, id DESC); pass the last row's
+-- rank and id as p_after_rank / p_after_id to fetch the next page.
+CREATE OR REPLACE FUNCTION search_contacts_ranked(
+    p_business_id UUID,
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 50,
+    p_after_rank DOUBLE PRECISION DEFAULT NULL,
+    p_after_id UUID DEFAULT NULL,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (contact JSONB, search_rank DOUBLE PRECISION) AS $$
+DECLARE
+    v_text TEXT := lower(trim(coalesce(p_query, '')));
+    v_like TEXT;
+    v_digits TEXT := regexp_replace(coalesce(p_query, ''), '[^0-9]', '', 'g');
+    v_tsquery TSQUERY;
+BEGIN
+    IF v_text = '' THEN
+        RETURN;
+    END IF;
+
+    -- Escape LIKE wildcards typed by the user
+    v_like := '%' || replace(replace(replace(v_text, '\', '\\'), '%', '\%'), '_', '\_') || '%';
+
+    -- Prefix query over each alphanumeric word: "jo smi" -> 'jo':* & 'smi':*
+    SELECT to_tsquery('simple', string_agg(quote_literal(word) || ':*', ' & '))
+    INTO v_tsquery
+    FROM regexp_split_to_table(v_text, '[^[:alnum:]]+') AS word
+    WHERE word <> '';
+
+    RETURN QUERY
+    SELECT ranked.contact, ranked.search_rank
+    FROM (
+        SELECT
+            to_jsonb(c) - 'search_vector' - 'search_text' - 'phone_digits' AS contact,
+            c.id,
+            (
+                coalesce(ts_rank(c.search_vector, v_tsquery), 0)::DOUBLE PRECISION +
+                similarity(c.search_text, v_text)::DOUBLE PRECISION +
+                CASE WHEN length(v_digits) >= 3 AND c.phone_digits LIKE '%' || v_digits || '%'
+                     THEN 1.0 ELSE 0.0 END
+            ) AS search_rank
+        FROM contacts c
+        WHERE c.business_id = p_business_id
+          AND (
+              c.search_vector @@ v_tsquery
+              OR c.search_text LIKE v_like
+              OR c.search_text % v_text
+              OR (length(v_digits) >= 3 AND c.phone_digits LIKE '%' || v_digits || '%')
+          )
+    ) AS ranked
+    WHERE p_after_rank IS NULL
+       OR (ranked.search_rank, ranked.id) < (p_after_rank, p_after_id)
+    ORDER BY ranked.search_rank DESC, ranked.id DESC
+    OFFSET greatest(p_offset, 0)
+    LIMIT greatest(p_limit, 1);
+END;
+$$ LANGUAGE plpgsql STABLE;
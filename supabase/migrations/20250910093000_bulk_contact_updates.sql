@@ -0,0 +1,49 @@
+-- Set-based bulk contact updates
+-- Applies status, priority, assignment and tag changes to many contacts in a
+-- single statement instead of one UPDATE per contact. Columns are the ones the
+-- contact repository writes (status, priority, assigned_to, tags, last_modified).
+
+-- Columns the contact repository reads and writes
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS status VARCHAR(20) DEFAULT 'active';
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS priority VARCHAR(20) DEFAULT 'medium';
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS assigned_to UUID REFERENCES users(id);
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS last_modified TIMESTAMPTZ DEFAULT NOW();
+
+CREATE OR REPLACE FUNCTION bulk_update_contacts(
+    p_business_id UUID,
+    p_contact_ids UUID[],
+    p_status TEXT DEFAULT NULL,
+    p_priority TEXT DEFAULT NULL,
+    p_assigned_to TEXT DEFAULT NULL,
+    p_add_tags TEXT[] DEFAULT NULL,
+    p_remove_tags TEXT[] DEFAULT NULL
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    UPDATE contacts c
+    SET
+        status = coalesce(p_status::VARCHAR, c.status),
+        priority = coalesce(p_priority::VARCHAR, c.priority),
+        assigned_to = coalesce(p_assigned_to::UUID, c.assigned_to),
+        tags = CASE
+            WHEN p_add_tags IS NULL AND p_remove_tags IS NULL THEN c.tags
+            ELSE ARRAY(
+                -- Union existing and new tags, keep first-seen order, drop removed ones
+                SELECT tag
+                FROM unnest(coalesce(c.tags, '{}'::TEXT[]) || coalesce(p_add_tags, '{}'::TEXT[]))
+                     WITH ORDINALITY AS merged(tag, position)
+                WHERE p_remove_tags IS NULL OR NOT (tag = ANY(p_remove_tags))
+                GROUP BY tag
+                ORDER BY min(position)
+            )
+        END,
+        last_modified = NOW()
+    WHERE c.business_id = p_business_id
+      AND c.id = ANY(p_contact_ids);
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$ LANGUAGE plpgsql;
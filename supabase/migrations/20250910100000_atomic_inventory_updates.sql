@@ -0,0 +1,94 @@
+-- Atomic inventory mutations
+-- Stock and reservation changes are applied server-side in one statement per
+-- request instead of read-modify-write from the API, so concurrent updates to
+-- the same product can no longer overwrite each other. Guards keep on-hand
+-- stock from going negative and reservations within available stock.
+
+-- Columns the product repository reads and writes
+ALTER TABLE products ADD COLUMN IF NOT EXISTS reserved_stock DECIMAL(10,2) DEFAULT 0;
+ALTER TABLE products ADD COLUMN IF NOT EXISTS last_inventory_update TIMESTAMPTZ;
+
+-- Apply stock changes to one or more products, all or nothing.
+--   p_operation: 'adjust'  -> current_stock += quantity (negative to consume)
+--                'reserve' -> reserved_stock += quantity
+--                'release' -> reserved_stock -= quantity (floored at zero)
+--   p_lines: [{"product_id": "...", "quantity": 1.5}, ...]; repeated products are summed
+-- Returns the new levels of every changed product, or no rows (and changes
+-- nothing) when a product is missing or any line would break a guard.
+CREATE OR REPLACE FUNCTION apply_inventory_changes(
+    p_business_id UUID,
+    p_operation TEXT,
+    p_lines JSONB
+)
+RETURNS TABLE (product_id UUID, current_stock DECIMAL, reserved_stock DECIMAL) AS $$
+#variable_conflict use_column
+DECLARE
+    v_product_ids UUID[];
+    v_quantities DECIMAL[];
+    v_locked INTEGER;
+    v_violations INTEGER;
+BEGIN
+    IF p_operation NOT IN ('adjust', 'reserve', 'release') THEN
+        RAISE EXCEPTION 'Unknown inventory operation: %', p_operation;
+    END IF;
+
+    SELECT array_agg(changes.product_id ORDER BY changes.product_id),
+           array_agg(changes.quantity ORDER BY changes.product_id)
+    INTO v_product_ids, v_quantities
+    FROM (
+        SELECT (line->>'product_id')::UUID AS product_id, sum((line->>'quantity')::DECIMAL) AS quantity
+        FROM jsonb_array_elements(coalesce(p_lines, '[]'::JSONB)) AS line
+        GROUP BY 1
+    ) AS changes;
+
+    IF v_product_ids IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Lock rows in a stable order so concurrent batches cannot deadlock
+    SELECT count(*) INTO v_locked
+    FROM (
+        SELECT p.id
+        FROM products p
+        WHERE p.business_id = p_business_id
+          AND p.id = ANY(v_product_ids)
+        ORDER BY p.id
+        FOR UPDATE
+    ) AS locked;
+
+    IF v_locked <> cardinality(v_product_ids) THEN
+        RETURN;
+    END IF;
+
+    SELECT count(*) INTO v_violations
+    FROM products p
+    JOIN unnest(v_product_ids, v_quantities) AS ch(product_id, quantity) ON ch.product_id = p.id
+    WHERE CASE p_operation
+            WHEN 'adjust' THEN coalesce(p.current_stock, 0) + ch.quantity < 0
+            WHEN 'reserve' THEN ch.quantity > coalesce(p.current_stock, 0) - coalesce(p.reserved_stock, 0)
+            ELSE FALSE
+          END;
+
+    IF v_violations > 0 THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    UPDATE products p
+    SET
+        current_stock = CASE WHEN p_operation = 'adjust'
+            THEN coalesce(p.current_stock, 0) + ch.quantity
+            ELSE p.current_stock END,
+        reserved_stock = CASE p_operation
+            WHEN 'reserve' THEN coalesce(p.reserved_stock, 0) + ch.quantity
+            WHEN 'release' THEN greatest(coalesce(p.reserved_stock, 0) - ch.quantity, 0)
+            ELSE p.reserved_stock END,
+        last_inventory_update = CASE WHEN p_operation = 'adjust'
+            THEN NOW() ELSE p.last_inventory_update END,
+        updated_at = NOW()
+    FROM unnest(v_product_ids, v_quantities) AS ch(product_id, quantity)
+    WHERE p.id = ch.product_id
+      AND p.business_id = p_business_id
+    RETURNING p.id, p.current_stock::DECIMAL, p.reserved_stock::DECIMAL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,238 @@
+-- Stock level projection
+-- Maintains per-product/per-location balances from the stock_movements ledger
+-- so current stock is a keyed lookup instead of a scan over every movement.
+-- Point-in-time balances start from the latest snapshot at or before the
+-- requested time and replay only the movements after it.
+
+-- Columns the stock movement repository writes (signed quantity, author, location)
+ALTER TABLE stock_movements ADD COLUMN IF NOT EXISTS quantity DECIMAL(12,3);
+ALTER TABLE stock_movements ADD COLUMN IF NOT EXISTS created_by TEXT;
+ALTER TABLE stock_movements ADD COLUMN IF NOT EXISTS location_id UUID;
+
+CREATE INDEX IF NOT EXISTS idx_stock_movements_product_date
+    ON stock_movements(business_id, product_id, movement_date);
+
+-- Running balance per product and location (NULL location = not location-tracked)
+CREATE TABLE IF NOT EXISTS stock_levels (
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    product_id UUID NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    location_id UUID,
+    quantity DECIMAL(14,3) NOT NULL DEFAULT 0,
+    movement_count BIGINT NOT NULL DEFAULT 0,
+    last_movement_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT stock_levels_product_location_unique
+        UNIQUE NULLS NOT DISTINCT (business_id, product_id, location_id)
+);
+
+-- Balances as of snapshot_at, used as replay starting points
+CREATE TABLE IF NOT EXISTS stock_level_snapshots (
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    product_id UUID NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    location_id UUID,
+    snapshot_at TIMESTAMPTZ NOT NULL,
+    quantity DECIMAL(14,3) NOT NULL,
+    CONSTRAINT stock_level_snapshots_unique
+        UNIQUE NULLS NOT DISTINCT (business_id, product_id, location_id, snapshot_at)
+);
+
+CREATE INDEX IF NOT EXISTS idx_stock_level_snapshots_lookup
+    ON stock_level_snapshots(business_id, product_id, snapshot_at DESC);
+
+-- Incremental maintenance: one aggregated upsert per statement, so a batch
+-- insert of N movements touches each (product, location) balance once.
+CREATE OR REPLACE FUNCTION apply_stock_movement_deltas()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO stock_levels AS sl (
+            business_id, product_id, location_id, quantity, movement_count, last_movement_at, updated_at
+        )
+        SELECT business_id, product_id, location_id,
+               sum(coalesce(quantity, 0)), count(*), max(movement_date), NOW()
+        FROM new_rows
+        GROUP BY business_id, product_id, location_id
+        ON CONFLICT (business_id, product_id, location_id) DO UPDATE SET
+            quantity = sl.quantity + EXCLUDED.quantity,
+            movement_count = sl.movement_count + EXCLUDED.movement_count,
+            last_movement_at = greatest(sl.last_movement_at, EXCLUDED.last_movement_at),
+            updated_at = NOW();
+
+        -- A backdated movement invalidates snapshots taken after it
+        DELETE FROM stock_level_snapshots s
+        USING (
+            SELECT business_id, product_id, location_id, min(movement_date) AS first_date
+            FROM new_rows
+            GROUP BY business_id, product_id, location_id
+        ) AS changed
+        WHERE s.business_id = changed.business_id
+          AND s.product_id = changed.product_id
+          AND s.location_id IS NOT DISTINCT FROM changed.location_id
+          AND s.snapshot_at >= changed.first_date;
+    END IF;
+
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        INSERT INTO stock_levels AS sl (
+            business_id, product_id, location_id, quantity, movement_count, updated_at
+        )
+        SELECT business_id, product_id, location_id,
+               -sum(coalesce(quantity, 0)), -count(*), NOW()
+        FROM old_rows
+        GROUP BY business_id, product_id, location_id
+        ON CONFLICT (business_id, product_id, location_id) DO UPDATE SET
+            quantity = sl.quantity + EXCLUDED.quantity,
+            movement_count = sl.movement_count + EXCLUDED.movement_count,
+            updated_at = NOW();
+
+        DELETE FROM stock_level_snapshots s
+        USING (
+            SELECT business_id, product_id, location_id, min(movement_date) AS first_date
+            FROM old_rows
+            GROUP BY business_id, product_id, location_id
+        ) AS changed
+        WHERE s.business_id = changed.business_id
+          AND s.product_id = changed.product_id
+          AND s.location_id IS NOT DISTINCT FROM changed.location_id
+          AND s.snapshot_at >= changed.first_date;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS stock_movements_projection_insert ON stock_movements;
+CREATE TRIGGER stock_movements_projection_insert
+    AFTER INSERT ON stock_movements
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_stock_movement_deltas();
+
+DROP TRIGGER IF EXISTS stock_movements_projection_update ON stock_movements;
+CREATE TRIGGER stock_movements_projection_update
+    AFTER UPDATE ON stock_movements
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_stock_movement_deltas();
+
+DROP TRIGGER IF EXISTS stock_movements_projection_delete ON stock_movements;
+CREATE TRIGGER stock_movements_projection_delete
+    AFTER DELETE ON stock_movements
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_stock_movement_deltas();
+
+-- Recompute balances for a set of products from the ledger in one aggregate
+-- pass. The repository calls this in chunks of product ids so a rebuild of a
+-- large business never runs as a single long statement.
+CREATE OR REPLACE FUNCTION rebuild_stock_levels(
+    p_business_id UUID,
+    p_product_ids UUID[],
+    p_location_id UUID DEFAULT NULL
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_rows INTEGER;
+BEGIN
+    DELETE FROM stock_levels
+    WHERE business_id = p_business_id
+      AND product_id = ANY(p_product_ids)
+      AND (p_location_id IS NULL OR location_id = p_location_id);
+
+    INSERT INTO stock_levels (
+        business_id, product_id, location_id, quantity, movement_count, last_movement_at, updated_at
+    )
+    SELECT business_id, product_id, location_id,
+           sum(coalesce(quantity, 0)), count(*), max(movement_date), NOW()
+    FROM stock_movements
+    WHERE business_id = p_business_id
+      AND product_id = ANY(p_product_ids)
+      AND (p_location_id IS NULL OR location_id = p_location_id)
+    GROUP BY business_id, product_id, location_id;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Balances as of a point in time: latest snapshot at or before p_as_of plus
+-- the movements between that snapshot and p_as_of.
+CREATE OR REPLACE FUNCTION get_stock_levels_at(
+    p_business_id UUID,
+    p_as_of TIMESTAMPTZ,
+    p_product_ids UUID[] DEFAULT NULL,
+    p_location_id UUID DEFAULT NULL
+)
+RETURNS TABLE (product_id UUID, location_id UUID, quantity DECIMAL) AS $$
+    WITH latest AS (
+        SELECT DISTINCT ON (s.product_id, s.location_id)
+               s.product_id, s.location_id, s.snapshot_at, s.quantity
+        FROM stock_level_snapshots s
+        WHERE s.business_id = p_business_id
+          AND s.snapshot_at <= p_as_of
+          AND (p_product_ids IS NULL OR s.product_id = ANY(p_product_ids))
+          AND (p_location_id IS NULL OR s.location_id = p_location_id)
+        ORDER BY s.product_id, s.location_id, s.snapshot_at DESC
+    ),
+    replay AS (
+        SELECT m.product_id, m.location_id, sum(coalesce(m.quantity, 0)) AS quantity
+        FROM stock_movements m
+        LEFT JOIN latest l
+               ON l.product_id = m.product_id
+              AND l.location_id IS NOT DISTINCT FROM m.location_id
+        WHERE m.business_id = p_business_id
+          AND m.movement_date <= p_as_of
+          AND (l.snapshot_at IS NULL OR m.movement_date > l.snapshot_at)
+          AND (p_product_ids IS NULL OR m.product_id = ANY(p_product_ids))
+          AND (p_location_id IS NULL OR m.location_id = p_location_id)
+        GROUP BY m.product_id, m.location_id
+    )
+    SELECT balances.product_id, balances.location_id, sum(balances.quantity)::DECIMAL
+    FROM (
+        SELECT latest.product_id, latest.location_id, latest.quantity FROM latest
+        UNION ALL
+        SELECT replay.product_id, replay.location_id, replay.quantity FROM replay
+    ) AS balances
+    GROUP BY balances.product_id, balances.location_id;
+$$ LANGUAGE sql STABLE;
+
+-- Record balances as of p_as_of for one business (or all when NULL).
+CREATE OR REPLACE FUNCTION snapshot_stock_levels(
+    p_business_id UUID DEFAULT NULL,
+    p_as_of TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_business_id UUID;
+    v_rows INTEGER;
+    v_total INTEGER := 0;
+BEGIN
+    FOR v_business_id IN
+        SELECT DISTINCT sl.business_id FROM stock_levels sl
+        WHERE p_business_id IS NULL OR sl.business_id = p_business_id
+    LOOP
+        INSERT INTO stock_level_snapshots (business_id, product_id, location_id, snapshot_at, quantity)
+        SELECT v_business_id, levels.product_id, levels.location_id, p_as_of, levels.quantity
+        FROM get_stock_levels_at(v_business_id, p_as_of) AS levels
+        ON CONFLICT (business_id, product_id, location_id, snapshot_at) DO UPDATE SET
+            quantity = EXCLUDED.quantity;
+
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        v_total := v_total + v_rows;
+    END LOOP;
+
+    RETURN v_total;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Backfill balances for existing movements
+INSERT INTO stock_levels (business_id, product_id, location_id, quantity, movement_count, last_movement_at, updated_at)
+SELECT business_id, product_id, location_id, sum(coalesce(quantity, 0)), count(*), max(movement_date), NOW()
+FROM stock_movements
+GROUP BY business_id, product_id, location_id
+ON CONFLICT (business_id, product_id, location_id) DO NOTHING;
+
+-- Take a nightly snapshot when pg_cron is available
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule('nightly-stock-level-snapshot', '15 3 * * *', 'SELECT snapshot_stock_levels()');
+    END IF;
+END;
+$$;
@@ -0,0 +1,410 @@
+-- Inventory costing
+-- Keeps a running cost position per product as stock movements arrive, so
+-- weighted-average cost and valuation are lookups instead of replays of the
+-- whole movement history. Products with costing_method = 'fifo' also keep
+-- receipt layers and issue stock from the oldest layer first.
+-- Each movement records the position after it, so an as-of valuation is one
+-- index probe per product starting from the latest valuation snapshot.
+
+-- Columns the product repository reads and writes
+ALTER TABLE products ADD COLUMN IF NOT EXISTS costing_method TEXT DEFAULT 'weighted_average';
+ALTER TABLE products ADD COLUMN IF NOT EXISTS weighted_average_cost DECIMAL(12,4) DEFAULT 0;
+ALTER TABLE products ADD COLUMN IF NOT EXISTS last_cost DECIMAL(12,4) DEFAULT 0;
+ALTER TABLE products ADD COLUMN IF NOT EXISTS category_id UUID REFERENCES product_categories(id);
+
+-- Current cost position per product
+CREATE TABLE IF NOT EXISTS inventory_cost_states (
+    product_id UUID PRIMARY KEY REFERENCES products(id) ON DELETE CASCADE,
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    costing_method TEXT NOT NULL DEFAULT 'weighted_average'
+        CHECK (costing_method IN ('weighted_average', 'fifo')),
+    quantity DECIMAL(14,3) NOT NULL DEFAULT 0,
+    inventory_value DECIMAL(16,4) NOT NULL DEFAULT 0,
+    average_cost DECIMAL(12,4) NOT NULL DEFAULT 0,
+    last_movement_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_inventory_cost_states_business
+    ON inventory_cost_states(business_id);
+
+-- Open receipt layers for FIFO products
+CREATE TABLE IF NOT EXISTS inventory_cost_layers (
+    id BIGSERIAL PRIMARY KEY,
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    product_id UUID NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    movement_id UUID NOT NULL,
+    received_at TIMESTAMPTZ NOT NULL,
+    unit_cost DECIMAL(12,4) NOT NULL,
+    remaining_quantity DECIMAL(14,3) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_inventory_cost_layers_open
+    ON inventory_cost_layers(product_id, received_at, id)
+    WHERE remaining_quantity > 0;
+
+-- Cost position after each movement
+CREATE TABLE IF NOT EXISTS stock_movement_costs (
+    movement_id UUID PRIMARY KEY,
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    product_id UUID NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    movement_date TIMESTAMPTZ NOT NULL,
+    unit_cost DECIMAL(12,4) NOT NULL,
+    cost_of_goods DECIMAL(16,4) NOT NULL DEFAULT 0,
+    quantity_after DECIMAL(14,3) NOT NULL,
+    inventory_value_after DECIMAL(16,4) NOT NULL,
+    average_cost_after DECIMAL(12,4) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_stock_movement_costs_product_date
+    ON stock_movement_costs(product_id, movement_date DESC, movement_id DESC);
+
+-- Valuation as of snapshot_at, used as as-of query starting points
+CREATE TABLE IF NOT EXISTS inventory_valuation_snapshots (
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    product_id UUID NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    snapshot_at TIMESTAMPTZ NOT NULL,
+    quantity DECIMAL(14,3) NOT NULL,
+    average_cost DECIMAL(12,4) NOT NULL,
+    inventory_value DECIMAL(16,4) NOT NULL,
+    CONSTRAINT inventory_valuation_snapshots_unique UNIQUE (product_id, snapshot_at)
+);
+
+CREATE INDEX IF NOT EXISTS idx_inventory_valuation_snapshots_business
+    ON inventory_valuation_snapshots(business_id, snapshot_at);
+
+-- Apply one movement to its product's cost position.
+--   Receipts add value at their unit cost (or total_cost / quantity, falling
+--   back to the current average); issues remove value at the average, or
+--   from the oldest layers for FIFO products.
+CREATE OR REPLACE FUNCTION apply_movement_cost(
+    p_business_id UUID,
+    p_product_id UUID,
+    p_movement_id UUID,
+    p_movement_date TIMESTAMPTZ,
+    p_quantity DECIMAL,
+    p_unit_cost DECIMAL,
+    p_total_cost DECIMAL
+)
+RETURNS VOID AS $$
+DECLARE
+    v_state inventory_cost_states%ROWTYPE;
+    v_quantity DECIMAL := coalesce(p_quantity, 0);
+    v_unit_cost DECIMAL;
+    v_cogs DECIMAL := 0;
+    v_remaining DECIMAL;
+    v_take DECIMAL;
+    v_layer RECORD;
+BEGIN
+    SELECT * INTO v_state
+    FROM inventory_cost_states
+    WHERE product_id = p_product_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        INSERT INTO inventory_cost_states (business_id, product_id, costing_method)
+        SELECT p_business_id, p_product_id,
+               CASE WHEN p.costing_method = 'fifo' THEN 'fifo' ELSE 'weighted_average' END
+        FROM products p
+        WHERE p.id = p_product_id
+        RETURNING * INTO v_state;
+    END IF;
+
+    IF v_quantity > 0 THEN
+        v_unit_cost := coalesce(p_unit_cost, p_total_cost / v_quantity, v_state.average_cost);
+
+        IF v_state.quantity < 0 THEN
+            -- Part of the receipt covers stock that was already issued
+            v_state.inventory_value := greatest(v_state.quantity + v_quantity, 0) * v_unit_cost;
+        ELSE
+            v_state.inventory_value := v_state.inventory_value + v_quantity * v_unit_cost;
+        END IF;
+
+        IF v_state.costing_method = 'fifo' AND v_state.quantity + v_quantity > 0 THEN
+            INSERT INTO inventory_cost_layers (
+                business_id, product_id, movement_id, received_at, unit_cost, remaining_quantity
+            )
+            VALUES (
+                p_business_id, p_product_id, p_movement_id, p_movement_date, v_unit_cost,
+                v_quantity + least(v_state.quantity, 0)
+            );
+        END IF;
+    ELSIF v_quantity < 0 THEN
+        IF v_state.costing_method = 'fifo' THEN
+            v_remaining := -v_quantity;
+            FOR v_layer IN
+                SELECT id, unit_cost, remaining_quantity
+                FROM inventory_cost_layers
+                WHERE product_id = p_product_id AND remaining_quantity > 0
+                ORDER BY received_at, id
+                FOR UPDATE
+            LOOP
+                EXIT WHEN v_remaining <= 0;
+                v_take := least(v_layer.remaining_quantity, v_remaining);
+                UPDATE inventory_cost_layers
+                SET remaining_quantity = remaining_quantity - v_take
+                WHERE id = v_layer.id;
+                v_cogs := v_cogs + v_take * v_layer.unit_cost;
+                v_remaining := v_remaining - v_take;
+            END LOOP;
+            -- Issued beyond the open layers: cost the shortfall at the average
+            v_cogs := v_cogs + v_remaining * v_state.average_cost;
+        ELSE
+            v_cogs := -v_quantity * v_state.average_cost;
+        END IF;
+
+        v_unit_cost := v_cogs / -v_quantity;
+        v_state.inventory_value := v_state.inventory_value - v_cogs;
+    ELSE
+        v_unit_cost := v_state.average_cost;
+    END IF;
+
+    v_state.quantity := v_state.quantity + v_quantity;
+    IF v_state.quantity > 0 THEN
+        v_state.average_cost := round(v_state.inventory_value / v_state.quantity, 4);
+    ELSE
+        v_state.inventory_value := 0;
+    END IF;
+
+    UPDATE inventory_cost_states
+    SET quantity = v_state.quantity,
+        inventory_value = v_state.inventory_value,
+        average_cost = v_state.average_cost,
+        last_movement_at = greatest(coalesce(last_movement_at, p_movement_date), p_movement_date),
+        updated_at = NOW()
+    WHERE product_id = p_product_id;
+
+    INSERT INTO stock_movement_costs (
+        movement_id, business_id, product_id, movement_date, unit_cost, cost_of_goods,
+        quantity_after, inventory_value_after, average_cost_after
+    )
+    VALUES (
+        p_movement_id, p_business_id, p_product_id, p_movement_date, round(v_unit_cost, 4), v_cogs,
+        v_state.quantity, v_state.inventory_value, v_state.average_cost
+    )
+    ON CONFLICT (movement_id) DO UPDATE SET
+        movement_date = EXCLUDED.movement_date,
+        unit_cost = EXCLUDED.unit_cost,
+        cost_of_goods = EXCLUDED.cost_of_goods,
+        quantity_after = EXCLUDED.quantity_after,
+        inventory_value_after = EXCLUDED.inventory_value_after,
+        average_cost_after = EXCLUDED.average_cost_after;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Replay a product's full movement history. Used for backdated, edited or
+-- deleted movements and after a product's costing method changes.
+-- Valuation snapshots from p_from_date on (all when NULL) are dropped.
+CREATE OR REPLACE FUNCTION recost_product(
+    p_business_id UUID,
+    p_product_id UUID,
+    p_from_date TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS VOID AS $$
+DECLARE
+    v_movement RECORD;
+BEGIN
+    DELETE FROM stock_movement_costs WHERE product_id = p_product_id;
+    DELETE FROM inventory_cost_layers WHERE product_id = p_product_id;
+    DELETE FROM inventory_cost_states WHERE product_id = p_product_id;
+
+    FOR v_movement IN
+        SELECT id, movement_date, quantity, unit_cost, total_cost
+        FROM stock_movements
+        WHERE business_id = p_business_id AND product_id = p_product_id
+        ORDER BY movement_date, id
+    LOOP
+        PERFORM apply_movement_cost(
+            p_business_id, p_product_id, v_movement.id, v_movement.movement_date,
+            v_movement.quantity, v_movement.unit_cost, v_movement.total_cost
+        );
+    END LOOP;
+
+    UPDATE products p
+    SET weighted_average_cost = coalesce(s.average_cost, 0)
+    FROM (SELECT p_product_id AS product_id) AS target
+    LEFT JOIN inventory_cost_states s ON s.product_id = target.product_id
+    WHERE p.id = target.product_id;
+
+    DELETE FROM inventory_valuation_snapshots
+    WHERE product_id = p_product_id
+      AND (p_from_date IS NULL OR snapshot_at >= p_from_date);
+END;
+$$ LANGUAGE plpgsql;
+
+-- Cost new movements in date order per product. Appends are applied
+-- incrementally; a batch reaching back before a product's last costed
+-- movement replays that product instead.
+CREATE OR REPLACE FUNCTION cost_stock_movements()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_product RECORD;
+    v_movement RECORD;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR v_product IN
+            SELECT n.business_id, n.product_id, min(n.movement_date) AS first_date, s.last_movement_at
+            FROM new_rows n
+            LEFT JOIN inventory_cost_states s ON s.product_id = n.product_id
+            GROUP BY n.business_id, n.product_id, s.last_movement_at
+            ORDER BY n.product_id
+        LOOP
+            IF v_product.last_movement_at IS NOT NULL AND v_product.first_date < v_product.last_movement_at THEN
+                PERFORM recost_product(v_product.business_id, v_product.product_id, v_product.first_date);
+                CONTINUE;
+            END IF;
+
+            FOR v_movement IN
+                SELECT id, movement_date, quantity, unit_cost, total_cost
+                FROM new_rows
+                WHERE product_id = v_product.product_id
+                ORDER BY movement_date, id
+            LOOP
+                PERFORM apply_movement_cost(
+                    v_product.business_id, v_product.product_id, v_movement.id, v_movement.movement_date,
+                    v_movement.quantity, v_movement.unit_cost, v_movement.total_cost
+                );
+            END LOOP;
+        END LOOP;
+
+        UPDATE products p
+        SET weighted_average_cost = s.average_cost
+        FROM inventory_cost_states s
+        WHERE s.product_id = p.id
+          AND p.id IN (SELECT DISTINCT product_id FROM new_rows);
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Only edits that change cost inputs need a replay
+        FOR v_product IN
+            SELECT changed.business_id, changed.product_id, min(changed.first_date) AS first_date
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            CROSS JOIN LATERAL (
+                VALUES (o.business_id, o.product_id, least(o.movement_date, n.movement_date)),
+                       (n.business_id, n.product_id, least(o.movement_date, n.movement_date))
+            ) AS changed(business_id, product_id, first_date)
+            WHERE (o.product_id, o.movement_date, o.quantity, o.unit_cost, o.total_cost)
+                  IS DISTINCT FROM (n.product_id, n.movement_date, n.quantity, n.unit_cost, n.total_cost)
+            GROUP BY changed.business_id, changed.product_id
+        LOOP
+            PERFORM recost_product(v_product.business_id, v_product.product_id, v_product.first_date);
+        END LOOP;
+    ELSE
+        FOR v_product IN
+            SELECT business_id, product_id, min(movement_date) AS first_date
+            FROM old_rows
+            GROUP BY business_id, product_id
+        LOOP
+            PERFORM recost_product(v_product.business_id, v_product.product_id, v_product.first_date);
+        END LOOP;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Valuation per product, current (p_as_of NULL) or as of a point in time.
+-- As-of values come from the last costed movement after the latest snapshot,
+-- or the snapshot itself when nothing moved since.
+CREATE OR REPLACE FUNCTION get_inventory_valuation(
+    p_business_id UUID,
+    p_as_of TIMESTAMPTZ DEFAULT NULL,
+    p_product_ids UUID[] DEFAULT NULL,
+    p_category_id UUID DEFAULT NULL
+)
+RETURNS TABLE (product_id UUID, quantity DECIMAL, average_cost DECIMAL, inventory_value DECIMAL) AS $$
+    SELECT s.product_id,
+           CASE WHEN p_as_of IS NULL THEN s.quantity
+                ELSE coalesce(last_cost.quantity_after, snap.quantity, 0) END,
+           CASE WHEN p_as_of IS NULL THEN s.average_cost
+                ELSE coalesce(last_cost.average_cost_after, snap.average_cost, 0) END,
+           CASE WHEN p_as_of IS NULL THEN s.inventory_value
+                ELSE coalesce(last_cost.inventory_value_after, snap.inventory_value, 0) END
+    FROM inventory_cost_states s
+    JOIN products p ON p.id = s.product_id
+    LEFT JOIN LATERAL (
+        SELECT vs.snapshot_at, vs.quantity, vs.average_cost, vs.inventory_value
+        FROM inventory_valuation_snapshots vs
+        WHERE vs.product_id = s.product_id
+          AND vs.snapshot_at <= p_as_of
+        ORDER BY vs.snapshot_at DESC
+        LIMIT 1
+    ) AS snap ON p_as_of IS NOT NULL
+    LEFT JOIN LATERAL (
+        SELECT c.quantity_after, c.average_cost_after, c.inventory_value_after
+        FROM stock_movement_costs c
+        WHERE c.product_id = s.product_id
+          AND c.movement_date <= p_as_of
+          AND (snap.snapshot_at IS NULL OR c.movement_date > snap.snapshot_at)
+        ORDER BY c.movement_date DESC, c.movement_id DESC
+        LIMIT 1
+    ) AS last_cost ON p_as_of IS NOT NULL
+    WHERE s.business_id = p_business_id
+      AND (p_product_ids IS NULL OR s.product_id = ANY(p_product_ids))
+      AND (p_category_id IS NULL OR p.category_id = p_category_id);
+$$ LANGUAGE sql STABLE;
+
+-- Record valuations as of p_as_of for one business (or all when NULL).
+CREATE OR REPLACE FUNCTION snapshot_inventory_valuation(
+    p_business_id UUID DEFAULT NULL,
+    p_as_of TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_rows INTEGER;
+BEGIN
+    INSERT INTO inventory_valuation_snapshots (
+        business_id, product_id, snapshot_at, quantity, average_cost, inventory_value
+    )
+    SELECT b.business_id, v.product_id, p_as_of, v.quantity, v.average_cost, v.inventory_value
+    FROM (
+        SELECT DISTINCT business_id FROM inventory_cost_states
+        WHERE p_business_id IS NULL OR business_id = p_business_id
+    ) AS b
+    CROSS JOIN LATERAL get_inventory_valuation(b.business_id, p_as_of) AS v
+    ON CONFLICT (product_id, snapshot_at) DO UPDATE SET
+        quantity = EXCLUDED.quantity,
+        average_cost = EXCLUDED.average_cost,
+        inventory_value = EXCLUDED.inventory_value;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Cost existing movements
+DO $$
+DECLARE
+    v_product RECORD;
+BEGIN
+    FOR v_product IN SELECT DISTINCT business_id, product_id FROM stock_movements LOOP
+        PERFORM recost_product(v_product.business_id, v_product.product_id);
+    END LOOP;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS stock_movements_costing_insert ON stock_movements;
+CREATE TRIGGER stock_movements_costing_insert
+    AFTER INSERT ON stock_movements
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION cost_stock_movements();
+
+DROP TRIGGER IF EXISTS stock_movements_costing_update ON stock_movements;
+CREATE TRIGGER stock_movements_costing_update
+    AFTER UPDATE ON stock_movements
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION cost_stock_movements();
+
+DROP TRIGGER IF EXISTS stock_movements_costing_delete ON stock_movements;
+CREATE TRIGGER stock_movements_costing_delete
+    AFTER DELETE ON stock_movements
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION cost_stock_movements();
+
+-- Month-end valuation snapshot when pg_cron is available
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule('monthly-inventory-valuation-snapshot', '5 0 1 * *', 'SELECT snapshot_inventory_valuation()');
+    END IF;
+END;
+$$;
@@ -0,0 +1,231 @@
+-- Batched stock movements and purchase order receipts
+-- Records N movements and applies their aggregated per-product stock deltas
+-- in one call, all or nothing. Each call carries a caller-chosen batch id;
+-- repeating a batch id returns 'duplicate' instead of applying it twice, so
+-- retried requests are safe.
+
+ALTER TABLE stock_movements ADD COLUMN IF NOT EXISTS batch_id UUID;
+CREATE INDEX IF NOT EXISTS idx_stock_movements_batch ON stock_movements(batch_id) WHERE batch_id IS NOT NULL;
+
+-- Columns the purchase order repository writes on receipt
+ALTER TABLE purchase_orders ADD COLUMN IF NOT EXISTS received_by TEXT;
+ALTER TABLE purchase_orders ADD COLUMN IF NOT EXISTS received_at TIMESTAMPTZ;
+ALTER TABLE purchase_orders ADD COLUMN IF NOT EXISTS receipt_notes TEXT;
+
+-- Applied batches, keyed by the caller's batch id
+CREATE TABLE IF NOT EXISTS stock_movement_batches (
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    batch_id UUID NOT NULL,
+    source TEXT NOT NULL,
+    movement_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (business_id, batch_id)
+);
+
+-- Record stock movements and apply their stock deltas.
+--   p_movements: rows shaped like the stock movement repository writes them
+--   ({"id", "product_id", "location_id", "movement_type", "quantity", ...})
+-- Returns status 'applied', 'duplicate' (batch already recorded) or
+-- 'insufficient_stock' (a product is missing or would go negative; nothing
+-- is written).
+CREATE OR REPLACE FUNCTION record_stock_movement_batch(
+    p_business_id UUID,
+    p_batch_id UUID,
+    p_movements JSONB
+)
+RETURNS TABLE (status TEXT, movement_count INTEGER) AS $$
+#variable_conflict use_column
+DECLARE
+    v_lines JSONB;
+    v_products INTEGER;
+    v_applied INTEGER;
+    v_count INTEGER := jsonb_array_length(coalesce(p_movements, '[]'::JSONB));
+BEGIN
+    -- Concurrent calls with the same batch id wait here for the first to finish
+    INSERT INTO stock_movement_batches (business_id, batch_id, source, movement_count)
+    VALUES (p_business_id, p_batch_id, 'movements', v_count)
+    ON CONFLICT DO NOTHING;
+
+    IF NOT FOUND THEN
+        RETURN QUERY
+        SELECT 'duplicate'::TEXT, b.movement_count
+        FROM stock_movement_batches b
+        WHERE b.business_id = p_business_id AND b.batch_id = p_batch_id;
+        RETURN;
+    END IF;
+
+    SELECT jsonb_agg(jsonb_build_object('product_id', m.product_id, 'quantity', m.quantity)),
+           count(DISTINCT m.product_id)
+    INTO v_lines, v_products
+    FROM jsonb_to_recordset(coalesce(p_movements, '[]'::JSONB)) AS m(product_id UUID, quantity DECIMAL);
+
+    SELECT count(*) INTO v_applied
+    FROM apply_inventory_changes(p_business_id, 'adjust', v_lines);
+
+    IF v_applied <> v_products THEN
+        DELETE FROM stock_movement_batches
+        WHERE business_id = p_business_id AND batch_id = p_batch_id;
+        RETURN QUERY SELECT 'insufficient_stock'::TEXT, 0;
+        RETURN;
+    END IF;
+
+    INSERT INTO stock_movements (
+        id, business_id, product_id, location_id, movement_type, quantity, unit_cost, total_cost,
+        movement_date, reference_type, reference_id, notes, created_by, batch_id
+    )
+    SELECT coalesce(m.id, gen_random_uuid()), p_business_id, m.product_id, m.location_id, m.movement_type,
+           m.quantity, m.unit_cost, m.total_cost, coalesce(m.movement_date, NOW()), m.reference_type,
+           m.reference_id, m.notes, m.created_by, p_batch_id
+    FROM jsonb_to_recordset(coalesce(p_movements, '[]'::JSONB)) AS m(
+        id UUID, product_id UUID, location_id UUID, movement_type TEXT, quantity DECIMAL,
+        unit_cost DECIMAL, total_cost DECIMAL, movement_date TIMESTAMPTZ, reference_type TEXT,
+        reference_id UUID, notes TEXT, created_by TEXT
+    );
+
+    RETURN QUERY SELECT 'applied'::TEXT, v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Receive purchase order lines: bump received quantities, record one
+-- purchase movement per line, add the stock and update last cost, then
+-- move the order to 'partial' or 'received'.
+--   p_receipts: [{"line_item_id": "...", "quantity_received": 5}, ...]
+-- Returns {"status": ..., "order_status", "items_updated",
+-- "total_received_value", "is_complete"} where status is 'applied',
+-- 'duplicate', 'not_found', 'invalid_status' or 'over_receipt'.
+CREATE OR REPLACE FUNCTION receive_purchase_order_items(
+    p_business_id UUID,
+    p_order_id UUID,
+    p_batch_id UUID,
+    p_receipts JSONB,
+    p_received_by TEXT,
+    p_received_at TIMESTAMPTZ DEFAULT NOW(),
+    p_notes TEXT DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_order_status TEXT;
+    v_items INTEGER;
+    v_value DECIMAL;
+    v_invalid INTEGER;
+    v_complete BOOLEAN;
+BEGIN
+    SELECT po.status INTO v_order_status
+    FROM purchase_orders po
+    WHERE po.id = p_order_id AND po.business_id = p_business_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'not_found');
+    END IF;
+
+    INSERT INTO stock_movement_batches (business_id, batch_id, source, movement_count)
+    VALUES (p_business_id, p_batch_id, 'purchase_order_receipt', jsonb_array_length(coalesce(p_receipts, '[]'::JSONB)))
+    ON CONFLICT DO NOTHING;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'duplicate', 'order_status', v_order_status);
+    END IF;
+
+    IF v_order_status NOT IN ('sent', 'confirmed', 'partial') THEN
+        DELETE FROM stock_movement_batches WHERE business_id = p_business_id AND batch_id = p_batch_id;
+        RETURN jsonb_build_object('status', 'invalid_status', 'order_status', v_order_status);
+    END IF;
+
+    CREATE TEMP TABLE IF NOT EXISTS pg_temp.po_receipt_lines (
+        line_item_id UUID,
+        product_id UUID,
+        quantity DECIMAL,
+        unit_cost DECIMAL
+    ) ON COMMIT DROP;
+    TRUNCATE pg_temp.po_receipt_lines;
+
+    INSERT INTO pg_temp.po_receipt_lines (line_item_id, product_id, quantity, unit_cost)
+    SELECT poi.id, poi.product_id, r.quantity, poi.unit_cost
+    FROM (
+        SELECT (line->>'line_item_id')::UUID AS line_item_id, sum((line->>'quantity_received')::DECIMAL) AS quantity
+        FROM jsonb_array_elements(coalesce(p_receipts, '[]'::JSONB)) AS line
+        GROUP BY 1
+    ) AS r
+    JOIN purchase_order_items poi ON poi.id = r.line_item_id AND poi.purchase_order_id = p_order_id
+    WHERE r.quantity > 0;
+
+    -- The order row lock above serialises receipts, so this check cannot race
+    SELECT count(*) INTO v_invalid
+    FROM purchase_order_items poi
+    JOIN pg_temp.po_receipt_lines l ON l.line_item_id = poi.id
+    WHERE coalesce(poi.quantity_received, 0) + l.quantity > poi.quantity_ordered;
+
+    IF v_invalid > 0 THEN
+        DELETE FROM stock_movement_batches WHERE business_id = p_business_id AND batch_id = p_batch_id;
+        RETURN jsonb_build_object('status', 'over_receipt', 'order_status', v_order_status);
+    END IF;
+
+    UPDATE purchase_order_items poi
+    SET quantity_received = coalesce(poi.quantity_received, 0) + l.quantity
+    FROM pg_temp.po_receipt_lines l
+    WHERE poi.id = l.line_item_id;
+
+    -- Receipts only add stock, so the adjust guard cannot reject them
+    PERFORM apply_inventory_changes(
+        p_business_id,
+        'adjust',
+        (SELECT jsonb_agg(jsonb_build_object('product_id', product_id, 'quantity', quantity))
+         FROM pg_temp.po_receipt_lines WHERE product_id IS NOT NULL)
+    );
+
+    UPDATE products p
+    SET last_cost = l.unit_cost,
+        cost_price = CASE WHEN p.costing_method IN ('standard_cost', 'specific_identification')
+                          THEN l.unit_cost ELSE p.cost_price END
+    FROM (
+        SELECT DISTINCT ON (product_id) product_id, unit_cost
+        FROM pg_temp.po_receipt_lines
+        WHERE product_id IS NOT NULL
+        ORDER BY product_id, line_item_id
+    ) AS l
+    WHERE p.id = l.product_id AND p.business_id = p_business_id;
+
+    INSERT INTO stock_movements (
+        id, business_id, product_id, movement_type, quantity, unit_cost, total_cost,
+        movement_date, reference_type, reference_id, notes, created_by, batch_id
+    )
+    SELECT gen_random_uuid(), p_business_id, l.product_id, 'purchase', l.quantity, l.unit_cost,
+           l.quantity * l.unit_cost, p_received_at, 'purchase_order', p_order_id, p_notes,
+           p_received_by, p_batch_id
+    FROM pg_temp.po_receipt_lines l
+    WHERE l.product_id IS NOT NULL;
+
+    SELECT count(*), coalesce(sum(quantity * unit_cost), 0)
+    INTO v_items, v_value
+    FROM pg_temp.po_receipt_lines;
+
+    SELECT bool_and(coalesce(poi.quantity_received, 0) >= poi.quantity_ordered)
+    INTO v_complete
+    FROM purchase_order_items poi
+    WHERE poi.purchase_order_id = p_order_id;
+
+    v_order_status := CASE WHEN coalesce(v_complete, FALSE) THEN 'received' ELSE 'partial' END;
+
+    UPDATE purchase_orders
+    SET status = v_order_status,
+        received_by = p_received_by,
+        received_at = p_received_at,
+        actual_delivery_date = CASE WHEN v_complete THEN p_received_at::DATE ELSE actual_delivery_date END,
+        receipt_notes = coalesce(p_notes, receipt_notes),
+        updated_at = NOW()
+    WHERE id = p_order_id;
+
+    UPDATE stock_movement_batches
+    SET movement_count = v_items
+    WHERE business_id = p_business_id AND batch_id = p_batch_id;
+
+    RETURN jsonb_build_object(
+        'status', 'applied',
+        'order_status', v_order_status,
+        'items_updated', v_items,
+        'total_received_value', v_value,
+        'is_complete', coalesce(v_complete, FALSE)
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,153 @@
+-- Purchase order analytics
+-- Aggregates procurement spend in the database so dashboards read a few
+-- summary rows instead of every purchase order in the period.
+-- Order-level breakdowns (status, supplier, period) come from one pass over
+-- the business's orders with GROUPING SETS; category and product spend come
+-- from the order lines.
+
+-- Covering index so order-level aggregates are index-only scans
+CREATE INDEX IF NOT EXISTS idx_purchase_orders_business_date_rollup
+    ON purchase_orders(business_id, order_date)
+    INCLUDE (supplier_id, status, total_amount);
+
+-- Purchase order spend analytics.
+--   p_period:   date_trunc unit for the period breakdown (day, week, month, quarter, year)
+--   p_sections: any of 'totals', 'status', 'supplier', 'period', 'category',
+--               'product', 'delivery'; NULL returns all of them
+-- Returns a JSONB object with one key per requested section.
+CREATE OR REPLACE FUNCTION get_purchase_order_analytics(
+    p_business_id UUID,
+    p_start_date DATE DEFAULT NULL,
+    p_end_date DATE DEFAULT NULL,
+    p_supplier_id UUID DEFAULT NULL,
+    p_period TEXT DEFAULT 'month',
+    p_sections TEXT[] DEFAULT NULL,
+    p_top_products INTEGER DEFAULT 20
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_result JSONB := '{}'::JSONB;
+    v_rollup JSONB;
+BEGIN
+    IF p_period NOT IN ('day', 'week', 'month', 'quarter', 'year') THEN
+        RAISE EXCEPTION 'Unsupported period: %', p_period;
+    END IF;
+
+    IF p_sections IS NULL OR p_sections && ARRAY['totals', 'status', 'supplier', 'period'] THEN
+        WITH orders AS (
+            SELECT po.supplier_id, po.status, po.total_amount,
+                   date_trunc(p_period, po.order_date)::DATE AS period_start
+            FROM purchase_orders po
+            WHERE po.business_id = p_business_id
+              AND (p_start_date IS NULL OR po.order_date >= p_start_date)
+              AND (p_end_date IS NULL OR po.order_date <= p_end_date)
+              AND (p_supplier_id IS NULL OR po.supplier_id = p_supplier_id)
+        ),
+        order_rollup AS (
+            SELECT GROUPING(supplier_id, status, period_start) AS grouping_id,
+                   supplier_id, status, period_start,
+                   count(*) AS order_count,
+                   coalesce(sum(total_amount), 0) AS total_spend
+            FROM orders
+            GROUP BY GROUPING SETS ((), (status), (supplier_id), (period_start))
+        )
+        SELECT jsonb_build_object(
+            -- GROUPING bits are set for columns a row is not grouped by:
+            -- supplier_id = 4, status = 2, period_start = 1
+            'totals', (
+                SELECT jsonb_build_object('order_count', order_count, 'total_spend', total_spend)
+                FROM order_rollup WHERE grouping_id = 7
+            ),
+            'status', coalesce((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'status', status, 'order_count', order_count, 'total_spend', total_spend
+                ) ORDER BY status)
+                FROM order_rollup WHERE grouping_id = 5
+            ), '[]'::JSONB),
+            'supplier', coalesce((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'supplier_id', r.supplier_id, 'supplier_name', s.name,
+                    'order_count', r.order_count, 'total_spend', r.total_spend
+                ) ORDER BY r.total_spend DESC)
+                FROM order_rollup r
+                LEFT JOIN suppliers s ON s.id = r.supplier_id
+                WHERE r.grouping_id = 3
+            ), '[]'::JSONB),
+            'period', coalesce((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'period_start', period_start, 'order_count', order_count, 'total_spend', total_spend
+                ) ORDER BY period_start)
+                FROM order_rollup WHERE grouping_id = 6
+            ), '[]'::JSONB)
+        )
+        INTO v_rollup;
+
+        v_result := v_result || v_rollup;
+    END IF;
+
+    IF p_sections IS NULL OR 'category' = ANY(p_sections) THEN
+        v_result := v_result || jsonb_build_object('category', coalesce((
+            SELECT jsonb_agg(jsonb_build_object(
+                'category_id', spend.category_id, 'category', coalesce(spend.category_name, 'Uncategorized'),
+                'order_count', spend.order_count, 'total_spend', spend.total_spend
+            ) ORDER BY spend.total_spend DESC)
+            FROM (
+                SELECT p.category_id, pc.name AS category_name,
+                       count(DISTINCT po.id) AS order_count,
+                       coalesce(sum(poi.line_total), 0) AS total_spend
+                FROM purchase_orders po
+                JOIN purchase_order_items poi ON poi.purchase_order_id = po.id
+                LEFT JOIN products p ON p.id = poi.product_id
+                LEFT JOIN product_categories pc ON pc.id = p.category_id
+                WHERE po.business_id = p_business_id
+                  AND (p_start_date IS NULL OR po.order_date >= p_start_date)
+                  AND (p_end_date IS NULL OR po.order_date <= p_end_date)
+                  AND (p_supplier_id IS NULL OR po.supplier_id = p_supplier_id)
+                GROUP BY p.category_id, pc.name
+            ) AS spend
+        ), '[]'::JSONB));
+    END IF;
+
+    IF p_sections IS NULL OR 'product' = ANY(p_sections) THEN
+        v_result := v_result || jsonb_build_object('product', coalesce((
+            SELECT jsonb_agg(to_jsonb(spend) ORDER BY spend.total_spend DESC)
+            FROM (
+                SELECT poi.product_id, max(poi.product_name) AS product_name,
+                       sum(poi.quantity_ordered) AS quantity_ordered,
+                       coalesce(sum(poi.line_total), 0) AS total_spend,
+                       count(DISTINCT po.id) AS order_count
+                FROM purchase_orders po
+                JOIN purchase_order_items poi ON poi.purchase_order_id = po.id
+                WHERE po.business_id = p_business_id
+                  AND (p_start_date IS NULL OR po.order_date >= p_start_date)
+                  AND (p_end_date IS NULL OR po.order_date <= p_end_date)
+                  AND (p_supplier_id IS NULL OR po.supplier_id = p_supplier_id)
+                GROUP BY poi.product_id
+                ORDER BY total_spend DESC
+                LIMIT greatest(p_top_products, 1)
+            ) AS spend
+        ), '[]'::JSONB));
+    END IF;
+
+    IF p_sections IS NULL OR 'delivery' = ANY(p_sections) THEN
+        v_result := v_result || jsonb_build_object('delivery', (
+            SELECT jsonb_build_object(
+                'total_orders', count(*),
+                'on_time_deliveries', count(*) FILTER (WHERE po.actual_delivery_date <= po.expected_delivery_date),
+                'late_deliveries', count(*) FILTER (WHERE po.actual_delivery_date > po.expected_delivery_date),
+                'average_delay_days', coalesce(avg(po.actual_delivery_date - po.expected_delivery_date)
+                    FILTER (WHERE po.actual_delivery_date > po.expected_delivery_date), 0)
+            )
+            FROM purchase_orders po
+            WHERE po.business_id = p_business_id
+              AND po.actual_delivery_date IS NOT NULL
+              AND po.expected_delivery_date IS NOT NULL
+              AND (p_start_date IS NULL OR po.order_date >= p_start_date)
+              AND (p_end_date IS NULL OR po.order_date <= p_end_date)
+              AND (p_supplier_id IS NULL OR po.supplier_id = p_supplier_id)
+        ));
+    END IF;
+
+    RETURN v_result;
+END;
+$$ LANGUAGE plpgsql STABLE;
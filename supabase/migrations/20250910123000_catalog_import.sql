@@ -0,0 +1,18 @@
+-- Catalog imports
+-- Supplier and product imports upsert in chunks keyed by supplier code and
+-- SKU. Suppliers already have UNIQUE(business_id, supplier_code); products
+-- need the matching unique index for ON CONFLICT (business_id, sku).
+
+-- Catalog columns the product import writes
+ALTER TABLE products ADD COLUMN IF NOT EXISTS product_type VARCHAR(20) NOT NULL DEFAULT 'product';
+ALTER TABLE products ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'active';
+ALTER TABLE products ADD COLUMN IF NOT EXISTS unit_of_measure VARCHAR(20) NOT NULL DEFAULT 'each';
+ALTER TABLE products ADD COLUMN IF NOT EXISTS barcode VARCHAR(100);
+ALTER TABLE products ADD COLUMN IF NOT EXISTS supplier_sku VARCHAR(100);
+ALTER TABLE products ADD COLUMN IF NOT EXISTS reorder_point DECIMAL(15,3) DEFAULT 0;
+ALTER TABLE products ADD COLUMN IF NOT EXISTS reorder_quantity DECIMAL(15,3) DEFAULT 0;
+ALTER TABLE products ADD COLUMN IF NOT EXISTS tags TEXT[];
+
+-- One product per SKU within a business (NULL SKUs stay unconstrained)
+DROP INDEX IF EXISTS idx_products_sku;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_products_business_sku ON products(business_id, sku);
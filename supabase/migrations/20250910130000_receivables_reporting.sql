@@ -0,0 +1,239 @@
+-- Receivables reporting
+-- AR aging, revenue by period and DSO are aggregated in the database from the
+-- stored invoice totals and the payments table, so month-end reports read a
+-- few summary rows instead of hydrating every invoice with its line items.
+
+-- Invoice totals the application stores with each invoice
+ALTER TABLE invoices ADD COLUMN IF NOT EXISTS amount_paid DECIMAL(12,2) DEFAULT 0;
+ALTER TABLE invoices ADD COLUMN IF NOT EXISTS amount_due DECIMAL(12,2) DEFAULT 0;
+ALTER TABLE invoices ADD COLUMN IF NOT EXISTS currency VARCHAR(3) DEFAULT 'USD';
+
+-- Payments recorded against invoices
+CREATE TABLE IF NOT EXISTS payments (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    invoice_id UUID NOT NULL REFERENCES invoices(id) ON DELETE CASCADE,
+    amount DECIMAL(12,2) NOT NULL,
+    payment_date TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    payment_method VARCHAR(50) DEFAULT 'cash',
+    payment_status VARCHAR(20) DEFAULT 'completed',
+    reference_number VARCHAR(100),
+    transaction_id VARCHAR(255),
+    notes TEXT,
+    refund_amount DECIMAL(12,2) DEFAULT 0,
+    created_by VARCHAR(255),
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+ALTER TABLE payments ADD COLUMN IF NOT EXISTS payment_status VARCHAR(20) DEFAULT 'completed';
+ALTER TABLE payments ADD COLUMN IF NOT EXISTS refund_amount DECIMAL(12,2) DEFAULT 0;
+
+-- Invoices that can carry a receivable balance, by due date for aging.
+-- Paid invoices stay in: they were open on any date before their last payment.
+CREATE INDEX IF NOT EXISTS idx_invoices_business_receivable_due
+    ON invoices(business_id, due_date)
+    INCLUDE (contact_id, issue_date, total_amount)
+    WHERE status NOT IN ('draft', 'cancelled', 'refunded');
+
+-- Invoiced revenue by issue date
+CREATE INDEX IF NOT EXISTS idx_invoices_business_issue_date
+    ON invoices(business_id, issue_date)
+    INCLUDE (status, total_amount);
+
+CREATE INDEX IF NOT EXISTS idx_payments_invoice_date
+    ON payments(invoice_id, payment_date)
+    INCLUDE (amount, refund_amount, payment_status);
+
+-- Invoices with a balance outstanding as of a date, one row per invoice.
+-- The balance is the invoice total less completed payments (net of refunds)
+-- made up to p_as_of, the same rule get_revenue_report uses for receivables,
+-- so an invoice paid since then still shows what was owed on p_as_of.
+-- Invoices without a due date age from issue date.
+CREATE OR REPLACE FUNCTION get_receivable_balances(
+    p_business_id UUID,
+    p_as_of DATE DEFAULT CURRENT_DATE,
+    p_contact_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    invoice_number TEXT,
+    status TEXT,
+    contact_id UUID,
+    client_name TEXT,
+    currency TEXT,
+    issue_date DATE,
+    due_date DATE,
+    total_amount NUMERIC,
+    amount_paid NUMERIC,
+    balance NUMERIC,
+    days_past_due INTEGER
+) AS $$
+    SELECT r.*
+    FROM (
+        SELECT i.id, i.invoice_number::TEXT, i.status::TEXT, i.contact_id,
+               coalesce(nullif(i.client_name, ''), nullif(c.company_name, ''),
+                        trim(coalesce(c.first_name, '') || ' ' || coalesce(c.last_name, '')))::TEXT,
+               coalesce(i.currency, 'USD')::TEXT, i.issue_date, i.due_date,
+               coalesce(i.total_amount, 0)::NUMERIC,
+               coalesce(paid.amount, 0)::NUMERIC,
+               (coalesce(i.total_amount, 0) - coalesce(paid.amount, 0))::NUMERIC AS balance,
+               p_as_of - coalesce(i.due_date, i.issue_date, p_as_of)
+        FROM invoices i
+        LEFT JOIN contacts c ON c.id = i.contact_id
+        LEFT JOIN LATERAL (
+            SELECT sum(p.amount - coalesce(p.refund_amount, 0)) AS amount
+            FROM payments p
+            WHERE p.invoice_id = i.id
+              AND coalesce(p.payment_status, 'completed') IN ('completed', 'partially_refunded')
+              AND p.payment_date < p_as_of + 1
+        ) paid ON TRUE
+        WHERE i.business_id = p_business_id
+          AND i.status NOT IN ('draft', 'cancelled', 'refunded')
+          AND coalesce(i.issue_date, p_as_of) <= p_as_of
+          AND (p_contact_id IS NULL OR i.contact_id = p_contact_id)
+    ) r
+    WHERE r.balance > 0;
+$$ LANGUAGE sql STABLE;
+
+-- Receivables aging as of a date.
+-- Balances from get_receivable_balances are bucketed by days past due
+-- (0-30, 31-60, 61-90, 90+). Invoices not yet due fall in the 0-30 bucket.
+--   p_by_contact: also return the buckets per contact, largest balance first
+CREATE OR REPLACE FUNCTION get_receivables_aging(
+    p_business_id UUID,
+    p_as_of DATE DEFAULT CURRENT_DATE,
+    p_contact_id UUID DEFAULT NULL,
+    p_by_contact BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB AS $$
+    WITH bucketed AS (
+        SELECT contact_id, balance,
+               CASE
+                   WHEN days_past_due <= 30 THEN '0_30'
+                   WHEN days_past_due <= 60 THEN '31_60'
+                   WHEN days_past_due <= 90 THEN '61_90'
+                   ELSE '90_plus'
+               END AS bucket
+        FROM get_receivable_balances(p_business_id, p_as_of, p_contact_id)
+    ),
+    totals AS (
+        SELECT count(*) AS invoice_count,
+               coalesce(sum(balance), 0) AS total_outstanding,
+               coalesce(sum(balance) FILTER (WHERE bucket = '0_30'), 0) AS "0_30",
+               coalesce(sum(balance) FILTER (WHERE bucket = '31_60'), 0) AS "31_60",
+               coalesce(sum(balance) FILTER (WHERE bucket = '61_90'), 0) AS "61_90",
+               coalesce(sum(balance) FILTER (WHERE bucket = '90_plus'), 0) AS "90_plus"
+        FROM bucketed
+    ),
+    by_contact AS (
+        SELECT b.contact_id,
+               coalesce(nullif(c.company_name, ''), trim(coalesce(c.first_name, '') || ' ' || coalesce(c.last_name, ''))) AS contact_name,
+               count(*) AS invoice_count,
+               sum(b.balance) AS total_outstanding,
+               coalesce(sum(b.balance) FILTER (WHERE b.bucket = '0_30'), 0) AS "0_30",
+               coalesce(sum(b.balance) FILTER (WHERE b.bucket = '31_60'), 0) AS "31_60",
+               coalesce(sum(b.balance) FILTER (WHERE b.bucket = '61_90'), 0) AS "61_90",
+               coalesce(sum(b.balance) FILTER (WHERE b.bucket = '90_plus'), 0) AS "90_plus"
+        FROM bucketed b
+        LEFT JOIN contacts c ON c.id = b.contact_id
+        WHERE p_by_contact
+        GROUP BY b.contact_id, c.company_name, c.first_name, c.last_name
+    )
+    SELECT jsonb_build_object(
+        'as_of', p_as_of,
+        'totals', (SELECT to_jsonb(totals) FROM totals),
+        'contacts', coalesce((
+            SELECT jsonb_agg(to_jsonb(by_contact) ORDER BY total_outstanding DESC)
+            FROM by_contact
+        ), '[]'::JSONB)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Revenue by period with days sales outstanding.
+--   p_period: date_trunc unit (day, week, month, quarter, year)
+-- Invoiced revenue is bucketed by issue date, collections by payment date
+-- (completed payments net of refunds). DSO is receivables at p_end_date over
+-- revenue invoiced in the range, times the days in the range.
+CREATE OR REPLACE FUNCTION get_revenue_report(
+    p_business_id UUID,
+    p_start_date DATE,
+    p_end_date DATE,
+    p_period TEXT DEFAULT 'month'
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_periods JSONB;
+    v_invoiced NUMERIC;
+    v_collected NUMERIC;
+    v_receivables NUMERIC;
+BEGIN
+    IF p_period NOT IN ('day', 'week', 'month', 'quarter', 'year') THEN
+        RAISE EXCEPTION 'Unsupported period: %', p_period;
+    END IF;
+
+    WITH invoiced AS (
+        SELECT date_trunc(p_period, i.issue_date)::DATE AS period_start,
+               count(*) AS invoice_count,
+               coalesce(sum(i.total_amount), 0) AS invoiced
+        FROM invoices i
+        WHERE i.business_id = p_business_id
+          AND i.status NOT IN ('draft', 'cancelled')
+          AND i.issue_date BETWEEN p_start_date AND p_end_date
+        GROUP BY 1
+    ),
+    collected AS (
+        SELECT date_trunc(p_period, p.payment_date)::DATE AS period_start,
+               count(*) AS payment_count,
+               coalesce(sum(p.amount - coalesce(p.refund_amount, 0)), 0) AS collected
+        FROM payments p
+        JOIN invoices i ON i.id = p.invoice_id
+        WHERE i.business_id = p_business_id
+          AND coalesce(p.payment_status, 'completed') IN ('completed', 'partially_refunded')
+          AND p.payment_date >= p_start_date
+          AND p.payment_date < p_end_date + 1
+        GROUP BY 1
+    )
+    SELECT coalesce(jsonb_agg(jsonb_build_object(
+               'period_start', period_start,
+               'invoice_count', coalesce(inv.invoice_count, 0),
+               'invoiced', coalesce(inv.invoiced, 0),
+               'payment_count', coalesce(col.payment_count, 0),
+               'collected', coalesce(col.collected, 0)
+           ) ORDER BY period_start), '[]'::JSONB),
+           coalesce(sum(inv.invoiced), 0),
+           coalesce(sum(col.collected), 0)
+    INTO v_periods, v_invoiced, v_collected
+    FROM invoiced inv
+    FULL JOIN collected col USING (period_start);
+
+    -- Receivables at period end: invoiced up to then, less payments made up to then
+    SELECT coalesce(sum(i.total_amount), 0) - coalesce(sum(paid.amount), 0)
+    INTO v_receivables
+    FROM invoices i
+    LEFT JOIN LATERAL (
+        SELECT sum(p.amount - coalesce(p.refund_amount, 0)) AS amount
+        FROM payments p
+        WHERE p.invoice_id = i.id
+          AND coalesce(p.payment_status, 'completed') IN ('completed', 'partially_refunded')
+          AND p.payment_date < p_end_date + 1
+    ) paid ON TRUE
+    WHERE i.business_id = p_business_id
+      AND i.status NOT IN ('draft', 'cancelled')
+      AND i.issue_date <= p_end_date;
+
+    RETURN jsonb_build_object(
+        'start_date', p_start_date,
+        'end_date', p_end_date,
+        'period', p_period,
+        'periods', v_periods,
+        'totals', jsonb_build_object(
+            'invoiced', v_invoiced,
+            'collected', v_collected,
+            'receivables', greatest(v_receivables, 0)
+        ),
+        'dso', CASE
+            WHEN v_invoiced > 0
+                THEN round(greatest(v_receivables, 0) / v_invoiced * (p_end_date - p_start_date + 1), 1)
+            ELSE NULL
+        END
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
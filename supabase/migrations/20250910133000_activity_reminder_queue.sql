@@ -0,0 +1,93 @@
+-- Activity reminder queue
+-- Due reminders are read from a partial index on unsent reminders by due time,
+-- so polling cost follows the number of due reminders rather than the number
+-- of activities. Workers claim disjoint batches with a lease; a reminder whose
+-- worker died becomes claimable again once its lease expires.
+
+CREATE TABLE IF NOT EXISTS activity_reminders (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    activity_id UUID NOT NULL REFERENCES activities(id) ON DELETE CASCADE,
+    reminder_time TIMESTAMPTZ NOT NULL,
+    reminder_type VARCHAR(50) DEFAULT 'notification',
+    message TEXT,
+    is_sent BOOLEAN DEFAULT FALSE,
+    sent_at TIMESTAMPTZ,
+    created_date TIMESTAMPTZ DEFAULT NOW()
+);
+
+ALTER TABLE activity_reminders ADD COLUMN IF NOT EXISTS sent_at TIMESTAMPTZ;
+ALTER TABLE activity_reminders ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(255);
+ALTER TABLE activity_reminders ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMPTZ;
+ALTER TABLE activity_reminders ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_activity_reminders_activity_id
+    ON activity_reminders(activity_id);
+
+DROP INDEX IF EXISTS idx_activity_reminders_pending;
+CREATE INDEX IF NOT EXISTS idx_activity_reminders_due
+    ON activity_reminders(is_sent, reminder_time)
+    INCLUDE (activity_id, claimed_until)
+    WHERE is_sent = FALSE;
+
+-- Claim up to p_limit unsent reminders due by p_due_before.
+-- Rows locked by a concurrent claim are skipped, so parallel workers get
+-- disjoint batches. Claimed rows are leased to p_worker_id for
+-- p_lease_seconds and their attempt count is incremented; reminders that
+-- already had p_max_attempts attempts are left for inspection.
+--   p_business_id: only claim reminders of this business's activities
+CREATE OR REPLACE FUNCTION claim_due_reminders(
+    p_worker_id TEXT,
+    p_due_before TIMESTAMPTZ DEFAULT NOW(),
+    p_limit INTEGER DEFAULT 100,
+    p_lease_seconds INTEGER DEFAULT 300,
+    p_max_attempts INTEGER DEFAULT 4,
+    p_business_id UUID DEFAULT NULL
+)
+RETURNS SETOF activity_reminders AS $$
+    WITH due AS (
+        SELECT r.id
+        FROM activity_reminders r
+        WHERE r.is_sent = FALSE
+          AND r.reminder_time <= p_due_before
+          AND (r.claimed_until IS NULL OR r.claimed_until < NOW())
+          AND r.attempts < p_max_attempts
+          AND (p_business_id IS NULL OR EXISTS (
+              SELECT 1 FROM activities a
+              WHERE a.id = r.activity_id AND a.business_id = p_business_id
+          ))
+        ORDER BY r.reminder_time
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE activity_reminders r
+    SET claimed_by = p_worker_id,
+        claimed_until = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = r.attempts + 1
+    FROM due
+    WHERE r.id = due.id
+    RETURNING r.*;
+$$ LANGUAGE sql VOLATILE;
+
+-- Release reminders leased to p_worker_id, optionally moving them to
+-- p_retry_at. When p_count_attempt is FALSE the attempt taken by the claim
+-- is given back, so deferrals (quiet hours, frequency limits) do not use up
+-- delivery attempts. Returns the number of reminders released.
+CREATE OR REPLACE FUNCTION release_reminders(
+    p_worker_id TEXT,
+    p_reminder_ids UUID[],
+    p_retry_at TIMESTAMPTZ DEFAULT NULL,
+    p_count_attempt BOOLEAN DEFAULT TRUE
+)
+RETURNS INTEGER AS $$
+    WITH released AS (
+        UPDATE activity_reminders r
+        SET claimed_by = NULL,
+            claimed_until = NULL,
+            reminder_time = coalesce(p_retry_at, r.reminder_time),
+            attempts = CASE WHEN p_count_attempt THEN r.attempts ELSE greatest(r.attempts - 1, 0) END
+        WHERE r.id = ANY(p_reminder_ids)
+          AND r.claimed_by = p_worker_id
+        RETURNING r.id
+    )
+    SELECT count(*)::INTEGER FROM released;
+$$ LANGUAGE sql VOLATILE;
@@ -0,0 +1,91 @@
+-- Activity statistics
+-- Dashboard counters, contact summaries and user digests are aggregated in
+-- one grouped query instead of loading every matching activity row.
+
+-- Columns the activity repository reads and writes
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS contact_id UUID REFERENCES contacts(id) ON DELETE CASCADE;
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS priority VARCHAR(20) DEFAULT 'medium';
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS scheduled_date TIMESTAMPTZ;
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS due_date TIMESTAMPTZ;
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS completed_date TIMESTAMPTZ;
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS assigned_to TEXT;
+ALTER TABLE activities ADD COLUMN IF NOT EXISTS created_date TIMESTAMPTZ DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS idx_activities_business_created_stats
+    ON activities(business_id, created_date)
+    INCLUDE (status, activity_type, priority, assigned_to, contact_id);
+
+-- Activity counters for a business, optionally narrowed to an assignee and/or
+-- contact and to activities created in [p_start_date, p_end_date] (scheduled
+-- in that range when p_by_scheduled_date is set).
+--   overdue: open (not completed/cancelled) and past due, or past scheduled
+--            time when there is no due date
+--   upcoming: open and scheduled in the next 7 days
+--   this_week / this_month: scheduled in the current calendar week / month
+--   average_completion_hours: mean time from creation to completion
+--   p_achievements_limit: latest completed high/urgent activities to return
+CREATE OR REPLACE FUNCTION get_activity_statistics(
+    p_business_id UUID,
+    p_start_date TIMESTAMPTZ DEFAULT NULL,
+    p_end_date TIMESTAMPTZ DEFAULT NULL,
+    p_assigned_to TEXT DEFAULT NULL,
+    p_contact_id UUID DEFAULT NULL,
+    p_by_scheduled_date BOOLEAN DEFAULT FALSE,
+    p_achievements_limit INTEGER DEFAULT 0
+)
+RETURNS JSONB AS $$
+    WITH scoped AS (
+        SELECT a.id, a.title, a.status::TEXT AS status, a.activity_type::TEXT AS activity_type,
+               a.priority::TEXT AS priority, a.scheduled_date, a.due_date,
+               a.completed_date, a.created_date,
+               a.status::TEXT NOT IN ('completed', 'cancelled') AS is_open
+        FROM activities a
+        WHERE a.business_id = p_business_id
+          AND (p_start_date IS NULL OR CASE WHEN p_by_scheduled_date
+                                            THEN a.scheduled_date ELSE a.created_date END >= p_start_date)
+          AND (p_end_date IS NULL OR CASE WHEN p_by_scheduled_date
+                                          THEN a.scheduled_date ELSE a.created_date END <= p_end_date)
+          AND (p_assigned_to IS NULL OR a.assigned_to = p_assigned_to)
+          AND (p_contact_id IS NULL OR a.contact_id = p_contact_id)
+    ),
+    counters AS (
+        SELECT count(*) AS total,
+               count(*) FILTER (WHERE is_open AND coalesce(due_date, scheduled_date) < NOW()) AS overdue,
+               count(*) FILTER (WHERE is_open AND scheduled_date >= NOW()
+                                AND scheduled_date < NOW() + INTERVAL '7 days') AS upcoming,
+               count(*) FILTER (WHERE scheduled_date >= date_trunc('week', NOW())
+                                AND scheduled_date < date_trunc('week', NOW()) + INTERVAL '1 week') AS this_week,
+               count(*) FILTER (WHERE scheduled_date >= date_trunc('month', NOW())
+                                AND scheduled_date < date_trunc('month', NOW()) + INTERVAL '1 month') AS this_month,
+               round((avg(extract(EPOCH FROM completed_date - created_date))
+                      FILTER (WHERE status = 'completed' AND completed_date IS NOT NULL) / 3600)::NUMERIC, 2)
+                   AS average_completion_hours,
+               max(completed_date) AS last_completed_date,
+               min(scheduled_date) FILTER (WHERE is_open AND scheduled_date >= NOW()) AS next_scheduled_date
+        FROM scoped
+    )
+    SELECT to_jsonb(counters) || jsonb_build_object(
+        'by_status', coalesce((
+            SELECT jsonb_object_agg(status, n) FROM (SELECT status, count(*) AS n FROM scoped GROUP BY status) s
+        ), '{}'::JSONB),
+        'by_type', coalesce((
+            SELECT jsonb_object_agg(activity_type, n) FROM (SELECT activity_type, count(*) AS n FROM scoped GROUP BY activity_type) t
+        ), '{}'::JSONB),
+        'by_priority', coalesce((
+            SELECT jsonb_object_agg(priority, n) FROM (SELECT priority, count(*) AS n FROM scoped GROUP BY priority) p
+        ), '{}'::JSONB),
+        'recent_achievements', coalesce((
+            SELECT jsonb_agg(jsonb_build_object(
+                       'id', id, 'title', title, 'completed_date', completed_date, 'priority', priority
+                   ) ORDER BY completed_date DESC)
+            FROM (
+                SELECT id, title, completed_date, priority
+                FROM scoped
+                WHERE status = 'completed' AND priority IN ('high', 'urgent')
+                ORDER BY completed_date DESC NULLS LAST
+                LIMIT greatest(p_achievements_limit, 0)
+            ) achievements
+        ), '[]'::JSONB)
+    )
+    FROM counters;
+$$ LANGUAGE sql STABLE;
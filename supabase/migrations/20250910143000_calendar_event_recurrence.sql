@@ -0,0 +1,22 @@
+-- Calendar event recurrence
+-- Columns the calendar entity persists for per-user events and their
+-- recurrence, including exception dates for skipped occurrences. Events are
+-- loaded per user and window and expanded into occurrences in the
+-- application, so the index leads with the user and covers the series end.
+
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS user_id TEXT;
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS timezone VARCHAR(64) DEFAULT 'UTC';
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS recurrence_type VARCHAR(20) NOT NULL DEFAULT 'none';
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS recurrence_end_date DATE;
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS recurrence_count INTEGER;
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS recurrence_interval INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS recurrence_days_of_week INTEGER[] NOT NULL DEFAULT '{}';
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS recurrence_exception_dates DATE[] NOT NULL DEFAULT '{}';
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS blocks_scheduling BOOLEAN NOT NULL DEFAULT TRUE;
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS allows_emergency_override BOOLEAN NOT NULL DEFAULT FALSE;
+ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS is_active BOOLEAN NOT NULL DEFAULT TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_calendar_events_user_window
+    ON calendar_events(business_id, user_id, start_datetime)
+    INCLUDE (end_datetime, recurrence_type, recurrence_end_date)
+    WHERE is_active;
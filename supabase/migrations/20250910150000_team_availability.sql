@@ -0,0 +1,40 @@
+-- Team availability
+-- The team availability view loads members, approved time off and calendar
+-- events for a window in one query each. Time off is keyed by the member's
+-- user id like calendar events, and both are indexed for business-wide
+-- window reads.
+
+ALTER TABLE time_off_requests ADD COLUMN IF NOT EXISTS user_id TEXT;
+
+UPDATE time_off_requests t
+SET user_id = tech.user_id::TEXT
+FROM technicians tech
+WHERE tech.id = t.technician_id
+  AND t.user_id IS NULL;
+
+-- Requests filed against a technician take the technician's user id
+CREATE OR REPLACE FUNCTION set_time_off_request_user_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.user_id IS NULL AND NEW.technician_id IS NOT NULL THEN
+        SELECT tech.user_id::TEXT INTO NEW.user_id
+        FROM technicians tech
+        WHERE tech.id = NEW.technician_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_time_off_requests_user_id ON time_off_requests;
+CREATE TRIGGER trg_time_off_requests_user_id
+    BEFORE INSERT OR UPDATE OF technician_id ON time_off_requests
+    FOR EACH ROW EXECUTE FUNCTION set_time_off_request_user_id();
+
+CREATE INDEX IF NOT EXISTS idx_time_off_requests_business_window
+    ON time_off_requests(business_id, status, start_date, end_date)
+    INCLUDE (user_id);
+
+CREATE INDEX IF NOT EXISTS idx_calendar_events_business_window
+    ON calendar_events(business_id, start_datetime)
+    INCLUDE (user_id, end_datetime, recurrence_type, recurrence_end_date)
+    WHERE is_active;
@@ -0,0 +1,132 @@
+-- Booking slot holds
+-- A customer who picks a slot gets a short lease on it. Leases are taken under
+-- a per-business advisory lock, so two customers racing for the same interval
+-- cannot both get one, and the availability checks treat held time as taken.
+-- Creating the booking converts the hold in the same transaction as the
+-- insert; a converted hold keeps the interval until the appointment ends, or
+-- until the booking is cancelled or rescheduled.
+
+CREATE TABLE IF NOT EXISTS booking_slot_holds (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    business_id UUID NOT NULL REFERENCES businesses(id) ON DELETE CASCADE,
+    service_id UUID NOT NULL REFERENCES bookable_services(id) ON DELETE CASCADE,
+    technician_id UUID,
+    starts_at TIMESTAMPTZ NOT NULL,
+    ends_at TIMESTAMPTZ NOT NULL,
+    hold_token VARCHAR(100) NOT NULL UNIQUE,
+    expires_at TIMESTAMPTZ NOT NULL,
+    booking_id UUID REFERENCES bookings(id) ON DELETE CASCADE,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+
+    CHECK (ends_at > starts_at)
+);
+
+CREATE INDEX IF NOT EXISTS idx_booking_slot_holds_business_window
+    ON booking_slot_holds(business_id, starts_at)
+    INCLUDE (ends_at, expires_at, technician_id, booking_id);
+
+CREATE INDEX IF NOT EXISTS idx_booking_slot_holds_booking_id
+    ON booking_slot_holds(booking_id)
+    WHERE booking_id IS NOT NULL;
+
+-- Hold [p_starts_at, p_ends_at) for p_ttl_seconds. Returns the new hold, or no
+-- row when the interval overlaps a live hold or a confirmed/in-progress
+-- booking. Holds with different technicians do not conflict; a hold without a
+-- technician conflicts with every overlapping hold. Expired holds of the
+-- business are purged on the way.
+CREATE OR REPLACE FUNCTION acquire_booking_slot_hold(
+    p_business_id UUID,
+    p_service_id UUID,
+    p_starts_at TIMESTAMPTZ,
+    p_ends_at TIMESTAMPTZ,
+    p_hold_token TEXT,
+    p_ttl_seconds INTEGER DEFAULT 900,
+    p_technician_id UUID DEFAULT NULL
+)
+RETURNS SETOF booking_slot_holds AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended(p_business_id::TEXT, 0));
+
+    DELETE FROM booking_slot_holds
+    WHERE business_id = p_business_id AND expires_at <= NOW();
+
+    IF EXISTS (
+        SELECT 1 FROM booking_slot_holds h
+        WHERE h.business_id = p_business_id
+          AND h.starts_at < p_ends_at AND h.ends_at > p_starts_at
+          AND (h.technician_id IS NULL OR p_technician_id IS NULL OR h.technician_id = p_technician_id)
+    ) THEN
+        RETURN;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM bookings b
+        WHERE b.business_id = p_business_id
+          AND b.status IN ('confirmed', 'in_progress')
+          AND b.scheduled_at < p_ends_at
+          AND b.scheduled_at + make_interval(mins => b.estimated_duration_minutes) > p_starts_at
+    ) THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO booking_slot_holds (business_id, service_id, technician_id, starts_at, ends_at, hold_token, expires_at)
+    VALUES (p_business_id, p_service_id, p_technician_id, p_starts_at, p_ends_at, p_hold_token,
+            NOW() + make_interval(secs => p_ttl_seconds))
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+-- Insert p_booking (a bookings row as JSON; omitted columns keep their
+-- defaults) and attach it to the live, unused hold p_hold_token, in one
+-- transaction. A hold taken for a technician assigns that technician to the
+-- booking. Returns the booking, or no row when the hold is missing, expired,
+-- already used, or is for another business, service, start time or technician.
+CREATE OR REPLACE FUNCTION create_booking_from_hold(
+    p_hold_token TEXT,
+    p_starts_at TIMESTAMPTZ,
+    p_booking JSONB
+)
+RETURNS SETOF bookings AS $$
+DECLARE
+    v_hold booking_slot_holds;
+    v_columns TEXT;
+    v_booking bookings;
+BEGIN
+    SELECT * INTO v_hold
+    FROM booking_slot_holds
+    WHERE hold_token = p_hold_token
+    FOR UPDATE;
+
+    IF NOT FOUND
+       OR v_hold.booking_id IS NOT NULL
+       OR v_hold.expires_at <= NOW()
+       OR v_hold.starts_at <> p_starts_at
+       OR v_hold.business_id <> (p_booking->>'business_id')::UUID
+       OR v_hold.service_id <> (p_booking->>'service_id')::UUID
+       OR (v_hold.technician_id IS NOT NULL
+           AND p_booking->>'primary_technician_id' IS NOT NULL
+           AND (p_booking->>'primary_technician_id')::UUID <> v_hold.technician_id) THEN
+        RETURN;
+    END IF;
+
+    IF v_hold.technician_id IS NOT NULL THEN
+        p_booking := p_booking || jsonb_build_object('primary_technician_id', v_hold.technician_id);
+    END IF;
+
+    SELECT string_agg(quote_ident(key), ', ') INTO v_columns
+    FROM jsonb_object_keys(p_booking) AS key;
+
+    EXECUTE format(
+        'INSERT INTO bookings (%1$s) SELECT %1$s FROM jsonb_populate_record(NULL::bookings, $1) RETURNING *',
+        v_columns
+    ) INTO v_booking USING p_booking;
+
+    UPDATE booking_slot_holds
+    SET booking_id = v_booking.id,
+        expires_at = GREATEST(expires_at, ends_at)
+    WHERE id = v_hold.id;
+
+    RETURN NEXT v_booking;
+END;
+$$ LANGUAGE plpgsql VOLATILE;